@@ -8,10 +8,13 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from effilocal.config.logging import get_logger
 
+if TYPE_CHECKING:
+    from effilocal.doc.search_index import BlockSearchIndex
+
 LOGGER = get_logger(__name__)
 
 
@@ -86,6 +89,17 @@ class ArtifactLoader:
             len(self.blocks_by_ordinal),
             len(self.sections_by_id),
         )
+        self._search_index: Optional['BlockSearchIndex'] = None
+    
+    @property
+    def search_index(self) -> BlockSearchIndex:
+        """Full-text index over the blocks (``search_index.json``, loaded on first use)."""
+        if self._search_index is None:
+            # Deferred: importing effilocal.doc pulls in the document libraries
+            from effilocal.doc.search_index import BlockSearchIndex
+
+            self._search_index = BlockSearchIndex.for_directory(self.analysis_dir, self.blocks)
+        return self._search_index
     
     def _load_json(self, filename: str) -> Dict[str, Any]:
         """Load a JSON artifact file."""
@@ -293,8 +307,7 @@ class ArtifactLoader:
         results = self.blocks
         
         if text is not None:
-            text_lower = text.lower()
-            results = [b for b in results if text_lower in b.get('text', '').lower()]
+            results = [self.blocks[pos] for pos in self.search_index.matching_positions(text)]
         
         if block_type is not None:
             results = [b for b in results if b.get('type') == block_type]
@@ -11,9 +11,12 @@ from typing import Any, Iterable, Mapping
 from dotenv import load_dotenv
 
 from effilocal.config.logging import configure_logging, get_logger
+from effilocal.corpus_index import CORPUS_INDEX_FILENAME, CorpusIndex, default_corpus_roots, find_analysis_dirs
+from effilocal.doc.near_duplicates import NearDuplicateIndex
 from effilocal.flows import validate_doc
 from effilocal.flows.analyze_doc import AnalyzeError, analyze
 from effilocal.flows.label_doc import LabelingError, label as run_label
+from effilocal.tools.audit import summarize_audit
 LOGGER = get_logger("effilocal.cli")
 
 load_dotenv()
@@ -45,6 +48,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Emit ltu_tree.json summarising the clause hierarchy.",
     )
+    analyze_parser.add_argument(
+        "--corpus-index",
+        type=Path,
+        help="Update this corpus index in place with the analyzed document.",
+    )
 
     label_parser = subparsers.add_parser(
         "label",
@@ -67,6 +75,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Apply snippet redaction to mask emails and phone numbers before sending to the LLM.",
     )
+    label_parser.add_argument(
+        "--redact-rules",
+        type=Path,
+        help="JSON file of extra redaction terms/patterns (party names, account numbers); implies --redact.",
+    )
     label_parser.add_argument(
         "--temperature",
         type=float,
@@ -75,7 +88,7 @@ def build_parser() -> argparse.ArgumentParser:
     label_parser.add_argument(
         "--payload-max-chars",
         type=int,
-        help="Maximum allowed characters for the labeling payload; defaults to no limit.",
+        help="Character budget per labeling request; sections are packed into as few requests as fit (default: no limit).",
     )
 
     validate_parser = subparsers.add_parser(
@@ -93,6 +106,78 @@ def build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Optional path for writing the validation report JSON.",
     )
+    validate_parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Validate every analysis directory (containing blocks.jsonl) under data_dir.",
+    )
+    validate_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for --recursive (default: CPU count; 1 = in-process).",
+    )
+
+    corpus_parser = subparsers.add_parser(
+        "corpus",
+        help="Build or query the cross-document clause index.",
+    )
+    corpus_parser.add_argument(
+        "--index",
+        type=Path,
+        default=Path(CORPUS_INDEX_FILENAME),
+        help=f"Corpus index database (default: {CORPUS_INDEX_FILENAME}).",
+    )
+    corpus_actions = corpus_parser.add_subparsers(dest="corpus_command", required=True)
+    corpus_update = corpus_actions.add_parser(
+        "update",
+        help="Index new or re-analyzed documents and drop removed ones.",
+    )
+    corpus_update.add_argument(
+        "roots",
+        type=Path,
+        nargs="*",
+        help="Analysis roots (default: EL_Precedents/analysis and EL_Projects/*/analysis).",
+    )
+    corpus_search = corpus_actions.add_parser("search", help="Search clauses across documents.")
+    corpus_search.add_argument("query", nargs="?", help="Words to find in clause headings or text.")
+    corpus_search.add_argument("--title", help="Words that must appear in the clause heading.")
+    corpus_search.add_argument("--role", help="Section role, e.g. definitions or main_body.")
+    corpus_search.add_argument("--party", help="Party name or defined term (substring).")
+    corpus_search.add_argument("--project", help="Project folder name, or EL_Precedents.")
+    corpus_search.add_argument("--date-from", help="Earliest agreement date (YYYY-MM-DD).")
+    corpus_search.add_argument("--date-to", help="Latest agreement date (YYYY-MM-DD).")
+    corpus_search.add_argument("--limit", type=int, default=50, help="Maximum clauses returned.")
+
+    near_parser = subparsers.add_parser(
+        "near-duplicates",
+        help="Find near-verbatim precedent matches for each block of an analyzed document.",
+    )
+    near_parser.add_argument("analysis_dir", type=Path, help="Analysis directory of the incoming draft.")
+    near_parser.add_argument(
+        "--precedents",
+        type=Path,
+        nargs="+",
+        default=[Path("EL_Precedents") / "analysis"],
+        help="Precedent analysis roots (default: EL_Precedents/analysis).",
+    )
+    near_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="Minimum estimated similarity (0-1, default: 0.5).",
+    )
+    near_parser.add_argument("--limit", type=int, default=3, help="Matches per block (default: 3).")
+
+    audit_parser = subparsers.add_parser(
+        "audit-summary",
+        help="Summarise tool_audit.jsonl files into per-tool latency percentiles.",
+    )
+    audit_parser.add_argument(
+        "paths",
+        type=Path,
+        nargs="*",
+        help="Audit files (default: $EFFILOCAL_TOOL_AUDIT_FILE or tool_audit.jsonl).",
+    )
 
     return parser
 
@@ -125,6 +210,10 @@ def main(argv: Iterable[str] | None = None) -> int:
             LOGGER.error("Document analysis failed: %s", exc)
             return 1
 
+        if args.corpus_index:
+            with CorpusIndex(args.corpus_index) as index:
+                index.index_document(args.out, force=True)
+            LOGGER.info("Updated corpus index %s", args.corpus_index)
         if args.emit_ltu_tree:
             LOGGER.info("Requested LTU tree emission (ltu_tree.json).")
         if args.no_emit_block_ranges:
@@ -149,6 +238,7 @@ def main(argv: Iterable[str] | None = None) -> int:
                 temperature=args.temperature,
                 redact=args.redact,
                 payload_max_chars=args.payload_max_chars,
+                redact_rules=args.redact_rules,
             )
         except LabelingError as exc:
             LOGGER.error("Document labeling failed: %s", exc)
@@ -156,18 +246,82 @@ def main(argv: Iterable[str] | None = None) -> int:
         return 0
 
     if getattr(args, "command", None) == "validate":
-        report = validate_doc.validate_directory(args.data_dir, deep=args.deep)
-        output = {
-            "ok": report.ok,
-            "errors": [asdict(issue) for issue in report.errors],
-        }
+        if args.recursive:
+            reports = validate_doc.validate_tree(args.data_dir, deep=args.deep, workers=args.workers)
+        else:
+            reports = {args.data_dir: validate_doc.validate_directory(args.data_dir, deep=args.deep)}
+        ok = all(report.ok for report in reports.values())
+        if args.recursive:
+            output = {
+                "ok": ok,
+                "directories": {
+                    str(path): {"ok": report.ok, "errors": [asdict(issue) for issue in report.errors]}
+                    for path, report in reports.items()
+                },
+            }
+        else:
+            report = reports[args.data_dir]
+            output = {
+                "ok": report.ok,
+                "errors": [asdict(issue) for issue in report.errors],
+            }
         payload = json.dumps(output, indent=2)
         if args.report:
             args.report.write_text(payload + "\n", encoding="utf-8")
             LOGGER.info("Validation report written to %s", args.report)
         else:
             print(payload)
-        return 0 if report.ok else 1
+        return 0 if ok else 1
+
+    if getattr(args, "command", None) == "corpus":
+        with CorpusIndex(args.index) as index:
+            if args.corpus_command == "update":
+                roots = args.roots or default_corpus_roots(Path.cwd())
+                print(json.dumps(asdict(index.update(roots)), indent=2))
+                return 0
+            hits = index.search(
+                args.query,
+                title=args.title,
+                role=args.role,
+                party=args.party,
+                project=args.project,
+                date_from=args.date_from,
+                date_to=args.date_to,
+                limit=args.limit,
+            )
+        print(json.dumps([hit.to_dict() for hit in hits], indent=2, ensure_ascii=False))
+        return 0
+
+    if getattr(args, "command", None) == "near-duplicates":
+        analysis_dir = args.analysis_dir.resolve()
+        index = NearDuplicateIndex()
+        for root in args.precedents:
+            for precedent_dir in find_analysis_dirs(root):
+                if precedent_dir.resolve() != analysis_dir:
+                    index.add_directory(precedent_dir)
+        with (analysis_dir / "blocks.jsonl").open("r", encoding="utf-8") as handle:
+            blocks = [json.loads(line) for line in handle if line.strip()]
+        matches = index.match_blocks(blocks, threshold=args.threshold, limit=args.limit)
+        output = [
+            {
+                "block_id": block["id"],
+                "ordinal": (block.get("list") or {}).get("ordinal") or None,
+                "matches": [match.to_dict() for match in matches[block["id"]]],
+            }
+            for block in blocks
+            if block.get("id") in matches
+        ]
+        print(json.dumps({"indexed_blocks": len(index), "blocks": output}, indent=2, ensure_ascii=False))
+        return 0
+
+    if getattr(args, "command", None) == "audit-summary":
+        try:
+            summary = summarize_audit(args.paths or None)
+        except OSError as exc:
+            LOGGER.error("Cannot read audit file: %s", exc)
+            return 1
+        print(json.dumps(summary, indent=2))
+        return 0
 
     parser.print_help()
     return 1
@@ -0,0 +1,592 @@
+"""Cross-document clause index over analysis libraries.
+
+Per-document artifacts answer questions about one document; this module
+keeps a persistent SQLite index of every section ("clause") across many
+analysis directories -- typically ``EL_Precedents/analysis`` and every
+``EL_Projects/*/analysis`` -- so queries such as "every limitation of
+liability clause in our precedents" run without loading each document.
+
+Each analysis directory contributes:
+
+- a ``documents`` row (source file, project, agreement date, a stat
+  signature of its artifacts);
+- ``parties`` rows (company names and party defined terms from the preamble);
+- one ``clauses`` row per section in ``sections.json``, with its first block
+  id, clause ordinal, heading, effective role (its own or the nearest
+  ancestor's, from ``sections._ROLE_PATTERNS``) and any ``labels.json``
+  role/topics, plus an FTS5 row over heading, topics and text.
+
+:meth:`CorpusIndex.update` re-indexes only directories whose artifacts
+changed since the last run and drops directories that disappeared;
+:meth:`CorpusIndex.index_document` replaces a single document in place
+(e.g. straight after it is re-analyzed). Each document is written in its
+own transaction, so readers never see a half-indexed document.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import asdict, dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from effilocal.config.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+__all__ = [
+    "CORPUS_INDEX_FILENAME",
+    "ClauseHit",
+    "CorpusIndex",
+    "UpdateStats",
+    "default_corpus_roots",
+    "find_analysis_dirs",
+]
+
+CORPUS_INDEX_FILENAME = "corpus_index.sqlite"
+CORPUS_INDEX_VERSION = 1
+
+# Artifacts whose stat makes up a document's signature.
+_SIGNATURE_FILES = ("blocks.jsonl", "sections.json", "labels.json", "manifest.json")
+# Heading characters kept for run-in headings ("LIMITATION OF LIABILITY. (a) ...").
+_TITLE_LIMIT = 80
+# Leading blocks searched for the agreement date and parties.
+_PREAMBLE_BLOCKS = 40
+_DATE_ROLES = ("agreement_date", "order_details", "front_matter", "parties")
+# bm25 column weights: title, topics, text.
+_BM25_WEIGHTS = (10.0, 3.0, 1.0)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS documents (
+    doc_key TEXT PRIMARY KEY,
+    analysis_dir TEXT NOT NULL,
+    doc_id TEXT,
+    source_filename TEXT,
+    project TEXT,
+    doc_date TEXT,
+    analyzed_at TEXT,
+    signature TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS parties (
+    doc_key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    folded TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS parties_doc ON parties(doc_key);
+CREATE TABLE IF NOT EXISTS clauses (
+    clause_id INTEGER PRIMARY KEY,
+    doc_key TEXT NOT NULL,
+    section_id TEXT,
+    block_id TEXT,
+    ordinal TEXT,
+    title TEXT,
+    level INTEGER,
+    position INTEGER,
+    role TEXT,
+    label_role TEXT,
+    topics TEXT
+);
+CREATE INDEX IF NOT EXISTS clauses_doc ON clauses(doc_key);
+CREATE INDEX IF NOT EXISTS clauses_role ON clauses(role);
+CREATE VIRTUAL TABLE IF NOT EXISTS clauses_fts USING fts5(
+    title, topics, text, tokenize = 'porter unicode61'
+);
+"""
+
+_MONTHS = {
+    name: number
+    for number, names in enumerate(
+        (
+            ("january", "jan"), ("february", "feb"), ("march", "mar"), ("april", "apr"),
+            ("may",), ("june", "jun"), ("july", "jul"), ("august", "aug"),
+            ("september", "sep", "sept"), ("october", "oct"), ("november", "nov"),
+            ("december", "dec"),
+        ),
+        start=1,
+    )
+    for name in names
+}
+_MONTH = r"(?P<month>" + "|".join(sorted(_MONTHS, key=len, reverse=True)) + r")\.?"
+_DATE_PATTERNS = (
+    re.compile(r"\b(?P<day>\d{1,2})(?:st|nd|rd|th)?\s+(?:day\s+of\s+)?" + _MONTH + r",?\s+(?P<year>\d{4})\b", re.I),
+    re.compile(r"\b" + _MONTH + r"\s+(?P<day>\d{1,2})(?:st|nd|rd|th)?,?\s+(?P<year>\d{4})\b", re.I),
+    re.compile(r"\b(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})\b"),
+)
+_LEADING_ORDINAL_RE = re.compile(r"^\s*(?:\d+(?:\.\d+)*\.?|\([a-z0-9]+\))\s*", re.I)
+_RUN_IN_HEADING_RE = re.compile(r"^(.+?)[.:](?:\s|$)")
+_QUERY_TERM_RE = re.compile(r"\w+")
+
+
+@dataclass(frozen=True, slots=True)
+class ClauseHit:
+    """A clause matching a corpus query, as a block reference."""
+
+    doc_key: str
+    analysis_dir: str
+    source_filename: str | None
+    project: str | None
+    doc_date: str | None
+    section_id: str | None
+    block_id: str | None
+    ordinal: str | None
+    title: str
+    role: str | None
+    label_role: str | None
+    topics: tuple[str, ...]
+    score: float
+    snippet: str
+
+    def to_dict(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload["topics"] = list(self.topics)
+        return payload
+
+
+@dataclass(frozen=True, slots=True)
+class UpdateStats:
+    """Outcome of :meth:`CorpusIndex.update`."""
+
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    failed: int = 0
+
+
+def default_corpus_roots(base_dir: str | Path) -> list[Path]:
+    """Return the precedent and project analysis roots under ``base_dir``."""
+    base = Path(base_dir)
+    roots = [base / "EL_Precedents" / "analysis"]
+    roots.extend(sorted((base / "EL_Projects").glob("*/analysis")))
+    return [root for root in roots if root.is_dir()]
+
+
+def find_analysis_dirs(root: str | Path) -> Iterator[Path]:
+    """Yield every directory under ``root`` (inclusive) holding ``blocks.jsonl``."""
+    root_path = Path(root)
+    if (root_path / "blocks.jsonl").is_file():
+        yield root_path
+    for path in sorted(root_path.rglob("blocks.jsonl")):
+        if path.parent != root_path:
+            yield path.parent
+
+
+class CorpusIndex:
+    """Persistent clause index over many analysis directories."""
+
+    def __init__(self, path: str | Path, *, base_dir: str | Path | None = None) -> None:
+        """
+        Args:
+            path: SQLite database file (created if missing); ``":memory:"`` works too.
+            base_dir: Directory document keys are made relative to (defaults to
+                the database's directory), so an index stays valid when the
+                whole library is moved.
+        """
+        self.path = path
+        if base_dir is None:
+            base_dir = Path.cwd() if str(path) == ":memory:" else Path(path).resolve().parent
+        self.base_dir = Path(base_dir).resolve()
+        self._conn = sqlite3.connect(str(path))
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._check_version()
+
+    def __enter__(self) -> "CorpusIndex":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _check_version(self) -> None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is not None and row["value"] == str(CORPUS_INDEX_VERSION):
+            return
+        if row is not None:
+            LOGGER.info("Corpus index %s has an older format; rebuilding", self.path)
+        with self._conn:
+            for table in ("documents", "parties", "clauses", "clauses_fts"):
+                self._conn.execute(f"DELETE FROM {table}")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                (str(CORPUS_INDEX_VERSION),),
+            )
+
+    # ------------------------------------------------------------------ writes
+
+    def doc_key(self, analysis_dir: str | Path) -> str:
+        """Return the key identifying ``analysis_dir`` in the index."""
+        resolved = Path(analysis_dir).resolve()
+        try:
+            return resolved.relative_to(self.base_dir).as_posix()
+        except ValueError:
+            return resolved.as_posix()
+
+    def update(self, roots: Iterable[str | Path]) -> UpdateStats:
+        """Bring the index in line with every analysis directory under ``roots``.
+
+        Unchanged documents (same artifact signature) are skipped; documents
+        no longer present under any root are removed.
+        """
+        known = {
+            row["doc_key"]: row["signature"]
+            for row in self._conn.execute("SELECT doc_key, signature FROM documents")
+        }
+        seen: set[str] = set()
+        counts = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0, "failed": 0}
+        for root in roots:
+            for analysis_dir in find_analysis_dirs(root):
+                key = self.doc_key(analysis_dir)
+                if key in seen:
+                    continue
+                seen.add(key)
+                signature = _signature(analysis_dir)
+                if known.get(key) == signature:
+                    counts["unchanged"] += 1
+                    continue
+                try:
+                    self._index(analysis_dir, key, signature)
+                except (OSError, ValueError) as exc:
+                    LOGGER.warning("Skipping %s: %s", analysis_dir, exc)
+                    counts["failed"] += 1
+                    continue
+                counts["updated" if key in known else "added"] += 1
+
+        for key in known.keys() - seen:
+            self.remove_document(key)
+            counts["removed"] += 1
+        LOGGER.info("Corpus index updated: %s", counts)
+        return UpdateStats(**counts)
+
+    def index_document(self, analysis_dir: str | Path, *, force: bool = False) -> bool:
+        """Index or re-index one analysis directory in place.
+
+        Returns:
+            True if the document was (re)written, False if it was unchanged.
+        """
+        key = self.doc_key(analysis_dir)
+        signature = _signature(analysis_dir)
+        if not force:
+            row = self._conn.execute("SELECT signature FROM documents WHERE doc_key = ?", (key,)).fetchone()
+            if row is not None and row["signature"] == signature:
+                return False
+        self._index(Path(analysis_dir), key, signature)
+        return True
+
+    def remove_document(self, doc_key: str) -> None:
+        """Drop a document and its clauses."""
+        with self._conn:
+            self._delete(doc_key)
+
+    def _delete(self, doc_key: str) -> None:
+        self._conn.execute(
+            "DELETE FROM clauses_fts WHERE rowid IN (SELECT clause_id FROM clauses WHERE doc_key = ?)",
+            (doc_key,),
+        )
+        self._conn.execute("DELETE FROM clauses WHERE doc_key = ?", (doc_key,))
+        self._conn.execute("DELETE FROM parties WHERE doc_key = ?", (doc_key,))
+        self._conn.execute("DELETE FROM documents WHERE doc_key = ?", (doc_key,))
+
+    def _index(self, analysis_dir: Path, doc_key: str, signature: str) -> None:
+        record = _read_document(analysis_dir)
+        with self._conn:
+            self._delete(doc_key)
+            self._conn.execute(
+                "INSERT INTO documents (doc_key, analysis_dir, doc_id, source_filename, project, doc_date,"
+                " analyzed_at, signature) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    doc_key,
+                    str(analysis_dir.resolve()),
+                    record["doc_id"],
+                    record["source_filename"],
+                    _project(analysis_dir),
+                    record["doc_date"],
+                    record["analyzed_at"],
+                    signature,
+                ),
+            )
+            self._conn.executemany(
+                "INSERT INTO parties (doc_key, name, folded) VALUES (?, ?, ?)",
+                [(doc_key, name, name.casefold()) for name in record["parties"]],
+            )
+            for clause in record["clauses"]:
+                cursor = self._conn.execute(
+                    "INSERT INTO clauses (doc_key, section_id, block_id, ordinal, title, level, position,"
+                    " role, label_role, topics) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        doc_key,
+                        clause["section_id"],
+                        clause["block_id"],
+                        clause["ordinal"],
+                        clause["title"],
+                        clause["level"],
+                        clause["position"],
+                        clause["role"],
+                        clause["label_role"],
+                        json.dumps(clause["topics"]),
+                    ),
+                )
+                self._conn.execute(
+                    "INSERT INTO clauses_fts (rowid, title, topics, text) VALUES (?, ?, ?, ?)",
+                    (cursor.lastrowid, clause["title"], " ".join(clause["topics"]), clause["text"]),
+                )
+        LOGGER.debug("Indexed %s (%d clauses)", doc_key, len(record["clauses"]))
+
+    # ----------------------------------------------------------------- queries
+
+    def document_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def search(
+        self,
+        query: str | None = None,
+        *,
+        title: str | None = None,
+        role: str | None = None,
+        party: str | None = None,
+        project: str | None = None,
+        date_from: str | date | None = None,
+        date_to: str | date | None = None,
+        limit: int = 50,
+    ) -> list[ClauseHit]:
+        """Find clauses across the corpus.
+
+        Args:
+            query: Words that must all appear in the clause heading, topics or text.
+            title: Words that must all appear in the clause heading.
+            role: Section role (``definitions``, ``main_body``, ...) or labeled role.
+            party: Case-insensitive substring of a party name or defined term.
+            project: Project folder name (``EL_Precedents`` for precedents).
+            date_from: Earliest agreement date (ISO ``YYYY-MM-DD``), inclusive.
+            date_to: Latest agreement date, inclusive. Documents without a
+                detected agreement date are excluded when either bound is set.
+            limit: Maximum number of clauses returned.
+
+        Returns:
+            Clauses ranked by BM25 relevance (heading matches weigh most), or in
+            corpus/document order when neither ``query`` nor ``title`` is given.
+        """
+        match = _match_expression(query, title)
+        conditions: list[str] = []
+        params: list[Any] = []
+        if match is not None:
+            conditions.append("clauses_fts MATCH ?")
+            params.append(match)
+        if role:
+            conditions.append("(c.role = ? OR c.label_role = ?)")
+            params.extend([role, role])
+        if party:
+            conditions.append("EXISTS (SELECT 1 FROM parties p WHERE p.doc_key = c.doc_key AND instr(p.folded, ?) > 0)")
+            params.append(party.casefold())
+        if project:
+            conditions.append("d.project = ?")
+            params.append(project)
+        if date_from is not None:
+            conditions.append("d.doc_date >= ?")
+            params.append(str(date_from))
+        if date_to is not None:
+            conditions.append("d.doc_date <= ?")
+            params.append(str(date_to))
+
+        if match is not None:
+            weights = ", ".join(str(weight) for weight in _BM25_WEIGHTS)
+            score = f"bm25(clauses_fts, {weights})"
+            snippet = "snippet(clauses_fts, 2, '', '', '…', 16)"
+            order = "score"
+        else:
+            score = "0.0"
+            snippet = "substr(clauses_fts.text, 1, 120)"
+            order = "c.doc_key, c.position"
+        sql = (
+            f"SELECT c.*, d.analysis_dir, d.source_filename, d.project, d.doc_date,"
+            f" {score} AS score, {snippet} AS snippet"
+            " FROM clauses_fts"
+            " JOIN clauses c ON c.clause_id = clauses_fts.rowid"
+            " JOIN documents d ON d.doc_key = c.doc_key"
+            + (" WHERE " + " AND ".join(conditions) if conditions else "")
+            + f" ORDER BY {order} LIMIT ?"
+        )
+        params.append(max(int(limit), 1))
+        return [
+            ClauseHit(
+                doc_key=row["doc_key"],
+                analysis_dir=row["analysis_dir"],
+                source_filename=row["source_filename"],
+                project=row["project"],
+                doc_date=row["doc_date"],
+                section_id=row["section_id"],
+                block_id=row["block_id"],
+                ordinal=row["ordinal"],
+                title=row["title"],
+                role=row["role"],
+                label_role=row["label_role"],
+                topics=tuple(json.loads(row["topics"] or "[]")),
+                # bm25() is lower-is-better; expose higher-is-better
+                score=round(-row["score"], 6) if match is not None else 0.0,
+                snippet=row["snippet"] or "",
+            )
+            for row in self._conn.execute(sql, params)
+        ]
+
+
+def _match_expression(query: str | None, title: str | None) -> str | None:
+    """Build an FTS5 MATCH string from free text, quoting every term."""
+    parts = []
+    query_terms = _QUERY_TERM_RE.findall(query or "")
+    if query_terms:
+        parts.append(" AND ".join(f'"{term}"' for term in query_terms))
+    title_terms = _QUERY_TERM_RE.findall(title or "")
+    if title_terms:
+        parts.append("title : (" + " AND ".join(f'"{term}"' for term in title_terms) + ")")
+    return " AND ".join(parts) if parts else None
+
+
+def _signature(analysis_dir: str | Path) -> str:
+    parts = []
+    for name in _SIGNATURE_FILES:
+        try:
+            stat = (Path(analysis_dir) / name).stat()
+        except FileNotFoundError:
+            parts.append(f"{name}:-")
+            continue
+        parts.append(f"{name}:{stat.st_mtime_ns}:{stat.st_size}")
+    return "|".join(parts)
+
+
+def _project(analysis_dir: Path) -> str | None:
+    parts = analysis_dir.resolve().parts
+    for index, part in enumerate(parts):
+        if part == "EL_Precedents":
+            return part
+        if part == "EL_Projects" and index + 1 < len(parts):
+            return parts[index + 1]
+    return None
+
+
+def _read_json(path: Path) -> Any:
+    if not path.is_file():
+        return None
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _read_document(analysis_dir: Path) -> dict[str, Any]:
+    """Read the artifacts of one analysis directory into index rows."""
+    blocks: list[dict[str, Any]] = []
+    with (analysis_dir / "blocks.jsonl").open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                blocks.append(json.loads(line))
+    sections = _read_json(analysis_dir / "sections.json") or {}
+    manifest = _read_json(analysis_dir / "manifest.json") or {}
+    index = _read_json(analysis_dir / "index.json") or {}
+    labels = _read_json(analysis_dir / "labels.json") or {}
+    labels_by_section = {
+        label.get("section_id"): label for label in labels.get("labels", []) if isinstance(label, Mapping)
+    }
+
+    positions = {block.get("id"): position for position, block in enumerate(blocks)}
+    clauses = list(_clauses(sections.get("root") or {}, blocks, positions, labels_by_section))
+
+    return {
+        "doc_id": manifest.get("doc_id") or sections.get("doc_id"),
+        "source_filename": index.get("source_filename") or manifest.get("source_filename"),
+        "analyzed_at": manifest.get("created_at"),
+        "doc_date": _agreement_date(blocks, clauses, positions),
+        "parties": _parties(blocks, labels_by_section.values()),
+        "clauses": clauses,
+    }
+
+
+def _clauses(
+    root: Mapping[str, Any],
+    blocks: list[dict[str, Any]],
+    positions: Mapping[str, int],
+    labels_by_section: Mapping[str, Mapping[str, Any]],
+) -> Iterator[dict[str, Any]]:
+    stack: list[tuple[Mapping[str, Any], str | None]] = [
+        (child, None) for child in reversed(root.get("children") or [])
+    ]
+    while stack:
+        section, inherited_role = stack.pop()
+        role = section.get("role") or inherited_role
+        block_positions = [positions[block_id] for block_id in section.get("block_ids") or [] if block_id in positions]
+        texts = [blocks[position].get("text") or "" for position in block_positions]
+        first = blocks[block_positions[0]] if block_positions else {}
+        label = labels_by_section.get(section.get("id")) or {}
+        topics = [str(topic) for topic in label.get("topics") or []]
+        yield {
+            "section_id": section.get("id"),
+            "block_id": first.get("id"),
+            "ordinal": (first.get("list") or {}).get("ordinal") or None,
+            "title": _clause_title(section.get("title") or (texts[0] if texts else "")),
+            "level": section.get("level"),
+            "position": block_positions[0] if block_positions else None,
+            "role": role,
+            "label_role": label.get("role"),
+            "topics": topics,
+            "text": "\n".join(text for text in texts if text),
+            "_positions": block_positions,
+        }
+        stack.extend((child, role) for child in reversed(section.get("children") or []))
+
+
+def _clause_title(text: str) -> str:
+    """Reduce a section title to its heading ("10.LIMITATION OF LIABILITY. (a) ..." -> "LIMITATION OF LIABILITY")."""
+    title = _LEADING_ORDINAL_RE.sub("", " ".join(text.split()), count=1)
+    run_in = _RUN_IN_HEADING_RE.match(title)
+    if run_in and len(run_in.group(1)) <= _TITLE_LIMIT:
+        return run_in.group(1).strip()
+    return title[:_TITLE_LIMIT].rstrip()
+
+
+def _agreement_date(
+    blocks: list[dict[str, Any]],
+    clauses: list[dict[str, Any]],
+    positions: Mapping[str, int],
+) -> str | None:
+    """Find the agreement date in date/preamble sections, then the opening blocks."""
+    candidates: list[int] = []
+    for role in _DATE_ROLES:
+        for clause in clauses:
+            if clause["role"] == role:
+                candidates.extend(clause["_positions"])
+    candidates.extend(range(min(len(blocks), _PREAMBLE_BLOCKS)))
+    for position in candidates:
+        found = _parse_date(blocks[position].get("text") or "")
+        if found is not None:
+            return found
+    return None
+
+
+def _parse_date(text: str) -> str | None:
+    for pattern in _DATE_PATTERNS:
+        for match in pattern.finditer(text):
+            month = match.group("month")
+            month_number = int(month) if month.isdigit() else _MONTHS[month.lower()]
+            try:
+                return date(int(match.group("year")), month_number, int(match.group("day"))).isoformat()
+            except ValueError:
+                continue
+    return None
+
+
+def _parties(blocks: list[dict[str, Any]], labels: Iterable[Mapping[str, Any]]) -> list[str]:
+    from effilocal.doc.party_detection import PartyDetector  # deferred: effilocal.doc is slow to import
+
+    detector = PartyDetector.from_blocks(blocks)
+    names: dict[str, str] = {}
+    for name in (*detector.full_company_names, *detector.company_names, *detector.defined_terms):
+        names.setdefault(name.casefold(), name)
+    for label in labels:
+        for entity in label.get("entities") or []:
+            names.setdefault(str(entity).casefold(), str(entity))
+    return list(names.values())
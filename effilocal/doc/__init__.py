@@ -13,11 +13,12 @@ from effilocal.doc import (
     party_detection,
     relationships,
     sections,
+    style_table,
     styles,
 )
 
 # Import key classes and functions for direct access
-from effilocal.doc.anonymization import anonymize_text, generate_yaml_header
+from effilocal.doc.anonymization import Anonymizer, anonymize_text, generate_yaml_header
 from effilocal.doc.clause_lookup import ClauseLookup
 from effilocal.doc.email_parser import (
     Attachment,
@@ -28,10 +29,12 @@ from effilocal.doc.email_parser import (
     select_docx_attachment,
 )
 from effilocal.doc.party_detection import (
+    PartyDetector,
     PartyInfo,
     extract_company_names,
     extract_defined_party_terms,
 )
+from effilocal.doc.style_table import ResolvedStyle, StyleTable
 
 __all__ = [
     # Submodules
@@ -46,14 +49,19 @@ __all__ = [
     "party_detection",
     "relationships",
     "sections",
+    "style_table",
     "styles",
     # Classes
+    "Anonymizer",
     "Attachment",
     "ClauseLookup",
     "EmailData",
     "EmailMessage",
     "MsgParser",
+    "PartyDetector",
     "PartyInfo",
+    "ResolvedStyle",
+    "StyleTable",
     # Functions
     "anonymize_text",
     "extract_company_names",
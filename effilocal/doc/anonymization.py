@@ -6,7 +6,7 @@ replacing specific company names with generic role placeholders like [SUPPLIER]
 or [CUSTOMER] to help LLMs generalize patterns.
 
 Typical usage:
-    from effilocal.doc.anonymization import anonymize_text, generate_yaml_header
+    from effilocal.doc.anonymization import Anonymizer, anonymize_text, generate_yaml_header
     from effilocal.doc.party_detection import PartyInfo
     
     # Anonymize text
@@ -18,6 +18,10 @@ Typical usage:
         counterparty_role="CUSTOMER"
     )
     
+    # Or compile once per document and reuse for every paragraph
+    anonymizer = Anonymizer.from_party_info(party_info)
+    paragraphs = anonymizer.anonymize_many(paragraphs)
+    
     # Generate YAML header
     yaml = generate_yaml_header(
         document_type="review_comments",
@@ -28,12 +32,153 @@ Typical usage:
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from effilocal.doc.party_detection import PartyInfo
 
 
+# Quote characters: straight quotes and curly quotes
+_QUOTES = r'["\'\u201C\u201D]'
+
+
+def _normalize_names(names: str | Iterable[str] | None) -> list[str]:
+    """Accept a single name or a list of names; drop empty entries."""
+    if not names:
+        return []
+    if isinstance(names, str):
+        return [names]
+    return [name for name in names if name]
+
+
+def _expand_case_variants(names: list[str]) -> list[str]:
+    """Add ALLCAPS variants for each name (defined terms often appear in ALLCAPS headings)."""
+    expanded: list[str] = []
+    for name in names:
+        if name not in expanded:
+            expanded.append(name)
+        upper = name.upper()
+        if upper != name and upper not in expanded:
+            expanded.append(upper)
+    return expanded
+
+
+def _name_pattern(name: str) -> str:
+    """Create the regex for one name.
+
+    Uses word boundaries for names ending in word characters, but a lookahead
+    for names ending in punctuation (like 'Inc.').
+    """
+    escaped = re.escape(name)
+    if re.match(r'\w', name[-1]):
+        return rf'\b{escaped}\b'
+    return rf'\b{escaped}(?=\s|["\'\(\)]|$)'
+
+
+class Anonymizer:
+    """
+    Precompiled party-name anonymizer.
+    
+    All name variants of both parties are compiled once into a single
+    alternation, so each text is anonymized with one ``re.sub`` for the
+    ("X" or "Y") collapse and one for the names, however many names there are.
+    Build one per document and reuse it for every paragraph and comment.
+    
+    Matching semantics are those of :func:`anonymize_text`: case-sensitive,
+    ALLCAPS variants added automatically, longer names preferred over shorter
+    ones, and client names preferred when a name belongs to both parties.
+    
+    Typical usage:
+        anonymizer = Anonymizer.from_party_info(party_info)
+        paragraphs = anonymizer.anonymize_many(paragraphs)
+    """
+    
+    def __init__(
+        self,
+        client_names: str | Iterable[str],
+        counterparty_names: str | Iterable[str],
+        client_role: str = "CLIENT",
+        counterparty_role: str = "COUNTERPARTY",
+    ) -> None:
+        self.client_names = _expand_case_variants(_normalize_names(client_names))
+        self.counterparty_names = _expand_case_variants(_normalize_names(counterparty_names))
+        self.client_placeholder = f'[{client_role}]'
+        self.counterparty_placeholder = f'[{counterparty_role}]'
+        
+        # Name -> placeholder; the client wins if a name appears on both sides
+        self._placeholders: dict[str, str] = {}
+        for name in self.client_names:
+            self._placeholders.setdefault(name, self.client_placeholder)
+        for name in self.counterparty_names:
+            self._placeholders.setdefault(name, self.counterparty_placeholder)
+        
+        # Python's alternation is ordered, so listing longer names first makes
+        # "Didimo Inc" win over "Didimo" at the same position (stable sort keeps
+        # client names ahead of counterparty names of equal length).
+        ordered = sorted(self._placeholders, key=len, reverse=True)
+        
+        self._names_re: re.Pattern[str] | None = None
+        self._or_re: re.Pattern[str] | None = None
+        if ordered:
+            self._names_re = re.compile('|'.join(_name_pattern(name) for name in ordered))
+            alternation = '|'.join(re.escape(name) for name in ordered)
+            self._or_re = re.compile(
+                rf'\(\s*{_QUOTES}(?P<first>{alternation}){_QUOTES}'
+                rf'\s+or\s+{_QUOTES}(?P<second>{alternation}){_QUOTES}\s*\)'
+            )
+    
+    @classmethod
+    def from_party_info(cls, party_info: "PartyInfo") -> "Anonymizer":
+        """Build an anonymizer for all names and role placeholders of ``party_info``."""
+        return cls(
+            party_info.all_client_names,
+            party_info.all_counterparty_names,
+            party_info.client_placeholder.strip("[]"),
+            party_info.counterparty_placeholder.strip("[]"),
+        )
+    
+    def __bool__(self) -> bool:
+        return self._names_re is not None
+    
+    def _collapse_or(self, match: re.Match[str]) -> str:
+        """Collapse ("X" or "Y") to one placeholder when X and Y are distinct names of one party."""
+        first, second = match.group('first'), match.group('second')
+        if first != second:
+            if first in self.client_names and second in self.client_names:
+                return f'("{self.client_placeholder}")'
+            if first in self.counterparty_names and second in self.counterparty_names:
+                return f'("{self.counterparty_placeholder}")'
+        return match.group(0)
+    
+    def _replace_name(self, match: re.Match[str]) -> str:
+        return self._placeholders[match.group(0)]
+    
+    def anonymize(self, text: str) -> str:
+        """Replace party names in ``text`` with role placeholders."""
+        if not text or self._names_re is None:
+            return text
+        text = self._or_re.sub(self._collapse_or, text)
+        return self._names_re.sub(self._replace_name, text)
+    
+    __call__ = anonymize
+    
+    def anonymize_many(self, texts: Iterable[str]) -> list[str]:
+        """Anonymize a sequence of texts (e.g. every paragraph of a document)."""
+        return [self.anonymize(text) for text in texts]
+
+
+@lru_cache(maxsize=32)
+def _cached_anonymizer(
+    client_names: tuple[str, ...],
+    counterparty_names: tuple[str, ...],
+    client_role: str,
+    counterparty_role: str,
+) -> Anonymizer:
+    return Anonymizer(client_names, counterparty_names, client_role, counterparty_role)
+
+
 def anonymize_text(
     text: str,
     client_names: str | list[str],
@@ -54,6 +199,9 @@ def anonymize_text(
     
     This prevents replacing "a Delaware limited liability company" incorrectly.
     
+    The compiled :class:`Anonymizer` is cached per name set, so repeated calls
+    with the same parties do not recompile any patterns.
+    
     Args:
         text: Text to anonymize
         client_names: Client name(s) to replace (single string or list of variations)
@@ -66,78 +214,13 @@ def anonymize_text(
     """
     if not text:
         return text
-    
-    # Normalize to lists
-    if isinstance(client_names, str):
-        client_names = [client_names] if client_names else []
-    if isinstance(counterparty_names, str):
-        counterparty_names = [counterparty_names] if counterparty_names else []
-    
-    def expand_case_variants(names: list[str]) -> list[str]:
-        """Add ALLCAPS variants for each name (defined terms often appear in ALLCAPS headings)."""
-        expanded = []
-        for name in names:
-            if name:
-                expanded.append(name)
-                # Add ALLCAPS variant if not already present
-                upper = name.upper()
-                if upper != name and upper not in expanded:
-                    expanded.append(upper)
-        return expanded
-    
-    # Expand to include ALLCAPS variants
-    client_names = expand_case_variants(client_names)
-    counterparty_names = expand_case_variants(counterparty_names)
-    
-    # Quote characters: straight quotes and curly quotes
-    quotes = r'["\'\u201C\u201D]'
-    
-    # First, handle ("X" or "Y") patterns where both names belong to the same party
-    # This prevents them from becoming ("[PLACEHOLDER]" or "[PLACEHOLDER]")
-    def collapse_or_pattern(names: list[str], placeholder: str) -> None:
-        nonlocal text
-        # Generate all pairs of names from the list
-        for i, name1 in enumerate(names):
-            for name2 in names[i+1:]:
-                if name1 and name2:
-                    # Match ("Name1" or "Name2") or ("Name2" or "Name1") - case sensitive
-                    for n1, n2 in [(name1, name2), (name2, name1)]:
-                        pattern = rf'\(\s*{quotes}{re.escape(n1)}{quotes}\s+or\s+{quotes}{re.escape(n2)}{quotes}\s*\)'
-                        text = re.sub(pattern, f'("{placeholder}")', text)
-    
-    collapse_or_pattern(client_names, f'[{client_role}]')
-    collapse_or_pattern(counterparty_names, f'[{counterparty_role}]')
-    
-    def make_replacement_pattern(name: str) -> str:
-        """Create regex pattern for name replacement.
-        
-        Uses word boundaries for names ending in word characters,
-        but uses lookahead for names ending in punctuation (like 'Inc.')
-        """
-        escaped = re.escape(name)
-        # Names ending in word characters use normal word boundary
-        if re.match(r'\w', name[-1]) if name else False:
-            return rf'\b{escaped}\b'
-        else:
-            # Names ending in non-word chars (like period) - use lookahead
-            # Match start word boundary but end with lookahead for space/punctuation/end
-            return rf'\b{escaped}(?=\s|["\'\(\)]|$)'
-    
-    # Replace client names (CASE-SENSITIVE)
-    # Process longer names first to avoid partial replacements
-    # Case-sensitive ensures "Company" is replaced but "company" is not
-    for name in sorted(client_names, key=len, reverse=True):
-        if name:
-            pattern = make_replacement_pattern(name)
-            text = re.sub(pattern, f'[{client_role}]', text)
-    
-    # Replace counterparty names (CASE-SENSITIVE)
-    for name in sorted(counterparty_names, key=len, reverse=True):
-        if name:
-            pattern = make_replacement_pattern(name)
-            text = re.sub(pattern, f'[{counterparty_role}]', text)
-    
-    return text
+    anonymizer = _cached_anonymizer(
+        tuple(_normalize_names(client_names)),
+        tuple(_normalize_names(counterparty_names)),
+        client_role,
+        counterparty_role,
+    )
+    return anonymizer.anonymize(text)
 
 
 def generate_yaml_header(
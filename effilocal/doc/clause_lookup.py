@@ -227,7 +227,7 @@ class ClauseLookup:
         }
     
     @classmethod
-    def from_docx_bytes(cls, docx_bytes: bytes) -> "ClauseLookup":
+    def from_docx_bytes(cls, docx_bytes: bytes, cache_dir: Path | None = None) -> "ClauseLookup":
         """
         Create ClauseLookup from raw docx bytes.
         
@@ -237,6 +237,9 @@ class ClauseLookup:
         
         Args:
             docx_bytes: Raw bytes of a .docx document
+            cache_dir: Optional analysis cache directory. When given, the
+                analysis is stored there keyed by content hash and reused
+                for identical documents.
             
         Returns:
             ClauseLookup instance with blocks from the analyzed document
@@ -249,8 +252,10 @@ class ClauseLookup:
             raise TypeError("docx_bytes cannot be None")
         
         # Import here to avoid circular import
-        from scripts.docx_to_llm_markdown import run_analyze_doc
-        from effilocal.doc.uuid_embedding import generate_para_id
+        from scripts.docx_to_llm_markdown import run_analyze_doc, run_analyze_doc_cached
+        
+        if cache_dir is not None:
+            return cls.from_analysis_dir(run_analyze_doc_cached(docx_bytes, cache_dir))
         
         # Write bytes to temp file for analyze_doc
         with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as tmp:
@@ -264,35 +269,51 @@ class ClauseLookup:
             try:
                 # Run analyze_doc to extract blocks with numbering
                 run_analyze_doc(tmp_path, analysis_dir)
-                
-                # Load blocks from generated file
-                blocks_file = analysis_dir / "blocks.jsonl"
-                if not blocks_file.exists():
-                    # Return empty lookup if no blocks generated
-                    return cls([])
-                
-                # Load blocks and ensure all have para_ids
-                blocks = cls._load_jsonl(blocks_file)
-                existing_ids: set[str] = set()
-                
-                # Collect existing para_ids
-                for block in blocks:
-                    pid = block.get("para_id")
-                    if pid:
-                        existing_ids.add(pid.upper())
-                
-                # Generate para_ids for blocks that don't have them
-                for block in blocks:
-                    if not block.get("para_id"):
-                        new_id = generate_para_id(existing_ids)
-                        block["para_id"] = new_id
-                        existing_ids.add(new_id.upper())
-                
-                return cls(blocks)
+                return cls.from_analysis_dir(analysis_dir)
             finally:
                 # Clean up temp docx file
                 tmp_path.unlink(missing_ok=True)
     
+    @classmethod
+    def from_analysis_dir(cls, analysis_dir: Path) -> "ClauseLookup":
+        """
+        Create ClauseLookup from existing analysis artifacts.
+        
+        Blocks without a native para_id get a synthetic one.
+        
+        Args:
+            analysis_dir: Directory containing blocks.jsonl
+            
+        Returns:
+            ClauseLookup instance (empty if no blocks were generated)
+        """
+        from effilocal.doc.uuid_embedding import generate_para_id
+        
+        # Load blocks from generated file
+        blocks_file = Path(analysis_dir) / "blocks.jsonl"
+        if not blocks_file.exists():
+            # Return empty lookup if no blocks generated
+            return cls([])
+        
+        # Load blocks and ensure all have para_ids
+        blocks = cls._load_jsonl(blocks_file)
+        existing_ids: set[str] = set()
+        
+        # Collect existing para_ids
+        for block in blocks:
+            pid = block.get("para_id")
+            if pid:
+                existing_ids.add(pid.upper())
+        
+        # Generate para_ids for blocks that don't have them
+        for block in blocks:
+            if not block.get("para_id"):
+                new_id = generate_para_id(existing_ids)
+                block["para_id"] = new_id
+                existing_ids.add(new_id.upper())
+        
+        return cls(blocks)
+    
     def to_ordinal_map(self) -> dict[str, str]:
         """
         Convert lookup to para_id -> clause_number mapping.
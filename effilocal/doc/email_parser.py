@@ -15,18 +15,24 @@ Typical usage:
     print(email.subject)
     print(email.body)
     
-    # Get docx attachments
+    # Get docx attachments (data is read from the MSG only when opened)
     for attachment in email.docx_attachments:
-        print(attachment.filename)
-        doc = Document(BytesIO(attachment.data))
+        print(attachment.filename, attachment.size)
+        doc = Document(attachment.open())
+    
+    # Keep the MSG open while reading several attachments
+    with MsgParser("path/to/email.msg") as parser:
+        email = parser.parse_message()
+        data = email.docx_attachments[0].data
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import Iterator
+from typing import BinaryIO, Callable, Iterator
 
 import extract_msg
 import olefile
@@ -37,18 +43,84 @@ import olefile
 # =============================================================================
 
 
-@dataclass
 class Attachment:
     """
-    Represents an email attachment with filename and binary data.
+    Represents an email attachment with filename and (lazily read) binary data.
+    
+    Attachments listed by :class:`MsgParser` only know their name and size
+    until the data is requested; the stream is then read from the MSG file
+    once and cached. Attachments built directly from bytes behave as before.
     
     Attributes:
         filename: The attachment filename
-        data: Raw binary data of the attachment
+        data: Raw binary data of the attachment (read on first access)
+        size: Size in bytes, known without reading the data
     """
     
-    filename: str
-    data: bytes
+    __slots__ = ("filename", "_data", "_size", "_source")
+    
+    def __init__(
+        self,
+        filename: str,
+        data: bytes | None = None,
+        *,
+        size: int | None = None,
+        source: Callable[[], BinaryIO] | None = None,
+    ) -> None:
+        """
+        Args:
+            filename: The attachment filename
+            data: Binary data, when already in memory
+            size: Size in bytes (defaults to ``len(data)``)
+            source: Callable returning a file-like object with the data,
+                used on first access when ``data`` is not given
+        """
+        self.filename = filename
+        self._data = data
+        self._size = size
+        self._source = source
+    
+    def __repr__(self) -> str:
+        return f"Attachment(filename={self.filename!r}, size={self.size})"
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Attachment):
+            return NotImplemented
+        return self.filename == other.filename and self.data == other.data
+    
+    __hash__ = None  # type: ignore[assignment]
+    
+    @property
+    def data(self) -> bytes:
+        """Return the attachment bytes, reading them from the source once."""
+        if self._data is None:
+            if self._source is None:
+                self._data = b""
+            else:
+                stream = self._source()
+                try:
+                    # olefile streams are BytesIO subclasses: getvalue() shares the buffer
+                    self._data = stream.getvalue() if isinstance(stream, BytesIO) else stream.read()
+                finally:
+                    stream.close()
+        return self._data
+    
+    @property
+    def size(self) -> int:
+        """Return the size in bytes without reading the data when possible."""
+        if self._size is None:
+            self._size = len(self.data)
+        return self._size
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Return True once the data is held in memory."""
+        return self._data is not None
+    
+    def release(self) -> None:
+        """Drop cached data so it is re-read from the source on next access."""
+        if self._source is not None:
+            self._data = None
     
     @property
     def is_docx(self) -> bool:
@@ -67,6 +139,10 @@ class Attachment:
             return "." + self.filename.rsplit(".", 1)[-1].lower()
         return ""
     
+    def open(self) -> BinaryIO:
+        """Return a file-like object over the data (no copy of the cached bytes)."""
+        return BytesIO(self.data)
+    
     def to_bytes_io(self) -> BytesIO:
         """Return attachment data as a BytesIO object for reading."""
         return BytesIO(self.data)
@@ -151,14 +227,21 @@ class MsgParser:
     
     Uses extract_msg for metadata extraction and olefile for reliable
     attachment parsing, since extract_msg fails on some non-standard
-    MSG files with unusual attachment properties.
+    MSG files with unusual attachment properties. Both read from a single
+    open file handle.
+    
+    Attachments are listed from the OLE directory (name and size only);
+    their data is read when first requested. While the parser is open the
+    reads use the existing handle; after :meth:`close` the file is reopened
+    on demand.
     
     Usage:
         email = MsgParser.parse("email.msg")
         
-        # Or create an instance for multiple operations
-        parser = MsgParser("email.msg")
-        email = parser.parse_message()
+        # Or keep the file open for multiple operations
+        with MsgParser("email.msg") as parser:
+            email = parser.parse_message()
+            data = email.docx_attachments[0].data
     """
     
     # OLE property IDs for attachment data
@@ -170,6 +253,8 @@ class MsgParser:
     PROP_UTF16 = "001F"  # UTF-16LE encoded
     PROP_ANSI = "001E"   # ANSI/Latin-1 encoded
     
+    ATTACHMENT_PREFIX = "__attach_version1.0_"
+    
     def __init__(self, msg_path: str | Path) -> None:
         """
         Initialize parser with path to MSG file.
@@ -183,13 +268,49 @@ class MsgParser:
         self.path = Path(msg_path)
         if not self.path.exists():
             raise FileNotFoundError(f"MSG file not found: {self.path}")
+        self._handle: BinaryIO | None = None
+        self._ole: olefile.OleFileIO | None = None
+    
+    def __enter__(self) -> "MsgParser":
+        self.open()
+        return self
+    
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+    
+    @property
+    def is_open(self) -> bool:
+        """Return True while the MSG file handle is open."""
+        return self._handle is not None
+    
+    def open(self) -> "MsgParser":
+        """Open the MSG file (no-op when already open) and return ``self``."""
+        if self._handle is None:
+            handle = self.path.open("rb")
+            try:
+                self._ole = olefile.OleFileIO(handle)
+            except Exception:
+                handle.close()
+                raise
+            self._handle = handle
+        return self
+    
+    def close(self) -> None:
+        """Close the MSG file; unread attachments reopen it on demand."""
+        if self._ole is not None:
+            self._ole.close()
+            self._ole = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
     
     @classmethod
     def parse(cls, msg_path: str | Path) -> EmailMessage:
         """
         Parse an MSG file and return an EmailMessage.
         
-        This is a convenience class method for one-off parsing.
+        This is a convenience class method for one-off parsing. The file is
+        closed on return; attachment data is read when first accessed.
         
         Args:
             msg_path: Path to the .msg file
@@ -200,27 +321,35 @@ class MsgParser:
         Raises:
             FileNotFoundError: If the MSG file doesn't exist
         """
-        parser = cls(msg_path)
-        return parser.parse_message()
+        with cls(msg_path) as parser:
+            return parser.parse_message()
     
     def parse_message(self) -> EmailMessage:
         """
         Parse the MSG file and return an EmailMessage.
         
+        Opens the file if needed and leaves it open; call :meth:`close`
+        (or use the parser as a context manager) when done.
+        
         Returns:
             EmailMessage with parsed content
         """
-        # Extract metadata using extract_msg (with delayed attachments to avoid errors)
-        msg = extract_msg.openMsg(str(self.path), delayAttachments=True)
+        self.open()
         
-        subject = msg.subject or ""
-        sender = msg.sender or ""
-        recipients = msg.to or ""
-        date = str(msg.date) if msg.date else ""
-        body = msg.body or ""
+        # Extract metadata using extract_msg (with delayed attachments to avoid errors).
+        # extract_msg reads from our handle and leaves it open when closed.
+        msg = extract_msg.openMsg(self._handle, delayAttachments=True)
+        try:
+            subject = msg.subject or ""
+            sender = msg.sender or ""
+            recipients = msg.to or ""
+            date = str(msg.date) if msg.date else ""
+            body = msg.body or ""
+        finally:
+            msg.close()
         
-        # Extract attachments using olefile directly (more reliable)
-        attachments = self._extract_attachments()
+        # List attachments using olefile directly (more reliable)
+        attachments = self._list_attachments()
         
         return EmailMessage(
             subject=subject,
@@ -231,40 +360,45 @@ class MsgParser:
             attachments=attachments
         )
     
-    def _extract_attachments(self) -> list[Attachment]:
+    def _list_attachments(self) -> list[Attachment]:
         """
-        Extract attachments from MSG file using olefile.
+        List attachments from the OLE directory without reading their data.
         
         This bypasses extract_msg's attachment parsing which fails on some
-        MSG files with non-standard attachment properties.
+        MSG files with non-standard attachment properties. Attachments
+        without a filename or with empty data are skipped.
         
         Returns:
-            List of Attachment objects
+            List of lazily loaded Attachment objects
         """
-        ole = olefile.OleFileIO(str(self.path))
+        ole = self.open()._ole
         attachments = []
         
-        try:
-            # Find all attachment directories
-            attach_dirs = self._find_attachment_dirs(ole)
-            
-            for attach_dir in sorted(attach_dirs):
-                filename = self._get_attachment_filename(ole, attach_dir)
-                data = self._get_attachment_data(ole, attach_dir)
-                
-                if filename and data:
-                    attachments.append(Attachment(filename=filename, data=data))
-        finally:
-            ole.close()
+        for attach_dir in sorted(self._find_attachment_dirs(ole)):
+            filename = self._get_attachment_filename(ole, attach_dir)
+            data_path = f"{attach_dir}/__substg1.0_{self.PROP_ATTACHMENT_DATA}"
+            if not filename or ole.get_type(data_path) != olefile.STGTY_STREAM:
+                continue
+            size = ole.get_size(data_path)
+            if size:
+                attachments.append(
+                    Attachment(filename, size=size, source=partial(self._open_stream, data_path))
+                )
         
         return attachments
     
+    def _open_stream(self, stream_path: str) -> BinaryIO:
+        """Open an OLE stream, reopening the MSG file if it was closed."""
+        if self._ole is not None:
+            return self._ole.openstream(stream_path)
+        with self:
+            return self._ole.openstream(stream_path)
+    
     def _find_attachment_dirs(self, ole: olefile.OleFileIO) -> set[str]:
         """Find all attachment directory names in the OLE structure."""
         attach_dirs: set[str] = set()
         for stream in ole.listdir():
-            stream_path = "/".join(stream)
-            if stream_path.startswith("__attach_version1.0_"):
+            if stream[0].startswith(self.ATTACHMENT_PREFIX):
                 attach_dirs.add(stream[0])
         return attach_dirs
     
@@ -298,23 +432,6 @@ class MsgParser:
                     continue
         
         return None
-    
-    def _get_attachment_data(self, ole: olefile.OleFileIO, attach_dir: str) -> bytes | None:
-        """
-        Get attachment binary data from MSG OLE stream.
-        
-        Args:
-            ole: Open OleFileIO object
-            attach_dir: Attachment directory name
-            
-        Returns:
-            Binary data, or None if not found
-        """
-        try:
-            stream_path = f"{attach_dir}/__substg1.0_{self.PROP_ATTACHMENT_DATA}"
-            return ole.openstream(stream_path).read()
-        except Exception:
-            return None
 
 
 # =============================================================================
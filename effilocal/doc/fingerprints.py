@@ -0,0 +1,215 @@
+"""Compact per-block fingerprints for comparing analyses across versions.
+
+``analyze()`` writes ``fingerprints.json`` next to ``blocks.jsonl``. It holds,
+for every block, just enough to tell whether the block still exists and
+whether its text changed: the block id, its para_id, a truncated content hash
+and the clause number it belongs to. Because the file is committed with the
+other analysis artifacts, per-clause change timelines can be computed from git
+history without re-reading any ``.docx`` (see
+:mod:`effilocal.flows.history_diff`).
+
+The block delta used here is the same one recorded in ``analysis_delta.json``:
+blocks are matched by id (falling back to para_id), and a matched block is
+"modified" when its content hash differs.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+__all__ = [
+    "FINGERPRINTS_FILENAME",
+    "BlockDelta",
+    "BlockFingerprint",
+    "build_fingerprints",
+    "clause_matches",
+    "diff_blocks",
+    "diff_fingerprints",
+    "load_fingerprints",
+]
+
+FINGERPRINTS_FILENAME = "fingerprints.json"
+FINGERPRINTS_VERSION = 1
+
+# Row layout of ``fingerprints.json`` ("fields" records it for readers).
+_FIELDS = ("id", "para_id", "hash", "clause", "attachment_id")
+
+# Hex digits of the sha256 content hash kept per block (64 bits).
+_HASH_PREFIX_LEN = 16
+_HASH_SCHEME = "sha256:"
+
+_CLAUSE_NUMBER = re.compile(r"^\d+(?:\.\d+)*$")
+
+
+@dataclass(frozen=True, slots=True)
+class BlockFingerprint:
+    """Identity, content hash and clause membership of one block."""
+
+    id: str
+    para_id: str | None
+    hash: str
+    clause: str | None
+    attachment_id: str | None = None
+
+
+@dataclass(slots=True)
+class BlockDelta:
+    """Block ids added, removed and modified between two versions."""
+
+    new_blocks: list[str] = field(default_factory=list)
+    deleted_blocks: list[str] = field(default_factory=list)
+    modified_blocks: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.new_blocks or self.deleted_blocks or self.modified_blocks)
+
+    def to_dict(self) -> dict[str, list[str]]:
+        """Convert to the field layout used by ``analysis_delta.json``."""
+        return {
+            "new_blocks": list(self.new_blocks),
+            "deleted_blocks": list(self.deleted_blocks),
+            "modified_blocks": list(self.modified_blocks),
+        }
+
+
+def _short_hash(content_hash: str | None) -> str:
+    if not content_hash:
+        return ""
+    digest = content_hash[len(_HASH_SCHEME):] if content_hash.startswith(_HASH_SCHEME) else content_hash
+    return digest[:_HASH_PREFIX_LEN]
+
+
+def _clause_number(block: Mapping[str, Any]) -> str | None:
+    """Return the block's own clause number (e.g. ``"12.3"``) if it has one."""
+    list_info = block.get("list") or {}
+    ordinal = str(list_info.get("ordinal") or "").strip().rstrip(".")
+    return ordinal if _CLAUSE_NUMBER.match(ordinal) else None
+
+
+def build_fingerprints(blocks: Iterable[Mapping[str, Any]], doc_id: str | None = None) -> dict[str, Any]:
+    """Build the ``fingerprints.json`` payload for analyzed blocks.
+
+    Each block is assigned the most recent dotted clause number seen in
+    document order, so sub-paragraphs such as ``(a)`` and unnumbered
+    continuations belong to the clause above them. The running number resets
+    at attachment boundaries (schedules restart their numbering).
+
+    Args:
+        blocks: Blocks in document order (as written to ``blocks.jsonl``).
+        doc_id: Document id recorded in the payload.
+
+    Returns:
+        JSON-serialisable payload with one row per block.
+    """
+    rows: list[list[str | None]] = []
+    current_clause: str | None = None
+    current_attachment: str | None = None
+    for block in blocks:
+        attachment_id = block.get("attachment_id")
+        if attachment_id != current_attachment:
+            current_attachment = attachment_id
+            current_clause = None
+        current_clause = _clause_number(block) or current_clause
+        rows.append(
+            [
+                block.get("id"),
+                block.get("para_id"),
+                _short_hash(block.get("content_hash")),
+                current_clause,
+                attachment_id,
+            ]
+        )
+    return {
+        "v": FINGERPRINTS_VERSION,
+        "doc_id": doc_id,
+        "fields": list(_FIELDS),
+        "blocks": rows,
+    }
+
+
+def load_fingerprints(payload: Mapping[str, Any]) -> list[BlockFingerprint]:
+    """Decode a ``fingerprints.json`` payload into fingerprint records."""
+    fields = payload.get("fields") or list(_FIELDS)
+    positions = {name: fields.index(name) for name in _FIELDS if name in fields}
+
+    def value(row: list[Any], name: str) -> Any:
+        pos = positions.get(name)
+        return row[pos] if pos is not None and pos < len(row) else None
+
+    return [
+        BlockFingerprint(
+            id=value(row, "id"),
+            para_id=value(row, "para_id"),
+            hash=value(row, "hash") or "",
+            clause=value(row, "clause"),
+            attachment_id=value(row, "attachment_id"),
+        )
+        for row in payload.get("blocks", [])
+    ]
+
+
+def clause_matches(clause: str | None, query: str) -> bool:
+    """Return True if ``clause`` is ``query`` or one of its sub-clauses."""
+    if clause is None:
+        return False
+    query = query.strip().rstrip(".")
+    return clause == query or clause.startswith(query + ".")
+
+
+def diff_fingerprints(
+    old: Iterable[BlockFingerprint],
+    new: Iterable[BlockFingerprint],
+) -> BlockDelta:
+    """Compute the block delta between two fingerprint sets.
+
+    Blocks are matched by id first and by para_id for blocks whose id changed.
+    """
+    old_list = list(old)
+    new_list = list(new)
+    old_by_id = {fp.id: fp for fp in old_list}
+    old_by_para = {fp.para_id: fp for fp in old_list if fp.para_id}
+
+    delta = BlockDelta()
+    matched_old: set[str] = set()
+    for fp in new_list:
+        previous = old_by_id.get(fp.id)
+        if previous is None and fp.para_id:
+            previous = old_by_para.get(fp.para_id)
+        if previous is None or previous.id in matched_old:
+            delta.new_blocks.append(fp.id)
+            continue
+        matched_old.add(previous.id)
+        if previous.hash != fp.hash:
+            delta.modified_blocks.append(fp.id)
+
+    delta.deleted_blocks = [fp.id for fp in old_list if fp.id not in matched_old]
+    return delta
+
+
+def diff_blocks(
+    old_blocks: Iterable[Mapping[str, Any]],
+    new_blocks: Iterable[Mapping[str, Any]],
+) -> BlockDelta:
+    """Compute the ``analysis_delta.json`` block lists for two analyses.
+
+    Blocks are matched on their (already reconciled) ids; a matched block is
+    modified when its ``content_hash`` differs.
+    """
+    old_list = list(old_blocks)
+    new_list = list(new_blocks)
+    old_by_id = {b.get("id"): b for b in old_list}
+    new_ids = {b.get("id") for b in new_list}
+
+    delta = BlockDelta()
+    for block in new_list:
+        block_id = block.get("id")
+        previous = old_by_id.get(block_id)
+        if previous is None:
+            delta.new_blocks.append(block_id)
+        elif previous.get("content_hash", "") != block.get("content_hash", ""):
+            delta.modified_blocks.append(block_id)
+    delta.deleted_blocks = [b.get("id") for b in old_list if b.get("id") not in new_ids]
+    return delta
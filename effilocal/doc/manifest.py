@@ -61,5 +61,19 @@ def build_manifest(
     return manifest
 
 
+def manifest_version(manifest: Mapping[str, Any]) -> str | None:
+    """Return the version token of an analysis from its manifest payload.
+
+    ``created_at`` has one-second resolution, so the ``blocks.jsonl``
+    checksum is appended to tell apart analyses made within the same second.
+    """
+
+    created_at = manifest.get("created_at")
+    blocks_checksum = (manifest.get("checksums") or {}).get("blocks.jsonl")
+    if created_at is None or not blocks_checksum:
+        return created_at
+    return f"{created_at}#{blocks_checksum.removeprefix('sha256:')[:16]}"
+
+
 def _utc_timestamp() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
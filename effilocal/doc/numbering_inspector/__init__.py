@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable
+from typing import Iterator
 
 from lxml import etree
 
@@ -13,9 +13,11 @@ from .model import (
     ParagraphData,
     build_numbering_maps,
     build_paragraphs,
+    iter_paragraphs,
     normalize_glyphs,
+    paragraph_data,
 )
-from .parser import parse_docx_parts
+from .parser import parse_document_part, parse_docx_parts, parse_numbering_parts
 from .renderer import NumberingSession, walk_paragraphs
 
 __all__ = [
@@ -24,8 +26,12 @@ __all__ = [
     "ParagraphData",
     "build_numbering_maps",
     "build_paragraphs",
+    "iter_paragraphs",
     "normalize_glyphs",
+    "paragraph_data",
+    "parse_document_part",
     "parse_docx_parts",
+    "parse_numbering_parts",
     "NumberingSession",
     "walk_paragraphs",
 ]
@@ -37,12 +43,14 @@ class NumberingInspector:
     def __init__(
         self,
         *,
-        doc_tree: etree._ElementTree,
+        doc_tree: etree._ElementTree | None,
         num_tree: etree._ElementTree | None,
         styles_tree: etree._ElementTree,
         enable_logging: bool | None = None,
+        docx_path: Path | None = None,
     ) -> None:
-        self._doc_tree = doc_tree
+        self._doc_tree = doc_tree  # Parsed on first use when only docx_path is known
+        self._docx_path = docx_path
         self._num_tree = num_tree  # May be None if document has no numbering.xml
         self._styles_tree = styles_tree
         self._nums = None
@@ -54,8 +62,23 @@ class NumberingInspector:
 
     @classmethod
     def from_docx(cls, docx_path: Path) -> "NumberingInspector":
-        doc_tree, num_tree, styles_tree = parse_docx_parts(docx_path)
-        return cls(doc_tree=doc_tree, num_tree=num_tree, styles_tree=styles_tree)
+        """Load numbering and style definitions; ``document.xml`` is parsed lazily.
+
+        The analysis pipeline feeds paragraphs it already visits through
+        :meth:`process_paragraph`, so it never pays for a second parse of the
+        document body. :meth:`analyze` and :meth:`paragraphs` parse it on demand.
+        """
+        docx_path = Path(docx_path)
+        num_tree, styles_tree = parse_numbering_parts(docx_path)
+        return cls(doc_tree=None, num_tree=num_tree, styles_tree=styles_tree, docx_path=docx_path)
+
+    @property
+    def doc_tree(self) -> etree._ElementTree:
+        if self._doc_tree is None:
+            if self._docx_path is None:
+                raise ValueError("NumberingInspector has no document tree or docx path")
+            self._doc_tree = parse_document_part(self._docx_path)
+        return self._doc_tree
 
     def ensure_models(self) -> None:
         if self._nums is None or self._abstracts is None or self._style_numpr is None:
@@ -66,8 +89,13 @@ class NumberingInspector:
             self._abstracts = abstracts
             self._style_numpr = style_numpr
 
-    def paragraphs(self) -> Iterable[ParagraphData]:
-        return build_paragraphs(self._doc_tree)
+    def paragraphs(self, source=None) -> Iterator[ParagraphData]:
+        """Yield paragraph data lazily in document order.
+
+        ``source`` may be any tree, element or iterable of ``w:p`` elements
+        accepted by :func:`iter_paragraphs`; defaults to this document's body.
+        """
+        return iter_paragraphs(self.doc_tree if source is None else source)
 
     def create_session(self, *, debug: bool = False, logging_enabled: bool | None = None) -> NumberingSession:
         """Return a session suitable for incremental paragraph processing."""
@@ -100,12 +128,16 @@ class NumberingInspector:
             self._session_debug = debug
         return self._session.process_paragraph(para)
 
-    def analyze(self, debug: bool = False, *, logging_enabled: bool | None = None):
-        """Return (rows, debug_rows) for all document paragraphs."""
+    def analyze(self, debug: bool = False, *, logging_enabled: bool | None = None, source=None):
+        """Return (rows, debug_rows) for all document paragraphs.
+
+        Paragraphs are fed to the session one at a time as they are read from
+        ``source`` (see :meth:`paragraphs`).
+        """
         rows = []
         debug_rows = []
         session = self.create_session(debug=debug, logging_enabled=logging_enabled)
-        for para in build_paragraphs(self._doc_tree):
+        for para in self.paragraphs(source):
             result = session.process_paragraph(para)
             rows.append(result.row)
             if debug and result.debug_row:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 from lxml import etree
 
@@ -10,6 +10,19 @@ NS = {
     "w14": "http://schemas.microsoft.com/office/word/2010/wordml",
 }
 
+_W = "{%s}" % NS["w"]
+W_BODY = f"{_W}body"
+W_P = f"{_W}p"
+W_T = f"{_W}t"
+W_PPR = f"{_W}pPr"
+W_PSTYLE = f"{_W}pStyle"
+W_NUMPR = f"{_W}numPr"
+W_ILVL = f"{_W}ilvl"
+W_NUMID = f"{_W}numId"
+W_NUMRESTART = f"{_W}numRestart"
+W_VAL = f"{_W}val"
+W14_PARA_ID = "{%s}paraId" % NS["w14"]
+
 BULLET_PRIVATE_USE = "\uf0b7"
 BULLET_REPLACEMENT = "\u2022"
 
@@ -86,46 +99,76 @@ def build_numbering_maps(num_tree, styles_tree):
 
 def build_paragraphs(doc_tree) -> list[ParagraphData]:
     """Return structured paragraph data for every paragraph in the document body."""
-    paragraphs: list[ParagraphData] = []
-    for idx, para_node in enumerate(doc_tree.xpath("//w:body//w:p", namespaces=NS)):
-        para_id = (para_node.xpath("./@w14:paraId", namespaces=NS) or [""])[0]
-        style_id = para_style(para_node) or ""
-        text = para_text(para_node)
-        paragraphs.append(
-            ParagraphData(
-                idx=idx,
-                para_id=para_id,
-                style_id=style_id,
-                text=text,
-                direct_numpr=para_numpr(para_node),
-            )
-        )
-    return paragraphs
+    return list(iter_paragraphs(doc_tree))
+
+
+def iter_paragraphs(source) -> Iterator[ParagraphData]:
+    """Yield paragraph data lazily, in document order, for every ``w:p`` under the body.
+
+    ``source`` may be a parsed ``document.xml`` tree, its root, the ``w:body``
+    element, or any iterable of ``w:p`` elements (for example the paragraphs a
+    caller is already visiting), so the same lxml nodes can feed both the
+    caller and :class:`NumberingSession` without a second parse.
+    """
+    for idx, para_node in enumerate(_paragraph_elements(source)):
+        yield paragraph_data(para_node, idx)
+
+
+def _paragraph_elements(source) -> Iterable[etree._Element]:
+    if isinstance(source, etree._ElementTree):
+        source = source.getroot()
+    if not isinstance(source, etree._Element):
+        return source
+    if source.tag != W_BODY:
+        body = source.find(W_BODY)
+        if body is None:
+            return ()
+        source = body
+    return source.iter(W_P)
+
+
+def paragraph_data(para_node, idx: int) -> ParagraphData:
+    """Build :class:`ParagraphData` for one ``w:p`` element using direct child lookups."""
+    return ParagraphData(
+        idx=idx,
+        para_id=para_node.get(W14_PARA_ID, ""),
+        style_id=para_style(para_node) or "",
+        text=para_text(para_node),
+        direct_numpr=para_numpr(para_node),
+    )
 
 
 def para_text(p):
-    return normalize_glyphs("".join(p.xpath(".//w:t/text()", namespaces=NS)).strip())
+    return normalize_glyphs("".join(t.text for t in p.iter(W_T) if t.text).strip())
 
 
 def para_style(p):
-    s = p.xpath("./w:pPr/w:pStyle/@w:val", namespaces=NS)
-    return s[0] if s else None
+    p_pr = p.find(W_PPR)
+    if p_pr is None:
+        return None
+    style = p_pr.find(W_PSTYLE)
+    return style.get(W_VAL) if style is not None else None
 
 
 def para_numpr(p):
-    npr = p.xpath("./w:pPr/w:numPr", namespaces=NS)
-    if not npr:
+    p_pr = p.find(W_PPR)
+    npr = p_pr.find(W_NUMPR) if p_pr is not None else None
+    if npr is None:
         return None
-    il = npr[0].xpath("./w:ilvl/@w:val", namespaces=NS)
-    ni = npr[0].xpath("./w:numId/@w:val", namespaces=NS)
-    nr = bool(npr[0].xpath("./w:numRestart", namespaces=NS))
+    il = _child_val(npr, W_ILVL)
+    ni = _child_val(npr, W_NUMID)
     return {
-        "numId": int(ni[0]) if ni else None,
-        "ilvl": int(il[0]) if il else 0,
-        "numRestart": nr,
+        "numId": int(ni) if ni is not None else None,
+        "ilvl": int(il) if il is not None else 0,
+        "numRestart": npr.find(W_NUMRESTART) is not None,
     }
 
 
+def _child_val(node, tag):
+    child = node.find(tag)
+    return child.get(W_VAL) if child is not None else None
+
+
 def _extract_number_definitions(num_tree):
     nums = {}
     for n in num_tree.xpath("//w:num", namespaces=NS):
@@ -5,9 +5,12 @@ import zipfile
 
 from lxml import etree
 
+DOCUMENT_PART = "word/document.xml"
+NUMBERING_PART = "word/numbering.xml"
+STYLES_PART = "word/styles.xml"
 
-def parse_docx_parts(docx_path: Path):
-    """Extract the WordprocessingML XML parts that drive numbering analysis."""
+
+def _load_parts(docx_path: Path, parts: tuple[tuple[str, bool], ...]):
     if not docx_path.exists():
         raise FileNotFoundError(f"{docx_path} does not exist")
 
@@ -23,9 +26,28 @@ def parse_docx_parts(docx_path: Path):
                 else:
                     return None
 
-        # numbering.xml is optional
-        return (
-            _load("word/document.xml"),
-            _load("word/numbering.xml", required=False),
-            _load("word/styles.xml"),
-        )
+        return tuple(_load(part, required) for part, required in parts)
+
+
+def parse_docx_parts(docx_path: Path):
+    """Extract the WordprocessingML XML parts that drive numbering analysis."""
+    # numbering.xml is optional
+    return _load_parts(
+        docx_path,
+        ((DOCUMENT_PART, True), (NUMBERING_PART, False), (STYLES_PART, True)),
+    )
+
+
+def parse_numbering_parts(docx_path: Path):
+    """Return ``(num_tree, styles_tree)`` without parsing ``document.xml``.
+
+    Callers that walk the document body themselves (such as the analysis
+    pipeline) only need the numbering definitions and style bindings.
+    """
+    return _load_parts(docx_path, ((NUMBERING_PART, False), (STYLES_PART, True)))
+
+
+def parse_document_part(docx_path: Path):
+    """Parse ``word/document.xml`` on its own."""
+    (doc_tree,) = _load_parts(docx_path, ((DOCUMENT_PART, True),))
+    return doc_tree
@@ -7,7 +7,7 @@ from .model import (
     BindingResult,
     NumberingResult,
     ParagraphData,
-    build_paragraphs,
+    iter_paragraphs,
     normalize_glyphs,
 )
 
@@ -452,7 +452,7 @@ def walk_paragraphs(doc, nums, abstracts, style_numpr, debug=False):
     session = NumberingSession(nums, abstracts, style_numpr, debug=debug)
     rows = []
     debug_rows = []
-    for para in build_paragraphs(doc):
+    for para in iter_paragraphs(doc):
         result = session.process_paragraph(para)
         rows.append(result.row)
         if debug and result.debug_row:
@@ -12,10 +12,19 @@ from docx.oxml.ns import qn
 
 from effilocal.doc.amended_paragraph import AmendedParagraph
 from effilocal.doc.blocks import ParagraphBlock
+from effilocal.doc.style_table import StyleTable
 
 
 _HEADING_RE = re.compile(r"heading\s*(\d)", re.IGNORECASE)
 
+# Clark-notation tags for direct child lookups (cheaper than per-paragraph xpath)
+_W_PPR = qn("w:pPr")
+_W_NUMPR = qn("w:numPr")
+_W_NUMID = qn("w:numId")
+_W_ILVL = qn("w:ilvl")
+_W_NUMRESTART = qn("w:numRestart")
+_W_VAL = qn("w:val")
+
 
 def has_page_break_before(paragraph: Paragraph) -> bool:
     """Check if paragraph has a page break before it.
@@ -118,6 +127,7 @@ def build_paragraph_block(
     hash_provider: Callable[[str], str],
     as_dataclass: bool = False,
     amended: Optional[AmendedParagraph] = None,
+    style_table: Optional[StyleTable] = None,
 ) -> tuple[dict[str, Any] | ParagraphBlock | None, str]:
     """Create the baseline block for ``paragraph`` and return the next section id.
     
@@ -129,6 +139,9 @@ def build_paragraph_block(
         amended: Optional AmendedParagraph wrapper for track changes support.
                  If provided, uses amended_text (visible text with insertions,
                  without deletions) instead of paragraph.text.
+        style_table: Optional resolved style table for the document. When
+                 provided, the style name, id and heading level are looked up
+                 there instead of resolving ``paragraph.style`` per call.
     """
     # Use amended_text if AmendedParagraph provided, otherwise fall back to standard text
     if amended is not None:
@@ -149,7 +162,7 @@ def build_paragraph_block(
     if not text and not has_deleted_content:
         return None, current_section_id
 
-    style_name = paragraph.style.name if paragraph.style is not None else ""
+    style_name, style_id = paragraph_style_info(paragraph, style_table)
     block_type, level = classify_paragraph(style_name)
 
     new_section_id = current_section_id
@@ -160,7 +173,6 @@ def build_paragraph_block(
     heading_meta = {"text": text, "source": "explicit"} if block_type == "heading" else None
 
     para_id = paragraph._p.get(qn("w14:paraId")) or ""
-    style_id = _style_id(paragraph)
     num_pr = _num_pr(paragraph)
     
     # Detect page breaks
@@ -213,6 +225,23 @@ def build_paragraph_block(
     return block, new_section_id
 
 
+def paragraph_style_info(
+    paragraph: Paragraph, style_table: Optional[StyleTable] = None
+) -> tuple[str, str]:
+    """Return ``(style name, style id)`` for ``paragraph``.
+
+    Uses ``style_table`` when given; otherwise resolves ``paragraph.style``
+    through python-docx. Both paths report the same values.
+    """
+    if style_table is not None:
+        style = style_table.paragraph_style(paragraph._p)
+        if style is None:
+            return "", ""
+        return style.name or "", style.style_id
+    style_name = paragraph.style.name if paragraph.style is not None else ""
+    return style_name or "", _style_id(paragraph)
+
+
 def _style_id(paragraph: Paragraph) -> str:
     try:
         style = paragraph.style
@@ -222,14 +251,14 @@ def _style_id(paragraph: Paragraph) -> str:
 
 
 def _num_pr(paragraph: Paragraph) -> dict[str, int | bool] | None:
-    num_pr_nodes = paragraph._p.xpath("./*[local-name()='pPr']/*[local-name()='numPr']")
-    if not num_pr_nodes:
+    p_pr = paragraph._p.find(_W_PPR)
+    num_pr = p_pr.find(_W_NUMPR) if p_pr is not None else None
+    if num_pr is None:
         return None
-    num_pr = num_pr_nodes[0]
-    num_id_nodes = num_pr.xpath("./*[local-name()='numId']")
-    if not num_id_nodes:
+    num_id_node = num_pr.find(_W_NUMID)
+    if num_id_node is None:
         return None
-    num_id_val = num_id_nodes[0].get(qn("w:val"))
+    num_id_val = num_id_node.get(_W_VAL)
     try:
         num_id = int(num_id_val) if num_id_val is not None else None
     except (TypeError, ValueError):
@@ -237,13 +266,12 @@ def _num_pr(paragraph: Paragraph) -> dict[str, int | bool] | None:
     if num_id is None:
         return None
 
-    ilvl_nodes = num_pr.xpath("./*[local-name()='ilvl']")
-    ilvl_val = ilvl_nodes[0].get(qn("w:val")) if ilvl_nodes else None
+    ilvl_node = num_pr.find(_W_ILVL)
+    ilvl_val = ilvl_node.get(_W_VAL) if ilvl_node is not None else None
     try:
         ilvl = int(ilvl_val) if ilvl_val is not None else 0
     except (TypeError, ValueError):
         ilvl = 0
 
-    restart_nodes = num_pr.xpath("./*[local-name()='numRestart']")
-    has_restart = bool(restart_nodes)
+    has_restart = num_pr.find(_W_NUMRESTART) is not None
     return {"numId": num_id, "ilvl": ilvl, "numRestart": has_restart}
@@ -10,6 +10,7 @@ from Word documents, including:
 
 Typical usage:
     from effilocal.doc.party_detection import (
+        PartyDetector,
         extract_defined_party_terms,
         extract_company_names,
         extract_party_from_comment_prefixes,
@@ -20,16 +21,25 @@ Typical usage:
     defined_terms = extract_defined_party_terms(doc)
     company_names = extract_company_names(doc)
     prefixes = extract_party_from_comment_prefixes(comments)
+    
+    # Or read the document once and run every extractor over the shared text
+    detector = PartyDetector.from_docx("agreement.docx")
+    party_info = detector.party_info(client_prefix="Didimo", counterparty_prefix="NBC")
 """
 
 from __future__ import annotations
 
 import re
+import zipfile
 from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from typing import Any
+from io import BytesIO
+from pathlib import Path
+from typing import IO, Any
 
 from docx import Document
+from lxml import etree
 
 
 # =============================================================================
@@ -73,6 +83,165 @@ DEFINED_TERM_TO_ROLE: dict[str, str] = {
 }
 
 
+# Quote characters: straight quotes and curly quotes (Unicode U+201C/U+201D)
+_QUOTES = r'["\'\u201C\u201D]'
+
+# Legal entity suffixes (matched loosely, e.g. "Ltd" / "Ltd." / "ltd")
+_SUFFIXES = r'(?:[Ll]td\.?|[Ll]imited|LLP|[Ii]nc\.?|LLC|CIC|[Cc]orp\.?|[Cc]orporation|PLC|plc|S\.?A\.?|GmbH|B\.?V\.?|N\.?V\.?)'
+
+# Legal entity suffixes captured verbatim for full company names
+_FULL_NAME_SUFFIXES = '(' + '|'.join(re.escape(s) for s in (
+    'Ltd', 'Limited', 'LLP', 'Inc', 'LLC', 'CIC', 'Corp', 'Corporation',
+    'PLC', 'plc', 'SA', 'S.A.', 'GmbH', 'BV', 'B.V.', 'NV', 'N.V.'
+)) + r')\.?'
+
+# One or more capitalized words (the name part of a company)
+_CAPITALIZED_WORDS = r'[A-Z][A-Za-z0-9]*(?:\s+[A-Z][A-Za-z0-9]*)*'
+
+# Capitalized word followed by shall/will/may, e.g. "Vendor shall", "Company will".
+# (?:The\s+)? optionally matches "The " without capturing it.
+_DEFINED_TERM_RE = re.compile(r'\b(?:[Tt]he\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:shall|will|may)\b')
+
+# Company name followed by a legal suffix
+_COMPANY_NAME_RE = re.compile(rf'({_CAPITALIZED_WORDS})\s*,?\s*{_SUFFIXES}\b')
+
+# Company name, separator and suffix, captured separately to rebuild the full legal name
+_FULL_COMPANY_NAME_RE = re.compile(
+    rf'({_CAPITALIZED_WORDS})(\s*,\s*|\s+){_FULL_NAME_SUFFIXES}(?=\s|[,"\'\(\)]|$)'
+)
+
+# "Company Name, LLC ... ("DefinedTerm")" or "... ("DefinedTerm" or "Alias")"
+_COMPANY_TO_TERM_RE = re.compile(
+    rf'({_CAPITALIZED_WORDS})\s*,?\s*{_SUFFIXES}'  # Company name with suffix
+    rf'[^()]*'  # Skip jurisdiction/description
+    rf'\(\s*{_QUOTES}([A-Z][A-Za-z]+){_QUOTES}'  # First quoted defined term in parentheses
+    rf'(?:\s+or\s+{_QUOTES}[A-Za-z]+{_QUOTES})?'  # Optional "or Alias"
+    rf'\s*\)'  # Close paren
+)
+
+# ("DefinedTerm") or ("DefinedTerm" or "Alternate")
+_ALTERNATE_NAMES_RE = re.compile(
+    rf'\(\s*{_QUOTES}([A-Z][A-Za-z]+){_QUOTES}'  # First quoted term
+    rf'(?:\s+or\s+{_QUOTES}([A-Za-z]+){_QUOTES})?'  # Optional "or Alternate"
+    rf'\s*\)'  # Close paren
+)
+
+# "For X:" at the start of a comment
+_COMMENT_PREFIX_RE = re.compile(r'^For\s+([^:]+):', re.IGNORECASE)
+
+# Words that precede shall/will/may but are not party names
+_DEFINED_TERM_STOPWORDS = frozenset({'the', 'each', 'either', 'neither', 'any', 'no', 'such', 'this', 'that'})
+
+# Leading words that are not part of company names ("between X Ltd and Y Inc")
+_NAME_LEADING_WORDS = ("Between", "between", "And", "and")
+
+
+# =============================================================================
+# Text Scanners
+# =============================================================================
+
+
+def _strip_leading_words(name: str) -> str:
+    for prefix in _NAME_LEADING_WORDS:
+        if name.startswith(prefix + " "):
+            name = name[len(prefix) + 1:]
+    return name
+
+
+def _unique_casefold(names: list[str]) -> list[str]:
+    """Remove case-insensitive duplicates while preserving order."""
+    seen: set[str] = set()
+    unique: list[str] = []
+    for name in names:
+        if name.lower() not in seen:
+            seen.add(name.lower())
+            unique.append(name)
+    return unique
+
+
+def _preamble(texts: Iterable[str], max_paragraphs: int) -> list[str]:
+    """Return the first ``max_paragraphs`` non-blank texts."""
+    preamble: list[str] = []
+    if max_paragraphs <= 0:
+        return preamble
+    for text in texts:
+        if text.strip():
+            preamble.append(text)
+            if len(preamble) >= max_paragraphs:
+                break
+    return preamble
+
+
+def _scan_defined_terms(texts: Iterable[str]) -> list[str]:
+    party_candidates: Counter[str] = Counter()
+    for text in texts:
+        for match in _DEFINED_TERM_RE.findall(text):
+            if match.lower() not in _DEFINED_TERM_STOPWORDS:
+                party_candidates[match] += 1
+    return [term for term, _ in party_candidates.most_common()]
+
+
+def _scan_company_names(preamble: Iterable[str]) -> list[str]:
+    company_names: list[str] = []
+    for text in preamble:
+        for match in _COMPANY_NAME_RE.findall(text):
+            name = _strip_leading_words(match.strip().rstrip(','))
+            if name and len(name) > 2:
+                company_names.append(name)
+    return _unique_casefold(company_names)
+
+
+def _scan_full_company_names(preamble: Iterable[str]) -> list[str]:
+    full_names: list[str] = []
+    for text in preamble:
+        for match in _FULL_COMPANY_NAME_RE.finditer(text):
+            name_part = _strip_leading_words(match.group(1).strip())
+            if not name_part or len(name_part) <= 2:
+                continue
+            separator = match.group(2)
+            suffix_part = match.group(3)
+            # Build full name preserving original format
+            if ',' in separator:
+                full_name = f"{name_part}, {suffix_part}"
+            else:
+                full_name = f"{name_part} {suffix_part}"
+            # Add trailing period if original had it
+            if match.group(0).rstrip().endswith('.') and not full_name.endswith('.'):
+                full_name += '.'
+            full_names.append(full_name)
+    return _unique_casefold(full_names)
+
+
+def _scan_company_to_term(preamble: Iterable[str]) -> dict[str, str]:
+    mapping: dict[str, str] = {}
+    for text in preamble:
+        for company_name, defined_term in _COMPANY_TO_TERM_RE.findall(text):
+            company_name = _strip_leading_words(company_name.strip())
+            if company_name and defined_term:
+                mapping[company_name] = defined_term
+    return mapping
+
+
+def _scan_alternate_names(preamble: Iterable[str]) -> dict[str, list[str]]:
+    alternates: dict[str, list[str]] = {}
+    for text in preamble:
+        for match in _ALTERNATE_NAMES_RE.finditer(text):
+            primary = match.group(1)
+            alternate = match.group(2)
+            names = alternates.setdefault(primary, [primary])
+            if alternate and alternate not in names:
+                names.append(alternate)
+    return alternates
+
+
+def _document_paragraph_texts(doc: Document) -> list[str]:
+    return [para.text for para in doc.paragraphs]
+
+
+def _document_cell_texts(doc: Document) -> list[str]:
+    return [cell.text for table in doc.tables for row in table.rows for cell in row.cells]
+
+
 # =============================================================================
 # Extraction Functions
 # =============================================================================
@@ -91,34 +260,7 @@ def extract_defined_party_terms(doc: Document) -> list[str]:
     Returns:
         List of likely party defined terms, sorted by frequency
     """
-    party_candidates: Counter[str] = Counter()
-    
-    # Pattern: Capitalized word followed by shall/will/may
-    # e.g., "Vendor shall", "Company will", "Licensor may"
-    # Use (?:The\s+)? to optionally match "The " but not capture it
-    pattern = re.compile(r'\b(?:[Tt]he\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:shall|will|may)\b')
-    
-    # Words to filter out
-    filter_words = {'the', 'each', 'either', 'neither', 'any', 'no', 'such', 'this', 'that'}
-    
-    for para in doc.paragraphs:
-        text = para.text
-        matches = pattern.findall(text)
-        for match in matches:
-            if match.lower() not in filter_words:
-                party_candidates[match] += 1
-    
-    # Also check tables
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                matches = pattern.findall(cell.text)
-                for match in matches:
-                    if match.lower() not in filter_words:
-                        party_candidates[match] += 1
-    
-    # Return terms sorted by frequency (most common first)
-    return [term for term, _ in party_candidates.most_common()]
+    return _scan_defined_terms(_document_paragraph_texts(doc) + _document_cell_texts(doc))
 
 
 def extract_company_names(doc: Document, max_paragraphs: int = 20) -> list[str]:
@@ -134,47 +276,7 @@ def extract_company_names(doc: Document, max_paragraphs: int = 20) -> list[str]:
     Returns:
         List of detected company names
     """
-    company_names: list[str] = []
-    
-    # Pattern for company names with legal suffixes
-    suffixes = r'(?:[Ll]td\.?|[Ll]imited|LLP|[Ii]nc\.?|LLC|CIC|[Cc]orp\.?|[Cc]orporation|PLC|plc|S\.?A\.?|GmbH|B\.?V\.?|N\.?V\.?)'
-    
-    # Pattern: One or more capitalized words followed by a legal suffix
-    pattern = re.compile(
-        rf'([A-Z][A-Za-z0-9]*(?:\s+[A-Z][A-Za-z0-9]*)*)\s*,?\s*{suffixes}\b'
-    )
-    
-    paragraphs_scanned = 0
-    for para in doc.paragraphs:
-        if paragraphs_scanned >= max_paragraphs:
-            break
-        
-        text = para.text
-        if not text.strip():
-            continue
-            
-        paragraphs_scanned += 1
-        
-        matches = pattern.findall(text)
-        for match in matches:
-            # Clean up the match
-            name = match.strip().rstrip(',')
-            # Remove common leading words that aren't part of company names
-            for prefix in ("Between", "between", "And", "and"):
-                if name.startswith(prefix + " "):
-                    name = name[len(prefix) + 1:]
-            if name and len(name) > 2:
-                company_names.append(name)
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_names = []
-    for name in company_names:
-        if name.lower() not in seen:
-            seen.add(name.lower())
-            unique_names.append(name)
-    
-    return unique_names
+    return _scan_company_names(_preamble(_document_paragraph_texts(doc), max_paragraphs))
 
 
 def extract_full_company_names(doc: Document, max_paragraphs: int = 20) -> list[str]:
@@ -191,67 +293,7 @@ def extract_full_company_names(doc: Document, max_paragraphs: int = 20) -> list[
     Returns:
         List of full company names with their legal suffixes
     """
-    full_names: list[str] = []
-    
-    # Legal entity suffixes
-    suffix_bases = [
-        'Ltd', 'Limited', 'LLP', 'Inc', 'LLC', 'CIC', 'Corp', 'Corporation',
-        'PLC', 'plc', 'SA', 'S.A.', 'GmbH', 'BV', 'B.V.', 'NV', 'N.V.'
-    ]
-    suffixes = '(' + '|'.join(re.escape(s) for s in suffix_bases) + r')\.?'
-    
-    # Pattern: Company name followed by optional comma and legal suffix
-    pattern = re.compile(
-        rf'([A-Z][A-Za-z0-9]*(?:\s+[A-Z][A-Za-z0-9]*)*)(\s*,\s*|\s+){suffixes}(?=\s|[,"\'\(\)]|$)'
-    )
-    
-    paragraphs_scanned = 0
-    for para in doc.paragraphs:
-        if paragraphs_scanned >= max_paragraphs:
-            break
-        
-        text = para.text
-        if not text.strip():
-            continue
-            
-        paragraphs_scanned += 1
-        
-        for match in pattern.finditer(text):
-            name_part = match.group(1).strip()
-            separator = match.group(2)
-            suffix_part = match.group(3)
-            
-            # Check if there's a period after the suffix in the full match
-            full_match = match.group(0)
-            has_trailing_period = full_match.rstrip().endswith('.')
-            
-            # Remove common leading words
-            for prefix in ("Between", "between", "And", "and"):
-                if name_part.startswith(prefix + " "):
-                    name_part = name_part[len(prefix) + 1:]
-            
-            if name_part and len(name_part) > 2:
-                # Build full name preserving original format
-                if ',' in separator:
-                    full_name = f"{name_part}, {suffix_part}"
-                else:
-                    full_name = f"{name_part} {suffix_part}"
-                
-                # Add trailing period if original had it
-                if has_trailing_period and not full_name.endswith('.'):
-                    full_name += '.'
-                    
-                full_names.append(full_name)
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_names = []
-    for name in full_names:
-        if name.lower() not in seen:
-            seen.add(name.lower())
-            unique_names.append(name)
-    
-    return unique_names
+    return _scan_full_company_names(_preamble(_document_paragraph_texts(doc), max_paragraphs))
 
 
 def extract_company_to_defined_term_mapping(doc: Document, max_paragraphs: int = 20) -> dict[str, str]:
@@ -270,46 +312,7 @@ def extract_company_to_defined_term_mapping(doc: Document, max_paragraphs: int =
         Dictionary mapping company names to their defined terms
         e.g., {"NBCUniversal": "Company", "Didimo": "Vendor"}
     """
-    mapping: dict[str, str] = {}
-    
-    # Legal entity suffixes
-    suffixes = r'(?:[Ll]td\.?|[Ll]imited|LLP|[Ii]nc\.?|LLC|CIC|[Cc]orp\.?|[Cc]orporation|PLC|plc|S\.?A\.?|GmbH|B\.?V\.?|N\.?V\.?)'
-    
-    # Quote characters: straight quotes and curly quotes (Unicode U+201C/U+201D)
-    quotes = r'["\'\u201C\u201D]'
-    
-    # Pattern to match: "Company Name, LLC ... ("DefinedTerm")"
-    pattern = re.compile(
-        rf'([A-Z][A-Za-z0-9]*(?:\s+[A-Z][A-Za-z0-9]*)*)\s*,?\s*{suffixes}'  # Company name with suffix
-        rf'[^()]*'  # Skip jurisdiction/description
-        rf'\(\s*{quotes}([A-Z][A-Za-z]+){quotes}'  # First quoted defined term in parentheses
-        rf'(?:\s+or\s+{quotes}[A-Za-z]+{quotes})?'  # Optional "or Alias"
-        rf'\s*\)'  # Close paren
-    )
-    
-    paragraphs_scanned = 0
-    for para in doc.paragraphs:
-        if paragraphs_scanned >= max_paragraphs:
-            break
-        
-        text = para.text
-        if not text.strip():
-            continue
-            
-        paragraphs_scanned += 1
-        
-        matches = pattern.findall(text)
-        for company_name, defined_term in matches:
-            # Clean up company name
-            company_name = company_name.strip()
-            for prefix in ("Between", "between", "And", "and"):
-                if company_name.startswith(prefix + " "):
-                    company_name = company_name[len(prefix) + 1:]
-            
-            if company_name and defined_term:
-                mapping[company_name] = defined_term
-    
-    return mapping
+    return _scan_company_to_term(_preamble(_document_paragraph_texts(doc), max_paragraphs))
 
 
 def extract_party_alternate_names(doc: Document, max_paragraphs: int = 20) -> dict[str, list[str]]:
@@ -327,40 +330,7 @@ def extract_party_alternate_names(doc: Document, max_paragraphs: int = 20) -> di
     Returns:
         Dictionary mapping primary defined term to list of all names for that party
     """
-    alternates: dict[str, list[str]] = {}
-    
-    # Quote characters: straight quotes and curly quotes
-    quotes = r'["\'\u201C\u201D]'
-    
-    # Pattern to match: ("DefinedTerm") or ("DefinedTerm" or "Alternate")
-    pattern = re.compile(
-        rf'\(\s*{quotes}([A-Z][A-Za-z]+){quotes}'  # First quoted term
-        rf'(?:\s+or\s+{quotes}([A-Za-z]+){quotes})?'  # Optional "or Alternate"
-        rf'\s*\)'  # Close paren
-    )
-    
-    paragraphs_scanned = 0
-    for para in doc.paragraphs:
-        if paragraphs_scanned >= max_paragraphs:
-            break
-        
-        text = para.text
-        if not text.strip():
-            continue
-            
-        paragraphs_scanned += 1
-        
-        for match in pattern.finditer(text):
-            primary = match.group(1)
-            alternate = match.group(2)
-            
-            if primary not in alternates:
-                alternates[primary] = [primary]
-            
-            if alternate and alternate not in alternates[primary]:
-                alternates[primary].append(alternate)
-    
-    return alternates
+    return _scan_alternate_names(_preamble(_document_paragraph_texts(doc), max_paragraphs))
 
 
 def extract_party_from_comment_prefixes(comments: list[dict[str, Any]]) -> list[str]:
@@ -373,18 +343,16 @@ def extract_party_from_comment_prefixes(comments: list[dict[str, Any]]) -> list[
         comments: List of comment dictionaries with 'text' field
         
     Returns:
-        List of unique party identifiers found in comment prefixes
+        List of unique party identifiers found in comment prefixes, in order
+        of first appearance
     """
-    prefixes: set[str] = set()
-    
-    # Pattern: "For X:" at the start of a comment
-    pattern = re.compile(r'^For\s+([^:]+):', re.IGNORECASE)
+    prefixes: dict[str, None] = {}
     
     for comment in comments:
         text = comment.get("text", "")
-        match = pattern.match(text.strip())
+        match = _COMMENT_PREFIX_RE.match(text.strip())
         if match:
-            prefixes.add(match.group(1).strip())
+            prefixes.setdefault(match.group(1).strip())
     
     return list(prefixes)
 
@@ -566,3 +534,259 @@ class PartyInfo:
                 seen.add(name)
                 result.append(name)
         return result
+
+
+# =============================================================================
+# Party Detector
+# =============================================================================
+
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_BODY_TAG = f"{_W}body"
+_TABLE_TAG = f"{_W}tbl"
+_CELL_TAG = f"{_W}tc"
+_PARAGRAPH_TAG = f"{_W}p"
+_RUN_TAG = f"{_W}r"
+_HYPERLINK_TAG = f"{_W}hyperlink"
+_RUN_TEXT = {f"{_W}t": None, f"{_W}tab": "\t", f"{_W}br": "\n", f"{_W}cr": "\n", f"{_W}noBreakHyphen": "-"}
+
+
+def _xml_paragraph_text(p_elem: Any) -> str:
+    """Text of a ``w:p`` the way python-docx ``Paragraph.text`` renders it."""
+    parts: list[str] = []
+    for child in p_elem:
+        if child.tag == _RUN_TAG:
+            runs = [child]
+        elif child.tag == _HYPERLINK_TAG:
+            runs = list(child.iterchildren(_RUN_TAG))
+        else:
+            continue
+        for run in runs:
+            for item in run:
+                if item.tag in _RUN_TEXT:
+                    replacement = _RUN_TEXT[item.tag]
+                    parts.append(item.text or "" if replacement is None else replacement)
+    return "".join(parts)
+
+
+def _docx_texts(source: str | Path | bytes | IO[bytes]) -> tuple[list[str], list[str]]:
+    """Read body paragraph texts and table cell texts straight from ``word/document.xml``."""
+    if isinstance(source, bytes):
+        source = BytesIO(source)
+    paragraphs: list[str] = []
+    cells: list[str] = []
+    with zipfile.ZipFile(source) as archive, archive.open("word/document.xml") as handle:
+        for _event, elem in etree.iterparse(handle, events=("end",), tag=(_PARAGRAPH_TAG, _TABLE_TAG)):
+            parent = elem.getparent()
+            if parent is None or parent.tag != _BODY_TAG:
+                continue
+            if elem.tag == _PARAGRAPH_TAG:
+                paragraphs.append(_xml_paragraph_text(elem))
+            else:
+                for cell in elem.iter(_CELL_TAG):
+                    if cell.getparent().getparent() is elem:
+                        cells.append("\n".join(_xml_paragraph_text(p) for p in cell.iterchildren(_PARAGRAPH_TAG)))
+            # Body-level blocks are no longer needed once scanned
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+    return paragraphs, cells
+
+
+class PartyDetector:
+    """
+    Run every party extractor over one shared read of the document text.
+    
+    The document is read once (from analysis blocks, the raw ``document.xml``
+    or an already opened python-docx ``Document``); each extractor then runs
+    its precompiled pattern over the cached texts and memoizes its result.
+    :meth:`party_info` combines them into a :class:`PartyInfo` once the
+    client and counterparty are known.
+    
+    Typical usage:
+        detector = PartyDetector.from_docx("agreement.docx")
+        detector.defined_terms        # ["Vendor", "Company", ...]
+        party_info = detector.party_info("Didimo", "NBC")
+    """
+    
+    def __init__(
+        self,
+        paragraphs: Iterable[str],
+        table_cells: Iterable[str] = (),
+        max_paragraphs: int = 20,
+    ) -> None:
+        """
+        Args:
+            paragraphs: Body paragraph texts in document order
+            table_cells: Table cell texts (only used for defined terms)
+            max_paragraphs: How many non-blank paragraphs form the preamble
+        """
+        self.paragraphs = list(paragraphs)
+        self.table_cells = list(table_cells)
+        self.preamble = _preamble(self.paragraphs, max_paragraphs)
+        self._defined_terms: list[str] | None = None
+        self._company_names: list[str] | None = None
+        self._full_company_names: list[str] | None = None
+        self._company_to_term: dict[str, str] | None = None
+        self._alternate_names: dict[str, list[str]] | None = None
+    
+    @classmethod
+    def from_blocks(cls, blocks: Iterable[dict[str, Any]], max_paragraphs: int = 20) -> "PartyDetector":
+        """Build from analysis blocks (``blocks.jsonl`` records)."""
+        paragraphs: list[str] = []
+        cells: list[str] = []
+        for block in blocks:
+            text = block.get("text") or ""
+            if block.get("type") == "table_cell" or block.get("table"):
+                cells.append(text)
+            else:
+                paragraphs.append(text)
+        return cls(paragraphs, cells, max_paragraphs)
+    
+    @classmethod
+    def from_docx(cls, source: str | Path | bytes | IO[bytes], max_paragraphs: int = 20) -> "PartyDetector":
+        """Build from a ``.docx`` path, bytes or file object without loading python-docx."""
+        paragraphs, cells = _docx_texts(source)
+        return cls(paragraphs, cells, max_paragraphs)
+    
+    @classmethod
+    def from_document(cls, doc: Document, max_paragraphs: int = 20) -> "PartyDetector":
+        """Build from an already opened python-docx ``Document``."""
+        return cls(_document_paragraph_texts(doc), _document_cell_texts(doc), max_paragraphs)
+    
+    @property
+    def defined_terms(self) -> list[str]:
+        """Likely party defined terms, most frequent first (see :func:`extract_defined_party_terms`)."""
+        if self._defined_terms is None:
+            self._defined_terms = _scan_defined_terms(self.paragraphs + self.table_cells)
+        return self._defined_terms
+    
+    @property
+    def company_names(self) -> list[str]:
+        """Company names in the preamble (see :func:`extract_company_names`)."""
+        if self._company_names is None:
+            self._company_names = _scan_company_names(self.preamble)
+        return self._company_names
+    
+    @property
+    def full_company_names(self) -> list[str]:
+        """Full legal names in the preamble (see :func:`extract_full_company_names`)."""
+        if self._full_company_names is None:
+            self._full_company_names = _scan_full_company_names(self.preamble)
+        return self._full_company_names
+    
+    @property
+    def company_to_term(self) -> dict[str, str]:
+        """Company name -> defined term (see :func:`extract_company_to_defined_term_mapping`)."""
+        if self._company_to_term is None:
+            self._company_to_term = _scan_company_to_term(self.preamble)
+        return self._company_to_term
+    
+    @property
+    def alternate_names(self) -> dict[str, list[str]]:
+        """Defined term -> all names for that party (see :func:`extract_party_alternate_names`)."""
+        if self._alternate_names is None:
+            self._alternate_names = _scan_alternate_names(self.preamble)
+        return self._alternate_names
+    
+    def resolve_defined_term(
+        self,
+        prefix: str,
+        exclude: str = "",
+        fallback_index: int = 0,
+        default: str = "Vendor",
+    ) -> str:
+        """
+        Find the defined term used in the contract for a party identifier.
+        
+        Tries the preamble company→term mapping, then the best fuzzy match
+        among defined terms and company names, then the first similar
+        defined term, and finally the ``fallback_index``-th defined term
+        (or ``default`` when there are too few).
+        
+        Args:
+            prefix: Party identifier (e.g., comment prefix "Didimo")
+            exclude: Defined term already taken by the other party
+            fallback_index: Which defined term to use when nothing matches
+            default: Term to use when there are too few defined terms
+            
+        Returns:
+            The defined term (e.g., "Vendor")
+        """
+        company_to_term = self.company_to_term
+        defined = company_to_term.get(prefix, "")
+        
+        # If no direct mapping, try matching via the fuzzy prefix match
+        if not defined:
+            matched = match_prefixes_to_parties([prefix], self.defined_terms, self.company_names).get(prefix, "")
+            defined = company_to_term.get(matched, matched)
+        
+        # If still no good match, use similarity matching to defined terms
+        if not defined or defined == prefix:
+            for term in self.defined_terms:
+                if term != exclude and compute_similarity(prefix, term) > 0.3:
+                    defined = term
+                    break
+            if not defined:
+                terms = self.defined_terms
+                defined = terms[fallback_index] if len(terms) > fallback_index else default
+        return defined
+    
+    def party_info(
+        self,
+        client_prefix: str,
+        counterparty_prefix: str,
+        original_provided_by: str = "counterparty",
+    ) -> PartyInfo:
+        """
+        Build the complete :class:`PartyInfo` for the given parties.
+        
+        Args:
+            client_prefix: Identifier of our client (e.g., "Didimo")
+            counterparty_prefix: Identifier of the counterparty (e.g., "NBC")
+            original_provided_by: "client" or "counterparty"
+            
+        Returns:
+            PartyInfo with defined terms, semantic roles and alternate names
+        """
+        client_defined = self.resolve_defined_term(client_prefix)
+        counterparty_defined = self.resolve_defined_term(
+            counterparty_prefix, exclude=client_defined, fallback_index=1, default="Company"
+        )
+        
+        # Alternate names for each party (e.g., "Company" and "NBCUniversal")
+        client_alternates = list(self.alternate_names.get(client_defined, []))
+        counterparty_alternates = list(self.alternate_names.get(counterparty_defined, []))
+        
+        # Associate full company names (e.g., "NBCUniversal Media, LLC") with a party.
+        # The prefix might be a short form like "NBC", so check both directions.
+        client_lower = client_prefix.lower()
+        counterparty_lower = counterparty_prefix.lower()
+        for full_name in self.full_company_names:
+            full_name_lower = full_name.lower()
+            full_name_parts = [full_name.split(',')[0].lower(), full_name.split()[0].lower()]
+            client_match = client_lower in full_name_lower or any(
+                part in client_lower for part in full_name_parts if len(part) > 3
+            )
+            counterparty_match = counterparty_lower in full_name_lower or any(
+                part in counterparty_lower for part in full_name_parts if len(part) > 3
+            )
+            if client_match == counterparty_match:
+                continue
+            target = client_alternates if client_match else counterparty_alternates
+            # Also add the ALL-CAPS version for signature blocks
+            for name in (full_name, full_name.upper()):
+                if name not in target:
+                    target.append(name)
+        
+        return PartyInfo(
+            client_prefix=client_prefix,
+            counterparty_prefix=counterparty_prefix,
+            client_defined_term=client_defined,
+            counterparty_defined_term=counterparty_defined,
+            original_provided_by=original_provided_by,
+            client_role=infer_party_role(client_defined),
+            counterparty_role=infer_party_role(counterparty_defined),
+            client_alternate_names=client_alternates,
+            counterparty_alternate_names=counterparty_alternates,
+        )
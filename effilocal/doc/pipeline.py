@@ -16,6 +16,7 @@ from effilocal.doc.numbering import NumberingDefinitions
 from effilocal.doc.numbering_inspector import NumberingInspector
 from effilocal.doc.numbering_context import NumberingEvent
 from effilocal.doc.paragraphs import build_paragraph_block
+from effilocal.doc.style_table import StyleTable
 from effilocal.doc.tables import build_table_rows
 from effilocal.doc.trackers import (
     AttachmentTracker,
@@ -69,8 +70,11 @@ class AnalysisPipeline:
         drafting_helper: DraftingNoteHelperProtocol | None = None,
         initial_section_id: str | None = None,
         use_value_objects: bool = False,
+        style_table: StyleTable | None = None,
     ) -> None:
         self._hash_tracker = _ContentHashTracker()
+        # Resolved lazily from the first paragraph/table when not supplied
+        self._style_table = style_table
         self._fallback_heading_label = fallback_heading_label
         self._attachment_tracker = attachment_tracker or AttachmentTracker()
         self._definition_tracker = definition_tracker or DefinitionTracker()
@@ -119,6 +123,7 @@ class AnalysisPipeline:
             hash_provider=self._hash_tracker.next_hash,
             as_dataclass=self._use_value_objects,
             amended=amended,
+            style_table=self._style_table_for(paragraph),
         )
         if build_result is None:
             if self._definition_tracker is not None:
@@ -185,6 +190,16 @@ class AnalysisPipeline:
         self._assign_role(block, text_value)
         return block
 
+    def _style_table_for(self, item: Paragraph | Table) -> StyleTable | None:
+        """Return the document's style table, or ``None`` for detached items."""
+
+        if self._style_table is None:
+            try:
+                self._style_table = StyleTable.for_part(item.part)
+            except AttributeError:
+                return None
+        return self._style_table
+
     def _apply_numbering_metadata(self, block: Block) -> tuple[dict[str, Any] | None, str | None]:
         if self._numbering_tracker is None:
             return None, None
@@ -303,6 +318,7 @@ class AnalysisPipeline:
             hash_provider=self._hash_tracker.next_hash,
             fallback_heading_label=self._fallback_heading_label,
             as_dataclass=self._use_value_objects,
+            style_table=self._style_table_for(table),
         )
         flattened: BlockList = []
         for row in rows:
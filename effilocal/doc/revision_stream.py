@@ -0,0 +1,264 @@
+"""Streaming extraction of tracked changes (``w:ins`` / ``w:del``) per paragraph.
+
+Walks ``word/document.xml`` once and yields, for every paragraph containing
+revisions, its before/after text together with the exact character offsets of
+each consolidated insertion and deletion. When given a ``.docx`` path or bytes
+the XML is read with :func:`lxml.etree.iterparse` and each paragraph is freed
+as soon as it has been processed, so memory stays flat for very large
+redlines. An already loaded python-docx ``Document`` is walked in place with
+:func:`lxml.etree.iterwalk`.
+
+Run semantics match :class:`effilocal.doc.amended_paragraph.AmendedParagraph`:
+direct ``w:r`` children contribute their ``w:t`` text, ``w:ins`` contributes
+the ``w:t`` text of its runs and ``w:del`` the ``w:delText`` of its runs.
+Consecutive runs of the same revision kind are consolidated into one change.
+"""
+
+from __future__ import annotations
+
+import zipfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from io import BytesIO
+from pathlib import Path
+from typing import IO, Any, Union
+
+from lxml import etree
+
+__all__ = [
+    "ParagraphRevisions",
+    "RevisionSpan",
+    "iter_paragraph_revisions",
+]
+
+NAMESPACE_W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+NAMESPACE_W14 = "http://schemas.microsoft.com/office/word/2010/wordml"
+
+_W = f"{{{NAMESPACE_W}}}"
+TAG_BODY = f"{_W}body"
+TAG_P = f"{_W}p"
+TAG_R = f"{_W}r"
+TAG_T = f"{_W}t"
+TAG_DEL_TEXT = f"{_W}delText"
+TAG_INS = f"{_W}ins"
+TAG_DEL = f"{_W}del"
+ATTR_AUTHOR = f"{_W}author"
+ATTR_DATE = f"{_W}date"
+ATTR_PARA_ID = f"{{{NAMESPACE_W14}}}paraId"
+
+DOCUMENT_PART = "word/document.xml"
+
+KIND_INSERT = "insert"
+KIND_DELETE = "delete"
+
+DocxSource = Union[str, Path, bytes, IO[bytes], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class RevisionSpan:
+    """One consolidated insertion or deletion with offsets into both texts.
+
+    For a deletion ``before_start:before_end`` covers the removed text and
+    ``after_start == after_end`` is where it was removed from; for an
+    insertion the roles are reversed. ``text`` is the change with surrounding
+    whitespace stripped, and the offsets cover exactly that text.
+    """
+
+    kind: str
+    text: str
+    before_start: int
+    before_end: int
+    after_start: int
+    after_end: int
+    author: str | None = None
+    date: str | None = None
+
+
+@dataclass(slots=True)
+class ParagraphRevisions:
+    """Before/after state of one paragraph and its revisions."""
+
+    para_idx: int
+    para_id: str | None
+    before_text: str
+    after_text: str
+    spans: list[RevisionSpan] = field(default_factory=list)
+    authors: set[str] = field(default_factory=set)
+    dates: set[str] = field(default_factory=set)
+
+    @property
+    def insertions(self) -> list[str]:
+        """Consolidated inserted texts in document order."""
+        return [span.text for span in self.spans if span.kind == KIND_INSERT]
+
+    @property
+    def deletions(self) -> list[str]:
+        """Consolidated deleted texts in document order."""
+        return [span.text for span in self.spans if span.kind == KIND_DELETE]
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.spans)
+
+
+class _ParagraphBuilder:
+    """Accumulates run pieces for one paragraph and tracks text offsets."""
+
+    def __init__(self) -> None:
+        self.before: list[str] = []
+        self.after: list[str] = []
+        self.before_pos = 0
+        self.after_pos = 0
+        self.spans: list[RevisionSpan] = []
+        self.authors: set[str] = set()
+        self.dates: set[str] = set()
+        self._group_kind: str | None = None
+        self._group_parts: list[str] = []
+        self._group_start = 0
+        self._group_anchor = 0
+        self._group_author: str | None = None
+        self._group_date: str | None = None
+
+    def add_normal(self, text: str) -> None:
+        self._flush()
+        self.before.append(text)
+        self.after.append(text)
+        self.before_pos += len(text)
+        self.after_pos += len(text)
+
+    def add_change(self, kind: str, text: str, author: str | None, date: str | None) -> None:
+        if kind != self._group_kind:
+            self._flush()
+            self._group_kind = kind
+            self._group_author = author
+            self._group_date = date
+            if kind == KIND_DELETE:
+                self._group_start, self._group_anchor = self.before_pos, self.after_pos
+            else:
+                self._group_start, self._group_anchor = self.after_pos, self.before_pos
+        self._group_parts.append(text)
+        if author:
+            self.authors.add(author)
+        if date:
+            self.dates.add(date)
+        if kind == KIND_DELETE:
+            self.before.append(text)
+            self.before_pos += len(text)
+        else:
+            self.after.append(text)
+            self.after_pos += len(text)
+
+    def finish(self, para_idx: int, para_id: str | None) -> ParagraphRevisions:
+        self._flush()
+        return ParagraphRevisions(
+            para_idx=para_idx,
+            para_id=para_id,
+            before_text="".join(self.before),
+            after_text="".join(self.after),
+            spans=self.spans,
+            authors=self.authors,
+            dates=self.dates,
+        )
+
+    def _flush(self) -> None:
+        kind, self._group_kind = self._group_kind, None
+        if kind is None:
+            return
+        raw = "".join(self._group_parts)
+        self._group_parts = []
+        stripped = raw.strip()
+        if not stripped:
+            return
+        start = self._group_start + (len(raw) - len(raw.lstrip()))
+        end = start + len(stripped)
+        anchor = self._group_anchor
+        if kind == KIND_DELETE:
+            offsets = (start, end, anchor, anchor)
+        else:
+            offsets = (anchor, anchor, start, end)
+        self.spans.append(
+            RevisionSpan(kind, stripped, *offsets, author=self._group_author, date=self._group_date)
+        )
+
+
+def _run_text(run: etree._Element, text_tag: str) -> str:
+    return "".join(t.text for t in run.iter(text_tag) if t.text)
+
+
+def _build_paragraph(p_elem: etree._Element, para_idx: int) -> ParagraphRevisions:
+    builder = _ParagraphBuilder()
+    for child in p_elem:
+        tag = child.tag
+        if tag == TAG_R:
+            text = _run_text(child, TAG_T)
+            if text:
+                builder.add_normal(text)
+        elif tag == TAG_INS or tag == TAG_DEL:
+            kind = KIND_INSERT if tag == TAG_INS else KIND_DELETE
+            text_tag = TAG_T if tag == TAG_INS else TAG_DEL_TEXT
+            author = child.get(ATTR_AUTHOR)
+            date = child.get(ATTR_DATE)
+            for run in child.iter(TAG_R):
+                text = _run_text(run, text_tag)
+                if text:
+                    builder.add_change(kind, text, author, date)
+    return builder.finish(para_idx, p_elem.get(ATTR_PARA_ID))
+
+
+def _open_events(source: DocxSource) -> tuple[Iterable[tuple[str, etree._Element]], bool]:
+    """Return ``(end events, streaming)`` for the given source.
+
+    ``streaming`` is True when elements belong to a private parse and may be
+    cleared after use.
+    """
+    element = getattr(source, "element", None)
+    if element is not None and hasattr(element, "body"):
+        # python-docx Document: walk the existing tree without reparsing
+        return etree.iterwalk(element.body, events=("end",)), False
+
+    if isinstance(source, bytes):
+        source = BytesIO(source)
+    archive = zipfile.ZipFile(source)
+
+    def events() -> Iterator[tuple[str, etree._Element]]:
+        with archive, archive.open(DOCUMENT_PART) as handle:
+            yield from etree.iterparse(handle, events=("end",), huge_tree=True)
+
+    return events(), True
+
+
+def iter_paragraph_revisions(
+    source: DocxSource,
+    *,
+    include_tables: bool = False,
+    changed_only: bool = True,
+) -> Iterator[ParagraphRevisions]:
+    """Yield per-paragraph tracked-change diffs in document order.
+
+    Args:
+        source: ``.docx`` path, raw bytes, binary file object, or a loaded
+            python-docx ``Document``.
+        include_tables: When False (default) only body-level paragraphs are
+            visited, matching ``Document.paragraphs``; when True, paragraphs
+            nested in tables and content controls are included too.
+        changed_only: When True (default) skip paragraphs without revisions.
+
+    Yields:
+        :class:`ParagraphRevisions`, with ``para_idx`` counting every visited
+        paragraph (changed or not).
+    """
+    events, streaming = _open_events(source)
+    para_idx = 0
+    for _event, elem in events:
+        parent = elem.getparent()
+        at_body_level = parent is not None and parent.tag == TAG_BODY
+        if elem.tag == TAG_P and (at_body_level or include_tables):
+            revisions = _build_paragraph(elem, para_idx)
+            para_idx += 1
+            if revisions.has_changes or not changed_only:
+                yield revisions
+        if streaming and at_body_level:
+            # Free the processed block (paragraph or table) and everything before it.
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
@@ -0,0 +1,303 @@
+"""Inverted full-text index over analyzed blocks.
+
+``analyze()`` writes ``search_index.json`` next to ``blocks.jsonl``. It holds
+two posting tables over the case-folded block text, each mapping a key to the
+positions (in ``blocks.jsonl`` order) of the blocks containing it:
+
+- ``tokens``: every ``\\w+`` word, for whole-word queries;
+- ``trigrams``: every three-character window (spaces and punctuation
+  included), for substring and phrase queries.
+
+A query intersects the postings of its rarest keys and verifies only the
+surviving candidates, so results (and their character offsets) are exactly
+those of a linear case-insensitive substring scan, at a fraction of the cost.
+Queries shorter than a trigram fall back to scanning.
+
+The index stores no text: it is decoded together with the blocks it was built
+from, and a digest of their text rejects an index that no longer matches
+``blocks.jsonl``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from effilocal.config.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+__all__ = [
+    "SEARCH_INDEX_FILENAME",
+    "BlockSearchIndex",
+    "SearchHit",
+    "build_search_index",
+]
+
+SEARCH_INDEX_FILENAME = "search_index.json"
+SEARCH_INDEX_VERSION = 1
+
+_GRAM = 3
+# Postings intersected per query before verifying candidates directly.
+_MAX_INTERSECT = 4
+_TOKEN_RE = re.compile(r"\w+")
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    """A block matching a query, with the character offsets of each match."""
+
+    block_id: str
+    ordinal: str | None
+    position: int
+    offsets: tuple[int, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "block_id": self.block_id,
+            "ordinal": self.ordinal,
+            "position": self.position,
+            "offsets": list(self.offsets),
+        }
+
+
+def _block_text(block: Mapping[str, Any]) -> str:
+    return block.get("text") or ""
+
+
+def _text_digest(texts: Iterable[str]) -> str:
+    digest = hashlib.sha256()
+    for text in texts:
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        digest.update(b"\x1e")
+    return "sha256:" + digest.hexdigest()
+
+
+def _encode(postings: list[int]) -> list[int]:
+    """Delta-encode a sorted posting list (keeps the JSON small)."""
+    previous = 0
+    encoded = []
+    for position in postings:
+        encoded.append(position - previous)
+        previous = position
+    return encoded
+
+
+def _decode(encoded: Sequence[int]) -> list[int]:
+    position = 0
+    postings = []
+    for delta in encoded:
+        position += delta
+        postings.append(position)
+    return postings
+
+
+def build_search_index(blocks: Iterable[Mapping[str, Any]]) -> dict[str, Any]:
+    """Build the ``search_index.json`` payload for analyzed blocks.
+
+    Args:
+        blocks: Blocks in document order (as written to ``blocks.jsonl``).
+
+    Returns:
+        JSON-serialisable payload with delta-encoded posting lists.
+    """
+    return BlockSearchIndex.build(list(blocks)).to_payload()
+
+
+class BlockSearchIndex:
+    """Token and trigram postings over one analysis' blocks."""
+
+    def __init__(
+        self,
+        blocks: Sequence[Mapping[str, Any]],
+        tokens: dict[str, list[int]],
+        trigrams: dict[str, list[int]],
+    ) -> None:
+        """
+        Args:
+            blocks: The indexed blocks, in ``blocks.jsonl`` order.
+            tokens: Folded word -> sorted block positions.
+            trigrams: Folded three-character window -> sorted block positions.
+        """
+        self._blocks = blocks
+        self._tokens = tokens
+        self._trigrams = trigrams
+        self._texts = [_block_text(block) for block in blocks]
+        self._folded = [text.lower() for text in self._texts]
+
+    @classmethod
+    def build(cls, blocks: Sequence[Mapping[str, Any]]) -> "BlockSearchIndex":
+        """Index ``blocks`` in memory."""
+        tokens: dict[str, list[int]] = {}
+        trigrams: dict[str, list[int]] = {}
+        for position, block in enumerate(blocks):
+            folded = _block_text(block).lower()
+            for token in set(_TOKEN_RE.findall(folded)):
+                tokens.setdefault(token, []).append(position)
+            for gram in {folded[i:i + _GRAM] for i in range(len(folded) - _GRAM + 1)}:
+                trigrams.setdefault(gram, []).append(position)
+        return cls(blocks, tokens, trigrams)
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: Mapping[str, Any],
+        blocks: Sequence[Mapping[str, Any]],
+    ) -> "BlockSearchIndex | None":
+        """Decode a persisted index, or return None if it does not match ``blocks``."""
+        if payload.get("v") != SEARCH_INDEX_VERSION or payload.get("block_count") != len(blocks):
+            return None
+        if payload.get("text_digest") != _text_digest(_block_text(block) for block in blocks):
+            return None
+        tokens = {key: _decode(value) for key, value in payload.get("tokens", {}).items()}
+        trigrams = {key: _decode(value) for key, value in payload.get("trigrams", {}).items()}
+        return cls(blocks, tokens, trigrams)
+
+    @classmethod
+    def for_directory(
+        cls,
+        analysis_dir: str | Path,
+        blocks: Sequence[Mapping[str, Any]],
+    ) -> "BlockSearchIndex":
+        """Load ``search_index.json`` from ``analysis_dir``, or build the index.
+
+        The persisted index is used when it matches ``blocks``; otherwise
+        (missing, older format, or ``blocks.jsonl`` edited since analysis)
+        the index is rebuilt in memory.
+        """
+        path = Path(analysis_dir) / SEARCH_INDEX_FILENAME
+        if path.exists():
+            try:
+                with path.open("r", encoding="utf-8") as handle:
+                    index = cls.from_payload(json.load(handle), blocks)
+            except (OSError, ValueError) as exc:
+                LOGGER.warning("Ignoring unreadable %s: %s", path, exc)
+                index = None
+            if index is not None:
+                return index
+            LOGGER.info("Search index at %s is stale; rebuilding in memory", path)
+        return cls.build(blocks)
+
+    def to_payload(self) -> dict[str, Any]:
+        """Return the ``search_index.json`` payload."""
+        return {
+            "v": SEARCH_INDEX_VERSION,
+            "block_count": len(self._blocks),
+            "text_digest": _text_digest(self._texts),
+            "tokens": {key: _encode(value) for key, value in self._tokens.items()},
+            "trigrams": {key: _encode(value) for key, value in self._trigrams.items()},
+        }
+
+    def matching_positions(self, query: str) -> list[int]:
+        """Return positions of blocks containing ``query`` (case-insensitive)."""
+        needle = query.lower()
+        return [position for position in self._candidates(needle, whole_word=False) if needle in self._folded[position]]
+
+    def search(
+        self,
+        query: str,
+        *,
+        whole_word: bool = False,
+        case_sensitive: bool = False,
+        limit: int | None = None,
+    ) -> list[SearchHit]:
+        """Find blocks containing ``query``.
+
+        Args:
+            query: Text to find; may span words and punctuation.
+            whole_word: Only match where ``query`` is not part of a longer word.
+            case_sensitive: Match case exactly (default: case-insensitive).
+            limit: Maximum number of blocks to return.
+
+        Returns:
+            Matching blocks in document order, each with the offsets of every
+            non-overlapping match in the block's original text.
+        """
+        if not query:
+            return []
+        needle = query.lower()
+        pattern = None
+        if whole_word:
+            pattern = re.compile(
+                r"(?<!\w)" + re.escape(query) + r"(?!\w)",
+                0 if case_sensitive else re.IGNORECASE,
+            )
+
+        hits: list[SearchHit] = []
+        for position in self._candidates(needle, whole_word=whole_word):
+            if needle not in self._folded[position]:
+                continue
+            offsets = self._offsets(position, query, pattern, case_sensitive)
+            if not offsets:
+                continue
+            block = self._blocks[position]
+            hits.append(
+                SearchHit(
+                    block_id=block.get("id"),
+                    ordinal=(block.get("list") or {}).get("ordinal") or None,
+                    position=position,
+                    offsets=offsets,
+                )
+            )
+            if limit is not None and len(hits) >= limit:
+                break
+        return hits
+
+    def _candidates(self, needle: str, *, whole_word: bool) -> Iterable[int]:
+        if whole_word:
+            keys, table = set(_TOKEN_RE.findall(needle)), self._tokens
+        else:
+            keys = {needle[i:i + _GRAM] for i in range(len(needle) - _GRAM + 1)}
+            table = self._trigrams
+        if not keys:
+            return range(len(self._blocks))
+
+        postings = []
+        for key in keys:
+            posting = table.get(key)
+            if not posting:
+                return ()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:_MAX_INTERSECT]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return ()
+        return sorted(candidates)
+
+    def _offsets(
+        self,
+        position: int,
+        query: str,
+        pattern: re.Pattern[str] | None,
+        case_sensitive: bool,
+    ) -> tuple[int, ...]:
+        text = self._texts[position]
+        if pattern is not None:
+            return tuple(match.start() for match in pattern.finditer(text))
+
+        haystack, needle = (text, query) if case_sensitive else (self._folded[position], query.lower())
+        offsets = []
+        start = haystack.find(needle)
+        while start != -1:
+            offsets.append(start)
+            start = haystack.find(needle, start + len(needle))
+        if not case_sensitive and len(haystack) != len(text):
+            offsets = [_original_offset(text, offset) for offset in offsets]
+        return tuple(offsets)
+
+
+def _original_offset(text: str, folded_offset: int) -> int:
+    """Map an offset in ``text.lower()`` back to ``text`` (lower() can change length)."""
+    folded_length = 0
+    for index, char in enumerate(text):
+        if folded_length >= folded_offset:
+            return index
+        folded_length += len(char.lower())
+    return len(text)
@@ -56,6 +56,7 @@ def assign_sections(blocks_iter: Iterable[dict[str, Any]], doc_id: str) -> dict[
         block["section_id"] = section["id"]
         section["block_ids"].append(block["id"])
         section["char_count"] += len(block.get("text") or "")
+        section["token_count"] += block.get("token_count") or 0
 
     def _section_title(block: dict[str, Any], override: str | None = None) -> str:
         if override:
@@ -88,6 +89,7 @@ def assign_sections(blocks_iter: Iterable[dict[str, Any]], doc_id: str) -> dict[
             "level": max(1, min(level, 6)),
             "block_ids": [],
             "char_count": 0,
+            "token_count": 0,
             "children": [],
             "role": inferred_role,
             "attachment_id": attachment_id,
@@ -0,0 +1,236 @@
+"""Per-document resolved style table.
+
+python-docx resolves ``paragraph.style`` by searching the styles part on every
+access (an xpath over ``w:style`` for the id, then another scan for the default
+style when the id is missing). The analysis pipeline and the MCP tools touch
+the style of every paragraph, so :class:`StyleTable` reads ``styles.xml`` once
+and answers those lookups from a dictionary.
+
+Each :class:`ResolvedStyle` carries the UI name (as python-docx reports it),
+the derived heading level, the ``basedOn`` chain, and the numbering
+properties and indentation inherited along that chain.
+
+Lookup semantics match ``DocumentPart.get_style(style_id, PARAGRAPH)``: an
+unknown id, or an id naming a non-paragraph style, falls back to the default
+paragraph style (the last ``w:default`` one in document order).
+"""
+
+from __future__ import annotations
+
+import re
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+from docx.oxml.ns import qn
+from docx.oxml.simpletypes import ST_SignedTwipsMeasure
+from docx.styles import BabelFish
+
+__all__ = [
+    "ResolvedStyle",
+    "StyleTable",
+]
+
+_W_STYLE = qn("w:style")
+_W_NAME = qn("w:name")
+_W_BASED_ON = qn("w:basedOn")
+_W_PPR = qn("w:pPr")
+_W_PSTYLE = qn("w:pStyle")
+_W_NUMPR = qn("w:numPr")
+_W_NUMID = qn("w:numId")
+_W_ILVL = qn("w:ilvl")
+_W_NUMRESTART = qn("w:numRestart")
+_W_IND = qn("w:ind")
+_W_VAL = qn("w:val")
+_W_TYPE = qn("w:type")
+_W_STYLE_ID = qn("w:styleId")
+_W_DEFAULT = qn("w:default")
+
+_TRUE_VALUES = ("1", "true", "on")
+_HEADING_RE = re.compile(r"heading\s*(\d)", re.IGNORECASE)
+_INDENT_ATTRS = {
+    "left": (qn("w:left"), qn("w:start")),
+    "hanging": (qn("w:hanging"),),
+    "first_line": (qn("w:firstLine"),),
+}
+
+# Cache of tables per python-docx part; entries die with the document.
+_TABLES: "weakref.WeakKeyDictionary[Any, tuple[int, StyleTable]]" = weakref.WeakKeyDictionary()
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedStyle:
+    """A style with its inheritance chain already resolved."""
+
+    style_id: str
+    name: str | None
+    type: str
+    based_on: tuple[str, ...] = ()
+    heading_level: int | None = None
+    num_pr: dict[str, Any] | None = None
+    indent: dict[str, int] | None = None
+
+    @property
+    def block_type(self) -> str:
+        """``"heading"`` for Heading 1-6 styles, otherwise ``"paragraph"``."""
+        return "heading" if self.heading_level is not None else "paragraph"
+
+
+def _heading_level(name: str | None) -> int | None:
+    match = _HEADING_RE.search(name or "")
+    if match:
+        level = int(match.group(1))
+        if 1 <= level <= 6:
+            return level
+    return None
+
+
+def _child_val(node: Any, tag: str) -> str | None:
+    child = node.find(tag) if node is not None else None
+    return child.get(_W_VAL) if child is not None else None
+
+
+def _own_num_pr(style_el: Any) -> dict[str, Any]:
+    p_pr = style_el.find(_W_PPR)
+    num_pr = p_pr.find(_W_NUMPR) if p_pr is not None else None
+    if num_pr is None:
+        return {}
+    info: dict[str, Any] = {}
+    num_id = _child_val(num_pr, _W_NUMID)
+    ilvl = _child_val(num_pr, _W_ILVL)
+    if num_id is not None:
+        info["numId"] = int(num_id)
+    if ilvl is not None:
+        info["ilvl"] = int(ilvl)
+    if num_pr.find(_W_NUMRESTART) is not None:
+        info["numRestart"] = True
+    return info
+
+
+def _own_indent(style_el: Any) -> dict[str, int]:
+    p_pr = style_el.find(_W_PPR)
+    ind = p_pr.find(_W_IND) if p_pr is not None else None
+    if ind is None:
+        return {}
+    indent: dict[str, int] = {}
+    for key, attrs in _INDENT_ATTRS.items():
+        for attr in attrs:
+            value = ind.get(attr)
+            if value is not None:
+                indent[key] = int(ST_SignedTwipsMeasure.convert_from_xml(value))
+                break
+    return indent
+
+
+class StyleTable:
+    """Resolved ``styleId`` → :class:`ResolvedStyle` table for one document."""
+
+    def __init__(self, styles_element: Any | None) -> None:
+        """
+        Args:
+            styles_element: The ``w:styles`` root element (``None`` for a
+                document without a styles part).
+        """
+        self._raw: dict[str, Any] = {}
+        self._default_paragraph_id: str | None = None
+        self._resolved: dict[str, ResolvedStyle] = {}
+        if styles_element is None:
+            return
+        for style_el in styles_element.iterchildren(_W_STYLE):
+            style_id = style_el.get(_W_STYLE_ID)
+            if style_id is not None and style_id not in self._raw:
+                self._raw[style_id] = style_el
+            if style_el.get(_W_TYPE) == "paragraph" and style_el.get(_W_DEFAULT) in _TRUE_VALUES:
+                self._default_paragraph_id = style_id
+
+    @classmethod
+    def for_part(cls, part: Any) -> "StyleTable":
+        """Return the (cached) table for a python-docx ``DocumentPart``.
+
+        The cache is keyed by the part and rebuilt when the number of style
+        definitions changes, e.g. after a tool adds a style to the document.
+        """
+        styles_element = part.styles.element if part is not None else None
+        count = len(styles_element) if styles_element is not None else 0
+        cached = _TABLES.get(part)
+        if cached is not None and cached[0] == count:
+            return cached[1]
+        table = cls(styles_element)
+        _TABLES[part] = (count, table)
+        return table
+
+    @classmethod
+    def for_document(cls, document: Any) -> "StyleTable":
+        """Return the (cached) table for a python-docx ``Document``."""
+        return cls.for_part(document.part)
+
+    @property
+    def default_paragraph_style(self) -> ResolvedStyle | None:
+        if self._default_paragraph_id is None:
+            return None
+        return self.get(self._default_paragraph_id)
+
+    def get(self, style_id: str) -> ResolvedStyle | None:
+        """Return the resolved style for ``style_id`` (any type) or ``None``."""
+        resolved = self._resolved.get(style_id)
+        if resolved is None and style_id in self._raw:
+            resolved = self._resolve(style_id)
+            self._resolved[style_id] = resolved
+        return resolved
+
+    def paragraph_style(self, p_element: Any) -> ResolvedStyle | None:
+        """Return the effective paragraph style of a ``w:p`` element.
+
+        Mirrors python-docx ``Paragraph.style``: the ``w:pStyle`` id when it
+        names a paragraph style, otherwise the default paragraph style.
+        """
+        style_id = _child_val(p_element.find(_W_PPR), _W_PSTYLE)
+        if style_id:
+            style = self.get(style_id)
+            if style is not None and style.type == "paragraph":
+                return style
+        return self.default_paragraph_style
+
+    def _resolve(self, style_id: str) -> ResolvedStyle:
+        style_el = self._raw[style_id]
+        name = _child_val(style_el, _W_NAME)
+        if name is not None:
+            name = BabelFish.internal2ui(name)
+
+        chain: list[str] = []
+        num_pr: dict[str, Any] = {}
+        indent: dict[str, int] = {}
+        visited = {style_id}
+        current: str | None = style_id
+        while current is not None:
+            current_el = self._raw.get(current)
+            if current_el is None:
+                break
+            # Nearest definition wins for each property
+            for key, value in _own_num_pr(current_el).items():
+                num_pr.setdefault(key, value)
+            for key, value in _own_indent(current_el).items():
+                indent.setdefault(key, value)
+            parent = _child_val(current_el, _W_BASED_ON)
+            if parent is None or parent in visited:
+                break
+            visited.add(parent)
+            chain.append(parent)
+            current = parent
+
+        resolved_num_pr = None
+        if "numId" in num_pr:
+            resolved_num_pr = {
+                "numId": num_pr["numId"],
+                "ilvl": num_pr.get("ilvl", 0),
+                "numRestart": num_pr.get("numRestart", False),
+            }
+        return ResolvedStyle(
+            style_id=style_id,
+            name=name,
+            type=style_el.get(_W_TYPE) or "",
+            based_on=tuple(chain),
+            heading_level=_heading_level(name),
+            num_pr=resolved_num_pr,
+            indent=indent or None,
+        )
@@ -9,6 +9,8 @@ from docx.table import Table
 
 from effilocal.doc.amended_paragraph import AmendedParagraph
 from effilocal.doc.blocks import TableCellBlock
+from effilocal.doc.paragraphs import paragraph_style_info
+from effilocal.doc.style_table import StyleTable
 
 
 def _get_amended_cell_content(cell) -> tuple[str, List[Dict[str, Any]]]:
@@ -45,6 +47,7 @@ def build_table_rows(
     hash_provider: Callable[[str], str],
     fallback_heading_label: str | None,
     as_dataclass: bool = False,
+    style_table: StyleTable | None = None,
 ) -> list[list[dict[str, Any] | TableCellBlock]]:
     """Return a list of table rows, each containing baseline cell blocks.
     
@@ -68,7 +71,9 @@ def build_table_rows(
             if not runs and text:
                 runs = [{'text': text, 'formats': []}]
             
-            style_name = cell.paragraphs[0].style.name if cell.paragraphs else ""
+            style_name = (
+                paragraph_style_info(cell.paragraphs[0], style_table)[0] if cell.paragraphs else ""
+            )
             heading_meta = (
                 {
                     "text": fallback_heading_label,
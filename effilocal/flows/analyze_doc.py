@@ -4,6 +4,9 @@ Supports block ID preservation across re-analysis:
 - Uses native w14:paraId attributes from Word paragraphs (no embedding needed)
 - Matches new blocks to previous analysis by para_id, hash, then position
 - Emits analysis_delta.json tracking what changed
+- Emits fingerprints.json (compact per-block hashes) for history diffs
+- Emits minhash.json (per-block MinHash signatures) for near-duplicate search
+- Stores estimated token counts per block and section for context budgeting
 """
 
 from __future__ import annotations
@@ -18,17 +21,21 @@ from typing import Any, Iterable, Mapping, MutableMapping
 from effilocal.config.logging import get_logger
 from effilocal.doc import (
     direct_docx,
+    fingerprints,
     hierarchy,
     models,
+    near_duplicates,
     relationships,
+    search_index,
     sections as section_builder,
 )
 from effilocal.doc.indexer import build_index
-from effilocal.doc.manifest import build_manifest
+from effilocal.doc.manifest import build_manifest, manifest_version
 from effilocal.doc.styles import analyze_styles
 from effilocal.doc.uuid_embedding import extract_block_uuids, embed_block_uuids, assign_block_ids
 from effilocal.util.hash import sha256_file
 from effilocal.util.io import write_jsonl
+from effilocal.util.tokens import estimate_tokens
 from effilocal.mcp_server.core.comments import extract_all_comments
 from docx import Document
 
@@ -99,6 +106,7 @@ def analyze(
     # Load previous blocks for matching
     old_blocks: list[dict] = []
     old_blocks_path = out_dir / "blocks.jsonl"
+    previous_version = _manifest_version(out_dir / "manifest.json") if preserve_uuids else None
     if preserve_uuids and old_blocks_path.exists():
         try:
             with old_blocks_path.open("r", encoding="utf-8") as f:
@@ -130,6 +138,10 @@ def analyze(
         id_stats.get("generated", 0),
     )
 
+    # Token estimates are stored once so context budgets never re-tokenize
+    for block in blocks:
+        block["token_count"] = estimate_tokens(block.get("text"))
+
     # Infer hierarchy AFTER ID assignment so parent/child references use final IDs
     hierarchy.infer_block_hierarchy(blocks)
 
@@ -187,6 +199,22 @@ def analyze(
     _write_json(index_path, index_payload)
     artifacts["index.json"] = index_path
 
+    fingerprints_path = out_dir / fingerprints.FINGERPRINTS_FILENAME
+    _write_json(
+        fingerprints_path,
+        fingerprints.build_fingerprints(blocks, doc_id),
+        compact=True,
+    )
+    artifacts[fingerprints.FINGERPRINTS_FILENAME] = fingerprints_path
+
+    search_index_path = out_dir / search_index.SEARCH_INDEX_FILENAME
+    _write_json(search_index_path, search_index.build_search_index(blocks), compact=True)
+    artifacts[search_index.SEARCH_INDEX_FILENAME] = search_index_path
+
+    minhash_path = out_dir / near_duplicates.MINHASH_FILENAME
+    _write_json(minhash_path, near_duplicates.build_minhash_signatures(blocks), compact=True)
+    artifacts[near_duplicates.MINHASH_FILENAME] = minhash_path
+
     if emit_ltu_tree:
         ltu_tree_path = out_dir / "ltu_tree.json"
         ltu_tree_payload = {"doc_id": doc_id, "root": sections_payload.get("root", {})}
@@ -211,37 +239,18 @@ def analyze(
 
     # Emit analysis_delta.json tracking what changed
     if preserve_uuids and old_blocks:
-        # Find new blocks (generated IDs, not matched to old)
-        new_block_ids = []
-        old_ids = {b.get("id") for b in old_blocks}
-        for block in blocks:
-            if block.get("id") not in old_ids:
-                new_block_ids.append(block.get("id"))
-        
-        # Find deleted blocks (old IDs not in new)
-        new_ids = {b.get("id") for b in blocks}
-        deleted_block_ids = [b.get("id") for b in old_blocks if b.get("id") not in new_ids]
-        
-        # Find modified blocks (same ID but different hash)
-        modified_block_ids = []
-        old_blocks_by_id = {b.get("id"): b for b in old_blocks}
-        for block in blocks:
-            block_id = block.get("id")
-            if block_id in old_blocks_by_id:
-                old_hash = old_blocks_by_id[block_id].get("content_hash", "")
-                new_hash = block.get("content_hash", "")
-                if old_hash != new_hash:
-                    modified_block_ids.append(block_id)
-        
+        delta = fingerprints.diff_blocks(old_blocks, blocks)
+
         delta_payload = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "matched_from_para_id": id_stats.get("from_para_id", 0),
             "matched_from_hash": id_stats.get("from_hash", 0),
             "matched_from_position": id_stats.get("from_position", 0),
             "generated_new": id_stats.get("generated", 0),
-            "new_blocks": new_block_ids,
-            "deleted_blocks": deleted_block_ids,
-            "modified_blocks": modified_block_ids,
+            # Version of the analysis the delta applies to, and of this one
+            "base_version": previous_version,
+            "version": manifest_version(manifest_payload),
+            **delta.to_dict(),
         }
         delta_path = out_dir / "analysis_delta.json"
         _write_json(delta_path, delta_payload)
@@ -281,16 +290,36 @@ def analyze(
     return artifacts
 
 
-def _write_json(path: Path, payload: Mapping[str, object] | Iterable[object]) -> None:
-    """Write JSON with UTF-8 encoding and a trailing newline."""
+def _write_json(
+    path: Path,
+    payload: Mapping[str, object] | Iterable[object],
+    *,
+    compact: bool = False,
+) -> None:
+    """Write JSON with UTF-8 encoding and a trailing newline.
+
+    ``compact`` drops indentation for large row-oriented payloads.
+    """
 
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, ensure_ascii=False, indent=2)
+        if compact:
+            json.dump(payload, handle, ensure_ascii=False, separators=(",", ":"))
+        else:
+            json.dump(payload, handle, ensure_ascii=False, indent=2)
         handle.write("\n")
 
 
+def _manifest_version(manifest_path: Path) -> str | None:
+    """Return the version token of an existing manifest, if readable."""
+
+    try:
+        return manifest_version(json.loads(manifest_path.read_text(encoding="utf-8")))
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
 def _collect_attachments(blocks: Iterable[Mapping[str, Any]]) -> list[Mapping[str, Any]]:
     """Extract attachment metadata from analyzer blocks in document order."""
 
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import struct
+import threading
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Mapping, Sequence
+from typing import Any, BinaryIO, Callable, Mapping, Sequence
+
+from effilocal.util.tokens import MESSAGE_OVERHEAD_TOKENS, estimate_tokens, estimate_tokens_cached
 
 CHAT_ARTIFACTS_ROOT = Path(os.environ.get("EFFILOCAL_CHAT_ARTIFACTS_DIR", "artifacts"))
 
@@ -22,6 +27,7 @@ class ConversationRecorder:
             "type": "message",
             "role": "user",
             "content": content,
+            "token_count": estimate_tokens(content),
         }
         if metadata:
             entry["metadata"] = dict(metadata)
@@ -33,6 +39,7 @@ class ConversationRecorder:
                 "type": "message",
                 "role": "assistant",
                 "content": content,
+                "token_count": estimate_tokens(content),
             }
         )
 
@@ -52,8 +59,359 @@ class ConversationRecorder:
         )
 
 
-def _history_path(doc_id: str) -> Path:
-    return CHAT_ARTIFACTS_ROOT / doc_id / "chat_history.jsonl"
+HISTORY_FILENAME = "chat_history.jsonl"
+INDEX_FILENAME = "chat_history.idx"
+ARCHIVE_FILENAME = "chat_history.archive.jsonl"
+
+# Compaction runs once the live file holds more than COMPACT_AFTER_ENTRIES
+# entries and keeps the newest KEEP_AFTER_COMPACTION behind a checkpoint.
+COMPACT_AFTER_ENTRIES = 400
+KEEP_AFTER_COMPACTION = 100
+FLUSH_EVERY_ENTRIES = 32
+SUMMARY_MAX_LINES = 40
+SUMMARY_LINE_CHARS = 200
+CHECKPOINT_HEADING = "Summary of the earlier conversation:"
+
+Summarizer = Callable[[str, Sequence[Mapping[str, Any]]], str]
+
+_OFFSET = struct.Struct("<Q")
+_SCAN_CHUNK = 1 << 20
+
+
+def _history_dir(doc_id: str) -> Path:
+    return CHAT_ARTIFACTS_ROOT / doc_id
+
+
+def _encode(entry: Mapping[str, Any]) -> bytes:
+    return (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _decode(line: bytes) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def summarize_entries(previous: str, entries: Sequence[Mapping[str, Any]]) -> str:
+    """Default checkpoint summary: one clipped line per user and assistant message.
+
+    Deterministic and model-free. Lines from ``previous`` come first and the
+    oldest lines are dropped beyond ``SUMMARY_MAX_LINES``.
+    """
+
+    lines = [line for line in previous.splitlines() if line.strip()]
+    for entry in entries:
+        if entry.get("type") != "message" or entry.get("role") not in {"user", "assistant"}:
+            continue
+        content = " ".join(str(entry.get("content", "") or "").split())
+        if not content:
+            continue
+        if len(content) > SUMMARY_LINE_CHARS:
+            content = content[: SUMMARY_LINE_CHARS - 3].rstrip() + "..."
+        label = "User" if entry["role"] == "user" else "Assistant"
+        lines.append(f"- {label}: {content}")
+    return "\n".join(lines[-SUMMARY_MAX_LINES:])
+
+
+class ChatHistoryStore:
+    """Append-only history for one document with a tail index and checkpoints.
+
+    ``chat_history.jsonl`` holds one entry per line and ``chat_history.idx``
+    the end offset of every line (little-endian uint64), so the last N
+    entries are located with one seek into the index and read without
+    decoding the rest of the log. An index that lags the log (older files,
+    interrupted writes) is caught up by scanning only the unindexed bytes.
+
+    Appends are buffered and written through handles that stay open. When
+    the live log outgrows ``compact_after`` entries, older entries move to
+    ``chat_history.archive.jsonl`` and the log is rewritten as a single
+    ``checkpoint`` entry summarising everything archived, followed by the
+    newest ``keep`` entries.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        compact_after: int = COMPACT_AFTER_ENTRIES,
+        keep: int = KEEP_AFTER_COMPACTION,
+        flush_every: int = FLUSH_EVERY_ENTRIES,
+        summarizer: Summarizer | None = None,
+    ) -> None:
+        if not 0 <= keep < compact_after:
+            raise ValueError("keep must be non-negative and smaller than compact_after")
+        self.directory = Path(directory)
+        self.path = self.directory / HISTORY_FILENAME
+        self.index_path = self.directory / INDEX_FILENAME
+        self.archive_path = self.directory / ARCHIVE_FILENAME
+        self.compact_after = compact_after
+        self.keep = keep
+        self.flush_every = max(1, flush_every)
+        self.summarizer: Summarizer = summarizer or summarize_entries
+        self._lock = threading.RLock()
+        self._pending: list[bytes] = []
+        self._log: BinaryIO | None = None
+        self._index: BinaryIO | None = None
+        self._count: int | None = None
+        self._size = 0
+
+    def __enter__(self) -> ChatHistoryStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._sync()
+            return int(self._count or 0) + len(self._pending)
+
+    def append(self, entries: Sequence[Mapping[str, Any]]) -> None:
+        """Buffer ``entries``; they are written every ``flush_every`` entries."""
+
+        if not entries:
+            return
+        with self._lock:
+            self._pending.extend(_encode(entry) for entry in entries)
+            if len(self._pending) >= self.flush_every:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write buffered entries, compacting if the log has grown too long."""
+
+        with self._lock:
+            self._write_pending()
+            if (self._count or 0) > self.compact_after:
+                self.compact()
+
+    def close(self) -> None:
+        """Flush and release the open file handles."""
+
+        with self._lock:
+            self.flush()
+            self._close_handles()
+
+    def tail(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """Return the checkpoint (if any) followed by the last ``limit`` entries.
+
+        Reads ``limit`` index slots and the matching byte range of the log,
+        so the cost does not grow with the length of the conversation.
+        ``None`` returns every live entry.
+        """
+
+        with self._lock:
+            self._write_pending()
+            self._sync()
+            count = self._count or 0
+            if not count:
+                return []
+            first = 0 if limit is None else max(count - max(limit, 0), 0)
+            entries = self._read_entries(first, count)
+            if first > 0:
+                head = self._read_entries(0, 1)
+                if head and head[0].get("type") == "checkpoint":
+                    entries.insert(0, head[0])
+            return entries
+
+    def compact(self) -> bool:
+        """Archive all but the newest ``keep`` entries behind a checkpoint.
+
+        The archive is appended before the live log is atomically replaced,
+        so an interrupted compaction can duplicate archived entries but never
+        lose them. Returns ``False`` when there is nothing to archive.
+        """
+
+        with self._lock:
+            entries = self.tail(None)
+            checkpoint = entries[0] if entries and entries[0].get("type") == "checkpoint" else None
+            body = entries[1:] if checkpoint else entries
+            split = len(body) - self.keep
+            if split <= 0:
+                return False
+            archived, kept = body[:split], body[split:]
+            previous = str(checkpoint.get("summary", "") or "") if checkpoint else ""
+            summary = self.summarizer(previous, archived)
+            archived_total = int(checkpoint.get("archived_entries", 0) or 0) if checkpoint else 0
+            new_checkpoint = {
+                "type": "checkpoint",
+                "summary": summary,
+                "archived_entries": archived_total + len(archived),
+                "token_count": estimate_tokens(summary),
+            }
+            self._close_handles()
+            with self.archive_path.open("ab") as handle:
+                handle.write(b"".join(_encode(entry) for entry in archived))
+            lines = [_encode(new_checkpoint), *(_encode(entry) for entry in kept)]
+            offsets = bytearray()
+            end = 0
+            for line in lines:
+                end += len(line)
+                offsets += _OFFSET.pack(end)
+            _replace_bytes(self.path, b"".join(lines))
+            _replace_bytes(self.index_path, bytes(offsets))
+            self._count, self._size = len(lines), end
+            return True
+
+    def discard(self) -> None:
+        """Drop buffered entries and release handles without writing."""
+
+        with self._lock:
+            self._pending.clear()
+            self._close_handles()
+            self._count = None
+            self._size = 0
+
+    def _handles(self) -> tuple[BinaryIO, BinaryIO]:
+        if self._log is None or self._index is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._log = self.path.open("ab")
+            self._index = self.index_path.open("ab")
+        return self._log, self._index
+
+    def _close_handles(self) -> None:
+        for handle in (self._log, self._index):
+            if handle is not None:
+                handle.close()
+        self._log = self._index = None
+
+    def _write_pending(self) -> None:
+        if not self._pending:
+            return
+        self._sync()
+        log, index = self._handles()
+        offsets = bytearray()
+        end = self._size
+        for line in self._pending:
+            end += len(line)
+            offsets += _OFFSET.pack(end)
+        # Log first: an index that lags is repaired by _sync, one that leads is not.
+        log.write(b"".join(self._pending))
+        log.flush()
+        index.write(offsets)
+        index.flush()
+        self._count = (self._count or 0) + len(self._pending)
+        self._size = end
+        self._pending.clear()
+
+    def _sync(self) -> None:
+        """Make the index cover the whole log, scanning only unindexed bytes."""
+
+        if self._log is not None and self._count is not None:
+            return  # this store is the writer; its state is current
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if self._count is None:
+            self._count, self._size = self._load_index_state()
+        if size == self._size:
+            return
+        if size < self._size:
+            # The log was truncated or replaced underneath the index.
+            self.index_path.unlink(missing_ok=True)
+            self._count, self._size = 0, 0
+            if size == 0:
+                return  # the log is empty or gone; nothing to index
+        self._index_range(self._size, size)
+
+    def _load_index_state(self) -> tuple[int, int]:
+        try:
+            index_size = self.index_path.stat().st_size
+        except FileNotFoundError:
+            return 0, 0
+        count = index_size // _OFFSET.size
+        if index_size % _OFFSET.size:
+            os.truncate(self.index_path, count * _OFFSET.size)  # torn slot
+        if not count:
+            return 0, 0
+        with self.index_path.open("rb") as handle:
+            handle.seek((count - 1) * _OFFSET.size)
+            (covered,) = _OFFSET.unpack(handle.read(_OFFSET.size))
+        return count, covered
+
+    def _index_range(self, start: int, stop: int) -> None:
+        ends: list[int] = []
+        with self.path.open("rb") as handle:
+            handle.seek(start)
+            position = start
+            while position < stop:
+                chunk = handle.read(min(_SCAN_CHUNK, stop - position))
+                if not chunk:
+                    break
+                cursor = chunk.find(b"\n")
+                while cursor != -1:
+                    ends.append(position + cursor + 1)
+                    cursor = chunk.find(b"\n", cursor + 1)
+                position += len(chunk)
+        if position > (ends[-1] if ends else start):
+            # A torn final line: terminate it so it decodes as junk on its own.
+            with self.path.open("ab") as handle:
+                handle.write(b"\n")
+            position += 1
+            ends.append(position)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self.index_path.open("ab") as handle:
+            handle.write(b"".join(_OFFSET.pack(end) for end in ends))
+        self._count = (self._count or 0) + len(ends)
+        self._size = position
+
+    def _read_entries(self, first: int, stop: int) -> list[dict[str, Any]]:
+        slot = max(first - 1, 0)
+        with self.index_path.open("rb") as handle:
+            handle.seek(slot * _OFFSET.size)
+            raw = handle.read((stop - slot) * _OFFSET.size)
+        ends = [end for (end,) in _OFFSET.iter_unpack(raw)]
+        if first > 0:
+            start, ends = ends[0], ends[1:]
+        else:
+            start = 0
+        with self.path.open("rb") as handle:
+            handle.seek(start)
+            data = handle.read(ends[-1] - start) if ends else b""
+        entries: list[dict[str, Any]] = []
+        cursor = 0
+        for end in ends:
+            line = data[cursor : end - start].strip()
+            cursor = end - start
+            payload = _decode(line) if line else None
+            if payload is not None:
+                entries.append(payload)
+        return entries
+
+
+def _replace_bytes(path: Path, data: bytes) -> None:
+    """Atomically replace ``path`` with ``data`` via a sibling temp file."""
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+
+
+_STORES: dict[Path, ChatHistoryStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def history_store(doc_id: str) -> ChatHistoryStore:
+    """Return this process's shared history store for ``doc_id``."""
+
+    directory = _history_dir(doc_id).absolute()
+    with _STORES_LOCK:
+        store = _STORES.get(directory)
+        if store is None:
+            store = _STORES[directory] = ChatHistoryStore(directory)
+        return store
+
+
+@atexit.register
+def flush_history_stores() -> None:
+    """Flush buffered appends of every open store (also run at exit)."""
+
+    with _STORES_LOCK:
+        stores = list(_STORES.values())
+    for store in stores:
+        store.flush()
 
 
 def format_user_prompt(doc_id: str, question: str) -> str:
@@ -63,69 +421,76 @@ def format_user_prompt(doc_id: str, question: str) -> str:
     return f"Document ID: {doc_id}\n\n{stripped}" if stripped else f"Document ID: {doc_id}"
 
 
-def load_history_entries(doc_id: str) -> list[dict[str, Any]]:
-    """Load stored history entries for ``doc_id``."""
-
-    path = _history_path(doc_id)
-    if not path.is_file():
-        return []
-    entries: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                payload = json.loads(stripped)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(payload, dict):
-                entries.append(payload)
-    return entries
+def load_history_entries(doc_id: str, limit: int | None = None) -> list[dict[str, Any]]:
+    """Load stored history entries for ``doc_id``.
+
+    With ``limit`` only the newest ``limit`` entries are read, preceded by
+    the compaction checkpoint when one exists.
+    """
+
+    return history_store(doc_id).tail(limit)
 
 
 def history_entries_to_messages(entries: Sequence[Mapping[str, Any]], doc_id: str) -> list[dict[str, Any]]:
-    """Convert stored entries to chat messages for the next run."""
+    """Convert stored entries to chat messages for the next run.
+
+    Each message carries a ``token_count`` estimate (taken from the entry
+    when it was recorded) for context budgeting; ``run_chat_loop`` strips it
+    before sending. A compaction checkpoint becomes a developer message
+    carrying its summary.
+    """
 
+    prefix_tokens = estimate_tokens_cached(format_user_prompt(doc_id, ""))
     messages: list[dict[str, Any]] = []
     for entry in entries:
+        if entry.get("type") == "checkpoint":
+            summary = str(entry.get("summary", "") or "").strip()
+            if summary:
+                content = f"{CHECKPOINT_HEADING}\n{summary}"
+                messages.append(
+                    {
+                        "role": "developer",
+                        "content": content,
+                        "token_count": estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS,
+                    }
+                )
+            continue
         if entry.get("type") != "message":
             continue
         role = entry.get("role")
         if role not in {"user", "assistant"}:
             continue
         content = str(entry.get("content", "") or "")
+        token_count = entry.get("token_count")
+        if not isinstance(token_count, int):
+            token_count = estimate_tokens(content)
         if role == "user":
             content = format_user_prompt(doc_id, content)
+            token_count += prefix_tokens
         message = {
             "role": role,
             "content": content,
+            "token_count": token_count + MESSAGE_OVERHEAD_TOKENS,
         }
         messages.append(message)
     return messages
 
 
 def append_history_entries(doc_id: str, entries: Sequence[Mapping[str, Any]]) -> None:
-    """Append new conversation entries for ``doc_id``."""
+    """Append new conversation entries for ``doc_id`` (buffered)."""
 
-    if not entries:
-        return
-    path = _history_path(doc_id)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as handle:
-        for entry in entries:
-            handle.write(json.dumps(entry, ensure_ascii=False))
-            handle.write("\n")
+    history_store(doc_id).append(entries)
 
 
 def clear_history(doc_id: str) -> None:
-    """Delete the stored history for ``doc_id`` if it exists."""
+    """Delete the stored history, index and archive for ``doc_id``."""
 
-    path = _history_path(doc_id)
-    try:
-        path.unlink()
-    except FileNotFoundError:
-        return
-    parent = path.parent
-    if parent.exists() and not any(parent.iterdir()):
-        parent.rmdir()
+    directory = _history_dir(doc_id)
+    with _STORES_LOCK:
+        store = _STORES.pop(directory.absolute(), None)
+    if store is not None:
+        store.discard()
+    for name in (HISTORY_FILENAME, INDEX_FILENAME, ARCHIVE_FILENAME):
+        (directory / name).unlink(missing_ok=True)
+    if directory.exists() and not any(directory.iterdir()):
+        directory.rmdir()
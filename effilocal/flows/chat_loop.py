@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
 import logging
+import threading
 from pprint import pformat
 from pathlib import Path
 from typing import Any, Mapping, Sequence
@@ -15,13 +18,44 @@ from effilocal.logging import get_tracer
 import logfire
 from shared.structured import ToolArgsError, parse_tool_result
 from effilocal.flows.chat_history import ConversationRecorder, format_user_prompt
+from effilocal.util.tokens import MESSAGE_OVERHEAD_TOKENS, estimate_tokens, estimate_tokens_cached
 
 __all__ = ["run_chat_loop"]
 
 _DEVELOPER_PROMPT_PATH = Path("prompts/chat_tool_use.md")
 _MAX_PAGINATION_STEPS = 20
+# Estimated input tokens for prompts and history; the rest of the model
+# context is left for tool results and the answer.
+DEFAULT_CONTEXT_TOKENS = 64_000
+# Dispatcher tools that only read analysis artifacts and may run concurrently.
+_READ_ONLY_TOOLS = frozenset({
+    "get_doc_outline",
+    "get_section",
+    "get_content_by_range",
+    "get_related_units",
+    "get_by_tag",
+    "get_by_clause_number",
+})
+_MAX_TOOL_WORKERS = 4
 LOGGER = logging.getLogger(__name__)
 
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _executor(name: str) -> ThreadPoolExecutor:
+    """Return the shared pool ``name``, creating it on first use.
+
+    Tool calls and page prefetches use separate pools: a tool call waits on
+    its prefetches, so sharing one pool could starve them.
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=_MAX_TOOL_WORKERS, thread_name_prefix=f"chat-{name}")
+            _executors[name] = executor
+        return executor
+
 
 def _load_developer_prompt() -> str:
     if not _DEVELOPER_PROMPT_PATH.is_file():
@@ -39,28 +73,29 @@ def run_chat_loop(
     question: str,
     history: Sequence[Mapping[str, Any]] | None = None,
     recorder: ConversationRecorder | None = None,
+    context_tokens: int = DEFAULT_CONTEXT_TOKENS,
 ) -> str:
     """
     Execute a skeleton chat loop against the Responses API.
 
     The implementation intentionally stops after the first completed response;
     later sprints will extend this with tool handling and streaming updates.
+
+    ``history`` is trimmed, oldest first, so the estimated size of the
+    prompts, history and question stays within ``context_tokens``.
     """
 
     system_prompt = get_chat_system_prompt()
     developer_prompt = _load_developer_prompt()
-
-    messages: list[Mapping[str, Any]] = [
-        {"role": "system", "content": system_prompt},
-        {"role": "developer", "content": developer_prompt},
-    ]
-    if history:
-        messages.extend(history)
-    messages.append(
-        {
-            "role": "user",
-            "content": format_user_prompt(doc_id, question),
-        }
+    user_message = {
+        "role": "user",
+        "content": format_user_prompt(doc_id, question),
+    }
+    fixed_tokens = (
+        estimate_tokens_cached(system_prompt)
+        + estimate_tokens_cached(developer_prompt)
+        + estimate_tokens(user_message["content"])
+        + 3 * MESSAGE_OVERHEAD_TOKENS
     )
 
     with get_tracer(
@@ -80,19 +115,29 @@ def run_chat_loop(
         with logfire.span(
             "chat.budget",
             _span_name="chat.budget",
-            message_count=len(messages),
-        ):
-            # Budgeting helper will plug in here once token estimates are wired up.
-            pass
+            history_count=len(history or ()),
+            context_tokens=context_tokens,
+        ) as budget_span:
+            kept_history, history_tokens = _fit_history(history or (), context_tokens - fixed_tokens)
+            messages: list[Mapping[str, Any]] = [
+                {"role": "system", "content": system_prompt},
+                {"role": "developer", "content": developer_prompt},
+                *kept_history,
+                user_message,
+            ]
+            if budget_span is not None:
+                budget_span.set_attribute("history_dropped", len(history or ()) - len(kept_history))
+                budget_span.set_attribute("estimated_tokens", fixed_tokens + history_tokens)
 
         stream = client.responses.stream(
             model=model,
             input=messages,
             tools=tools,
-            parallel_tool_calls=False,
+            parallel_tool_calls=True,
         )
 
         final_text_parts: list[str] = []
+        tool_calls = _ToolCallQueue(recorder)
         with stream as events:
             for event in events:
                 event_type = getattr(event, "type", None)
@@ -110,8 +155,9 @@ def run_chat_loop(
                     if LOGGER.isEnabledFor(logging.DEBUG):
                         func = getattr(event, "function", None)
                         LOGGER.debug("tool call event: %s", getattr(func, "name", None))
-                    _handle_tool_call(event, recorder=recorder)
+                    tool_calls.submit(event)
                 elif event_type == "response.completed":
+                    tool_calls.drain()
                     response_obj = getattr(event, "response", None)
                     if response_obj is not None:
                         final_text_parts.append(
@@ -119,8 +165,10 @@ def run_chat_loop(
                         )
                     break
                 elif event_type == "response.error":
+                    tool_calls.drain()
                     error = getattr(event, "error", "Unknown error")
                     raise RuntimeError(f"Responses API error: {error}")
+            tool_calls.drain()
 
         with logfire.span(
             "chat.compose",
@@ -139,7 +187,88 @@ def run_chat_loop(
             return composed
 
 
+def _message_tokens(message: Mapping[str, Any]) -> int:
+    stored = message.get("token_count")
+    if isinstance(stored, int):
+        return stored
+    return estimate_tokens(str(message.get("content", "") or "")) + MESSAGE_OVERHEAD_TOKENS
+
+
+def _fit_history(
+    history: Sequence[Mapping[str, Any]],
+    budget: int,
+) -> tuple[list[dict[str, Any]], int]:
+    """Keep the newest history messages whose estimated tokens fit ``budget``.
+
+    Uses the ``token_count`` stored on each message, so text is only
+    tokenized for messages recorded without one. Returns the messages, ready
+    to send (``token_count`` removed), and their estimated token total.
+    """
+
+    kept = 0
+    total = 0
+    for message in reversed(history):
+        tokens = _message_tokens(message)
+        if total + tokens > budget:
+            break
+        total += tokens
+        kept += 1
+
+    start = len(history) - kept
+    # Don't open with an answer whose question was dropped
+    while start < len(history) and history[start].get("role") == "assistant":
+        total -= _message_tokens(history[start])
+        start += 1
+
+    trimmed = [
+        {key: value for key, value in message.items() if key != "token_count"}
+        for message in history[start:]
+    ]
+    return trimmed, total
+
+
 def _handle_tool_call(event: Any, *, recorder: ConversationRecorder | None) -> None:
+    name, arguments = _parse_tool_call(event)
+    _deliver_tool_result(event, name, arguments, _run_tool(name, arguments), recorder=recorder)
+
+
+class _ToolCallQueue:
+    """Runs the tool calls of one response and delivers results in call order.
+
+    Read-only dispatcher tools start on the shared pool as soon as their
+    event arrives, so parallel tool calls overlap. Any other tool first
+    waits for the calls before it and then runs inline. Results are
+    recorded and submitted strictly in the order the calls arrived.
+    """
+
+    def __init__(self, recorder: ConversationRecorder | None) -> None:
+        self._recorder = recorder
+        self._pending: deque[tuple[Any, str, dict[str, Any], Future[dict[str, Any]]]] = deque()
+
+    def submit(self, event: Any) -> None:
+        name, arguments = _parse_tool_call(event)
+        if name in _READ_ONLY_TOOLS:
+            future = _executor("tools").submit(_run_tool, name, arguments)
+        else:
+            self.drain()
+            future = Future()
+            future.set_result(_run_tool(name, arguments))
+        self._pending.append((event, name, arguments, future))
+        # Hand back whatever has already finished, without blocking the stream
+        while self._pending and self._pending[0][3].done():
+            self._deliver_next()
+
+    def drain(self) -> None:
+        """Wait for every outstanding call and deliver the results in order."""
+        while self._pending:
+            self._deliver_next()
+
+    def _deliver_next(self) -> None:
+        event, name, arguments, future = self._pending.popleft()
+        _deliver_tool_result(event, name, arguments, future.result(), recorder=self._recorder)
+
+
+def _parse_tool_call(event: Any) -> tuple[str, dict[str, Any]]:
     function = getattr(event, "function", None)
     if function is None:
         raise RuntimeError("Tool call event missing function payload")
@@ -170,15 +299,26 @@ def _handle_tool_call(event: Any, *, recorder: ConversationRecorder | None) -> N
         argument_keys=sorted(arguments.keys()),
     ):
         validated_arguments = dict(arguments)
+    return name, validated_arguments
+
 
+def _run_tool(name: str, arguments: Mapping[str, Any]) -> dict[str, Any]:
     try:
-        merged_result = _execute_tool_with_pagination(name, validated_arguments)
-        payload = merged_result
+        return _execute_tool_with_pagination(name, arguments)
     except ToolArgsError as exc:
-        payload = {"error": str(exc) or exc.__class__.__name__}
+        return {"error": str(exc) or exc.__class__.__name__}
 
+
+def _deliver_tool_result(
+    event: Any,
+    name: str,
+    arguments: Mapping[str, Any],
+    payload: Mapping[str, Any],
+    *,
+    recorder: ConversationRecorder | None,
+) -> None:
     if recorder is not None:
-        recorder.record_tool_call(name, validated_arguments, payload)
+        recorder.record_tool_call(name, arguments, payload)
 
     event.result = json.dumps(payload, ensure_ascii=False)
     submit = getattr(event, "submit", None)
@@ -196,20 +336,38 @@ def _execute_tool_with_pagination(
     visited_tokens: set[str | int] = set()
     current_arguments = dict(base_arguments)
 
+    def fetch(page_arguments: Mapping[str, Any]) -> Future[Any]:
+        payload = {
+            "function": {
+                "name": tool_name,
+                "arguments": dict(page_arguments),
+            }
+        }
+        return _executor("pages").submit(run_tool_call, payload)
+
     with logfire.span(
         "chat.dispatch",
         _span_name="chat.dispatch",
         tool=tool_name,
         base_argument_keys=sorted(base_arguments.keys()),
     ):
+        pending: Future[Any] | None = None
         for page_index in range(_MAX_PAGINATION_STEPS):
-            payload = {
-                "function": {
-                    "name": tool_name,
-                    "arguments": current_arguments,
-                }
-            }
-            raw_result = run_tool_call(payload)
+            if pending is None:
+                pending = fetch(current_arguments)
+            raw_result = pending.result()
+            pending = None
+
+            # Request the next page before parsing this one so the two overlap
+            prefetched_token = raw_result.get("next_page")
+            if (
+                raw_result.get("truncated")
+                and prefetched_token is not None
+                and prefetched_token not in visited_tokens
+                and page_index + 1 < _MAX_PAGINATION_STEPS
+            ):
+                pending = fetch({**base_arguments, "page_token": prefetched_token})
+
             result_model = parse_tool_result(raw_result)
 
             with logfire.span(
@@ -234,6 +392,9 @@ def _execute_tool_with_pagination(
             visited_tokens.add(next_page)
             current_arguments = dict(base_arguments)
             current_arguments["page_token"] = next_page
+            if pending is not None and next_page != prefetched_token:
+                pending.cancel()
+                pending = None
         else:
             raise ToolArgsError("Exceeded maximum pagination depth")
 
@@ -0,0 +1,182 @@
+"""Per-clause change timelines across the git history of an analysis.
+
+Answers questions like "what changed in clause 12 across the last N saves"
+from the ``fingerprints.json`` snapshots committed alongside each analysis.
+All versions are read through the repository's shared ``cat-file`` process
+(:class:`effilocal.util.git_ops.GitBackend`); no ``.docx`` is checked out or
+re-analyzed.
+
+Commits without a ``fingerprints.json`` (those made before it was
+introduced) are handled by deriving the fingerprints from the
+``blocks.jsonl`` committed at that revision.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from effilocal.config.logging import get_logger
+from effilocal.doc.fingerprints import (
+    FINGERPRINTS_FILENAME,
+    BlockDelta,
+    BlockFingerprint,
+    build_fingerprints,
+    clause_matches,
+    diff_fingerprints,
+    load_fingerprints,
+)
+from effilocal.util.git_ops import (
+    CommitInfo,
+    FileVersion,
+    get_backend,
+    get_repo_root,
+)
+
+__all__ = [
+    "ClauseChange",
+    "HistoryDiffError",
+    "clause_timeline",
+]
+
+LOGGER = get_logger(__name__)
+
+BLOCKS_FILENAME = "blocks.jsonl"
+
+
+class HistoryDiffError(RuntimeError):
+    """Raised when a history diff cannot be computed."""
+
+
+@dataclass(slots=True)
+class ClauseChange:
+    """Changes to one clause introduced by a single commit."""
+
+    commit: CommitInfo
+    delta: BlockDelta
+    initial: bool = False
+    texts: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        payload: dict[str, Any] = {
+            "commit": self.commit.to_dict(),
+            "initial": self.initial,
+            **self.delta.to_dict(),
+        }
+        if self.texts:
+            payload["texts"] = dict(self.texts)
+        return payload
+
+
+def _fingerprints_from_blob(content: bytes, filename: str) -> list[BlockFingerprint]:
+    text = content.decode("utf-8")
+    if filename == FINGERPRINTS_FILENAME:
+        return load_fingerprints(json.loads(text))
+    blocks = [json.loads(line) for line in text.splitlines() if line.strip()]
+    return load_fingerprints(build_fingerprints(blocks))
+
+
+def _load_versions(
+    repo_root: Path,
+    analysis_dir: Path,
+    max_commits: int,
+) -> list[tuple[FileVersion, str]]:
+    """Return ``(version, filename)`` per commit touching either snapshot file.
+
+    Each commit is read from ``fingerprints.json`` when that commit has one
+    and from ``blocks.jsonl`` otherwise, so commits made before fingerprints
+    were introduced stay in the timeline.
+    """
+    backend = get_backend(repo_root)
+    rel_fingerprints = (analysis_dir / FINGERPRINTS_FILENAME).relative_to(repo_root)
+    rel_blocks = (analysis_dir / BLOCKS_FILENAME).relative_to(repo_root)
+    versions: list[tuple[FileVersion, str]] = []
+    for commit in backend.log(rel_fingerprints, rel_blocks, max_commits=max_commits):
+        content = backend.read_blob(commit.hash, rel_fingerprints)
+        if content is not None:
+            versions.append((FileVersion(commit, content), FINGERPRINTS_FILENAME))
+        else:
+            versions.append((FileVersion(commit, backend.read_blob(commit.hash, rel_blocks)), BLOCKS_FILENAME))
+    return versions
+
+
+def _block_texts(
+    repo_root: Path,
+    rel_blocks_path: Path,
+    commit_hash: str,
+    block_ids: set[str],
+) -> dict[str, str]:
+    content = get_backend(repo_root).read_blob(commit_hash, rel_blocks_path)
+    if content is None:
+        return {}
+    texts: dict[str, str] = {}
+    for line in content.decode("utf-8").splitlines():
+        if not line.strip():
+            continue
+        block = json.loads(line)
+        if block.get("id") in block_ids:
+            texts[block["id"]] = block.get("text", "")
+    return texts
+
+
+def clause_timeline(
+    analysis_dir: Path,
+    clause: str,
+    *,
+    max_commits: int = 50,
+    attachment_id: str | None = None,
+    include_text: bool = False,
+) -> list[ClauseChange]:
+    """Return the commits that changed ``clause``, oldest first.
+
+    Args:
+        analysis_dir: Analysis directory tracked in git (holds fingerprints.json).
+        clause: Clause number such as ``"12"`` or ``"12.3"``; sub-clauses are included.
+        max_commits: Number of most recent snapshot commits to examine.
+        attachment_id: Restrict to a schedule/annex; ``None`` means the main body.
+        include_text: When True, add the text of added/modified blocks, read
+            from the ``blocks.jsonl`` committed at that revision.
+
+    Returns:
+        One :class:`ClauseChange` per commit that altered the clause. The first
+        snapshot in which the clause appears is reported with ``initial=True``.
+
+    Raises:
+        HistoryDiffError: If ``analysis_dir`` is not inside a git repository.
+    """
+    analysis_dir = Path(analysis_dir).resolve()
+    repo_root = get_repo_root(analysis_dir)
+    if repo_root is None:
+        raise HistoryDiffError(f"Not in a git repository: {analysis_dir}")
+    repo_root = repo_root.resolve()
+
+    versions = _load_versions(repo_root, analysis_dir, max_commits)
+    LOGGER.debug("Loaded %d snapshots for %s", len(versions), analysis_dir)
+    rel_blocks_path = (analysis_dir / BLOCKS_FILENAME).relative_to(repo_root)
+
+    changes: list[ClauseChange] = []
+    previous: list[BlockFingerprint] = []
+    seen = False
+    for version, filename in reversed(versions):
+        if version.content is None:
+            continue
+        current = [
+            fp
+            for fp in _fingerprints_from_blob(version.content, filename)
+            if fp.attachment_id == attachment_id and clause_matches(fp.clause, clause)
+        ]
+        delta = diff_fingerprints(previous, current)
+        initial = not seen and bool(current)
+        seen = seen or bool(current)
+        previous = current
+        if not delta:
+            continue
+        change = ClauseChange(commit=version.commit, delta=delta, initial=initial)
+        if include_text:
+            wanted = set(delta.new_blocks) | set(delta.modified_blocks)
+            change.texts = _block_texts(repo_root, rel_blocks_path, version.commit.hash, wanted)
+        changes.append(change)
+    return changes
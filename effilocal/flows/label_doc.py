@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import re
 from collections import OrderedDict
 from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
@@ -17,7 +18,7 @@ from effilocal.ai.labeling import (
 )
 from effilocal.ai.prompts import build_labeling_prompt
 from effilocal.util.io import iter_jsonl
-from effilocal.util.redact import redact_snippets
+from effilocal.util.redact import load_redactor, redact_snippets
 
 SCHEMA_DIR = Path(__file__).resolve().parents[2] / "schemas"
 LABELS_SCHEMA_PATH = SCHEMA_DIR / "labels.schema.json"
@@ -50,8 +51,13 @@ def label(
     temperature: float | None = None,
     redact: bool = False,
     payload_max_chars: int | None = None,
+    redact_rules: Path | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
-    """Run the Sprint 2 labeling flow using stub transport."""
+    """Run the Sprint 2 labeling flow using stub transport.
+
+    ``redact_rules`` points at a JSON rule file (see ``Redactor.from_file``)
+    with extra terms and patterns to mask; it implies ``redact``.
+    """
 
     doc_dir = Path(data_dir) / doc_id
     if not doc_dir.exists():
@@ -63,14 +69,17 @@ def label(
 
     outline = build_outline(sections_path, blocks_path)
     snippets = build_snippets(sections_path, blocks_path)
-    if redact:
-        snippets = redact_snippets(snippets)
+    if redact or redact_rules:
+        redact = True
+        try:
+            redactor = load_redactor(redact_rules)
+        except (OSError, ValueError, KeyError, re.error) as exc:
+            raise LabelingError(f"Invalid redaction rules {redact_rules}: {exc}") from exc
+        snippets = redact_snippets(snippets, redactor)
     style_summary = load_style_summary(styles_path)
     section_lookup = build_section_lookup(outline)
 
-    limit = batch_section_limit if batch_section_limit is not None else BATCH_SECTION_LIMIT
     run_temperature = DEFAULT_TEMPERATURE if temperature is None else temperature
-    outline_batches = _split_outline(outline, limit)
     selected_transport = transport or _build_transport(run_temperature)
     schema = _load_labels_schema()
     debug_payload_content: dict[str, Any] | None = None
@@ -78,7 +87,15 @@ def label(
     batch_payloads: list[dict[str, Any]] | None = None
 
     try:
-        if len(outline_batches) == 1:
+        batches = _pack_outline(
+            doc_id,
+            outline,
+            snippets,
+            style_summary,
+            max_chars=payload_max_chars,
+            section_limit=batch_section_limit,
+        )
+        if len(batches) == 1:
             system_message, payload = build_labeling_prompt(
                 doc_id,
                 {
@@ -108,8 +125,7 @@ def label(
         else:
             result, meta, batch_payloads = _run_batched_labeling(
                 doc_id=doc_id,
-                outline_batches=outline_batches,
-                snippets=snippets,
+                batches=batches,
                 style_summary=style_summary,
                 transport=selected_transport,
                 schema=schema,
@@ -184,22 +200,31 @@ def build_outline(
     sections_path: Path,
     blocks_path: Path,
 ) -> list[dict[str, Any]]:
-    """Construct outline entries with block and character counts."""
+    """Construct outline entries with block and character counts.
+
+    Uses the ``char_count`` that analysis stores on each section; blocks are
+    only read for sections written before it was recorded.
+    """
 
     sections = json.loads(Path(sections_path).read_text(encoding="utf-8"))
-    blocks_by_id = {block["id"]: block for block in _iter_blocks(blocks_path)}
+    blocks_by_id: dict[str, Mapping[str, Any]] | None = None
 
     outline: list[dict[str, Any]] = []
     for node in _iter_section_nodes(sections.get("root", {})):
         block_ids = node.get("block_ids", [])
-        texts = [blocks_by_id.get(block_id, {}).get("text", "") for block_id in block_ids]
+        char_count = node.get("char_count")
+        if not isinstance(char_count, int):
+            if blocks_by_id is None:
+                blocks_by_id = {block["id"]: block for block in _iter_blocks(blocks_path)}
+            texts = [blocks_by_id.get(block_id, {}).get("text", "") for block_id in block_ids]
+            char_count = sum(len(text or "") for text in texts)
         outline.append(
             {
                 "section_id": node.get("id"),
                 "title": node.get("title"),
                 "level": node.get("level"),
                 "block_count": len(block_ids),
-                "char_count": sum(len(text or "") for text in texts),
+                "char_count": char_count,
             }
         )
     return outline
@@ -296,8 +321,7 @@ def _resolve_real_transport(temperature: float) -> TransportFn:
 def _run_batched_labeling(
     *,
     doc_id: str,
-    outline_batches: list[list[dict[str, Any]]],
-    snippets: Mapping[str, str],
+    batches: list[tuple[list[dict[str, Any]], dict[str, str]]],
     style_summary: Mapping[str, Any],
     transport: Any,
     schema: Mapping[str, Any] | None,
@@ -307,13 +331,7 @@ def _run_batched_labeling(
     batch_results: list[tuple[dict[str, Any], dict[str, Any]]] = []
     batch_payloads: list[dict[str, Any]] = []
 
-    for batch_outline in outline_batches:
-        section_ids: list[str] = []
-        for entry in batch_outline:
-            section_id = entry.get("section_id")
-            if isinstance(section_id, str) and section_id:
-                section_ids.append(section_id)
-        batch_snippets = _filter_snippets(snippets, section_ids)
+    for batch_outline, batch_snippets in batches:
         system_message, payload = build_labeling_prompt(
             doc_id,
             {
@@ -345,6 +363,124 @@ def _split_outline(outline: list[dict[str, Any]], limit: int | None) -> list[lis
     return [outline[index : index + limit] for index in range(0, len(outline), limit)]
 
 
+def _pack_outline(
+    doc_id: str,
+    outline: list[dict[str, Any]],
+    snippets: Mapping[str, str],
+    style_summary: Mapping[str, Any],
+    *,
+    max_chars: int | None,
+    section_limit: int | None,
+) -> list[tuple[list[dict[str, Any]], dict[str, str]]]:
+    """Group the outline into labeling batches of (outline, snippets).
+
+    Without a character budget the outline is cut into groups of
+    ``section_limit`` (default ``BATCH_SECTION_LIMIT``) sections. With one,
+    sections are packed in document order into as few batches as fit the
+    budget; ``section_limit`` then only applies when given explicitly. Each
+    section's serialized size is measured once, so batches are sized
+    without building their payloads. Batches stay contiguous so the model
+    sees neighbouring sections together, and cutting a new batch only when
+    the next section does not fit gives the fewest contiguous batches.
+
+    A section too large for any batch of its own has its snippet split at
+    whitespace into parts that fit; each part goes out with the section's
+    outline entry, marked ``snippet_part``, in a batch by itself.
+
+    Raises:
+        PayloadBudgetExceeded: If a section's outline entry alone exceeds
+            the budget.
+    """
+    if max_chars is None or max_chars <= 0:
+        limit = section_limit if section_limit is not None else BATCH_SECTION_LIMIT
+        return [
+            (batch, _filter_snippets(snippets, _batch_section_ids(batch)))
+            for batch in _split_outline(outline, limit)
+        ]
+    if not outline:
+        return [(outline, {})]
+
+    limit = section_limit if section_limit is not None and section_limit > 0 else None
+    _, empty_payload = build_labeling_prompt(
+        doc_id,
+        {"outline": [], "snippets": {}, "style_summary": style_summary},
+    )
+    base_chars = _json_size(empty_payload)
+
+    batches: list[tuple[list[dict[str, Any]], dict[str, str]]] = []
+    batch_outline: list[dict[str, Any]] = []
+    batch_snippets: dict[str, str] = {}
+    batch_chars = base_chars
+
+    def flush() -> None:
+        nonlocal batch_outline, batch_snippets, batch_chars
+        if batch_outline:
+            batches.append((batch_outline, batch_snippets))
+        batch_outline, batch_snippets, batch_chars = [], {}, base_chars
+
+    for entry in outline:
+        section_id = entry.get("section_id")
+        snippet = snippets.get(section_id, "") if isinstance(section_id, str) and section_id else None
+        # Each item also costs a ", " separator in its list or object
+        entry_chars = _json_size(entry) + 2
+        snippet_chars = 0 if snippet is None else _json_size(section_id) + 2 + _json_size(snippet) + 2
+
+        if batch_chars + entry_chars + snippet_chars > max_chars or (limit and len(batch_outline) >= limit):
+            flush()
+        if batch_chars + entry_chars + snippet_chars <= max_chars:
+            batch_outline.append(entry)
+            if snippet is not None:
+                batch_snippets[section_id] = snippet
+            batch_chars += entry_chars + snippet_chars
+            continue
+
+        # Too large even for an empty batch: send the snippet in parts
+        part_entry_chars = _json_size({**entry, "snippet_part": "999/999"}) + 2
+        room = max_chars - base_chars - part_entry_chars - (_json_size(section_id) + 4 if snippet is not None else 0)
+        if snippet is None or room < _MIN_SNIPPET_PART_CHARS:
+            raise PayloadBudgetExceeded(base_chars + entry_chars + snippet_chars, max_chars)
+        parts = _split_snippet(snippet, room)
+        for number, part in enumerate(parts, start=1):
+            batches.append((
+                [{**entry, "snippet_part": f"{number}/{len(parts)}"}],
+                {section_id: part},
+            ))
+
+    flush()
+    return batches
+
+
+# Smallest snippet part worth sending when a section has to be split.
+_MIN_SNIPPET_PART_CHARS = 16
+
+
+def _split_snippet(text: str, max_chars: int) -> list[str]:
+    """Split ``text`` at whitespace into parts whose JSON encoding fits ``max_chars``."""
+    parts: list[str] = []
+    remaining = text
+    while remaining:
+        cut = min(len(remaining), max_chars - 2)
+        while _json_size(remaining[:cut]) > max_chars:
+            # Escaped characters take more than one character each
+            cut = max(cut * max_chars // _json_size(remaining[:cut]) - 1, 1)
+        if cut < len(remaining):
+            space = remaining.rfind(" ", cut // 2, cut + 1)
+            if space > 0:
+                cut = space
+        parts.append(remaining[:cut].rstrip())
+        remaining = remaining[cut:].lstrip()
+    return parts
+
+
+def _batch_section_ids(batch: Iterable[Mapping[str, Any]]) -> list[str]:
+    section_ids: list[str] = []
+    for entry in batch:
+        section_id = entry.get("section_id")
+        if isinstance(section_id, str) and section_id:
+            section_ids.append(section_id)
+    return section_ids
+
+
 def _filter_snippets(snippets: Mapping[str, str], section_ids: list[str]) -> dict[str, str]:
     if not section_ids:
         return {}
@@ -374,7 +510,15 @@ def _merge_batch_results(
 
         for label in result.get("labels", []) or []:
             section_id = label.get("section_id")
-            if section_id:
+            if not section_id:
+                continue
+            previous = labels_by_section.get(section_id)
+            if previous is not None:
+                # A section split across batches keeps its first label with every part's topics
+                topics = list(previous.get("topics") or [])
+                topics.extend(topic for topic in label.get("topics") or [] if topic not in topics)
+                labels_by_section[section_id] = {**previous, "topics": topics}
+            else:
                 labels_by_section[section_id] = label
 
         elapsed_total += float(meta.get("elapsed_sec") or 0.0)
@@ -412,10 +556,14 @@ def _merge_usage_totals(
     return merged
 
 
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, ensure_ascii=False))
+
+
 def _ensure_payload_budget(payload: Mapping[str, Any], max_chars: int | None) -> None:
     if max_chars is None or max_chars <= 0:
         return
-    payload_size = len(json.dumps(payload, ensure_ascii=False))
+    payload_size = _json_size(payload)
     if payload_size > max_chars:
         raise PayloadBudgetExceeded(payload_size, max_chars)
 
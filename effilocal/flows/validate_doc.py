@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from json import JSONDecodeError
 from jsonschema import Draft202012Validator
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Iterator, Mapping
 
 from effilocal.util import validate as cross_validate
 
@@ -28,89 +30,152 @@ def _load_schema(name: str) -> dict[str, Any]:
     return json.loads(schema_path.read_text(encoding="utf-8"))
 
 
-def validate_directory(data_dir: Path, *, deep: bool = False) -> cross_validate.ValidationReport:
-    report, artifacts = _quick_validate(data_dir)
-    if deep and report.ok:
-        deep_report = cross_validate.validate_artifacts(
-            blocks=artifacts.get("blocks", []),
-            sections=artifacts.get("sections", {}),
-            tag_ranges=artifacts.get("tag_ranges"),
-            manifest=artifacts.get("manifest"),
-            schema_dir=SCHEMA_DIR,
-        )
-        report.errors.extend(deep_report.errors)
-    return report
+@lru_cache(maxsize=None)
+def _validator(schema_name: str) -> Draft202012Validator:
+    """Return the compiled validator for ``schema_name`` (once per process)."""
+    return Draft202012Validator(_load_schema(schema_name))
 
 
-def _quick_validate(
-    data_dir: Path,
-) -> tuple[cross_validate.ValidationReport, dict[str, Any]]:
+def validate_directory(data_dir: Path, *, deep: bool = False) -> cross_validate.ValidationReport:
+    """Schema-validate the artifacts in ``data_dir`` and optionally cross-check them.
+
+    JSONL artifacts are streamed: each entry is schema-checked and, for
+    ``deep`` validation, fed to the cross-file checks in the same pass, so
+    only IDs are held in memory. Deep results are reported only when the
+    schema checks pass.
+    """
     report = cross_validate.ValidationReport()
-    artifacts: dict[str, Any] = {}
+    documents: dict[str, Any] = {}
+    file_issues: dict[str, list[cross_validate.ValidationIssue]] = {}
 
+    # Plain JSON artifacts first: the section tree is needed before blocks stream by
     for filename, (schema_name, is_jsonl) in _SCHEMA_MAP.items():
-        path = data_dir / filename
-        optional = filename == "tag_ranges.jsonl"
-        if not path.exists():
-            if optional:
-                continue
-            report.add("missing_artifact", f"Required artifact missing: {filename}")
-            continue
-
-        try:
-            data: Any
-            if is_jsonl:
-                data = _load_jsonl(path)
-            else:
-                data = json.loads(path.read_text(encoding="utf-8"))
-        except JSONDecodeError as exc:
-            report.add(
-                "invalid_json",
-                f"Could not parse {filename}: {exc.msg}",
-                {"filename": filename, "lineno": exc.lineno, "colno": exc.colno},
-            )
-            continue
-
-        schema = _load_schema(schema_name)
-        validator = Draft202012Validator(schema)
-        error_count_before = len(report.errors)
+        if not is_jsonl:
+            file_issues[filename] = _validate_json_file(data_dir / filename, filename, schema_name, documents)
 
+    cross = cross_validate.ArtifactValidator(documents.get("sections", {})) if deep else None
+    for filename, (schema_name, is_jsonl) in _SCHEMA_MAP.items():
         if is_jsonl:
-            for index, item in enumerate(data):
-                for error in validator.iter_errors(item):
-                    report.add(
+            sink = None
+            if cross is not None:
+                sink = cross.add_block if filename == "blocks.jsonl" else cross.add_tag_range
+            file_issues[filename] = _validate_jsonl_file(data_dir / filename, filename, schema_name, sink)
+
+    # Report in artifact order, as the per-file passes did
+    for filename in _SCHEMA_MAP:
+        for issue in file_issues[filename]:
+            report.add(issue.code, issue.message, issue.context)
+
+    if cross is not None and report.ok:
+        cross.finish(report, manifest=documents.get("manifest"), schema_dir=SCHEMA_DIR)
+    return report
+
+
+def validate_tree(
+    root: Path,
+    *,
+    deep: bool = False,
+    workers: int | None = None,
+) -> dict[Path, cross_validate.ValidationReport]:
+    """Validate every analysis directory under ``root`` in parallel.
+
+    An analysis directory is any directory containing ``blocks.jsonl``.
+    Each worker process compiles the schemas once and reuses them for all
+    the directories it validates.
+
+    Args:
+        root: Directory to search recursively.
+        deep: Run cross-file validation as well.
+        workers: Process count (default: CPU count); 1 validates in-process.
+
+    Returns:
+        Reports keyed by analysis directory, in sorted path order.
+    """
+    directories = sorted({path.parent for path in Path(root).rglob("blocks.jsonl")})
+    check = partial(validate_directory, deep=deep)
+    if workers == 1 or len(directories) <= 1:
+        reports = [check(directory) for directory in directories]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            reports = list(pool.map(check, directories, chunksize=4))
+    return dict(zip(directories, reports))
+
+
+def _validate_json_file(
+    path: Path,
+    filename: str,
+    schema_name: str,
+    documents: dict[str, Any],
+) -> list[cross_validate.ValidationIssue]:
+    if not path.exists():
+        return [cross_validate.ValidationIssue("missing_artifact", f"Required artifact missing: {filename}")]
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except JSONDecodeError as exc:
+        return [_invalid_json(filename, exc)]
+
+    issues = [
+        cross_validate.ValidationIssue(
+            "schema_validation_error",
+            f"{filename}: {error.message}",
+            {"filename": filename, "path": list(error.path)},
+        )
+        for error in _validator(schema_name).iter_errors(data)
+    ]
+    if not issues:
+        documents[filename.replace(".json", "")] = data
+    return issues
+
+
+def _validate_jsonl_file(
+    path: Path,
+    filename: str,
+    schema_name: str,
+    sink: Callable[[Mapping[str, Any]], None] | None,
+) -> list[cross_validate.ValidationIssue]:
+    if not path.exists():
+        if filename == "tag_ranges.jsonl":
+            return []
+        return [cross_validate.ValidationIssue("missing_artifact", f"Required artifact missing: {filename}")]
+
+    validator = _validator(schema_name)
+    issues: list[cross_validate.ValidationIssue] = []
+    try:
+        for index, entry in enumerate(_iter_jsonl(path)):
+            for error in validator.iter_errors(entry):
+                issues.append(
+                    cross_validate.ValidationIssue(
                         "schema_validation_error",
                         f"{filename} line {index + 1}: {error.message}",
                         {"filename": filename, "index": index, "path": list(error.path)},
                     )
-        else:
-            for error in validator.iter_errors(data):
-                report.add(
-                    "schema_validation_error",
-                    f"{filename}: {error.message}",
-                    {"filename": filename, "path": list(error.path)},
                 )
-
-        if len(report.errors) == error_count_before:
-            key = filename.replace(".jsonl", "").replace(".json", "")
-            artifacts[key] = data
-
-    artifacts.setdefault("tag_ranges", None)
-    artifacts.setdefault("manifest", None)
-    return report, artifacts
-
-
-def _load_jsonl(path: Path) -> list[dict[str, Any]]:
-    entries: list[dict[str, Any]] = []
-    for line_number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        stripped = line.strip()
-        if not stripped:
-            continue
-        try:
-            entry = json.loads(stripped)
-        except JSONDecodeError as exc:
-            raise JSONDecodeError(exc.msg, exc.doc, exc.pos) from None
-        if not isinstance(entry, Mapping):
-            raise JSONDecodeError("JSONL entry must be an object", stripped, 0)
-        entries.append(dict(entry))
-    return entries
+            if sink is not None:
+                sink(entry)
+    except JSONDecodeError as exc:
+        # An unparseable file reports only the parse error
+        return [_invalid_json(filename, exc)]
+    return issues
+
+
+def _invalid_json(filename: str, exc: JSONDecodeError) -> cross_validate.ValidationIssue:
+    return cross_validate.ValidationIssue(
+        "invalid_json",
+        f"Could not parse {filename}: {exc.msg}",
+        {"filename": filename, "lineno": exc.lineno, "colno": exc.colno},
+    )
+
+
+def _iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            stripped = line.strip()
+            if not stripped:
+                continue
+            try:
+                entry = json.loads(stripped)
+            except JSONDecodeError as exc:
+                raise JSONDecodeError(exc.msg, exc.doc, exc.pos) from None
+            if not isinstance(entry, Mapping):
+                raise JSONDecodeError("JSONL entry must be an object", stripped, 0)
+            yield dict(entry)
@@ -13,11 +13,13 @@ Override Pattern:
 """
 
 import datetime
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Set, Tuple
 from docx import Document
 from docx.document import Document as DocumentType
 from docx.text.paragraph import Paragraph
 from docx.oxml.ns import qn
+from lxml import etree
 
 from effilocal.mcp_server.utils.document_utils import iter_document_paragraphs
 
@@ -47,6 +49,10 @@ def extract_all_comments(doc: DocumentType) -> List[Dict[str, Any]]:
     - Paragraph index mapping by scanning document body
     - Reference text extraction (the text the comment is anchored to)
     
+    The document body is walked once (see _scan_body) to collect comment
+    references, anchor ranges and paragraph texts together; comments.xml and
+    commentsExtended.xml are each parsed once and joined with the result.
+    
     Args:
         doc: The Document object to extract comments from
         
@@ -56,15 +62,7 @@ def extract_all_comments(doc: DocumentType) -> List[Dict[str, Any]]:
     comments_map = {}
     
     try:
-        # Access comments through document part
-        # The correct relationship type for the main comments part ends with '/comments'
-        # We must be specific to avoid matching commentsIds, commentsExtensible, etc.
-        COMMENTS_RELTYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/comments'
-        comments_part = None
-        for rel_id, rel in doc.part.rels.items():
-            if rel.reltype == COMMENTS_RELTYPE:
-                comments_part = rel.target_part
-                break
+        comments_part, comments_extended_part = _get_comment_parts(doc)
         
         if comments_part:
             # Parse comments.xml for comment elements
@@ -77,40 +75,6 @@ def extract_all_comments(doc: DocumentType) -> List[Dict[str, Any]]:
                     cid = comment_data['comment_id']
                     comments_map[cid] = comment_data
         
-        # Scan paragraphs to map comments to locations
-        # This populates 'paragraph_index' and 'doc_para_id' for comments found in the body
-        # NOTE: 'para_id' holds the comment's INTERNAL paragraph ID (for linking to commentsExtended)
-        # 'doc_para_id' holds the DOCUMENT paragraph ID (where the comment reference appears)
-        # Use iter_document_paragraphs to include SDT-wrapped paragraphs
-        for i, p in enumerate(iter_document_paragraphs(doc)):
-            p_element = p._element
-            # Find comment references
-            refs = p_element.xpath('.//w:commentReference')
-            for ref in refs:
-                cid = ref.get(qn('w:id'))
-                if cid in comments_map:
-                    comments_map[cid]['paragraph_index'] = i
-                    # Capture the document paragraph's native para_id for clause matching
-                    # Store in 'doc_para_id' to avoid overwriting the comment's internal para_id
-                    doc_para_id = p_element.get(qn('w14:paraId'))
-                    if doc_para_id:
-                        comments_map[cid]['doc_para_id'] = doc_para_id
-        
-        # Also scan table cells for comment references
-        # This captures comments in tables that iter_document_paragraphs misses
-        body = doc.element.body
-        for tbl in body.iter(qn('w:tbl')):
-            for tc in tbl.iter(qn('w:tc')):
-                for p_element in tc.iter(qn('w:p')):
-                    refs = p_element.xpath('.//w:commentReference')
-                    for ref in refs:
-                        cid = ref.get(qn('w:id'))
-                        if cid in comments_map:
-                            # Store document paragraph ID in doc_para_id (not para_id)
-                            doc_para_id = p_element.get(qn('w14:paraId'))
-                            if doc_para_id:
-                                comments_map[cid]['doc_para_id'] = doc_para_id
-                    
         comments = list(comments_map.values())
         
         if not comments:
@@ -118,26 +82,42 @@ def extract_all_comments(doc: DocumentType) -> List[Dict[str, Any]]:
             # Note: upstream method doesn't extract text well, but it's a fallback
             comments = extract_comments_from_paragraphs(doc)
         
-        # Extract comment status information from commentsExtended.xml
-        status_map = extract_comment_status_map(doc)
+        if not comments:
+            return comments
+        
+        scan = _scan_body(
+            doc,
+            comment_ids={comment.get('comment_id') for comment in comments},
+            para_ids={comment.get('para_id') for comment in comments},
+        )
         
-        # Merge status information into comments
+        # Map comments to locations.
+        # NOTE: 'para_id' holds the comment's INTERNAL paragraph ID (for linking to commentsExtended)
+        # 'doc_para_id' holds the DOCUMENT paragraph ID (where the comment reference appears)
+        for cid, paragraph_index, doc_para_id in scan.paragraph_refs:
+            if cid in comments_map:
+                comments_map[cid]['paragraph_index'] = paragraph_index
+                if doc_para_id:
+                    comments_map[cid]['doc_para_id'] = doc_para_id
+        # References in table cells (which paragraph_index does not cover)
+        for cid, doc_para_id in scan.cell_refs:
+            if cid in comments_map:
+                comments_map[cid]['doc_para_id'] = doc_para_id
+        
+        # Merge status information from commentsExtended.xml
+        status_map = _parse_comment_status(comments_extended_part) if comments_extended_part else {}
         if status_map:
             comments = merge_comment_status(comments, status_map)
         
-        # Extract reference text for all comments (the text they're anchored to)
-        reference_texts = get_all_reference_texts(doc)
         for comment in comments:
+            # Reference text: the text the comment is anchored to
             cid = comment.get('comment_id')
-            if cid and cid in reference_texts:
-                comment['reference_text'] = reference_texts[cid]
-        
-        # Extract paragraph text for all paragraphs (including table cells)
-        paragraph_texts = get_all_paragraph_texts(doc)
-        for comment in comments:
+            if cid and cid in scan.reference_texts:
+                comment['reference_text'] = scan.reference_texts[cid]
+            # Paragraph text (including table cells)
             para_id = comment.get('para_id')
-            if para_id and para_id in paragraph_texts:
-                comment['paragraph_text'] = paragraph_texts[para_id]
+            if para_id and para_id in scan.paragraph_texts:
+                comment['paragraph_text'] = scan.paragraph_texts[para_id]
     
     except Exception as e:
         # If direct access fails, try alternative approach
@@ -146,6 +126,134 @@ def extract_all_comments(doc: DocumentType) -> List[Dict[str, Any]]:
     return comments
 
 
+@dataclass
+class _BodyScan:
+    """Everything extract_all_comments needs from one walk of the document body."""
+    
+    # (comment_id, paragraph_index, doc_para_id) per reference in a top-level paragraph
+    paragraph_refs: List[Tuple[str, int, Optional[str]]] = field(default_factory=list)
+    # (comment_id, doc_para_id) per reference inside a table cell paragraph
+    cell_refs: List[Tuple[str, str]] = field(default_factory=list)
+    reference_texts: Dict[str, str] = field(default_factory=dict)
+    paragraph_texts: Dict[str, str] = field(default_factory=dict)
+
+
+_W_P = qn('w:p')
+_W_T = qn('w:t')
+_W_TC = qn('w:tc')
+_W_ID = qn('w:id')
+_W14_PARA_ID = qn('w14:paraId')
+_W_COMMENT_REFERENCE = qn('w:commentReference')
+_W_SDT = qn('w:sdt')
+_W_SDT_CONTENT = qn('w:sdtContent')
+_RANGE_START = '{*}commentRangeStart'
+_RANGE_END = '{*}commentRangeEnd'
+# Only these elements reach Python during the walk; lxml skips the rest in C.
+_BODY_SCAN_TAGS = (_W_P, _W_TC, _W_COMMENT_REFERENCE, _RANGE_START, _RANGE_END, '{*}t')
+
+
+def _is_document_paragraph(p_element, body) -> bool:
+    """True for paragraphs iter_document_paragraphs yields (body level, or SDT-wrapped)."""
+    parent = p_element.getparent()
+    if parent is body:
+        return True
+    if parent is None or parent.tag != _W_SDT_CONTENT:
+        return False
+    sdt = parent.getparent()
+    return sdt is not None and sdt.tag == _W_SDT and sdt.getparent() is body
+
+
+def _scan_body(
+    doc: DocumentType,
+    comment_ids: Optional[Set[str]] = None,
+    para_ids: Optional[Set[str]] = None,
+) -> _BodyScan:
+    """
+    Walk the document body once, collecting comment anchors and paragraph text.
+    
+    Args:
+        doc: The Document object
+        comment_ids: Only collect reference text for these comment ids (None = all)
+        para_ids: Only collect paragraph text for these para_ids (None = all)
+        
+    Returns:
+        _BodyScan with, in document order:
+        - references in top-level (incl. SDT-wrapped) paragraphs with the
+          paragraph's index in iter_document_paragraphs order and its para_id
+        - references in table cells with the innermost cell paragraph para_id
+        - text between commentRangeStart/commentRangeEnd per comment id
+        - text of every paragraph with a para_id (including table cells)
+    """
+    scan = _BodyScan()
+    body = doc.element.body
+    
+    # Open paragraphs, outermost first: [para_id, in_cell, text_parts or None, is_document]
+    stack: List[list] = []
+    document_paragraph_index = -1
+    cell_depth = 0
+    active_ranges: Dict[str, List[str]] = {}  # comment_id -> text fragments
+    # Paragraph texts in start order (a later duplicate para_id wins)
+    paragraph_entries: List[list] = []
+    
+    for event, element in etree.iterwalk(body, events=('start', 'end'), tag=_BODY_SCAN_TAGS):
+        tag = element.tag
+        if tag == _W_P:
+            if event == 'start':
+                para_id = element.get(_W14_PARA_ID)
+                is_document = not stack and _is_document_paragraph(element, body)
+                if is_document:
+                    document_paragraph_index += 1
+                collect = para_id and (para_ids is None or para_id in para_ids)
+                entry = [para_id, cell_depth > 0, [] if collect else None, is_document]
+                stack.append(entry)
+                if collect:
+                    paragraph_entries.append([para_id, entry[2]])
+            else:
+                stack.pop()
+            continue
+        if tag == _W_TC:
+            cell_depth += 1 if event == 'start' else -1
+            continue
+        if event == 'end':
+            continue
+        
+        if tag == _W_COMMENT_REFERENCE:
+            cid = element.get(_W_ID)
+            if stack and stack[0][3]:
+                scan.paragraph_refs.append((cid, document_paragraph_index, stack[0][0]))
+            for para_id, in_cell, _, _ in reversed(stack):
+                if in_cell and para_id:
+                    scan.cell_refs.append((cid, para_id))
+                    break
+            continue
+        
+        local_name = tag.rpartition('}')[2]
+        if local_name == 'commentRangeStart':
+            cid = element.get(_W_ID)
+            if cid and (comment_ids is None or cid in comment_ids):
+                active_ranges[cid] = []
+        elif local_name == 'commentRangeEnd':
+            cid = element.get(_W_ID)
+            if cid and cid in active_ranges:
+                scan.reference_texts[cid] = ''.join(active_ranges.pop(cid)).strip()
+        else:  # any *:t
+            text = element.text
+            if not text:
+                continue
+            for fragments in active_ranges.values():
+                fragments.append(text)
+            if tag == _W_T:
+                for _, _, parts, _ in stack:
+                    if parts is not None:
+                        parts.append(text)
+    
+    for para_id, parts in paragraph_entries:
+        if parts:
+            scan.paragraph_texts[para_id] = ''.join(parts).strip()
+    
+    return scan
+
+
 def extract_comment_data(comment_element, index: int) -> Optional[Dict[str, Any]]:
     """
     Extract data from a single comment element.
@@ -230,48 +338,42 @@ def extract_comment_status_map(doc: DocumentType) -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary mapping paraId to status info: {'paraId': {'status': 'active|resolved', 'done': 0|1, 'is_resolved': bool}}
     """
-    from lxml import etree
-    
+    comments_extended_part, _ = _get_comments_extended_part(doc)
+    if not comments_extended_part:
+        return {}
+    return _parse_comment_status(comments_extended_part)
+
+
+def _parse_comment_status(comments_extended_part) -> Dict[str, Dict[str, Any]]:
+    """Build the paraId -> status map of extract_comment_status_map from the commentsExtended part."""
     status_map = {}
     
     try:
-        # Find the comments extended part through relationships
-        document_part = doc.part
-        comments_extended_part = None
-        
-        for rel_id, rel in document_part.rels.items():
-            reltype = rel.reltype
-            # Look for commentsExtended relationship (office 2012+ Word namespace)
-            if 'commentsExtended' in reltype:
-                comments_extended_part = rel.target_part
-                break
+        # Parse commentsExtended.xml from blob (generic Part doesn't have .element)
+        root = etree.fromstring(comments_extended_part.blob)
         
-        if comments_extended_part:
-            # Parse commentsExtended.xml from blob (generic Part doesn't have .element)
-            root = etree.fromstring(comments_extended_part.blob)
-            
-            # Namespace: http://schemas.microsoft.com/office/word/2012/wordml
-            W15_NS = 'http://schemas.microsoft.com/office/word/2012/wordml'
-            nsmap = {'w15': W15_NS}
-            
-            comment_ex_elements = root.xpath('.//w15:commentEx', namespaces=nsmap)
+        # Namespace: http://schemas.microsoft.com/office/word/2012/wordml
+        W15_NS = 'http://schemas.microsoft.com/office/word/2012/wordml'
+        nsmap = {'w15': W15_NS}
+        
+        comment_ex_elements = root.xpath('.//w15:commentEx', namespaces=nsmap)
+        
+        for comment_ex in comment_ex_elements:
+            para_id = comment_ex.get(f'{{{W15_NS}}}paraId')
+            done_flag = comment_ex.get(f'{{{W15_NS}}}done', '0')
             
-            for comment_ex in comment_ex_elements:
-                para_id = comment_ex.get(f'{{{W15_NS}}}paraId')
-                done_flag = comment_ex.get(f'{{{W15_NS}}}done', '0')
+            if para_id:
+                # Convert done flag to boolean and status string
+                is_resolved = done_flag == '1'
+                status = 'resolved' if is_resolved else 'active'
                 
-                if para_id:
-                    # Convert done flag to boolean and status string
-                    is_resolved = done_flag == '1'
-                    status = 'resolved' if is_resolved else 'active'
-                    
-                    status_map[para_id] = {
-                        'status': status,
-                        'done': int(done_flag),
-                        'is_resolved': is_resolved
-                    }
+                status_map[para_id] = {
+                    'status': status,
+                    'done': int(done_flag),
+                    'is_resolved': is_resolved
+                }
     except Exception as e:
-        # If commentsExtended doesn't exist or can't be parsed, return empty map
+        # If commentsExtended can't be parsed, return empty map
         # This is normal for older Word documents without comment status tracking
         pass
     
@@ -330,6 +432,29 @@ def _get_comments_extended_part(doc: DocumentType):
     return None, None
 
 
+def _get_comment_parts(doc: DocumentType):
+    """
+    Get the comments and commentsExtended parts in one pass over the relationships.
+    
+    Args:
+        doc: The Document object
+        
+    Returns:
+        Tuple of (comments_part, comments_extended_part); either may be None
+    """
+    # The main comments relationship type ends with '/comments'; match it exactly
+    # to avoid commentsIds, commentsExtensible, etc.
+    COMMENTS_RELTYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/comments'
+    comments_part = None
+    comments_extended_part = None
+    for rel_id, rel in doc.part.rels.items():
+        if comments_part is None and rel.reltype == COMMENTS_RELTYPE:
+            comments_part = rel.target_part
+        elif comments_extended_part is None and 'commentsExtended' in rel.reltype:
+            comments_extended_part = rel.target_part
+    return comments_part, comments_extended_part
+
+
 def _get_comment_para_id(doc: DocumentType, comment_id: str) -> Optional[str]:
     """
     Get the para_id for a given comment_id by looking in comments.xml.
@@ -526,39 +651,10 @@ def get_all_reference_texts(doc: DocumentType) -> Dict[str, str]:
     Returns:
         Dictionary mapping comment_id to its reference text
     """
-    reference_texts: Dict[str, str] = {}
-    active_ranges: Dict[str, List[str]] = {}  # comment_id -> list of text fragments
-    
     try:
-        # Iterate over ALL elements in the document body (including tables)
-        # This ensures we capture comments in table cells
-        body = doc.element.body
-        
-        for element in body.iter():
-            tag = element.tag.split('}')[-1] if '}' in element.tag else element.tag
-            
-            # Handle commentRangeStart
-            if tag == 'commentRangeStart':
-                cid = element.get(qn('w:id'))
-                if cid:
-                    active_ranges[cid] = []
-            
-            # Handle commentRangeEnd
-            elif tag == 'commentRangeEnd':
-                cid = element.get(qn('w:id'))
-                if cid and cid in active_ranges:
-                    reference_texts[cid] = ''.join(active_ranges[cid]).strip()
-                    del active_ranges[cid]
-            
-            # Collect text for all active ranges
-            elif tag == 't' and element.text:
-                for cid in active_ranges:
-                    active_ranges[cid].append(element.text)
-    
+        return _scan_body(doc, para_ids=set()).reference_texts
     except Exception:
-        pass
-    
-    return reference_texts
+        return {}
 
 
 def get_all_paragraph_texts(doc: DocumentType) -> Dict[str, str]:
@@ -574,27 +670,10 @@ def get_all_paragraph_texts(doc: DocumentType) -> Dict[str, str]:
     Returns:
         Dictionary mapping para_id to paragraph text
     """
-    paragraph_texts: Dict[str, str] = {}
-    
     try:
-        body = doc.element.body
-        
-        # Find all paragraph elements in the document (including tables)
-        for p_elem in body.iter(qn('w:p')):
-            para_id = p_elem.get(qn('w14:paraId'))
-            if para_id:
-                # Extract all text from this paragraph
-                text_parts = []
-                for t_elem in p_elem.iter(qn('w:t')):
-                    if t_elem.text:
-                        text_parts.append(t_elem.text)
-                if text_parts:
-                    paragraph_texts[para_id] = ''.join(text_parts).strip()
-    
+        return _scan_body(doc, comment_ids=set()).paragraph_texts
     except Exception:
-        pass
-    
-    return paragraph_texts
+        return {}
 
 
 # ============================================================================
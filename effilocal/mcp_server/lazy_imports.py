@@ -0,0 +1,59 @@
+"""
+Deferred imports for MCP tool implementation modules.
+
+The tool wrappers in ``main.py`` only need their signatures and docstrings
+at registration time; the implementation modules behind them pull in
+python-docx, lxml, extract_msg, msoffcrypto and docx2pdf. A
+:class:`LazyModule` stands in for such a module and imports it on first
+attribute access, i.e. on the first call of a tool that uses it, so server
+startup (and the ``tools/list`` handshake) never pays for them.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from types import ModuleType
+from typing import Any
+
+__all__ = ["LazyModule"]
+
+_import_lock = threading.Lock()
+
+
+class LazyModule:
+    """Proxy for a module that is imported the first time it is used."""
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str) -> None:
+        """
+        Args:
+            name: Absolute dotted module name, e.g.
+                ``"effilocal.mcp_server.tools.document_tools"``.
+        """
+        self._name = name
+        self._module: ModuleType | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the underlying module has been imported through this proxy."""
+        return self._module is not None
+
+    def load(self) -> ModuleType:
+        """Import (once) and return the underlying module."""
+        module = self._module
+        if module is None:
+            with _import_lock:
+                module = self._module
+                if module is None:
+                    module = importlib.import_module(self._name)
+                    self._module = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
@@ -26,27 +26,31 @@ os.environ.setdefault('FASTMCP_LOG_LEVEL', 'INFO')
 
 from fastmcp import FastMCP
 
-# Import from effilocal override modules (which import from upstream where appropriate)
-from effilocal.mcp_server.tools import (
-    document_tools,
-    content_tools,
-    format_tools,
-    comment_tools,
-    attachment_tools,
-    numbering_tools,
-    review_tools,
-    relationship_tools,
-    clause_editing_tools,
-    plan_tools,
-)
-
-# Import directly from upstream for tools we don't override
-from word_document_server.tools import (
-    protection_tools,
-    footnote_tools,
-    extended_document_tools,
-)
-
+from effilocal.mcp_server.lazy_imports import LazyModule
+from effilocal.mcp_server.metrics import CONTENT_TYPE, REGISTRY, instrument, metrics_path
+from effilocal.util.io import close_appends
+
+# Tool implementation modules are imported on first use, not at startup: the
+# wrappers below declare each tool's schema, and the heavy document libraries
+# behind them load only when a tool is actually called.
+
+# effilocal override modules (which import from upstream where appropriate)
+document_tools = LazyModule("effilocal.mcp_server.tools.document_tools")
+content_tools = LazyModule("effilocal.mcp_server.tools.content_tools")
+format_tools = LazyModule("effilocal.mcp_server.tools.format_tools")
+comment_tools = LazyModule("effilocal.mcp_server.tools.comment_tools")
+attachment_tools = LazyModule("effilocal.mcp_server.tools.attachment_tools")
+numbering_tools = LazyModule("effilocal.mcp_server.tools.numbering_tools")
+review_tools = LazyModule("effilocal.mcp_server.tools.review_tools")
+relationship_tools = LazyModule("effilocal.mcp_server.tools.relationship_tools")
+search_tools = LazyModule("effilocal.mcp_server.tools.search_tools")
+clause_editing_tools = LazyModule("effilocal.mcp_server.tools.clause_editing_tools")
+plan_tools = LazyModule("effilocal.mcp_server.tools.plan_tools")
+
+# Upstream modules for tools we don't override
+protection_tools = LazyModule("word_document_server.tools.protection_tools")
+footnote_tools = LazyModule("word_document_server.tools.footnote_tools")
+extended_document_tools = LazyModule("word_document_server.tools.extended_document_tools")
 
 def get_transport_config():
     """
@@ -61,7 +65,8 @@ def get_transport_config():
         'host': '0.0.0.0',
         'port': 8000,
         'path': '/mcp',
-        'sse_path': '/sse'
+        'sse_path': '/sse',
+        'metrics_path': None
     }
     
     # Override with environment variables if provided
@@ -80,6 +85,7 @@ def get_transport_config():
     config['port'] = int(os.getenv('PORT', os.getenv('MCP_PORT', config['port'])))
     config['path'] = os.getenv('MCP_PATH', config['path'])
     config['sse_path'] = os.getenv('MCP_SSE_PATH', config['sse_path'])
+    config['metrics_path'] = os.getenv('MCP_METRICS_PATH', metrics_path(config['path']))
     
     return config
 
@@ -110,6 +116,26 @@ def setup_logging(debug_mode):
 mcp = FastMCP("effilocal Document Server")
 
 
+def metered_tool(*args, **kwargs):
+    """``mcp.tool`` that also records per-tool metrics (see ``metrics.instrument``)."""
+    register = mcp.tool(*args, **kwargs)
+    return lambda func: register(instrument(func))
+
+
+def register_metrics_route(path):
+    """
+    Serve the metrics registry in Prometheus text format at ``path``.
+    
+    Args:
+        path (str): HTTP path, normally ``/metrics`` beside ``MCP_PATH``
+    """
+    from starlette.responses import Response
+    
+    @mcp.custom_route(path, methods=["GET"])
+    async def metrics_endpoint(request):
+        return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
 def register_tools():
     """Register all tools with the MCP server using FastMCP decorators."""
     
@@ -117,37 +143,37 @@ def register_tools():
     # Document tools (create, copy, info, etc.)
     # ========================================================================
     
-    @mcp.tool()
+    @metered_tool()
     def create_document(filename: str, title: str = None, author: str = None):
         """Create a new Word document with optional metadata."""
         return document_tools.create_document(filename, title, author)
     
-    @mcp.tool()
+    @metered_tool()
     def copy_document(source_filename: str, destination_filename: str = None):
         """Create a copy of a Word document."""
         return document_tools.create_document_copy(source_filename, destination_filename)
     
-    @mcp.tool()
+    @metered_tool()
     def get_document_info(filename: str):
         """Get information about a Word document."""
         return document_tools.get_document_info(filename)
     
-    @mcp.tool()
+    @metered_tool()
     def get_document_text(filename: str):
         """Extract all text from a Word document."""
         return document_tools.get_document_text(filename)
     
-    @mcp.tool()
+    @metered_tool()
     def get_document_outline(filename: str):
         """Get the structure of a Word document."""
         return document_tools.get_document_outline(filename)
     
-    @mcp.tool()
+    @metered_tool()
     def list_available_documents(directory: str = "."):
         """List all .docx files in the specified directory."""
         return document_tools.list_available_documents(directory)
     
-    @mcp.tool()
+    @metered_tool()
     async def save_document_as_markdown(filename: str):
         """Extract all text from a Word document and save as a Markdown (.md) file."""
         return await document_tools.save_document_as_markdown(filename)
@@ -156,7 +182,7 @@ def register_tools():
     # Content tools (paragraphs, headings, tables, etc.)
     # ========================================================================
     
-    @mcp.tool()
+    @metered_tool()
     async def add_paragraph(filename: str, text: str, style: str = None,
                       font_name: str = None, font_size: int = None,
                       bold: bool = None, italic: bool = None, color: str = None):
@@ -165,7 +191,7 @@ def register_tools():
             filename, text, style, font_name, font_size, bold, italic, color
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def add_heading(filename: str, text: str, level: int = 1,
                     font_name: str = None, font_size: int = None,
                     bold: bool = None, italic: bool = None,
@@ -176,33 +202,33 @@ def register_tools():
             color=color
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def add_picture(filename: str, image_path: str, width: float = None):
         """Add an image to a Word document."""
         return await content_tools.add_picture(filename, image_path, width)
     
-    @mcp.tool()
+    @metered_tool()
     async def add_table(filename: str, rows: int, cols: int, data: list = None):
         """Add a table to a Word document."""
         return await content_tools.add_table(filename, rows, cols, data)
     
-    @mcp.tool()
+    @metered_tool()
     async def add_page_break(filename: str):
         """Add a page break to the document."""
         return await content_tools.add_page_break(filename)
     
-    @mcp.tool()
+    @metered_tool()
     async def delete_paragraph(filename: str, paragraph_index: int):
         """Delete a paragraph from a document."""
         return await content_tools.delete_paragraph(filename, paragraph_index)
     
-    @mcp.tool()
+    @metered_tool()
     async def search_and_replace(filename: str, find_text: str, replace_text: str, 
                                  whole_word_only: bool = False):
         """Search for text and replace all occurrences with optional whole-word matching."""
         return await content_tools.search_and_replace(filename, find_text, replace_text, whole_word_only)
     
-    @mcp.tool()
+    @metered_tool()
     async def edit_run_text(filename: str, paragraph_index: int, run_index: int, new_text: str, 
                      start_offset: int = None, end_offset: int = None):
         """Edit text within a specific run of a paragraph."""
@@ -210,7 +236,7 @@ def register_tools():
             filename, paragraph_index, run_index, new_text, start_offset, end_offset
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def insert_header_near_text(filename: str, target_text: str = None, header_title: str = None, 
                                 position: str = 'after', header_style: str = 'Heading 1', 
                                 target_paragraph_index: int = None):
@@ -219,7 +245,7 @@ def register_tools():
             filename, target_text, header_title, position, header_style, target_paragraph_index
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def insert_line_or_paragraph_near_text(filename: str, target_text: str = None, 
                                            line_text: str = None, position: str = 'after', 
                                            line_style: str = None, target_paragraph_index: int = None):
@@ -228,7 +254,7 @@ def register_tools():
             filename, target_text, line_text, position, line_style, target_paragraph_index
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def insert_numbered_list_near_text(filename: str, target_text: str = None, 
                                        list_items: list = None, position: str = 'after', 
                                        target_paragraph_index: int = None, bullet_type: str = 'bullet'):
@@ -237,7 +263,7 @@ def register_tools():
             filename, target_text, list_items, position, target_paragraph_index, bullet_type
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def replace_block_between_manual_anchors(filename: str, start_anchor_text: str, 
                                               new_paragraphs: list, end_anchor_text: str = None, 
                                               new_paragraph_style: str = None):
@@ -250,7 +276,7 @@ def register_tools():
     # Format tools (styling, text formatting, etc.)
     # ========================================================================
     
-    @mcp.tool()
+    @metered_tool()
     async def create_custom_style(filename: str, style_name: str, bold: bool = None, 
                           italic: bool = None, font_size: int = None, 
                           font_name: str = None, color: str = None, 
@@ -260,7 +286,7 @@ def register_tools():
             filename, style_name, bold, italic, font_size, font_name, color, base_style
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def format_text(filename: str, paragraph_index: int, start_pos: int, end_pos: int,
                    bold: bool = None, italic: bool = None, underline: bool = None,
                    color: str = None, font_size: int = None, font_name: str = None):
@@ -270,7 +296,7 @@ def register_tools():
             underline, color, font_size, font_name
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def set_background_highlight(filename: str, paragraph_index: int, start_pos: int, end_pos: int,
                                  color: str = "0000FF", use_shading: bool = True):
         """Apply background highlighting to a span of text within a paragraph."""
@@ -278,7 +304,7 @@ def register_tools():
             filename, paragraph_index, start_pos, end_pos, color, use_shading
         )
     
-    @mcp.tool()
+    @metered_tool()
     def get_document_runs(filename: str, paragraph_index: int):
         """Get a snapshot of all runs in a paragraph for debugging formatting."""
         return format_tools.get_document_runs(filename, paragraph_index)
@@ -287,22 +313,22 @@ def register_tools():
     # Comment tools (from effilocal with status support)
     # ========================================================================
     
-    @mcp.tool()
+    @metered_tool()
     async def get_all_comments(filename: str):
         """Extract all comments from a Word document including status (active/resolved)."""
         return await comment_tools.get_all_comments(filename)
     
-    @mcp.tool()
+    @metered_tool()
     async def get_comments_by_author(filename: str, author: str):
         """Extract comments from a specific author in a Word document."""
         return await comment_tools.get_comments_by_author(filename, author)
     
-    @mcp.tool()
+    @metered_tool()
     async def get_comments_for_paragraph(filename: str, paragraph_index: int):
         """Extract comments for a specific paragraph in a Word document."""
         return await comment_tools.get_paragraph_comments(filename, paragraph_index)
     
-    @mcp.tool()
+    @metered_tool()
     async def add_comment_after_text(filename: str, search_text: str, comment_text: str,
                                author: str = None, initials: str = None):
         """Add a Word comment to the first occurrence of search_text."""
@@ -310,7 +336,7 @@ def register_tools():
             filename, search_text, comment_text, author, initials
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def add_comment_for_paragraph(filename: str, paragraph_index: int, comment_text: str,
                                   author: str = None, initials: str = None):
         """Add a Word comment anchored to an entire paragraph."""
@@ -318,7 +344,7 @@ def register_tools():
             filename, paragraph_index, comment_text, author, initials
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def update_comment(filename: str, comment_id: str, new_text: str):
         """Update the text of an existing comment."""
         return await comment_tools.update_comment(filename, comment_id, new_text)
@@ -327,18 +353,18 @@ def register_tools():
     # Numbering analysis tools (effilocal-specific)
     # ========================================================================
     
-    @mcp.tool()
+    @metered_tool()
     def analyze_document_numbering(filename: str, debug: bool = False, 
                                    include_non_numbered: bool = False):
         """Analyze the numbering structure of a Word document using NumberingInspector."""
         return numbering_tools.analyze_document_numbering(filename, debug, include_non_numbered)
     
-    @mcp.tool()
+    @metered_tool()
     def get_numbering_summary(filename: str):
         """Get a high-level summary of numbering styles used in a document."""
         return numbering_tools.get_numbering_summary(filename)
     
-    @mcp.tool()
+    @metered_tool()
     def extract_outline_structure(filename: str, max_level: int = None):
         """Extract the document outline based on numbering structure."""
         return numbering_tools.extract_outline_structure(filename, max_level)
@@ -347,7 +373,7 @@ def register_tools():
     # Relationship tools (artifact-level analysis)
     # ========================================================================
 
-    @mcp.tool()
+    @metered_tool()
     def get_relationship_metadata(
         analysis_dir: str,
         block_id: str,
@@ -358,11 +384,19 @@ def register_tools():
             analysis_dir, block_id, include_block_details
         )
 
+    @metered_tool()
+    def search_blocks(analysis_dir: str, query: str, whole_word: bool = False,
+                      case_sensitive: bool = False, limit: int = 50):
+        """Search analyzed blocks for text; returns block ids, ordinals and match offsets."""
+        return search_tools.search_blocks(
+            analysis_dir, query, whole_word, case_sensitive, limit
+        )
+
     # ========================================================================
     # Clause-based paragraph insertion tools (effilocal contract-specific)
     # ========================================================================
     
-    @mcp.tool()
+    @metered_tool()
     async def add_paragraph_after_clause(filename: str, clause_number: str, text: str,
                                    style: str = None, inherit_numbering: bool = True):
         """Add a paragraph after a specific clause number (e.g., '1.2.3', '7.1(a)')."""
@@ -370,7 +404,7 @@ def register_tools():
             filename, clause_number, text, style, inherit_numbering
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def add_paragraphs_after_clause(filename: str, clause_number: str, paragraphs: list,
                                     style: str = None, inherit_numbering: bool = True):
         """Add multiple paragraphs after a specific clause number."""
@@ -382,7 +416,7 @@ def register_tools():
     # Attachment-based paragraph insertion tools (effilocal contract-specific)
     # ========================================================================
     
-    @mcp.tool()
+    @metered_tool()
     async def add_paragraph_after_attachment(filename: str, attachment_identifier: str, text: str,
                                        style: str = None, inherit_numbering: bool = True):
         """Add a paragraph after a specific attachment (Schedule, Annex, Exhibit, etc.)."""
@@ -390,7 +424,7 @@ def register_tools():
             filename, attachment_identifier, text, style, inherit_numbering
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def add_paragraphs_after_attachment(filename: str, attachment_identifier: str, 
                                         paragraphs: list, style: str = None, 
                                         inherit_numbering: bool = True):
@@ -399,7 +433,7 @@ def register_tools():
             filename, attachment_identifier, paragraphs, style, inherit_numbering
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def add_new_attachment_after(filename: str, after_attachment: str, 
                                  new_attachment_text: str, content: str = None):
         """Add a new attachment (Schedule, Annex, Exhibit) after an existing attachment."""
@@ -411,12 +445,12 @@ def register_tools():
     # Protection tools (upstream pass-through)
     # ========================================================================
     
-    @mcp.tool()
+    @metered_tool()
     async def protect_document(filename: str, password: str):
         """Add password protection to a Word document."""
         return await protection_tools.protect_document(filename, password)
     
-    @mcp.tool()
+    @metered_tool()
     async def unprotect_document(filename: str, password: str):
         """Remove password protection from a Word document."""
         return await protection_tools.unprotect_document(filename, password)
@@ -425,12 +459,12 @@ def register_tools():
     # Footnote tools (upstream pass-through)
     # ========================================================================
     
-    @mcp.tool()
+    @metered_tool()
     async def add_footnote_to_document(filename: str, paragraph_index: int, footnote_text: str):
         """Add a footnote to a specific paragraph in a Word document."""
         return await footnote_tools.add_footnote_to_document(filename, paragraph_index, footnote_text)
     
-    @mcp.tool()
+    @metered_tool()
     async def add_footnote_after_text(filename: str, search_text: str, footnote_text: str, 
                                output_filename: str = None):
         """Add a footnote after specific text with proper superscript formatting."""
@@ -438,7 +472,7 @@ def register_tools():
             filename, search_text, footnote_text, output_filename
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def customize_footnote_style(filename: str, numbering_format: str = "1, 2, 3",
                                 start_number: int = 1, font_name: str = None,
                                 font_size: int = None):
@@ -447,7 +481,7 @@ def register_tools():
             filename, numbering_format, start_number, font_name, font_size
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def delete_footnote_from_document(filename: str, footnote_id: int = None,
                                      search_text: str = None, output_filename: str = None):
         """Delete a footnote from a Word document."""
@@ -459,12 +493,12 @@ def register_tools():
     # Extended document tools (upstream pass-through)
     # ========================================================================
     
-    @mcp.tool()
+    @metered_tool()
     async def get_paragraph_text_from_document(filename: str, paragraph_index: int):
         """Get text from a specific paragraph in a Word document."""
         return await extended_document_tools.get_paragraph_text_from_document(filename, paragraph_index)
     
-    @mcp.tool()
+    @metered_tool()
     async def find_text_in_document(filename: str, text_to_find: str, match_case: bool = True,
                              whole_word: bool = False):
         """Find occurrences of specific text in a Word document."""
@@ -472,7 +506,7 @@ def register_tools():
             filename, text_to_find, match_case, whole_word
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def convert_to_pdf(filename: str, output_filename: str = None):
         """Convert a Word document to PDF format."""
         return await extended_document_tools.convert_to_pdf(filename, output_filename)
@@ -481,7 +515,7 @@ def register_tools():
     # Clause editing tools (ordinal-based editing with artifact loader)
     # ========================================================================
     
-    @mcp.tool()
+    @metered_tool()
     async def replace_clause_text_by_ordinal(filename: str, clause_number: str, new_text: str, 
                                        analysis_dir: str = None):
         """Replace the text of a clause identified by its ordinal number (e.g., '3.2.1')."""
@@ -489,7 +523,7 @@ def register_tools():
             filename, clause_number, new_text, analysis_dir
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def insert_paragraph_after_clause(filename: str, clause_number: str, text: str,
                                      style: str = "Normal", inherit_numbering: bool = False,
                                      analysis_dir: str = None):
@@ -498,14 +532,14 @@ def register_tools():
             filename, clause_number, text, style, inherit_numbering, analysis_dir
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def delete_clause_by_ordinal(filename: str, clause_number: str, analysis_dir: str = None):
         """Delete a clause and its continuations identified by ordinal (e.g., '12.5')."""
         return clause_editing_tools.delete_clause_by_ordinal(
             filename, clause_number, analysis_dir
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def get_clause_text_by_ordinal(filename: str, clause_number: str, 
                                    include_continuations: bool = True, analysis_dir: str = None):
         """Get the text of a clause by its ordinal number (e.g., '5.1')."""
@@ -513,7 +547,7 @@ def register_tools():
             filename, clause_number, include_continuations, analysis_dir
         )
     
-    @mcp.tool()
+    @metered_tool()
     async def list_all_clause_numbers(filename: str, analysis_dir: str = None):
         """List all clause ordinals in the document for discovery."""
         return clause_editing_tools.list_all_clause_numbers(filename, analysis_dir)
@@ -522,12 +556,12 @@ def register_tools():
     # Para ID tools (retrieval and replacement by paraId)
     # ========================================================================
 
-    @mcp.tool()
+    @metered_tool()
     async def get_text_by_para_id(filename: str, para_id: str):
         """Get the text content of a paragraph identified by its paraId."""
         return await content_tools.get_text_by_para_id(filename, para_id)
 
-    @mcp.tool()
+    @metered_tool()
     async def replace_text_by_para_id(filename: str, para_id: str, new_text: str):
         """Replace the entire text content of a paragraph identified by its paraId."""
         return await content_tools.replace_text_by_para_id(filename, para_id, new_text)
@@ -536,74 +570,74 @@ def register_tools():
     # Work Plan tools (task management for LLM workflows)
     # ========================================================================
 
-    @mcp.tool()
+    @metered_tool()
     async def get_work_plan(filename: str):
         """Get the current work plan for a project. Returns tasks, documents, and summary stats."""
         return await plan_tools.get_work_plan(filename)
 
-    @mcp.tool()
+    @metered_tool()
     async def add_task(filename: str, title: str, description: str, 
                        position: str = "end", ordinal: int = None):
         """Add a new task to the work plan. Position: 'start', 'end', or 'at' (with ordinal)."""
         return await plan_tools.add_task(filename, title, description, position, ordinal)
 
-    @mcp.tool()
+    @metered_tool()
     async def update_task(filename: str, task_id: str, title: str = None, 
                           description: str = None, status: str = None):
         """Update a task's title, description, or status (pending/in_progress/completed/blocked)."""
         return await plan_tools.update_task(filename, task_id, title, description, status)
 
-    @mcp.tool()
+    @metered_tool()
     async def delete_task(filename: str, task_id: str):
         """Delete a task from the work plan."""
         return await plan_tools.delete_task(filename, task_id)
 
-    @mcp.tool()
+    @metered_tool()
     async def move_task(filename: str, task_id: str, new_ordinal: int):
         """Move a task to a new position (0-based ordinal)."""
         return await plan_tools.move_task(filename, task_id, new_ordinal)
 
-    @mcp.tool()
+    @metered_tool()
     async def start_task(filename: str, task_id: str):
         """Start working on a task (sets status to in_progress)."""
         return await plan_tools.start_task(filename, task_id)
 
-    @mcp.tool()
+    @metered_tool()
     async def complete_task(filename: str, task_id: str):
         """Mark a task as completed."""
         return await plan_tools.complete_task(filename, task_id)
 
-    @mcp.tool()
+    @metered_tool()
     async def block_task(filename: str, task_id: str):
         """Mark a task as blocked."""
         return await plan_tools.block_task(filename, task_id)
 
-    @mcp.tool()
+    @metered_tool()
     async def unblock_task(filename: str, task_id: str):
         """Unblock a blocked task (sets status to pending). Only works if currently blocked."""
         return await plan_tools.unblock_task(filename, task_id)
 
-    @mcp.tool()
+    @metered_tool()
     async def convert_to_note(filename: str, task_id: str):
         """Convert a task to a note. Notes are not counted towards task completion totals."""
         return await plan_tools.convert_to_note(filename, task_id)
 
-    @mcp.tool()
+    @metered_tool()
     async def convert_to_task(filename: str, task_id: str):
         """Convert a note back to a regular task (pending status). Only works if currently a note."""
         return await plan_tools.convert_to_task(filename, task_id)
 
-    @mcp.tool()
+    @metered_tool()
     async def add_plan_document(filename: str, display_name: str = None):
         """Add the specified document to the work plan's tracked documents."""
         return await plan_tools.add_plan_document(filename, display_name)
 
-    @mcp.tool()
+    @metered_tool()
     async def remove_plan_document(filename: str, document_id: str):
         """Remove a document from the work plan's tracked documents."""
         return await plan_tools.remove_plan_document(filename, document_id)
 
-    @mcp.tool()
+    @metered_tool()
     async def list_plan_documents(filename: str):
         """List all documents tracked by the work plan."""
         return await plan_tools.list_plan_documents(filename)
@@ -629,7 +663,9 @@ def run_server():
             
         elif transport_type == 'streamable-http':
             # Run with streamable HTTP transport
+            register_metrics_route(config['metrics_path'])
             print(f"Server running on streamable-http transport at http://{config['host']}:{config['port']}{config['path']}")
+            print(f"Metrics at http://{config['host']}:{config['port']}{config['metrics_path']}")
             mcp.run(
                 transport='streamable-http',
                 host=config['host'],
@@ -654,6 +690,9 @@ def run_server():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        # Write out buffered edits.jsonl / tool_audit.jsonl lines
+        close_appends()
     
     return mcp
 
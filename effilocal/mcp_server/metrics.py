@@ -0,0 +1,291 @@
+"""In-process metrics for MCP tool calls, rendered in Prometheus text format.
+
+Every tool registered by ``main.register_tools`` is wrapped with
+``instrument``, which records per-tool call and error counts, a latency
+histogram, the size of the ``filename`` document and the number of blocks
+returned. Caches report hit/miss counts either through ``record_cache`` or,
+for ``functools.lru_cache`` functions, by being passed to
+``register_cache`` (read via ``cache_info()`` at scrape time). With the
+streamable-http transport the registry is served on ``/metrics``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+__all__ = [
+    "CONTENT_TYPE",
+    "REGISTRY",
+    "Histogram",
+    "MetricsRegistry",
+    "instrument",
+    "metrics_path",
+    "record_cache",
+    "register_cache",
+]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DOCUMENT_BYTES_BUCKETS = (16_384, 65_536, 262_144, 1_048_576, 4_194_304, 16_777_216, 67_108_864)
+BLOCK_COUNT_BUCKETS = (10, 50, 100, 250, 500, 1_000, 5_000)
+
+# Tool results are strings for most upstream tools; these mark failures.
+_ERROR_PREFIXES = ("Error", "Failed", "Invalid")
+_MISSING_DOCUMENT = " does not exist"
+
+
+class Histogram:
+    """Fixed-bucket histogram; callers hold the registry lock."""
+
+    __slots__ = ("bounds", "counts", "count", "total")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return ``(le, count)`` pairs including ``+Inf``."""
+
+        running = 0
+        pairs: list[tuple[str, int]] = []
+        for bound, count in zip((*self.bounds, None), self.counts):
+            running += count
+            pairs.append(("+Inf" if bound is None else _format_number(bound), running))
+        return pairs
+
+
+class _ToolStats:
+    __slots__ = ("calls", "errors", "latency", "document_bytes", "blocks")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.document_bytes = Histogram(DOCUMENT_BYTES_BUCKETS)
+        self.blocks = Histogram(BLOCK_COUNT_BUCKETS)
+
+
+class MetricsRegistry:
+    """Thread-safe store of tool and cache metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tools: dict[str, _ToolStats] = {}
+        self._cache_counts: dict[str, list[int]] = {}
+        self._cache_sources: dict[str, Callable[[], Any]] = {}
+
+    def register_tool(self, name: str) -> None:
+        """Export ``name`` with zero counts before its first call."""
+
+        with self._lock:
+            self._tools.setdefault(name, _ToolStats())
+
+    def observe_tool(
+        self,
+        name: str,
+        seconds: float,
+        *,
+        error: bool = False,
+        document_bytes: int | None = None,
+        blocks: int | None = None,
+    ) -> None:
+        """Record one call of tool ``name``."""
+
+        with self._lock:
+            stats = self._tools.setdefault(name, _ToolStats())
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.latency.observe(seconds)
+            if document_bytes is not None:
+                stats.document_bytes.observe(document_bytes)
+            if blocks is not None:
+                stats.blocks.observe(blocks)
+
+    def register_cache(self, name: str, cached: Callable[..., Any]) -> None:
+        """Report an ``lru_cache``-wrapped function's hits and misses as ``name``."""
+
+        with self._lock:
+            self._cache_sources[name] = cached.cache_info  # type: ignore[attr-defined]
+
+    def record_cache(self, name: str, *, hit: bool) -> None:
+        """Count one lookup in cache ``name``."""
+
+        with self._lock:
+            counts = self._cache_counts.setdefault(name, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def cache_counts(self) -> dict[str, tuple[int, int]]:
+        """Return ``{cache: (hits, misses)}`` across both kinds of cache."""
+
+        with self._lock:
+            counts = {name: (hits, misses) for name, (hits, misses) in self._cache_counts.items()}
+            sources = dict(self._cache_sources)
+        for name, cache_info in sources.items():
+            info = cache_info()
+            counts[name] = (info.hits, info.misses)
+        return counts
+
+    def render(self) -> str:
+        """Return every metric in Prometheus text exposition format."""
+
+        with self._lock:
+            tools = sorted(self._tools.items())
+            lines: list[str] = []
+            _counter(lines, "effilocal_tool_calls_total", "MCP tool calls.",
+                     ((name, stats.calls) for name, stats in tools))
+            _counter(lines, "effilocal_tool_errors_total", "MCP tool calls that raised or reported an error.",
+                     ((name, stats.errors) for name, stats in tools))
+            _histogram(lines, "effilocal_tool_duration_seconds", "MCP tool call latency.",
+                       ((name, stats.latency) for name, stats in tools))
+            _histogram(lines, "effilocal_tool_document_bytes", "Size of the document a tool call named.",
+                       ((name, stats.document_bytes) for name, stats in tools))
+            _histogram(lines, "effilocal_tool_blocks", "Blocks returned by a tool call.",
+                       ((name, stats.blocks) for name, stats in tools))
+        caches = sorted(self.cache_counts().items())
+        if caches:
+            lines.append("# HELP effilocal_cache_requests_total Cache lookups by result.")
+            lines.append("# TYPE effilocal_cache_requests_total counter")
+            for name, (hits, misses) in caches:
+                lines.append(f'effilocal_cache_requests_total{{cache="{_escape(name)}",result="hit"}} {hits}')
+                lines.append(f'effilocal_cache_requests_total{{cache="{_escape(name)}",result="miss"}} {misses}')
+            lines.append("# HELP effilocal_cache_hit_ratio Share of cache lookups that hit.")
+            lines.append("# TYPE effilocal_cache_hit_ratio gauge")
+            for name, (hits, misses) in caches:
+                ratio = hits / (hits + misses) if hits + misses else 0.0
+                lines.append(f'effilocal_cache_hit_ratio{{cache="{_escape(name)}"}} {_format_number(ratio)}')
+        return "\n".join(lines) + "\n"
+
+
+def _counter(lines: list[str], metric: str, help_text: str, values: Iterable[tuple[str, int]]) -> None:
+    lines.append(f"# HELP {metric} {help_text}")
+    lines.append(f"# TYPE {metric} counter")
+    for name, value in values:
+        lines.append(f'{metric}{{tool="{_escape(name)}"}} {value}')
+
+
+def _histogram(lines: list[str], metric: str, help_text: str, values: Iterable[tuple[str, Histogram]]) -> None:
+    lines.append(f"# HELP {metric} {help_text}")
+    lines.append(f"# TYPE {metric} histogram")
+    for name, histogram in values:
+        label = f'tool="{_escape(name)}"'
+        for le, count in histogram.cumulative():
+            lines.append(f'{metric}_bucket{{{label},le="{le}"}} {count}')
+        lines.append(f"{metric}_sum{{{label}}} {_format_number(histogram.total)}")
+        lines.append(f"{metric}_count{{{label}}} {histogram.count}")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+REGISTRY = MetricsRegistry()
+
+
+def register_cache(name: str, cached: Callable[..., Any]) -> None:
+    """Register an ``lru_cache`` function with the shared registry."""
+
+    REGISTRY.register_cache(name, cached)
+
+
+def record_cache(name: str, *, hit: bool) -> None:
+    """Count one lookup in cache ``name`` on the shared registry."""
+
+    REGISTRY.record_cache(name, hit=hit)
+
+
+def metrics_path(mcp_path: str) -> str:
+    """Return the ``/metrics`` path beside ``mcp_path`` (``/api/mcp`` -> ``/api/metrics``)."""
+
+    parent = mcp_path.rstrip("/").rpartition("/")[0]
+    return f"{parent}/metrics"
+
+
+def _document_bytes(args: tuple[Any, ...], kwargs: Mapping[str, Any]) -> int | None:
+    filename = kwargs.get("filename", args[0] if args else None)
+    if not isinstance(filename, str) or not filename:
+        return None
+    try:
+        return os.stat(filename).st_size if os.path.isfile(filename) else None
+    except OSError:
+        return None
+
+
+def _is_error(result: Any) -> bool:
+    if isinstance(result, Mapping):
+        return result.get("success") is False or bool(result.get("error"))
+    if isinstance(result, str):
+        return result.startswith(_ERROR_PREFIXES) or _MISSING_DOCUMENT in result.partition("\n")[0]
+    return False
+
+
+def _block_count(result: Any) -> int | None:
+    if not isinstance(result, Mapping):
+        return None
+    blocks = result.get("blocks")
+    if isinstance(blocks, list):
+        return len(blocks)
+    count = result.get("block_count")
+    return count if isinstance(count, int) else None
+
+
+def instrument(func: Callable, *, registry: MetricsRegistry | None = None) -> Callable:
+    """Wrap a sync or async tool function so each call is recorded.
+
+    The wrapper keeps ``func``'s name and signature, so it can be handed to
+    ``FastMCP.tool`` in place of ``func``.
+    """
+
+    target = registry or REGISTRY
+    name = func.__name__
+    target.register_tool(name)
+
+    def record(start: float, args: tuple[Any, ...], kwargs: Mapping[str, Any], result: Any, error: bool) -> None:
+        target.observe_tool(
+            name,
+            time.perf_counter() - start,
+            error=error or _is_error(result),
+            document_bytes=_document_bytes(args, kwargs),
+            blocks=_block_count(result),
+        )
+
+    @functools.wraps(func)
+    def sync_wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            record(start, args, kwargs, None, True)
+            raise
+        record(start, args, kwargs, result, False)
+        return result
+
+    @functools.wraps(func)
+    async def async_wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            record(start, args, kwargs, None, True)
+            raise
+        record(start, args, kwargs, result, False)
+        return result
+
+    return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
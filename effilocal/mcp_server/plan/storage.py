@@ -2,21 +2,38 @@
 
 Handles reading and writing plan.md (YAML frontmatter) and plan.meta.json files.
 Matches the TypeScript PlanStorage class from extension/src/models/planStorage.ts.
+
+Plans are cached per project and revalidated against the stat of both files,
+so repeated tool calls skip re-reading and re-parsing. Both files are
+replaced atomically, so the extension never reads a partial file. Both
+are written before save_plan returns (the extension reads plan.md); a file
+is only skipped when its content is unchanged and neither file was touched
+by anyone else since our last save.
 """
 
 from __future__ import annotations
 
 import json
+import logging
 import os
 import re
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+from effilocal.mcp_server.metrics import record_cache
 from effilocal.mcp_server.plan.models import WorkPlan
 from effilocal.mcp_server.tool_logging import get_project_path
 
+logger = logging.getLogger(__name__)
+
+# On Windows, os.replace fails while a reader has the target open
+_REPLACE_ATTEMPTS = 5
+_REPLACE_RETRY_SECONDS = 0.05
+
 
 def get_plan_dir(project_path: str) -> Path:
     """Get the plan directory for a project."""
@@ -39,18 +56,61 @@ def ensure_plan_directories(project_path: str) -> None:
     plan_dir.mkdir(parents=True, exist_ok=True)
 
 
-def load_plan(project_path: str) -> Optional[WorkPlan]:
-    """
-    Load a WorkPlan from disk.
+class _PlanStore:
+    """Cached plan and last written file contents for one project."""
     
-    Tries plan.meta.json first (faster), falls back to plan.md (YAML frontmatter).
-    
-    Args:
-        project_path: Path to the project directory
-        
-    Returns:
-        WorkPlan if found, None if no plan exists
-    """
+    def __init__(self, project_path: str):
+        self.project_path = project_path
+        self.lock = threading.RLock()
+        self.data: Optional[dict] = None  # to_dict() of the cached plan
+        self.signature: Optional[tuple] = None  # file stats the cache matches
+        self.meta_text: Optional[str] = None  # plan.meta.json as we last wrote it
+        self.md_text: Optional[str] = None  # plan.md as we last wrote it
+
+
+_stores: dict[str, _PlanStore] = {}
+_stores_lock = threading.Lock()
+
+
+def _get_store(project_path: str) -> _PlanStore:
+    key = os.path.normcase(os.path.abspath(project_path))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = _PlanStore(project_path)
+        return store
+
+
+def _stat_key(path: Path) -> Optional[tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _signature(project_path: str) -> tuple:
+    return _stat_key(get_plan_meta_path(project_path)), _stat_key(get_plan_md_path(project_path))
+
+
+def _atomic_write_text(path: Path, content: str) -> None:
+    """Write ``content`` to ``path`` through a temp file and ``os.replace``."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    for attempt in range(_REPLACE_ATTEMPTS):
+        try:
+            os.replace(tmp_path, path)
+            return
+        except PermissionError:
+            if attempt == _REPLACE_ATTEMPTS - 1:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            time.sleep(_REPLACE_RETRY_SECONDS)
+
+
+def _read_plan(project_path: str) -> Optional[WorkPlan]:
+    """Read a WorkPlan from plan.meta.json, falling back to plan.md."""
     # Try fast JSON first
     meta_path = get_plan_meta_path(project_path)
     if meta_path.exists():
@@ -74,6 +134,34 @@ def load_plan(project_path: str) -> Optional[WorkPlan]:
     return None
 
 
+def load_plan(project_path: str) -> Optional[WorkPlan]:
+    """
+    Load a WorkPlan from disk.
+    
+    Tries plan.meta.json first (faster), falls back to plan.md (YAML frontmatter).
+    Served from the per-project cache while neither file has changed; each
+    call returns a fresh WorkPlan, so callers may mutate it freely.
+    
+    Args:
+        project_path: Path to the project directory
+        
+    Returns:
+        WorkPlan if found, None if no plan exists
+    """
+    store = _get_store(project_path)
+    with store.lock:
+        signature = _signature(project_path)
+        if signature == store.signature:
+            record_cache("plan_store", hit=True)
+        else:
+            record_cache("plan_store", hit=False)
+            plan = _read_plan(project_path)
+            store.data = plan.to_dict() if plan is not None else None
+            store.signature = signature
+            store.meta_text = store.md_text = None
+        return WorkPlan.from_dict(store.data) if store.data is not None else None
+
+
 def load_plan_from_filename(filename: str) -> Optional[WorkPlan]:
     """
     Load a WorkPlan from disk, deriving project path from filename.
@@ -94,24 +182,30 @@ def save_plan(project_path: str, plan: WorkPlan) -> None:
     """
     Save a WorkPlan to disk.
     
-    Writes both plan.md (YAML frontmatter + markdown) and plan.meta.json (fast loading).
+    Writes plan.meta.json (fast loading) and plan.md (YAML frontmatter +
+    markdown), both atomically. A file whose content matches our last write
+    is skipped, unless either file changed on disk since then.
     
     Args:
         project_path: Path to the project directory
         plan: WorkPlan to save
     """
     ensure_plan_directories(project_path)
-    
-    # Write JSON (fast loading)
-    meta_path = get_plan_meta_path(project_path)
-    with open(meta_path, "w", encoding="utf-8") as f:
-        json.dump(plan.to_dict(), f, indent=2)
-    
-    # Write YAML frontmatter + markdown
-    md_path = get_plan_md_path(project_path)
-    content = _generate_plan_md(plan)
-    with open(md_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    data = plan.to_dict()
+    meta_text = json.dumps(data, indent=2)
+    md_text = _generate_plan_md(plan)
+    store = _get_store(project_path)
+    with store.lock:
+        # Compare both files: the extension may rewrite either one alone
+        untouched = store.signature is not None and _signature(project_path) == store.signature
+        if not (untouched and meta_text == store.meta_text):
+            _atomic_write_text(get_plan_meta_path(project_path), meta_text)
+        if not (untouched and md_text == store.md_text):
+            _atomic_write_text(get_plan_md_path(project_path), md_text)
+        store.data = data
+        store.meta_text = meta_text
+        store.md_text = md_text
+        store.signature = _signature(project_path)
 
 
 def save_plan_from_filename(filename: str, plan: WorkPlan) -> bool:
@@ -9,24 +9,21 @@ them with work plan tasks.
 
 Features:
 - Automatic project path derivation from document filename
-- Thread-safe append-only logging to edits.jsonl
+- Buffered append-only logging to edits.jsonl through a background writer
+  (ordered, fsynced periodically and flushed at shutdown)
 - Decorator for easy tool wrapping
 - Compatible with both sync and async functions
 """
 
-import json
 import os
 import re
-import threading
 import functools
 import asyncio
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, Optional, Union
 import hashlib
 
-
-# Thread lock for safe concurrent writes
-_write_lock = threading.Lock()
+from effilocal.util.io import append_jsonl, flush_appends
 
 
 def generate_id() -> str:
@@ -90,7 +87,8 @@ class ToolCallLogger:
     Logger for MCP tool calls.
     
     Writes tool call records to edits.jsonl in the project's logs directory.
-    Thread-safe for concurrent writes.
+    Records are queued for the shared background writer, which keeps the
+    file open and preserves call order; ``flush_tool_logs`` waits for them.
     """
     
     def __init__(self, project_path: str):
@@ -104,10 +102,6 @@ class ToolCallLogger:
         self.logs_dir = os.path.join(project_path, "logs")
         self.edits_path = os.path.join(self.logs_dir, "edits.jsonl")
     
-    def _ensure_directory(self) -> None:
-        """Ensure the logs directory exists."""
-        os.makedirs(self.logs_dir, exist_ok=True)
-    
     def log(
         self,
         tool_name: str,
@@ -135,15 +129,26 @@ class ToolCallLogger:
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
-        # Thread-safe write
-        with _write_lock:
-            self._ensure_directory()
-            with open(self.edits_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry) + "\n")
+        # Queued for the background writer, which creates the logs directory;
+        # ASCII-escaped as edits.jsonl always has been
+        append_jsonl(self.edits_path, entry, ensure_ascii=True)
         
         return entry
 
 
+def flush_tool_logs(timeout: Optional[float] = None) -> bool:
+    """
+    Wait until every queued tool call record has been written and fsynced.
+    
+    Args:
+        timeout: Seconds to wait, or None to wait indefinitely
+        
+    Returns:
+        False if the timeout expired first
+    """
+    return flush_appends(timeout)
+
+
 def log_tool_call(
     tool_name: str,
     request: Dict[str, Any],
@@ -9,8 +9,10 @@ from __future__ import annotations
 import os
 import json
 import re
+from bisect import bisect_right
 from collections import defaultdict
-from typing import Optional, Dict, Any, Tuple, Iterable, List
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Tuple, Iterable, List, Union
 from docx import Document
 from docx.text.run import Run
 from docx.oxml import OxmlElement
@@ -388,28 +390,17 @@ async def get_todo_comments(filename: str) -> str:
     }, indent=2)
 
 
-def _perform_review_action(
-    filename: str,
-    search_text: str,
-    action_code: str,
+def _normalize_review_comments(
     replacement_text: Optional[str] = None,
     comment_text: Optional[str] = None,
     comment_type: Optional[str] = None,
     comment_author: Optional[str] = None,
     comment_initials: Optional[str] = None,
     comment_entries: Optional[List[Dict[str, Optional[str]]]] = None,
-) -> str:
-    """Execute the requested review action and return a JSON payload."""
-    filename = ensure_docx_extension(filename)
-
-    if not os.path.exists(filename):
-        return json.dumps({"success": False, "error": f"Document {filename} does not exist"}, indent=2)
-
-    if not search_text:
-        return json.dumps({"success": False, "error": "search_text cannot be empty"}, indent=2)
-
+) -> Tuple[List[Dict[str, Optional[str]]], Optional[str]]:
+    """Validate review parameters; return (normalized comment entries, error JSON)."""
     if replacement_text is not None and replacement_text == "":
-        return json.dumps({"success": False, "error": "replacement_text cannot be empty"}, indent=2)
+        return [], json.dumps({"success": False, "error": "replacement_text cannot be empty"}, indent=2)
 
     if comment_entries is not None and (
         comment_text is not None
@@ -417,7 +408,7 @@ def _perform_review_action(
         or comment_author is not None
         or comment_initials is not None
     ):
-        return json.dumps({
+        return [], json.dumps({
             "success": False,
             "error": "Specify either single comment parameters or comment_entries, not both."
         }, indent=2)
@@ -427,10 +418,10 @@ def _perform_review_action(
     if comment_entries is not None:
         for entry in comment_entries:
             if entry is None:
-                return json.dumps({"success": False, "error": "comment_entries cannot contain null entries"}, indent=2)
+                return [], json.dumps({"success": False, "error": "comment_entries cannot contain null entries"}, indent=2)
             text_value = (entry.get("text") or "").strip()
             if not text_value:
-                return json.dumps({"success": False, "error": "Each comment entry must include non-empty text"}, indent=2)
+                return [], json.dumps({"success": False, "error": "Each comment entry must include non-empty text"}, indent=2)
             normalized_entry = {
                 "text": text_value,
                 "type": entry.get("type"),
@@ -441,7 +432,7 @@ def _perform_review_action(
     elif comment_text is not None:
         stripped_comment_text = comment_text.strip()
         if not stripped_comment_text:
-            return json.dumps({"success": False, "error": "comment_text cannot be empty"}, indent=2)
+            return [], json.dumps({"success": False, "error": "comment_text cannot be empty"}, indent=2)
         normalized_comment_entries.append({
             "text": stripped_comment_text,
             "type": comment_type,
@@ -449,6 +440,143 @@ def _perform_review_action(
             "initials": comment_initials,
         })
 
+    return normalized_comment_entries, None
+
+
+def _disambiguation_payload(doc: Document, matches: List[Tuple[Run, Dict[str, Any]]]) -> Dict[str, Any]:
+    """Describe every candidate location of an ambiguous search_text."""
+    comments_part_existing = _get_comments_part_if_exists(doc)
+    comment_lookup = _build_comment_lookup(comments_part_existing)
+
+    disambiguation_options: List[Dict[str, Any]] = []
+    for option_id, (candidate_run, candidate_context) in enumerate(matches, start=1):
+        comment_ids = _get_comment_ids_for_run(candidate_run)
+        comment_details = [
+            comment_lookup.get(cid, {"comment_id": cid})
+            for cid in comment_ids
+        ]
+        disambiguation_options.append({
+            "option_id": option_id,
+            "location": _location_from_context(candidate_context),
+            "run_text": candidate_context.get("run_text_before"),
+            "paragraph_preview": candidate_context.get("paragraph_text"),
+            "comment_ids": comment_ids,
+            "comments": comment_details,
+        })
+
+    return {
+        "success": False,
+        "requires_disambiguation": True,
+        "matches": disambiguation_options,
+        "message": (
+            f"search_text matched {len(matches)} locations. "
+            "Select the appropriate option (by option_id) or refine the search_text."
+        ),
+    }
+
+
+def _add_review_comments(
+    doc: Document,
+    run: Run,
+    comment_entries: List[Dict[str, Optional[str]]],
+) -> List[Dict[str, Any]]:
+    """Add each comment entry to the comments part and anchor it on ``run``."""
+    comment_records: List[Dict[str, Any]] = []
+    if not comment_entries:
+        return comment_records
+
+    comments_part = _get_or_add_comments_part(doc.part)
+    for entry in comment_entries:
+        comment = comments_part.comments.add_comment(
+            text="",
+            author=entry.get("author") or "",
+            initials=entry.get("initials") if entry.get("initials") is not None else "",
+        )
+        comment_id = comment.comment_id
+        identifier = _set_comment_text_with_identifier(comment, entry["text"])
+        _wrap_run_with_comment(run, comment_id)
+        comment_records.append({
+            "id": comment_id,
+            "identifier": identifier,
+            "audience": entry.get("type"),
+            "author": entry.get("author"),
+            "initials": entry.get("initials"),
+            "text": entry.get("text"),
+        })
+    return comment_records
+
+
+def _review_result(
+    action_code: str,
+    filename: str,
+    search_text: str,
+    replacement_text: Optional[str],
+    context: Dict[str, Any],
+    comment_records: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Build the success payload reported for one applied review action."""
+    paragraph_preview = context.get("paragraph_text") or ""
+    if len(paragraph_preview) > 160:
+        paragraph_preview = paragraph_preview[:157] + "..."
+
+    location = _location_from_context(context)
+
+    result: Dict[str, Any] = {
+        "success": True,
+        "action": action_code,
+        "filename": filename,
+        "search_text": search_text,
+        "did_edit": replacement_text is not None,
+        "did_comment": bool(comment_records),
+        "location": location,
+        "paragraph_text_preview": paragraph_preview,
+        "original_run_text": context.get("original_run_text"),
+        "updated_run_text": context.get("run_text_after"),
+    }
+
+    if replacement_text is not None:
+        result["replacement_text"] = replacement_text
+
+    if comment_records:
+        if len(comment_records) == 1:
+            result["comment"] = comment_records[0]
+        else:
+            result["comments"] = comment_records
+
+    return result
+
+
+def _perform_review_action(
+    filename: str,
+    search_text: str,
+    action_code: str,
+    replacement_text: Optional[str] = None,
+    comment_text: Optional[str] = None,
+    comment_type: Optional[str] = None,
+    comment_author: Optional[str] = None,
+    comment_initials: Optional[str] = None,
+    comment_entries: Optional[List[Dict[str, Optional[str]]]] = None,
+) -> str:
+    """Execute the requested review action and return a JSON payload."""
+    filename = ensure_docx_extension(filename)
+
+    if not os.path.exists(filename):
+        return json.dumps({"success": False, "error": f"Document {filename} does not exist"}, indent=2)
+
+    if not search_text:
+        return json.dumps({"success": False, "error": "search_text cannot be empty"}, indent=2)
+
+    normalized_comment_entries, error = _normalize_review_comments(
+        replacement_text=replacement_text,
+        comment_text=comment_text,
+        comment_type=comment_type,
+        comment_author=comment_author,
+        comment_initials=comment_initials,
+        comment_entries=comment_entries,
+    )
+    if error:
+        return error
+
     is_writeable, error_message = check_file_writeable(filename)
     if not is_writeable:
         return json.dumps({"success": False, "error": f"Cannot modify document: {error_message}"}, indent=2)
@@ -466,39 +594,10 @@ def _perform_review_action(
         }, indent=2)
 
     if len(matches) > 1:
-        comments_part_existing = _get_comments_part_if_exists(doc)
-        comment_lookup = _build_comment_lookup(comments_part_existing)
-
-        disambiguation_options: List[Dict[str, Any]] = []
-        for option_id, (candidate_run, candidate_context) in enumerate(matches, start=1):
-            comment_ids = _get_comment_ids_for_run(candidate_run)
-            comment_details = [
-                comment_lookup.get(cid, {"comment_id": cid})
-                for cid in comment_ids
-            ]
-            disambiguation_options.append({
-                "option_id": option_id,
-                "location": _location_from_context(candidate_context),
-                "run_text": candidate_context.get("run_text_before"),
-                "paragraph_preview": candidate_context.get("paragraph_text"),
-                "comment_ids": comment_ids,
-                "comments": comment_details,
-            })
-
-        return json.dumps({
-            "success": False,
-            "requires_disambiguation": True,
-            "matches": disambiguation_options,
-            "message": (
-                f"search_text matched {len(matches)} locations. "
-                "Select the appropriate option (by option_id) or refine the search_text."
-            ),
-        }, indent=2)
+        return json.dumps(_disambiguation_payload(doc, matches), indent=2)
 
     run, context = matches[0]
 
-    comment_records: List[Dict[str, Any]] = []
-
     if replacement_text is not None:
         original_text = run.text or ""
         match_index = context.get("match_index_in_run", original_text.find(search_text))
@@ -515,60 +614,25 @@ def _perform_review_action(
         context["original_run_text"] = run.text
         context["run_text_after"] = run.text
 
-    if normalized_comment_entries:
-        comments_part = _get_or_add_comments_part(doc.part)
-        for entry in normalized_comment_entries:
-            comment = comments_part.comments.add_comment(
-                text="",
-                author=entry.get("author") or "",
-                initials=entry.get("initials") if entry.get("initials") is not None else "",
-            )
-            comment_id = comment.comment_id
-            identifier = _set_comment_text_with_identifier(comment, entry["text"])
-            _wrap_run_with_comment(run, comment_id)
-            comment_records.append({
-                "id": comment_id,
-                "identifier": identifier,
-                "audience": entry.get("type"),
-                "author": entry.get("author"),
-                "initials": entry.get("initials"),
-                "text": entry.get("text"),
-            })
+    comment_records = _add_review_comments(doc, run, normalized_comment_entries)
 
     try:
         doc.save(filename)
     except Exception as exc:
         return json.dumps({"success": False, "error": f"Failed to save document: {exc}"}, indent=2)
 
-    paragraph_preview = context.get("paragraph_text") or ""
-    if len(paragraph_preview) > 160:
-        paragraph_preview = paragraph_preview[:157] + "..."
-
-    location = _location_from_context(context)
-
-    result: Dict[str, Any] = {
-        "success": True,
-        "action": action_code,
-        "filename": filename,
-        "search_text": search_text,
-        "did_edit": replacement_text is not None,
-        "did_comment": bool(comment_records),
-        "location": location,
-        "paragraph_text_preview": paragraph_preview,
-        "original_run_text": context.get("original_run_text"),
-        "updated_run_text": context.get("run_text_after"),
-    }
+    result = _review_result(action_code, filename, search_text, replacement_text, context, comment_records)
+    return json.dumps(result, indent=2)
 
-    if replacement_text is not None:
-        result["replacement_text"] = replacement_text
 
-    if comment_records:
-        if len(comment_records) == 1:
-            result["comment"] = comment_records[0]
-        else:
-            result["comments"] = comment_records
+@dataclass(frozen=True)
+class _ReviewPlan:
+    """A validated review instruction, ready to be applied to a document."""
 
-    return json.dumps(result, indent=2)
+    search_text: str
+    action_code: str
+    replacement_text: Optional[str] = None
+    comment_entries: Optional[List[Dict[str, Optional[str]]]] = None
 
 
 def _json_error(message: str) -> str:
@@ -670,7 +734,6 @@ def _reject_external_comment_params(
 
 
 def _execute_ne(
-    filename: str,
     search_text: str,
     replacement_text: Optional[str],
     internal_comment_text: Optional[str],
@@ -679,7 +742,7 @@ def _execute_ne(
     internal_comment_initials: Optional[str],
     external_comment_author: Optional[str],
     external_comment_initials: Optional[str],
-) -> str:
+) -> Union[str, _ReviewPlan]:
     if replacement_text is not None:
         return _json_error("Instruction NE does not support replacement_text. Use an E-based code to perform edits.")
 
@@ -691,15 +754,13 @@ def _execute_ne(
     if error:
         return error
 
-    return _perform_review_action(
-        filename=filename,
+    return _ReviewPlan(
         search_text=search_text,
         action_code="NE",
     )
 
 
 def _execute_ne_ic(
-    filename: str,
     search_text: str,
     replacement_text: Optional[str],
     internal_comment_text: Optional[str],
@@ -708,7 +769,7 @@ def _execute_ne_ic(
     internal_comment_initials: Optional[str],
     external_comment_author: Optional[str],
     external_comment_initials: Optional[str],
-) -> str:
+) -> Union[str, _ReviewPlan]:
     if replacement_text is not None:
         return _json_error("Instruction NE+IC cannot be used for edits. Use E+IC if the text should be modified.")
 
@@ -726,8 +787,7 @@ def _execute_ne_ic(
         return internal_error
     assert internal_entry is not None
 
-    return _perform_review_action(
-        filename=filename,
+    return _ReviewPlan(
         search_text=search_text,
         action_code="NE+IC",
         comment_entries=[internal_entry],
@@ -735,7 +795,6 @@ def _execute_ne_ic(
 
 
 def _execute_ne_ec(
-    filename: str,
     search_text: str,
     replacement_text: Optional[str],
     internal_comment_text: Optional[str],
@@ -744,7 +803,7 @@ def _execute_ne_ec(
     internal_comment_initials: Optional[str],
     external_comment_author: Optional[str],
     external_comment_initials: Optional[str],
-) -> str:
+) -> Union[str, _ReviewPlan]:
     if replacement_text is not None:
         return _json_error("Instruction NE+EC cannot be used for edits. Use E+EC if the text should be modified.")
 
@@ -762,8 +821,7 @@ def _execute_ne_ec(
         return external_error
     assert external_entry is not None
 
-    return _perform_review_action(
-        filename=filename,
+    return _ReviewPlan(
         search_text=search_text,
         action_code="NE+EC",
         comment_entries=[external_entry],
@@ -771,7 +829,6 @@ def _execute_ne_ec(
 
 
 def _execute_ne_ic_ec(
-    filename: str,
     search_text: str,
     replacement_text: Optional[str],
     internal_comment_text: Optional[str],
@@ -780,7 +837,7 @@ def _execute_ne_ic_ec(
     internal_comment_initials: Optional[str],
     external_comment_author: Optional[str],
     external_comment_initials: Optional[str],
-) -> str:
+) -> Union[str, _ReviewPlan]:
     if replacement_text is not None:
         return _json_error("Instruction NE+IC+EC cannot be used for edits. Use E+IC+EC if the text should be modified.")
 
@@ -804,8 +861,7 @@ def _execute_ne_ic_ec(
         return external_error
     assert external_entry is not None
 
-    return _perform_review_action(
-        filename=filename,
+    return _ReviewPlan(
         search_text=search_text,
         action_code="NE+IC+EC",
         comment_entries=[internal_entry, external_entry],
@@ -813,7 +869,6 @@ def _execute_ne_ic_ec(
 
 
 def _execute_e(
-    filename: str,
     search_text: str,
     replacement_text: Optional[str],
     internal_comment_text: Optional[str],
@@ -822,7 +877,7 @@ def _execute_e(
     internal_comment_initials: Optional[str],
     external_comment_author: Optional[str],
     external_comment_initials: Optional[str],
-) -> str:
+) -> Union[str, _ReviewPlan]:
     if replacement_text is None:
         return _json_error("replacement_text is required for instruction E.")
 
@@ -834,8 +889,7 @@ def _execute_e(
     if error:
         return error
 
-    return _perform_review_action(
-        filename=filename,
+    return _ReviewPlan(
         search_text=search_text,
         action_code="E",
         replacement_text=replacement_text,
@@ -843,7 +897,6 @@ def _execute_e(
 
 
 def _execute_e_ic(
-    filename: str,
     search_text: str,
     replacement_text: Optional[str],
     internal_comment_text: Optional[str],
@@ -852,7 +905,7 @@ def _execute_e_ic(
     internal_comment_initials: Optional[str],
     external_comment_author: Optional[str],
     external_comment_initials: Optional[str],
-) -> str:
+) -> Union[str, _ReviewPlan]:
     if replacement_text is None:
         return _json_error("replacement_text is required for instruction E+IC.")
 
@@ -870,8 +923,7 @@ def _execute_e_ic(
         return internal_error
     assert internal_entry is not None
 
-    return _perform_review_action(
-        filename=filename,
+    return _ReviewPlan(
         search_text=search_text,
         action_code="E+IC",
         replacement_text=replacement_text,
@@ -880,7 +932,6 @@ def _execute_e_ic(
 
 
 def _execute_e_ec(
-    filename: str,
     search_text: str,
     replacement_text: Optional[str],
     internal_comment_text: Optional[str],
@@ -889,7 +940,7 @@ def _execute_e_ec(
     internal_comment_initials: Optional[str],
     external_comment_author: Optional[str],
     external_comment_initials: Optional[str],
-) -> str:
+) -> Union[str, _ReviewPlan]:
     if replacement_text is None:
         return _json_error("replacement_text is required for instruction E+EC.")
 
@@ -907,8 +958,7 @@ def _execute_e_ec(
         return external_error
     assert external_entry is not None
 
-    return _perform_review_action(
-        filename=filename,
+    return _ReviewPlan(
         search_text=search_text,
         action_code="E+EC",
         replacement_text=replacement_text,
@@ -917,7 +967,6 @@ def _execute_e_ec(
 
 
 def _execute_e_ic_ec(
-    filename: str,
     search_text: str,
     replacement_text: Optional[str],
     internal_comment_text: Optional[str],
@@ -926,7 +975,7 @@ def _execute_e_ic_ec(
     internal_comment_initials: Optional[str],
     external_comment_author: Optional[str],
     external_comment_initials: Optional[str],
-) -> str:
+) -> Union[str, _ReviewPlan]:
     if replacement_text is None:
         return _json_error("replacement_text is required for instruction E+IC+EC.")
 
@@ -950,8 +999,7 @@ def _execute_e_ic_ec(
         return external_error
     assert external_entry is not None
 
-    return _perform_review_action(
-        filename=filename,
+    return _ReviewPlan(
         search_text=search_text,
         action_code="E+IC+EC",
         replacement_text=replacement_text,
@@ -971,10 +1019,9 @@ INSTRUCTION_EXECUTORS = {
 }
 
 
-async def execute_review_instruction(
-    filename: str,
-    search_text: str,
+def _plan_review_instruction(
     instruction_code: str,
+    search_text: str,
     replacement_text: Optional[str] = None,
     internal_comment_text: Optional[str] = None,
     external_comment_text: Optional[str] = None,
@@ -982,8 +1029,8 @@ async def execute_review_instruction(
     internal_comment_initials: Optional[str] = None,
     external_comment_author: Optional[str] = None,
     external_comment_initials: Optional[str] = None,
-) -> str:
-    """Execute a combined edit/comment workflow based on a TODO instruction code."""
+) -> Union[str, _ReviewPlan]:
+    """Validate one instruction; return its plan or an error JSON payload."""
     canonical_code = _canonicalize_instruction_code(instruction_code)
     if canonical_code is None or canonical_code not in INSTRUCTION_EXECUTORS:
         supported = ", ".join(SUPPORTED_INSTRUCTION_CODES)
@@ -993,7 +1040,6 @@ async def execute_review_instruction(
 
     executor = INSTRUCTION_EXECUTORS[canonical_code]
     return executor(
-        filename=filename,
         search_text=search_text,
         replacement_text=replacement_text,
         internal_comment_text=internal_comment_text,
@@ -1003,3 +1049,260 @@ async def execute_review_instruction(
         external_comment_author=external_comment_author,
         external_comment_initials=external_comment_initials,
     )
+
+
+async def execute_review_instruction(
+    filename: str,
+    search_text: str,
+    instruction_code: str,
+    replacement_text: Optional[str] = None,
+    internal_comment_text: Optional[str] = None,
+    external_comment_text: Optional[str] = None,
+    internal_comment_author: Optional[str] = None,
+    internal_comment_initials: Optional[str] = None,
+    external_comment_author: Optional[str] = None,
+    external_comment_initials: Optional[str] = None,
+) -> str:
+    """Execute a combined edit/comment workflow based on a TODO instruction code."""
+    plan = _plan_review_instruction(
+        instruction_code=instruction_code,
+        search_text=search_text,
+        replacement_text=replacement_text,
+        internal_comment_text=internal_comment_text,
+        external_comment_text=external_comment_text,
+        internal_comment_author=internal_comment_author,
+        internal_comment_initials=internal_comment_initials,
+        external_comment_author=external_comment_author,
+        external_comment_initials=external_comment_initials,
+    )
+    if isinstance(plan, str):
+        return plan
+    return _perform_review_action(
+        filename=filename,
+        search_text=plan.search_text,
+        action_code=plan.action_code,
+        replacement_text=plan.replacement_text,
+        comment_entries=plan.comment_entries,
+    )
+
+
+# Fields accepted in each execute_review_instructions entry ("id" is echoed back).
+_BATCH_INSTRUCTION_FIELDS = frozenset({
+    "id",
+    "search_text",
+    "instruction_code",
+    "replacement_text",
+    "internal_comment_text",
+    "external_comment_text",
+    "internal_comment_author",
+    "internal_comment_initials",
+    "external_comment_author",
+    "external_comment_initials",
+})
+
+# Joins run texts in _RunOffsetIndex; cannot occur in document text (invalid in XML).
+_RUN_SEPARATOR = "\x00"
+
+
+class _RunOffsetIndex:
+    """All run texts joined into one string, with the offset at which each run starts.
+
+    Built with a single _iter_run_contexts pass; every search text is then
+    located with C-level ``str.find`` over the joined string instead of a
+    Python loop over the runs. Runs are separated by a character that cannot
+    appear in document text, so matches never span runs -- the same matches,
+    in the same order, as _find_run_matches.
+    """
+
+    def __init__(self, doc: Document) -> None:
+        self.runs: List[Run] = []
+        self.contexts: List[Dict[str, Any]] = []
+        self.texts: List[str] = []
+        self.starts: List[int] = []
+        offset = 0
+        for run, context in _iter_run_contexts(doc):
+            text = run.text or ""
+            self.runs.append(run)
+            self.contexts.append(context)
+            self.texts.append(text)
+            self.starts.append(offset)
+            offset += len(text) + len(_RUN_SEPARATOR)
+        self.joined = _RUN_SEPARATOR.join(self.texts)
+
+    def find_all(self, search_text: str) -> List[Tuple[int, int]]:
+        """Return (run position, offset in run) of every non-overlapping match."""
+        if not search_text or _RUN_SEPARATOR in search_text:
+            return []
+        matches: List[Tuple[int, int]] = []
+        start = self.joined.find(search_text)
+        while start != -1:
+            position = bisect_right(self.starts, start) - 1
+            matches.append((position, start - self.starts[position]))
+            start = self.joined.find(search_text, start + len(search_text))
+        return matches
+
+    def match_context(self, position: int, offset: int, search_text: str) -> Dict[str, Any]:
+        """Return the _find_run_matches-style context for one match."""
+        context = dict(self.contexts[position])
+        context["match_index_in_run"] = offset
+        context["match_length"] = len(search_text)
+        context["run_text_before"] = self.texts[position]
+        return context
+
+
+async def execute_review_instructions(filename: str, instructions: List[Dict[str, Any]]) -> str:
+    """Execute a batch of review instructions with one document load and save.
+
+    Each instruction takes the parameters of ``execute_review_instruction``
+    (``search_text``, ``instruction_code``, ``replacement_text`` and the
+    comment fields) plus an optional ``id`` echoed back in its result.
+
+    Every search_text is located in the document as it was before the batch,
+    using one run-offset index. Edits are applied per run from the
+    right so earlier offsets stay valid, and comments are added in document
+    order. An instruction that fails validation, is not found, is ambiguous
+    or would edit text already edited by an earlier instruction is reported
+    and skipped without affecting the others.
+
+    Returns:
+        JSON with ``applied``/``failed`` counts and one result per
+        instruction, in input order, shaped like ``execute_review_instruction``.
+    """
+    filename = ensure_docx_extension(filename)
+
+    if not os.path.exists(filename):
+        return _json_error(f"Document {filename} does not exist")
+    if not instructions:
+        return _json_error("instructions cannot be empty")
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(instructions)
+    planned: List[Tuple[int, _ReviewPlan, List[Dict[str, Optional[str]]]]] = []
+
+    for position, instruction in enumerate(instructions):
+        if not isinstance(instruction, dict):
+            results[position] = {"success": False, "error": "Each instruction must be an object"}
+            continue
+        unknown = sorted(set(instruction) - _BATCH_INSTRUCTION_FIELDS)
+        if unknown:
+            results[position] = {"success": False, "error": f"Unknown instruction field(s): {', '.join(unknown)}"}
+            continue
+        non_text = sorted(
+            key for key, value in instruction.items()
+            if key != "id" and value is not None and not isinstance(value, str)
+        )
+        if non_text:
+            results[position] = {"success": False, "error": f"Field(s) must be strings: {', '.join(non_text)}"}
+            continue
+        if not instruction.get("search_text"):
+            results[position] = {"success": False, "error": "search_text cannot be empty"}
+            continue
+
+        fields = {key: value for key, value in instruction.items() if key != "id"}
+        fields.setdefault("instruction_code", None)
+        plan = _plan_review_instruction(**fields)
+        if isinstance(plan, str):
+            results[position] = json.loads(plan)
+            continue
+        comment_entries, error = _normalize_review_comments(
+            replacement_text=plan.replacement_text,
+            comment_entries=plan.comment_entries,
+        )
+        if error:
+            results[position] = json.loads(error)
+            continue
+        planned.append((position, plan, comment_entries))
+
+    applied: List[Tuple[int, int, int, _ReviewPlan, List[Dict[str, Optional[str]]]]] = []
+    if planned:
+        is_writeable, error_message = check_file_writeable(filename)
+        if not is_writeable:
+            return _json_error(f"Cannot modify document: {error_message}")
+
+        try:
+            doc = Document(filename)
+        except Exception as exc:
+            return _json_error(f"Failed to open document: {exc}")
+
+        index = _RunOffsetIndex(doc)
+        edit_spans: Dict[int, List[Tuple[int, int, int]]] = defaultdict(list)
+
+        for position, plan, comment_entries in planned:
+            matches = index.find_all(plan.search_text)
+            if not matches:
+                results[position] = {"success": False, "error": f"Text '{plan.search_text}' not found in document."}
+                continue
+            if len(matches) > 1:
+                results[position] = _disambiguation_payload(doc, [
+                    (index.runs[run_position], index.match_context(run_position, offset, plan.search_text))
+                    for run_position, offset in matches
+                ])
+                continue
+
+            run_position, offset = matches[0]
+            if plan.replacement_text is not None:
+                end = offset + len(plan.search_text)
+                overlapping = next(
+                    (other for start, stop, other in edit_spans[run_position] if start < end and offset < stop),
+                    None,
+                )
+                if overlapping is not None:
+                    results[position] = {
+                        "success": False,
+                        "error": f"Text '{plan.search_text}' overlaps the edit made by instruction {overlapping}.",
+                    }
+                    continue
+                edit_spans[run_position].append((offset, end, position))
+            applied.append((run_position, offset, position, plan, comment_entries))
+
+        # Edits: rewrite each run once, right to left so offsets stay valid
+        updated_texts: Dict[int, str] = {}
+        for run_position, offset, position, plan, _ in sorted(applied, reverse=True):
+            if plan.replacement_text is None:
+                continue
+            text = updated_texts.get(run_position, index.texts[run_position])
+            updated_texts[run_position] = (
+                text[:offset] + plan.replacement_text + text[offset + len(plan.search_text):]
+            )
+        for run_position, text in updated_texts.items():
+            index.runs[run_position].text = text
+
+        # Comments: in document order, so comment ids follow the document
+        for run_position, offset, position, plan, comment_entries in sorted(applied):
+            context = index.match_context(run_position, offset, plan.search_text)
+            context["original_run_text"] = index.texts[run_position]
+            context["run_text_after"] = updated_texts.get(run_position, index.texts[run_position])
+            comment_records = _add_review_comments(doc, index.runs[run_position], comment_entries)
+            results[position] = _review_result(
+                plan.action_code,
+                filename,
+                plan.search_text,
+                plan.replacement_text,
+                context,
+                comment_records,
+            )
+
+        if applied:
+            try:
+                doc.save(filename)
+            except Exception as exc:
+                return _json_error(f"Failed to save document: {exc}")
+
+    report: List[Dict[str, Any]] = []
+    for position, result in enumerate(results):
+        entry: Dict[str, Any] = {"index": position}
+        instruction = instructions[position]
+        if isinstance(instruction, dict) and "id" in instruction:
+            entry["id"] = instruction["id"]
+        entry.update(result or {})
+        report.append(entry)
+
+    failed = sum(1 for entry in report if not entry.get("success"))
+    return json.dumps({
+        "success": failed == 0,
+        "filename": filename,
+        "total": len(report),
+        "applied": len(applied),
+        "failed": failed,
+        "saved": bool(applied),
+        "results": report,
+    }, indent=2)
@@ -0,0 +1,96 @@
+"""Full-text search over analysis artifacts using the persisted block index."""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from effilocal.artifact_loader import ArtifactLoader
+from effilocal.mcp_server.metrics import register_cache
+
+# Characters of context shown either side of the first match.
+_SNIPPET_CONTEXT = 40
+
+
+@lru_cache(maxsize=8)
+def _cached_loader(analysis_dir: str, mtime_ns: int, size: int) -> ArtifactLoader:
+    # Keyed on the blocks.jsonl stat so a re-analysis is picked up
+    return ArtifactLoader(analysis_dir)
+
+
+register_cache("search_tools.loader", _cached_loader)
+
+
+def _load(analysis_path: Path) -> ArtifactLoader:
+    stat = (analysis_path / "blocks.jsonl").stat()
+    return _cached_loader(str(analysis_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def _snippet(text: str, offset: int, length: int) -> str:
+    start = max(offset - _SNIPPET_CONTEXT, 0)
+    end = min(offset + length + _SNIPPET_CONTEXT, len(text))
+    return ("…" if start else "") + text[start:end] + ("…" if end < len(text) else "")
+
+
+def search_blocks(
+    analysis_dir: str,
+    query: str,
+    whole_word: bool = False,
+    case_sensitive: bool = False,
+    limit: int = 50,
+) -> str:
+    """Search the analyzed blocks of a document for text.
+
+    Returns matching block ids, clause ordinals, document positions and the
+    character offsets of every match, in document order.
+    """
+
+    if not analysis_dir or not str(analysis_dir).strip():
+        return json.dumps({"success": False, "error": "analysis_dir is required."}, indent=2)
+    if not query:
+        return json.dumps({"success": False, "error": "query is required."}, indent=2)
+    try:
+        limit = max(int(limit or 0), 1)
+    except (TypeError, ValueError):
+        return json.dumps({"success": False, "error": f"limit must be an integer, got {limit!r}."}, indent=2)
+
+    analysis_path = Path(analysis_dir).expanduser()
+    if not analysis_path.is_dir():
+        return json.dumps(
+            {"success": False, "error": f"Analysis directory not found: {analysis_path}"},
+            indent=2,
+        )
+
+    try:
+        loader = _load(analysis_path)
+    except FileNotFoundError as exc:
+        return json.dumps({"success": False, "error": f"Missing artifact file: {exc}"}, indent=2)
+    except json.JSONDecodeError as exc:
+        return json.dumps({"success": False, "error": f"Malformed artifact JSON: {exc}"}, indent=2)
+
+    hits = loader.search_index.search(
+        query,
+        whole_word=bool(whole_word),
+        case_sensitive=bool(case_sensitive),
+        limit=limit + 1,
+    )
+    matches: list[dict[str, Any]] = []
+    for hit in hits[:limit]:
+        text = loader.blocks[hit.position].get("text") or ""
+        match = hit.to_dict()
+        match["snippet"] = _snippet(text, hit.offsets[0], len(query))
+        matches.append(match)
+
+    return json.dumps(
+        {
+            "success": True,
+            "query": query,
+            "count": len(matches),
+            "truncated": len(hits) > limit,
+            "matches": matches,
+        },
+        indent=2,
+        ensure_ascii=False,
+    )
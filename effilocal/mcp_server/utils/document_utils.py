@@ -43,6 +43,7 @@ from effilocal.doc.uuid_embedding import (
     set_paragraph_para_id,
     collect_all_para_ids,
 )
+from effilocal.doc.style_table import StyleTable
 
 
 # ============================================================================
@@ -108,6 +109,12 @@ def get_paragraph_by_id(doc, para_id: str):
             return p
     return None
 
+def _is_toc_paragraph(paragraph: Paragraph, style_table: StyleTable) -> bool:
+    """Return True when the paragraph uses a TOC style (TOC 1, TOC Heading, ...)."""
+    style = style_table.paragraph_style(paragraph._p)
+    return style is not None and (style.name or "").startswith("TOC")
+
+
 def _find_and_replace_in_doc(doc, old_text: str, new_text: str, whole_word_only: bool = False):
     """
     Find and replace text in a Document object (used by tests).
@@ -120,13 +127,14 @@ def _find_and_replace_in_doc(doc, old_text: str, new_text: str, whole_word_only:
     replacements = 0
     snippets = []
     split_matches = []
+    style_table = StyleTable.for_document(doc)
     
     # Process paragraphs
     for para_idx, paragraph in enumerate(doc.paragraphs):
         para_text = paragraph.text
         
         # Skip TOC paragraphs
-        if paragraph.style and paragraph.style.name.startswith("TOC"):
+        if _is_toc_paragraph(paragraph, style_table):
             continue
         
         if old_text not in para_text:
@@ -217,7 +225,7 @@ def _find_and_replace_in_doc(doc, old_text: str, new_text: str, whole_word_only:
             for cell_idx, cell in enumerate(row.cells):
                 for para in cell.paragraphs:
                     # Skip TOC paragraphs
-                    if para.style and para.style.name.startswith("TOC"):
+                    if _is_toc_paragraph(para, style_table):
                         continue
                     
                     if old_text not in para.text:
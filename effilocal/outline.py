@@ -0,0 +1,277 @@
+"""Paged outline queries and delta updates for webview display.
+
+The webview outline used to be rebuilt from a single JSON blob holding every
+block. :class:`OutlineService` answers the queries the webview actually
+needs instead:
+
+- windowed pages of the outline (visible blocks ``start`` .. ``start + limit``),
+  optionally with collapsed subtrees hidden, using the block hierarchy in
+  ``relationships.json``;
+- the children of one block, to expand a collapsed node;
+- delta updates between two analyses, from ``analysis_delta.json``, so the
+  view can be patched instead of reloaded.
+
+Every response carries the analysis ``version`` (the manifest's
+``created_at`` plus the ``blocks.jsonl`` checksum). A client holding version *V* asks for the delta since *V*:
+it gets ``"current"`` when nothing changed, ``"delta"`` when the latest
+analysis was made directly on top of *V*, and ``"reload"`` otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from effilocal.artifact_loader import ArtifactLoader
+from effilocal.config.logging import get_logger
+from effilocal.doc.manifest import manifest_version
+
+LOGGER = get_logger(__name__)
+
+__all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "OUTLINE_TEXT_LIMIT",
+    "OutlineService",
+    "outline_item",
+]
+
+DEFAULT_PAGE_SIZE = 200
+OUTLINE_TEXT_LIMIT = 100
+DELTA_FILENAME = "analysis_delta.json"
+
+
+def outline_item(block: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the outline row for a block.
+
+    Numbered blocks are labelled with their ordinal; unnumbered headings and
+    table cells get a bracketed style/position label, other paragraphs none.
+    """
+    list_meta = block.get('list') or {}
+    ordinal = list_meta.get('ordinal', '')
+    block_type = block.get('type', 'paragraph')
+
+    if not ordinal:
+        if block_type == 'heading':
+            ordinal = f'[{block.get("style", "") or "Heading"}]'
+        elif block_type == 'table_cell':
+            table_info = block.get('table', {})
+            ordinal = f'[Table R{table_info.get("row", 0)+1}C{table_info.get("col", 0)+1}]'
+        else:
+            ordinal = ''
+
+    return {
+        'id': block['id'],
+        'ordinal': ordinal,
+        'text': block.get('text', '')[:OUTLINE_TEXT_LIMIT],
+        'level': list_meta.get('level', 0),
+        'type': block_type,
+        'section_id': block.get('section_id'),
+        'is_numbered': bool(list_meta.get('ordinal')),
+    }
+
+
+class OutlineService:
+    """Outline queries over one analysis directory.
+
+    Usage:
+        service = OutlineService.from_dir('EL_Projects/My Project/analysis/Contract')
+
+        first = service.page(0, 200)
+        folded = service.page(0, 200, collapsed=[schedule_heading_id])
+        expanded = service.children(schedule_heading_id)
+        patch = service.delta(since_version=first['version'])
+    """
+
+    def __init__(self, loader: ArtifactLoader):
+        """
+        Args:
+            loader: Loaded artifacts for the analysis.
+        """
+        self.loader = loader
+        self._blocks = loader.blocks
+        self._positions: Dict[str, int] = {
+            block['id']: index for index, block in enumerate(self._blocks)
+        }
+
+    @classmethod
+    def from_dir(cls, analysis_dir: str | Path) -> "OutlineService":
+        """Load the analysis in ``analysis_dir``."""
+        return cls(ArtifactLoader(analysis_dir))
+
+    @property
+    def version(self) -> Optional[str]:
+        """Version token of the loaded analysis (see ``manifest_version``)."""
+        return manifest_version(self.loader.manifest)
+
+    @property
+    def total(self) -> int:
+        """Number of blocks in the document."""
+        return len(self._blocks)
+
+    def item(self, block_id: str) -> Optional[Dict[str, Any]]:
+        """Return the outline row for ``block_id`` (with position), or None."""
+        index = self._positions.get(block_id)
+        return self._item_at(index) if index is not None else None
+
+    def full_outline(self) -> List[Dict[str, Any]]:
+        """Return every outline row in document order."""
+        return [self._item_at(index) for index in range(len(self._blocks))]
+
+    def page(
+        self,
+        start: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+        *,
+        collapsed: Iterable[str] = (),
+    ) -> Dict[str, Any]:
+        """Return one window of the visible outline.
+
+        Args:
+            start: Offset into the visible rows (0-based).
+            limit: Maximum number of rows to return.
+            collapsed: Block IDs whose descendants are hidden.
+
+        Returns:
+            Dict with ``outline`` rows, ``start``, ``count``, ``total``
+            (visible rows), ``next_start`` (None on the last page),
+            ``hidden`` (rows hidden by collapsing) and ``version``.
+        """
+        hidden = self._descendants(collapsed)
+        if hidden:
+            visible = [index for index in range(len(self._blocks)) if self._blocks[index]['id'] not in hidden]
+        else:
+            visible = range(len(self._blocks))
+        return self._window(visible, start, limit, hidden=len(hidden))
+
+    def page_of(
+        self,
+        block_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        *,
+        collapsed: Iterable[str] = (),
+    ) -> Dict[str, Any]:
+        """Return the page (of size ``limit``) containing ``block_id``.
+
+        Raises:
+            KeyError: If the block is unknown or hidden by ``collapsed``.
+        """
+        collapsed = list(collapsed)
+        hidden = self._descendants(collapsed)
+        if block_id not in self._positions or block_id in hidden:
+            raise KeyError(block_id)
+        position = self._positions[block_id]
+        offset = position - sum(1 for bid in hidden if self._positions.get(bid, position) < position)
+        return self.page(offset - offset % limit, limit, collapsed=collapsed)
+
+    def children(
+        self,
+        block_id: str,
+        start: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        """Return the direct children of ``block_id`` in document order (paged).
+
+        Raises:
+            KeyError: If the block is unknown.
+        """
+        if block_id not in self._positions:
+            raise KeyError(block_id)
+        positions = sorted(
+            self._positions[child_id]
+            for child_id in self._child_ids(block_id)
+            if child_id in self._positions
+        )
+        page = self._window(positions, start, limit)
+        page['parent_id'] = block_id
+        return page
+
+    def delta(self, since_version: Optional[str]) -> Dict[str, Any]:
+        """Return the changes since ``since_version``.
+
+        Returns:
+            Dict with ``status`` (``"current"``, ``"delta"`` or ``"reload"``),
+            ``version`` and ``total``. A ``"delta"`` also carries ``added``
+            rows (each with ``index`` and ``after_id``, the preceding block or
+            None), ``modified`` rows and ``removed`` block IDs.
+        """
+        result: Dict[str, Any] = {'version': self.version, 'total': self.total}
+        if since_version is not None and since_version == self.version:
+            result.update(status='current', added=[], modified=[], removed=[])
+            return result
+
+        payload = self._load_delta()
+        if (
+            since_version is None
+            or payload is None
+            or payload.get('base_version') != since_version
+            or payload.get('version') != self.version
+        ):
+            result['status'] = 'reload'
+            return result
+
+        added = []
+        for block_id in payload.get('new_blocks', []):
+            item = self.item(block_id)
+            if item is not None:
+                index = item['index']
+                item['after_id'] = self._blocks[index - 1]['id'] if index > 0 else None
+                added.append(item)
+        modified = [item for item in map(self.item, payload.get('modified_blocks', [])) if item is not None]
+        result.update(
+            status='delta',
+            base_version=since_version,
+            added=sorted(added, key=lambda row: row['index']),
+            modified=modified,
+            removed=list(payload.get('deleted_blocks', [])),
+        )
+        return result
+
+    def _item_at(self, index: int) -> Dict[str, Any]:
+        block = self._blocks[index]
+        item = outline_item(block)
+        item['index'] = index
+        item['child_count'] = len(self._child_ids(block['id']))
+        return item
+
+    def _child_ids(self, block_id: str) -> List[str]:
+        relationship = self.loader.relationships_by_block_id.get(block_id) or {}
+        return relationship.get('child_block_ids') or []
+
+    def _descendants(self, roots: Iterable[str]) -> set[str]:
+        """Return every block below ``roots`` in the hierarchy (roots excluded)."""
+        hidden: set[str] = set()
+        stack = [child for root in roots for child in self._child_ids(root)]
+        while stack:
+            block_id = stack.pop()
+            if block_id in hidden:
+                continue
+            hidden.add(block_id)
+            stack.extend(self._child_ids(block_id))
+        return hidden
+
+    def _window(self, positions: Any, start: int, limit: int, *, hidden: int = 0) -> Dict[str, Any]:
+        start = max(start, 0)
+        limit = max(limit, 0)
+        rows = [self._item_at(index) for index in positions[start:start + limit]]
+        end = start + len(rows)
+        return {
+            'outline': rows,
+            'start': start,
+            'count': len(rows),
+            'total': len(positions),
+            'next_start': end if end < len(positions) else None,
+            'hidden': hidden,
+            'version': self.version,
+        }
+
+    def _load_delta(self) -> Optional[Dict[str, Any]]:
+        path = self.loader.analysis_dir / DELTA_FILENAME
+        if not path.exists():
+            return None
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            LOGGER.warning("Ignoring unreadable %s: %s", path, exc)
+            return None
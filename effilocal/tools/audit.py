@@ -5,8 +5,11 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
+
+from effilocal.util.io import append_jsonl
 
 AUDIT_FILE_ENV = "EFFILOCAL_TOOL_AUDIT_FILE"
 DEFAULT_AUDIT_FILE = Path("tool_audit.jsonl")
@@ -20,7 +23,7 @@ def log_tool_call(
     truncated: bool,
     duration_ms: float,
 ) -> None:
-    """Append a JSON line describing a tool call."""
+    """Queue a JSON line describing a tool call for the background writer."""
     entry = {
         "tool": tool,
         "doc_id": doc_id,
@@ -28,11 +31,51 @@ def log_tool_call(
         "duration_ms": round(duration_ms, 3),
         "truncated": bool(truncated),
     }
-    path = _audit_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(entry, ensure_ascii=False))
-        handle.write("\n")
+    append_jsonl(_audit_path(), entry)
+
+
+def summarize_audit(paths: Iterable[Path] | None = None) -> dict[str, dict[str, Any]]:
+    """Summarise audit files into per-tool call counts and latency percentiles.
+
+    Args:
+        paths: Audit JSONL files; defaults to the configured audit file.
+
+    Returns:
+        ``{tool: {calls, truncated, mean_ms, p50_ms, p90_ms, p95_ms, p99_ms,
+        max_ms}}`` sorted by tool name. Unreadable lines are skipped.
+    """
+    durations: dict[str, list[float]] = defaultdict(list)
+    truncated: dict[str, int] = defaultdict(int)
+    for path in paths or [_audit_path()]:
+        with Path(path).open("r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                    tool, duration = str(entry["tool"]), float(entry["duration_ms"])
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    continue
+                durations[tool].append(duration)
+                truncated[tool] += bool(entry.get("truncated"))
+
+    summary: dict[str, dict[str, Any]] = {}
+    for tool in sorted(durations):
+        values = sorted(durations[tool])
+        summary[tool] = {
+            "calls": len(values),
+            "truncated": truncated[tool],
+            "mean_ms": round(sum(values) / len(values), 3),
+            **{f"p{q}_ms": round(_percentile(values, q), 3) for q in (50, 90, 95, 99)},
+            "max_ms": values[-1],
+        }
+    return summary
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Linearly interpolated percentile of sorted ``values``."""
+    rank = (len(values) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
 
 
 def _audit_path() -> Path:
@@ -5,12 +5,16 @@ from __future__ import annotations
 import json
 import re
 import time
+from bisect import bisect_right
 from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
 from effilocal.flows.label_doc import build_outline
 from effilocal.tools import audit, limits
+from effilocal.util.tokens import estimate_tokens, token_prefix_sums
 
 FIXTURES_ROOT = Path(__file__).resolve().parents[2] / "tests" / "fixtures" / "data"
 DOC_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9-]{0,127}$")
@@ -58,35 +62,17 @@ def get_content_by_range(
         raise ValueError("Invalid block range")
 
     _, blocks_path = _resolve_artifact_paths(doc_id)
-    blocks = _load_blocks(blocks_path)
+    table = _load_block_table(blocks_path)
+    blocks = table.blocks
     if end_block >= len(blocks):
         raise ValueError("Invalid block range")
 
-    max_blocks = limits.MAX_BLOCKS
-    max_chars = limits.MAX_CHARS
-    if max_blocks <= 0 or max_chars <= 0:
-        raise ValueError("Invalid dispatcher caps configuration")
-
-    sliced = blocks[start_block : end_block + 1]
-    selected: list[dict[str, Any]] = []
-    char_total = 0
-    truncated = False
+    max_blocks, max_tokens = _page_caps()
+    page_end = _page_end(table.token_prefix, start_block, end_block + 1, max_blocks, max_tokens)
+    selected = blocks[start_block:page_end]
+    truncated = page_end <= end_block
     apply_redaction = bool(redact)
 
-    for block in sliced:
-        text = block.get("text", "") or ""
-        next_char_total = char_total + len(text)
-        if len(selected) >= max_blocks or next_char_total > max_chars:
-            truncated = True
-            break
-        selected.append(block)
-        char_total = next_char_total
-
-    if not selected and sliced:
-        # Always return at least one block to prevent infinite pagination loops.
-        selected.append(sliced[0])
-        truncated = True
-
     next_page: dict[str, Any] | None = None
     if truncated:
         next_start = start_block + len(selected)
@@ -144,12 +130,7 @@ def get_section(
             "next_page": None,
         }
 
-    blocks = _load_blocks(blocks_path)
-    blocks_by_id: dict[str, dict[str, Any]] = {
-        str(block.get("id")): block
-        for block in blocks
-        if isinstance(block.get("id"), str)
-    }
+    blocks_by_id = _load_block_table(blocks_path).blocks_by_id
     ordered_blocks: list[dict[str, Any]] = []
     for candidate in block_ids:
         if not isinstance(candidate, str):
@@ -158,29 +139,13 @@ def get_section(
         if block is not None:
             ordered_blocks.append(block)
 
-    max_blocks = limits.MAX_BLOCKS
-    max_chars = limits.MAX_CHARS
-    if max_blocks <= 0 or max_chars <= 0:
-        raise ValueError("Invalid dispatcher caps configuration")
-
-    selected: list[dict[str, Any]] = []
-    char_total = 0
-    truncated = False
+    max_blocks, max_tokens = _page_caps()
+    prefix = token_prefix_sums([_block_tokens(block) for block in ordered_blocks])
+    page_end = _page_end(prefix, 0, len(ordered_blocks), max_blocks, max_tokens)
+    selected = ordered_blocks[:page_end]
+    truncated = page_end < len(ordered_blocks)
     apply_redaction = bool(redact)
 
-    for block in ordered_blocks:
-        text = block.get("text", "") or ""
-        next_char_total = char_total + len(text)
-        if len(selected) >= max_blocks or next_char_total > max_chars:
-            truncated = True
-            break
-        selected.append(block)
-        char_total = next_char_total
-
-    if not selected and ordered_blocks:
-        selected.append(ordered_blocks[0])
-        truncated = True
-
     next_page: dict[str, Any] | None = None
     if truncated:
         next_start = len(selected)
@@ -611,15 +576,72 @@ def _resolve_artifact_paths(doc_id: str) -> tuple[Path, Path]:
     return sections_path, blocks_path
 
 
-def _load_blocks(path: Path) -> list[dict[str, Any]]:
+@dataclass(frozen=True)
+class _BlockTable:
+    """Blocks of one blocks.jsonl with lookups shared by every tool call.
+
+    Treat as read-only: the same instance serves all calls until the file
+    changes.
+    """
+
+    blocks: list[dict[str, Any]]
+    blocks_by_id: dict[str, dict[str, Any]]
+    # token_prefix[i] is the estimated token total of blocks[:i]
+    token_prefix: list[int]
+
+
+def _block_tokens(block: Mapping[str, Any]) -> int:
+    stored = block.get("token_count")
+    if isinstance(stored, int):
+        return stored
+    # Analyses predating stored counts
+    return estimate_tokens(block.get("text"))
+
+
+@lru_cache(maxsize=16)
+def _cached_block_table(path: str, mtime_ns: int, size: int) -> _BlockTable:
+    # Keyed on the file stat so a re-analysis is picked up
     data: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
+    with Path(path).open("r", encoding="utf-8") as handle:
         for line in handle:
             line = line.strip()
             if not line:
                 continue
             data.append(json.loads(line))
-    return data
+    return _BlockTable(
+        blocks=data,
+        blocks_by_id={block["id"]: block for block in data if isinstance(block.get("id"), str)},
+        token_prefix=token_prefix_sums([_block_tokens(block) for block in data]),
+    )
+
+
+def _load_block_table(path: Path) -> _BlockTable:
+    stat = path.stat()
+    return _cached_block_table(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def _load_blocks(path: Path) -> list[dict[str, Any]]:
+    return _load_block_table(path).blocks
+
+
+def _page_caps() -> tuple[int, int]:
+    max_blocks = limits.MAX_BLOCKS
+    max_tokens = limits.MAX_TOKENS
+    if max_blocks <= 0 or max_tokens <= 0:
+        raise ValueError("Invalid dispatcher caps configuration")
+    return max_blocks, max_tokens
+
+
+def _page_end(prefix: Sequence[int], start: int, stop: int, max_blocks: int, max_tokens: int) -> int:
+    """Return the end (exclusive) of the fullest page of blocks from ``start``.
+
+    ``prefix`` holds running token totals, so the page is found by bisection
+    rather than by summing block texts. A page always holds at least one
+    block, so pagination cannot stall on a block larger than the budget.
+    """
+    limit = min(stop, start + max_blocks)
+    end = bisect_right(prefix, prefix[start] + max_tokens, start, limit + 1) - 1
+    return max(end, min(start + 1, stop))
 
 
 def _load_relationships(path: Path) -> dict[str, Any]:
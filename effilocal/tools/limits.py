@@ -6,8 +6,9 @@ from typing import Iterable
 
 from effilocal.util.redact import RedactionRule, redact_text
 
-MAX_BLOCKS = 50
-MAX_CHARS = 8_000
+MAX_BLOCKS = 200
+# Page budget in estimated tokens (see effilocal.util.tokens)
+MAX_TOKENS = 6_000
 DEFAULT_REDACT = "auto"
 
 
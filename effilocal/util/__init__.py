@@ -1,3 +1,3 @@
 """Utility helpers for sprint 1 (placeholders)."""
 
-__all__ = ["io", "hash", "redact"]
+__all__ = ["io", "hash", "redact", "tokens"]
@@ -4,16 +4,21 @@ Provides functions for automated git commits when documents are saved,
 with meaningful commit messages and version history retrieval.
 
 Uses subprocess to call git directly (no gitpython dependency required).
+Repository-root discovery is cached per directory, and blob reads go through
+a long-lived ``git cat-file --batch`` process per repository (see
+:class:`GitBackend`) so that walking many versions of a document does not
+spawn a process per version.
 """
 
 from __future__ import annotations
 
-import json
+import atexit
 import subprocess
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING
 
 from effilocal.config.logging import get_logger
 
@@ -27,7 +32,13 @@ __all__ = [
     "restore_version",
     "is_git_repo",
     "get_repo_root",
+    "get_file_at_commit",
+    "get_file_versions",
+    "get_backend",
+    "close_backends",
     "CommitInfo",
+    "FileVersion",
+    "GitBackend",
 ]
 
 LOGGER = get_logger(__name__)
@@ -35,6 +46,17 @@ LOGGER = get_logger(__name__)
 # Commit message prefix for effi operations
 EFFI_COMMIT_PREFIX = "[effi]"
 
+# git log format: hash|short_hash|author|date|message
+_LOG_FORMAT = "%H|%h|%an|%aI|%s"
+_LOG_FIELD_COUNT = 5
+
+# Discovered repository roots keyed by the resolved directory that was queried.
+_REPO_ROOT_CACHE: dict[Path, Path] = {}
+_REPO_ROOT_LOCK = threading.Lock()
+
+# Seconds to wait for a cat-file process to exit after its stdin is closed.
+_BATCH_SHUTDOWN_TIMEOUT_S = 5
+
 
 @dataclass(frozen=True, slots=True)
 class CommitInfo:
@@ -57,6 +79,206 @@ class CommitInfo:
         }
 
 
+@dataclass(frozen=True, slots=True)
+class FileVersion:
+    """A commit touching a file, together with the file's content at that commit."""
+
+    commit: CommitInfo
+    content: bytes | None
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization (content size only)."""
+        data = self.commit.to_dict()
+        data["size"] = None if self.content is None else len(self.content)
+        return data
+
+
+class GitBackend:
+    """Long-lived ``git cat-file --batch`` reader bound to one repository.
+
+    The batch process is started lazily on the first blob read and kept open
+    until :meth:`close` is called (backends handed out by :func:`get_backend`
+    are closed at interpreter exit). Reads are serialised with a lock so a
+    backend can be shared between threads.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = Path(repo_root)
+        self._process: subprocess.Popen[bytes] | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> GitBackend:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Terminate the batch process if it is running."""
+        with self._lock:
+            process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            if process.stdin:
+                process.stdin.close()
+            process.wait(timeout=_BATCH_SHUTDOWN_TIMEOUT_S)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+        finally:
+            if process.stdout:
+                process.stdout.close()
+
+    def read_object(self, spec: str) -> bytes | None:
+        """Return the raw content of ``spec`` (e.g. ``"<commit>:<path>"``).
+
+        Args:
+            spec: Any object name accepted by ``git cat-file``
+
+        Returns:
+            Object content, or None if the object does not exist
+        """
+        if "\n" in spec:
+            raise ValueError("Object names passed to cat-file must not contain newlines")
+        with self._lock:
+            process = self._ensure_process()
+            assert process.stdin is not None and process.stdout is not None
+            try:
+                process.stdin.write(spec.encode("utf-8") + b"\n")
+                process.stdin.flush()
+                return self._read_response(process.stdout)
+            except (OSError, ValueError):
+                # A dead process is restarted on the next read.
+                self._process = None
+                process.kill()
+                raise
+
+    def read_blob(self, commit_hash: str, rel_path: Path | str) -> bytes | None:
+        """Return the content of ``rel_path`` at ``commit_hash``, or None if absent."""
+        return self.read_object(f"{commit_hash}:{Path(rel_path).as_posix()}")
+
+    def log(
+        self,
+        *paths: Path | str,
+        max_commits: int,
+        grep: str | None = None,
+    ) -> list[CommitInfo]:
+        """Return commits (newest first), optionally limited to ``paths``."""
+        args = ["log", f"--max-count={max_commits}", f"--format={_LOG_FORMAT}"]
+        if grep:
+            args.append(f"--grep={grep}")
+        if paths:
+            args.extend(["--", *(Path(p).as_posix() for p in paths)])
+        result = _run_git(*args, cwd=self.repo_root, check=False)
+        if result.returncode != 0:
+            return []
+        return _parse_log_output(result.stdout)
+
+    def file_versions(
+        self,
+        rel_path: Path | str,
+        *,
+        max_commits: int = 50,
+    ) -> list[FileVersion]:
+        """Return the history of ``rel_path`` with the blob content at each commit.
+
+        Uses one ``git log`` invocation plus the shared batch process, so the
+        number of spawned processes does not grow with ``max_commits``.
+        """
+        commits = self.log(rel_path, max_commits=max_commits)
+        return [FileVersion(commit, self.read_blob(commit.hash, rel_path)) for commit in commits]
+
+    def _ensure_process(self) -> subprocess.Popen[bytes]:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.repo_root,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._process
+
+    @staticmethod
+    def _read_response(stdout: IO[bytes]) -> bytes | None:
+        header = stdout.readline()
+        if not header:
+            raise OSError("git cat-file --batch exited unexpectedly")
+        fields = header.rstrip(b"\n").split(b" ")
+        # "<spec> missing" / "<spec> ambiguous" responses carry no payload.
+        if len(fields) != 3 or not fields[2].isdigit():
+            return None
+        size = int(fields[2])
+        content = stdout.read(size)
+        stdout.read(1)  # trailing newline
+        if len(content) != size:
+            raise OSError("Truncated response from git cat-file --batch")
+        return content
+
+
+_BACKENDS: dict[Path, GitBackend] = {}
+_BACKENDS_LOCK = threading.Lock()
+
+
+def get_backend(repo_root: Path) -> GitBackend:
+    """Return the shared :class:`GitBackend` for ``repo_root``.
+
+    Args:
+        repo_root: Repository root directory
+
+    Returns:
+        A backend reused across calls for the same root
+    """
+    key = Path(repo_root).resolve()
+    with _BACKENDS_LOCK:
+        backend = _BACKENDS.get(key)
+        if backend is None:
+            backend = GitBackend(key)
+            _BACKENDS[key] = backend
+        return backend
+
+
+@atexit.register
+def close_backends() -> None:
+    """Close every shared backend (registered to run at interpreter exit)."""
+    with _BACKENDS_LOCK:
+        backends = list(_BACKENDS.values())
+        _BACKENDS.clear()
+    for backend in backends:
+        backend.close()
+
+
+def _parse_log_output(stdout: str) -> list[CommitInfo]:
+    """Parse ``git log`` output produced with ``_LOG_FORMAT``."""
+    commits = []
+    for line in stdout.strip().split("\n"):
+        if not line:
+            continue
+        parts = line.split("|", _LOG_FIELD_COUNT - 1)
+        if len(parts) != _LOG_FIELD_COUNT:
+            continue
+
+        try:
+            commit_date = datetime.fromisoformat(parts[3])
+        except ValueError:
+            commit_date = datetime.now()
+
+        commits.append(
+            CommitInfo(
+                hash=parts[0],
+                short_hash=parts[1],
+                author=parts[2],
+                date=commit_date,
+                message=parts[4],
+            )
+        )
+    return commits
+
+
+def _relative_to_repo(repo_path: Path, file_path: Path) -> Path:
+    return file_path.relative_to(repo_path) if file_path.is_absolute() else file_path
+
+
 def _run_git(
     *args: str,
     cwd: Path | None = None,
@@ -85,6 +307,17 @@ def _run_git(
     )
 
 
+def _cached_repo_root(path: Path) -> Path | None:
+    """Return a previously discovered root for ``path`` if it is still a repo."""
+    with _REPO_ROOT_LOCK:
+        root = _REPO_ROOT_CACHE.get(path)
+    if root is not None and not (root / ".git").exists():
+        with _REPO_ROOT_LOCK:
+            _REPO_ROOT_CACHE.pop(path, None)
+        return None
+    return root
+
+
 def is_git_repo(path: Path) -> bool:
     """Check if the given path is inside a git repository.
 
@@ -94,6 +327,8 @@ def is_git_repo(path: Path) -> bool:
     Returns:
         True if inside a git repository
     """
+    if _cached_repo_root(Path(path).resolve()) is not None:
+        return True
     try:
         result = _run_git("rev-parse", "--git-dir", cwd=path, check=False)
         return result.returncode == 0
@@ -104,16 +339,27 @@ def is_git_repo(path: Path) -> bool:
 def get_repo_root(path: Path) -> Path | None:
     """Get the root directory of the git repository.
 
+    Successful lookups are cached per directory; only negative lookups and
+    cache entries whose ``.git`` has disappeared fall through to git.
+
     Args:
         path: Path inside the repository
 
     Returns:
         Repository root path, or None if not in a repo
     """
+    key = Path(path).resolve()
+    cached = _cached_repo_root(key)
+    if cached is not None:
+        return cached
     try:
         result = _run_git("rev-parse", "--show-toplevel", cwd=path, check=False)
         if result.returncode == 0:
-            return Path(result.stdout.strip())
+            root = Path(result.stdout.strip())
+            with _REPO_ROOT_LOCK:
+                _REPO_ROOT_CACHE[key] = root
+                _REPO_ROOT_CACHE[root.resolve()] = root
+            return root
     except Exception:
         pass
     return None
@@ -133,18 +379,12 @@ def has_changes(
         True if there are changes to commit
     """
     try:
+        args = ["status", "--porcelain"]
         if files:
-            # Check specific files
-            for file_path in files:
-                rel_path = file_path.relative_to(repo_path) if file_path.is_absolute() else file_path
-                result = _run_git("status", "--porcelain", str(rel_path), cwd=repo_path, check=False)
-                if result.stdout.strip():
-                    return True
-            return False
-        else:
-            # Check all files
-            result = _run_git("status", "--porcelain", cwd=repo_path, check=False)
-            return bool(result.stdout.strip())
+            # One status call for all requested paths
+            args.extend(["--", *(str(_relative_to_repo(repo_path, f)) for f in files)])
+        result = _run_git(*args, cwd=repo_path, check=False)
+        return bool(result.stdout.strip())
     except Exception:
         return False
 
@@ -178,13 +418,13 @@ def auto_commit(
 
     # Stage files
     if files:
-        for file_path in files:
-            rel_path = file_path.relative_to(repo_path) if file_path.is_absolute() else file_path
-            if file_path.exists():
-                _run_git("add", str(rel_path), cwd=repo_path)
-            else:
-                # File might be deleted
-                _run_git("add", "-u", str(rel_path), cwd=repo_path, check=False)
+        existing = [str(_relative_to_repo(repo_path, f)) for f in files if f.exists()]
+        # Files that no longer exist might have been deleted
+        removed = [str(_relative_to_repo(repo_path, f)) for f in files if not f.exists()]
+        if existing:
+            _run_git("add", "--", *existing, cwd=repo_path)
+        if removed:
+            _run_git("add", "-u", "--", *removed, cwd=repo_path, check=False)
     else:
         if add_untracked:
             _run_git("add", "-A", cwd=repo_path)
@@ -274,47 +514,38 @@ def get_file_history(
     if not is_git_repo(repo_path):
         return []
 
-    rel_path = file_path.relative_to(repo_path) if file_path.is_absolute() else file_path
-
-    # Get log with format: hash|short_hash|author|date|message
-    format_str = "%H|%h|%an|%aI|%s"
-    result = _run_git(
-        "log",
-        f"--max-count={max_commits}",
-        f"--format={format_str}",
-        "--",
-        str(rel_path),
-        cwd=repo_path,
-        check=False,
-    )
+    rel_path = _relative_to_repo(repo_path, file_path)
+    return get_backend(repo_path).log(rel_path, max_commits=max_commits)
 
-    if result.returncode != 0:
-        return []
 
-    commits = []
-    for line in result.stdout.strip().split("\n"):
-        if not line:
-            continue
-        parts = line.split("|", 4)
-        if len(parts) != 5:
-            continue
+def get_file_versions(
+    repo_path: Path,
+    file_path: Path,
+    *,
+    max_commits: int = 50,
+) -> list[FileVersion]:
+    """Get commit history for a file together with its content at each commit.
 
-        try:
-            commit_date = datetime.fromisoformat(parts[3])
-        except ValueError:
-            commit_date = datetime.now()
+    This is the batched form of calling :func:`get_file_history` followed by
+    :func:`get_file_at_commit` for every commit: it runs one ``git log`` and
+    streams all blobs through the repository's shared ``cat-file`` process.
 
-        commits.append(
-            CommitInfo(
-                hash=parts[0],
-                short_hash=parts[1],
-                author=parts[2],
-                date=commit_date,
-                message=parts[4],
-            )
-        )
+    Args:
+        repo_path: Path to repository root
+        file_path: Path to the file
+        max_commits: Maximum number of commits to return
 
-    return commits
+    Returns:
+        List of FileVersion objects, newest first
+    """
+    repo_path = Path(repo_path)
+    file_path = Path(file_path)
+
+    if not is_git_repo(repo_path):
+        return []
+
+    rel_path = _relative_to_repo(repo_path, file_path)
+    return get_backend(repo_path).file_versions(rel_path, max_commits=max_commits)
 
 
 def get_file_at_commit(
@@ -335,17 +566,12 @@ def get_file_at_commit(
     repo_path = Path(repo_path)
     file_path = Path(file_path)
 
-    rel_path = file_path.relative_to(repo_path) if file_path.is_absolute() else file_path
+    rel_path = _relative_to_repo(repo_path, file_path)
 
     try:
-        result = subprocess.run(
-            ["git", "show", f"{commit_hash}:{rel_path}"],
-            cwd=repo_path,
-            capture_output=True,
-            check=True,
-        )
-        return result.stdout
-    except subprocess.CalledProcessError:
+        return get_backend(repo_path).read_blob(commit_hash, rel_path)
+    except (OSError, ValueError) as exc:
+        LOGGER.warning("Could not read %s at %s: %s", rel_path, commit_hash, exc)
         return None
 
 
@@ -408,40 +634,4 @@ def get_effi_commits(
     if not is_git_repo(repo_path):
         return []
 
-    format_str = "%H|%h|%an|%aI|%s"
-    result = _run_git(
-        "log",
-        f"--max-count={max_commits}",
-        f"--format={format_str}",
-        f"--grep={EFFI_COMMIT_PREFIX}",
-        cwd=repo_path,
-        check=False,
-    )
-
-    if result.returncode != 0:
-        return []
-
-    commits = []
-    for line in result.stdout.strip().split("\n"):
-        if not line:
-            continue
-        parts = line.split("|", 4)
-        if len(parts) != 5:
-            continue
-
-        try:
-            commit_date = datetime.fromisoformat(parts[3])
-        except ValueError:
-            commit_date = datetime.now()
-
-        commits.append(
-            CommitInfo(
-                hash=parts[0],
-                short_hash=parts[1],
-                author=parts[2],
-                date=commit_date,
-                message=parts[4],
-            )
-        )
-
-    return commits
+    return get_backend(repo_path).log(max_commits=max_commits, grep=EFFI_COMMIT_PREFIX)
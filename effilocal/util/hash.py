@@ -18,6 +18,12 @@ def sha256_file(path: Path) -> str:
     return f"sha256:{digest.hexdigest()}"
 
 
+def sha256_bytes(data: bytes) -> str:
+    """Return the sha256 digest of ``data`` as `sha256:<hex>`."""
+
+    return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+
 def norm_text_hash(text: str) -> str:
     """
     Normalize whitespace in ``text`` and return its sha256 digest.
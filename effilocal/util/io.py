@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
+import atexit
 import json
-from collections.abc import Iterable, Iterator
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+from effilocal.config.logging import get_logger
+
+LOGGER = get_logger(__name__)
 
 _LINE_ENDING = "\n"
 
+# Background appender defaults: queued lines before writers block, seconds
+# between fsyncs, and append handles kept open at once.
+APPEND_QUEUE_SIZE = 10_000
+APPEND_FSYNC_INTERVAL = 1.0
+APPEND_MAX_OPEN_FILES = 32
+
 
 def write_jsonl(path: Path, iterable_objs: Iterable[dict[str, Any]]) -> None:
     """
@@ -47,3 +63,193 @@ def iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
                     f"Line {line_number} in {path} did not deserialize to an object"
                 )
             yield loaded
+
+
+class JsonlAppender:
+    """Append JSON lines to files from a single background thread.
+
+    ``append`` serialises and encodes the entry in the caller's thread (so
+    bad entries raise there) and queues the bytes; one writer thread drains
+    the queue in order, so lines reach each file in the order ``append`` was
+    called. Paths are normalised (absolute, case-folded where the platform
+    is case-insensitive), so different spellings of one file share a
+    handle. Append handles stay open (up to ``max_open_files``, least
+    recently used closed first), each drained batch is flushed to the OS so
+    other readers see it promptly, and files are fsynced every
+    ``fsync_interval`` seconds. The queue is bounded: when it is full
+    ``append`` blocks rather than dropping lines. A failure writing one
+    entry is logged and skipped, and a writer thread that died is restarted
+    on the next ``append`` or ``flush``.
+
+    A file deleted or rotated while its handle is open is reopened at the
+    next sync; lines written to the old handle in the meantime go to the
+    unlinked file and are lost.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue: int = APPEND_QUEUE_SIZE,
+        fsync_interval: float = APPEND_FSYNC_INTERVAL,
+        max_open_files: int = APPEND_MAX_OPEN_FILES,
+    ) -> None:
+        self.fsync_interval = fsync_interval
+        self.max_open_files = max(1, max_open_files)
+        self._queue: queue.Queue[tuple[Path, bytes] | threading.Event | None] = queue.Queue(max_queue)
+        self._handles: OrderedDict[Path, IO[bytes]] = OrderedDict()
+        self._unsynced: set[Path] = set()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def append(self, path: Path | str, entry: Mapping[str, Any], *, ensure_ascii: bool = False) -> None:
+        """Queue ``entry`` as one JSON line for ``path``.
+
+        Raises:
+            TypeError, ValueError: If ``entry`` cannot be serialised or
+                encoded as UTF-8 (for example, a lone surrogate).
+        """
+
+        line = (json.dumps(entry, ensure_ascii=ensure_ascii) + _LINE_ENDING).encode("utf-8")
+        self._ensure_thread()
+        self._queue.put((Path(os.path.normcase(os.path.abspath(path))), line))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every line queued so far is written and fsynced.
+
+        Returns ``False`` if ``timeout`` expired first.
+        """
+
+        if self._thread is None:
+            return True
+        self._ensure_thread()
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = 10.0) -> None:
+        """Flush, stop the writer thread and close every handle."""
+
+        with self._start_lock:  # an append racing close waits for a fresh thread
+            if self._thread is None:
+                return
+            if self._thread.is_alive():
+                self._queue.put(None)
+                self._thread.join(timeout)
+            else:
+                self._close_handles()
+            self._thread = None
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="jsonl-appender", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        next_sync = time.monotonic() + self.fsync_interval
+        while True:
+            try:
+                batch = [self._queue.get(timeout=max(next_sync - time.monotonic(), 0.0))]
+            except queue.Empty:
+                batch = []
+            while True:  # drain what is already queued before flushing
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            waiters: list[threading.Event] = []
+            for entry in batch:
+                if entry is None:
+                    stop = True
+                elif isinstance(entry, threading.Event):
+                    waiters.append(entry)
+                else:
+                    try:
+                        self._write(*entry)
+                    except Exception:  # one bad entry must not stop the writer
+                        LOGGER.exception("Failed to append to %s", entry[0])
+            self._flush_handles()
+            if waiters or stop or time.monotonic() >= next_sync:
+                self._sync_handles()
+                next_sync = time.monotonic() + self.fsync_interval
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                self._close_handles()
+                return
+
+    def _write(self, path: Path, line: bytes) -> None:
+        try:
+            handle = self._handles.get(path)
+            if handle is None:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                handle = self._handles[path] = path.open("ab")
+                while len(self._handles) > self.max_open_files:
+                    stale_path, stale = self._handles.popitem(last=False)
+                    self._close(stale_path, stale)
+            else:
+                self._handles.move_to_end(path)
+            handle.write(line)
+            self._unsynced.add(path)
+        except OSError as exc:
+            LOGGER.warning("Failed to append to %s: %s", path, exc)
+
+    def _flush_handles(self) -> None:
+        for path in list(self._unsynced):
+            handle = self._handles.get(path)
+            try:
+                if handle is not None:
+                    handle.flush()
+            except OSError as exc:
+                LOGGER.warning("Failed to flush %s: %s", path, exc)
+
+    def _sync_handles(self) -> None:
+        for path in list(self._unsynced):
+            handle = self._handles.get(path)
+            try:
+                if handle is not None:
+                    os.fsync(handle.fileno())
+            except OSError as exc:
+                LOGGER.warning("Failed to fsync %s: %s", path, exc)
+        self._unsynced.clear()
+        # Reopen files removed or rotated while their handle was open.
+        for path in [path for path in self._handles if not path.exists()]:
+            self._close(path, self._handles.pop(path))
+
+    def _close(self, path: Path, handle: IO[bytes]) -> None:
+        try:
+            handle.flush()
+            os.fsync(handle.fileno())
+            handle.close()
+        except OSError as exc:
+            LOGGER.warning("Failed to close %s: %s", path, exc)
+        self._unsynced.discard(path)
+
+    def _close_handles(self) -> None:
+        while self._handles:
+            self._close(*self._handles.popitem(last=False))
+
+
+_APPENDER = JsonlAppender()
+
+
+def append_jsonl(path: Path | str, entry: Mapping[str, Any], *, ensure_ascii: bool = False) -> None:
+    """Append ``entry`` to ``path`` through the shared background appender."""
+
+    _APPENDER.append(path, entry, ensure_ascii=ensure_ascii)
+
+
+def flush_appends(timeout: float | None = None) -> bool:
+    """Wait for the shared appender to write and fsync queued lines."""
+
+    return _APPENDER.flush(timeout)
+
+
+@atexit.register
+def close_appends() -> None:
+    """Flush and close the shared appender (also run at interpreter exit)."""
+
+    _APPENDER.close()
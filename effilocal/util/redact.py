@@ -1,10 +1,39 @@
-"""Redaction utilities for masking sensitive content in snippets."""
+"""Redaction utilities for masking sensitive content in snippets.
+
+A :class:`Redactor` compiles every rule into a single alternation, so a text
+is redacted in one regex scan however many rules there are. Build one per
+run (or use :func:`redact_text`, which caches compiled redactors) and reuse
+it for every block and snippet.
+
+At each position the leftmost match wins; when several rules match at the
+same position the earliest rule wins. Rules therefore never see each other's
+replacement text, unlike applying one ``re.sub`` per rule in sequence.
+
+Combining rules shifts group numbers, so numeric backreferences (``\1``)
+are rejected; named groups are renamed per rule, so ``(?P<w>...)`` and
+``(?P=w)`` work and names may repeat across rules.
+"""
 
 from __future__ import annotations
 
+import json
 import re
 from dataclasses import dataclass
-from typing import Iterable, List, Mapping, Pattern
+from functools import lru_cache
+from pathlib import Path
+from re import _parser as _sre_parser
+from typing import Any, Iterable, List, Mapping, Pattern
+
+__all__ = [
+    "DEFAULT_RULES",
+    "RedactionResult",
+    "RedactionRule",
+    "RedactionSpan",
+    "Redactor",
+    "load_redactor",
+    "redact_snippets",
+    "redact_text",
+]
 
 
 @dataclass(frozen=True)
@@ -13,29 +42,340 @@ class RedactionRule:
 
     pattern: Pattern[str]
     replacement: str
+    name: str = ""
+
+    @property
+    def label(self) -> str:
+        return self.name or self.replacement.strip("*") or self.pattern.pattern
+
+
+@dataclass(frozen=True, slots=True)
+class RedactionSpan:
+    """One redacted range, in both the original and the redacted text."""
+
+    start: int
+    end: int
+    redacted_start: int
+    redacted_end: int
+    rule: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "start": self.start,
+            "end": self.end,
+            "redacted_start": self.redacted_start,
+            "redacted_end": self.redacted_end,
+            "rule": self.rule,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class RedactionResult:
+    """Redacted text plus where each replacement was made."""
+
+    text: str
+    spans: tuple[RedactionSpan, ...]
 
 
 DEFAULT_RULES: List[RedactionRule] = [
     # Mask email addresses (simple heuristic, avoiding most punctuation pitfalls).
+    # Parts are bounded by the RFC 5321 lengths so a long run of address-like
+    # characters without an "@" costs linear, not quadratic, time.
     RedactionRule(
-        pattern=re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"),
+        pattern=re.compile(r"\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Za-z]{2,63}\b"),
         replacement="***EMAIL***",
+        name="email",
     ),
     # Mask phone numbers with optional spaces, hyphens, or parentheses.
     RedactionRule(
         pattern=re.compile(r"\+?\d[\d\s().-]{6,}\d"),
         replacement="***PHONE***",
+        name="phone",
     ),
 ]
 
+# Flags that can be scoped to one alternative with (?flags:...)
+_SCOPED_FLAGS = (
+    (re.ASCII, "a"), (re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"),
+)
+# Inline global flags; only legal at the start and already in ``pattern.flags``
+_LEADING_FLAGS_RE = re.compile(r"(?:\(\?[aiLmsux]+\))+")
+_GROUP_NAME_RE = re.compile(r"\(\?P<(\w+)>|\(\?P=(\w+)\)|\(\?\((\w+)\)")
+_UNBOUNDED_REPEATS = (_sre_parser.MAX_REPEAT, _sre_parser.MIN_REPEAT)
+
+
+def _subpatterns(op: Any, value: Any) -> Iterable[Any]:
+    """Sub-pattern lists nested in one parsed regex item."""
+    if op in _UNBOUNDED_REPEATS or op is _sre_parser.POSSESSIVE_REPEAT:
+        return (value[2],)
+    if op in (_sre_parser.SUBPATTERN, _sre_parser.ASSERT, _sre_parser.ASSERT_NOT):
+        return (value[-1],)
+    if op is _sre_parser.ATOMIC_GROUP:
+        return (value,)
+    if op is _sre_parser.BRANCH:
+        return value[1]
+    if op is _sre_parser.GROUPREF_EXISTS:
+        return tuple(item for item in value[1:] if item is not None)
+    return ()
+
+
+def _is_unbounded(op: Any, value: Any) -> bool:
+    return op in _UNBOUNDED_REPEATS and value[1] == _sre_parser.MAXREPEAT
+
+
+def _has_unbounded_repeat(items: Any) -> bool:
+    return any(
+        _is_unbounded(op, value) or any(_has_unbounded_repeat(sub) for sub in _subpatterns(op, value))
+        for op, value in items
+    )
+
+
+def _check_backtracking(pattern: Pattern[str]) -> None:
+    """Reject nested unbounded repeats such as ``(a+)+``.
+
+    They backtrack exponentially on near-misses. Possessive repeats and
+    atomic groups never give back what they matched and are allowed.
+    """
+
+    def walk(items: Any) -> None:
+        for op, value in items:
+            if _is_unbounded(op, value) and _has_unbounded_repeat(value[2]):
+                raise ValueError(
+                    f"Redaction pattern {pattern.pattern!r} nests unbounded repeats; "
+                    "use a possessive quantifier or an atomic group"
+                )
+            if op is _sre_parser.POSSESSIVE_REPEAT or op is _sre_parser.ATOMIC_GROUP:
+                continue
+            for sub in _subpatterns(op, value):
+                walk(sub)
+
+    walk(_sre_parser.parse(pattern.pattern, pattern.flags))
+
+
+def _term_pattern(term: str) -> str:
+    """Literal term with word boundaries on its word-character ends."""
+    escaped = re.escape(term)
+    prefix = r"\b" if re.match(r"\w", term[0]) else ""
+    suffix = r"\b" if re.match(r"\w", term[-1]) else ""
+    return f"{prefix}{escaped}{suffix}"
+
+
+def _combinable_source(rule: RedactionRule, position: int) -> str:
+    """Return ``rule``'s pattern rewritten to sit inside the combined alternation.
+
+    Leading inline flags are dropped (``_scoped`` re-applies them from
+    ``pattern.flags``) and group names get a per-rule prefix.
 
-def redact_text(text: str, rules: Iterable[RedactionRule] | None = None) -> str:
+    Raises:
+        ValueError: If the pattern uses a numeric backreference.
+    """
+    source = rule.pattern.pattern
+    leading = _LEADING_FLAGS_RE.match(source)
+    index = leading.end() if leading else 0
+    pieces: list[str] = []
+    in_class = False
+    while index < len(source):
+        char = source[index]
+        if char == "\\":
+            digits = source[index + 1:index + 4]
+            octal = len(digits) == 3 and all(digit in "01234567" for digit in digits)
+            if not in_class and digits[:1] in tuple("123456789") and not octal:
+                raise ValueError(
+                    f"Redaction rule {rule.label!r} uses the numeric backreference \\{digits[0]}; "
+                    "use a named group (?P<name>...) and (?P=name) instead"
+                )
+            pieces.append(source[index:index + 2])
+            index += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # "]" straight after "[" or "[^" is a literal member
+            end = index + 1 + (source[index + 1:index + 2] == "^")
+            if source[end:end + 1] == "]":
+                pieces.append(source[index:end + 1])
+                index = end + 1
+                continue
+        elif char == "(":
+            named = _GROUP_NAME_RE.match(source, index)
+            if named:
+                name = next(group for group in named.groups() if group)
+                if name.isdigit():
+                    raise ValueError(
+                        f"Redaction rule {rule.label!r} uses the numeric group condition (?({name}); "
+                        "use a named group instead"
+                    )
+                pieces.append(named.group(0).replace(name, f"r{position}_{name}", 1))
+                index = named.end()
+                continue
+        pieces.append(char)
+        index += 1
+    return "".join(pieces)
+
+
+def _scoped(pattern: Pattern[str], source: str) -> str:
+    flags = "".join(letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag)
+    if not flags:
+        return source
+    # A trailing verbose-mode comment would swallow the closing parenthesis
+    return f"(?{flags}:{source}\n)" if pattern.flags & re.VERBOSE else f"(?{flags}:{source})"
+
+
+class Redactor:
+    """Precompiled redaction engine.
+
+    Args:
+        rules: Regex rules, in priority order; defaults to ``DEFAULT_RULES``.
+        terms: Literal terms to mask, as placeholder -> terms (e.g.
+            ``{"PARTY": ["Acme Ltd", "Acme"], "ACCOUNT": ["12345678"]}``).
+            Terms are matched case-sensitively on word boundaries, longest
+            first, and replaced with ``***PLACEHOLDER***``. They take
+            priority over ``rules``.
+
+    Raises:
+        ValueError: If a rule pattern nests unbounded repeats or uses a
+            numeric backreference.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[RedactionRule] | None = None,
+        terms: Mapping[str, Iterable[str]] | None = None,
+    ) -> None:
+        # Python's alternation is ordered: list longer terms first so
+        # "Acme Ltd" wins over "Acme" at the same position
+        named_terms = sorted(
+            ((term, placeholder) for placeholder, values in (terms or {}).items() for term in values if term),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        term_rules = [
+            RedactionRule(
+                pattern=re.compile(_term_pattern(term)),
+                replacement=f"***{placeholder}***",
+                name=placeholder.lower(),
+            )
+            for term, placeholder in named_terms
+        ]
+
+        pattern_rules = list(DEFAULT_RULES if rules is None else rules)
+        for rule in pattern_rules:
+            _check_backtracking(rule.pattern)
+
+        self.rules: tuple[RedactionRule, ...] = (*term_rules, *pattern_rules)
+        self._pattern: Pattern[str] | None = None
+        if self.rules:
+            self._pattern = re.compile("|".join(
+                f"(?P<r{position}>{_scoped(rule.pattern, _combinable_source(rule, position))})"
+                for position, rule in enumerate(self.rules)
+            ))
+        # Replacements with group references are expanded against the rule's own match
+        self._templated = tuple("\\" in rule.replacement for rule in self.rules)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "Redactor":
+        """Load a rule set from JSON.
+
+        The file holds ``{"terms": {placeholder: [term, ...]}, "patterns":
+        [{"pattern": ..., "replacement": ..., "name": ..., "ignore_case": ...}],
+        "include_defaults": true}``; every key is optional.
+
+        Raises:
+            ValueError: If a pattern does not compile or cannot be combined
+                with the other rules; the message names the file and rule.
+        """
+        with Path(path).open("r", encoding="utf-8") as handle:
+            config = json.load(handle)
+        rules = list(DEFAULT_RULES) if config.get("include_defaults", True) else []
+        for entry in config.get("patterns", []):
+            flags = re.IGNORECASE if entry.get("ignore_case") else 0
+            try:
+                pattern = re.compile(entry["pattern"], flags)
+            except re.error as exc:
+                raise ValueError(f"{path}: invalid redaction pattern {entry['pattern']!r}: {exc}") from exc
+            rules.append(RedactionRule(
+                pattern=pattern,
+                replacement=entry.get("replacement", "***REDACTED***"),
+                name=entry.get("name", ""),
+            ))
+        try:
+            return cls(rules, config.get("terms"))
+        except (ValueError, re.error) as exc:
+            raise ValueError(f"{path}: {exc}") from exc
+
+    def __bool__(self) -> bool:
+        return self._pattern is not None
+
+    def _replacement(self, match: re.Match[str]) -> tuple[int, str]:
+        position = int(match.lastgroup[1:])
+        rule = self.rules[position]
+        if not self._templated[position]:
+            return position, rule.replacement
+        # Re-running the rule from the same start reproduces the same match
+        own = rule.pattern.match(match.string, match.start())
+        return position, own.expand(rule.replacement) if own else rule.replacement
+
+    def redact(self, text: str) -> str:
+        """Return ``text`` with every rule match replaced."""
+        if not text or self._pattern is None:
+            return text
+        return self._pattern.sub(lambda match: self._replacement(match)[1], text)
+
+    __call__ = redact
+
+    def redact_with_spans(self, text: str) -> RedactionResult:
+        """Redact ``text`` and report the span of every replacement."""
+        if not text or self._pattern is None:
+            return RedactionResult(text, ())
+        pieces: list[str] = []
+        spans: list[RedactionSpan] = []
+        cursor = 0
+        length = 0
+        for match in self._pattern.finditer(text):
+            position, replacement = self._replacement(match)
+            pieces.append(text[cursor:match.start()])
+            length += match.start() - cursor
+            pieces.append(replacement)
+            spans.append(RedactionSpan(
+                match.start(), match.end(), length, length + len(replacement), self.rules[position].label,
+            ))
+            length += len(replacement)
+            cursor = match.end()
+        if not spans:
+            return RedactionResult(text, ())
+        pieces.append(text[cursor:])
+        return RedactionResult("".join(pieces), tuple(spans))
+
+    def redact_many(self, texts: Iterable[str]) -> list[str]:
+        """Redact a sequence of texts (e.g. every block of a document)."""
+        return [self.redact(text) for text in texts]
+
+
+@lru_cache(maxsize=32)
+def _cached_redactor(rules: tuple[RedactionRule, ...] | None) -> Redactor:
+    return Redactor(rules)
+
+
+def _resolve(rules: Iterable[RedactionRule] | Redactor | None) -> Redactor:
+    if isinstance(rules, Redactor):
+        return rules
+    return _cached_redactor(None if rules is None else tuple(rules))
+
+
+def load_redactor(path: str | Path | None = None) -> Redactor:
+    """Return the redactor for a JSON rule file, or the default one."""
+    return Redactor.from_file(path) if path else _cached_redactor(None)
+
+
+def redact_text(text: str, rules: Iterable[RedactionRule] | Redactor | None = None) -> str:
     """Redact sensitive information from the provided text.
 
     Args:
         text: Input string to redact.
-        rules: Optional iterable of `RedactionRule` instances to apply. Defaults
-            to the module-level `DEFAULT_RULES`.
+        rules: Optional iterable of `RedactionRule` instances, or a compiled
+            `Redactor`, to apply. Defaults to the module-level `DEFAULT_RULES`.
+            Compiled redactors are cached per rule set.
 
     Returns:
         The redacted string.
@@ -43,15 +383,14 @@ def redact_text(text: str, rules: Iterable[RedactionRule] | None = None) -> str:
 
     if not text:
         return text
-
-    active_rules = list(DEFAULT_RULES if rules is None else rules)
-    redacted = text
-    for rule in active_rules:
-        redacted = rule.pattern.sub(rule.replacement, redacted)
-    return redacted
+    return _resolve(rules).redact(text)
 
 
-def redact_snippets(snippets: Mapping[str, str], rules: Iterable[RedactionRule] | None = None) -> dict[str, str]:
+def redact_snippets(
+    snippets: Mapping[str, str],
+    rules: Iterable[RedactionRule] | Redactor | None = None,
+) -> dict[str, str]:
     """Return a copy of snippets with redaction applied to each value."""
 
-    return {section_id: redact_text(content, rules) for section_id, content in snippets.items()}
+    redactor = _resolve(rules)
+    return {section_id: redactor.redact(content) for section_id, content in snippets.items()}
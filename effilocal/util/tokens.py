@@ -0,0 +1,48 @@
+"""Cheap, deterministic token estimates for budgeting model context.
+
+No tokenizer ships with the project, so counts approximate BPE tokenizers
+(cl100k/o200k) on contract English: every punctuation mark is a token and
+words cost one token per five characters, rounded up. Estimates are
+computed once -- at analysis time for blocks and sections, at record time
+for chat history -- and stored, so budgets never re-tokenize text.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from itertools import accumulate
+
+__all__ = [
+    "MESSAGE_OVERHEAD_TOKENS",
+    "estimate_tokens",
+    "estimate_tokens_cached",
+    "token_prefix_sums",
+]
+
+# Per-message framing tokens (role, separators) added by chat APIs.
+MESSAGE_OVERHEAD_TOKENS = 4
+
+_WORD_CHARS_PER_TOKEN = 5
+_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str | None) -> int:
+    """Return the estimated token count of ``text``."""
+    if not text:
+        return 0
+    return sum(
+        (len(piece) + _WORD_CHARS_PER_TOKEN - 1) // _WORD_CHARS_PER_TOKEN
+        for piece in _PIECE_RE.findall(text)
+    )
+
+
+@lru_cache(maxsize=256)
+def estimate_tokens_cached(text: str) -> int:
+    """``estimate_tokens`` memoized for texts sent every turn (system prompts)."""
+    return estimate_tokens(text)
+
+
+def token_prefix_sums(counts: list[int]) -> list[int]:
+    """Return ``[0, c0, c0 + c1, ...]`` for bisecting a token budget."""
+    return [0, *accumulate(counts)]
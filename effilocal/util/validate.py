@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -42,121 +44,161 @@ class ValidationReport:
         self.errors.append(ValidationIssue(code=code, message=message, context=context))
 
 
-def validate_artifacts(
-    *,
-    blocks: Sequence[Mapping[str, Any]],
-    sections: Mapping[str, Any],
-    tag_ranges: Sequence[Mapping[str, Any]] | None = None,
-    manifest: Mapping[str, Any] | None = None,
-    schema_dir: Path | None = None,
-) -> ValidationReport:
-    """Perform cross-file validation and return a structured report."""
-
-    report = ValidationReport()
-
-    _check_id_uniqueness(blocks, sections, tag_ranges, report)
-    _check_cross_references(blocks, sections, tag_ranges, report)
-    _check_list_payload(blocks, report)
-
-    if manifest is not None:
-        if schema_dir is None:
-            report.add("missing_schema_dir", "schema_dir must be provided when manifest is supplied.")
-        else:
-            _check_schema_checksums(manifest, schema_dir, report)
+class ArtifactValidator:
+    """Incremental cross-file checks over one analysis, in a single pass.
+
+    Feed the section tree first (block section references are checked against
+    it as blocks arrive), then blocks, then tag ranges (checked against the
+    block IDs seen so far). Only IDs are retained, so blocks and ranges can be
+    streamed straight from their JSONL files. :meth:`finish` reports issues in
+    the same order as the original multi-pass checks: duplicate IDs,
+    cross-references, list payloads, then schema checksums.
+    """
+
+    def __init__(self, sections: Mapping[str, Any] | None = None) -> None:
+        self._block_counts: Counter[str] = Counter()
+        self._section_counts: Counter[str] = Counter()
+        self._range_counts: Counter[tuple[str, str]] = Counter()
+        self._section_ids: set[Any] = set()
+        self._block_ids: set[Any] = set()
+        self._block_refs: list[ValidationIssue] = []
+        self._range_refs: list[ValidationIssue] = []
+        self._list_issues: list[ValidationIssue] = []
+        if sections is not None:
+            self.add_sections(sections)
+
+    def add_sections(self, sections: Mapping[str, Any]) -> None:
+        """Register every node of a ``sections.json`` tree."""
+
+        for node in _iter_sections(sections):
+            section_id = node.get("id")
+            self._section_ids.add(section_id)
+            if isinstance(section_id, str) and section_id:
+                self._section_counts[section_id] += 1
+
+    def add_block(self, block: Mapping[str, Any]) -> None:
+        """Check one block: ID, section reference and list payload."""
 
-    return report
-
-
-def _check_id_uniqueness(
-    blocks: Sequence[Mapping[str, Any]],
-    sections: Mapping[str, Any],
-    tag_ranges: Sequence[Mapping[str, Any]] | None,
-    report: ValidationReport,
-) -> None:
-    """Check that block, section, and tag range IDs are unique."""
-    seen: Counter[tuple[str, str]] = Counter()
-
-    for block in blocks:
         block_id = block.get("id")
+        self._block_ids.add(block_id)
         if isinstance(block_id, str) and block_id:
-            seen[("block", block_id)] += 1
-
-    for node in _iter_sections(sections):
-        section_id = node.get("id")
-        if isinstance(section_id, str) and section_id:
-            seen[("section", section_id)] += 1
-
-    if tag_ranges:
-        for rng in tag_ranges:
-            range_id = rng.get("id")
-            if isinstance(range_id, str) and range_id:
-                seen[("tag_range", range_id)] += 1
-            start_id = rng.get("start_marker_id")
-            if isinstance(start_id, str) and start_id:
-                seen[("marker", start_id)] += 1
-            end_id = rng.get("end_marker_id")
-            if isinstance(end_id, str) and end_id:
-                seen[("marker", end_id)] += 1
-
-    for (kind, identifier), count in seen.items():
-        if count > 1:
-            LOGGER.error(
-                "Duplicate ID detected",
-                extra={"kind": kind, "id": identifier, "count": count},
-            )
-            report.add(
-                "duplicate_id",
-                f"Duplicate {kind} ID detected: {identifier}",
-                {"id": identifier, "kind": kind, "count": count},
-            )
+            self._block_counts[block_id] += 1
 
-
-def _check_cross_references(
-    blocks: Sequence[Mapping[str, Any]],
-    sections: Mapping[str, Any],
-    tag_ranges: Sequence[Mapping[str, Any]] | None,
-    report: ValidationReport,
-) -> None:
-    section_ids = {node.get("id") for node in _iter_sections(sections)}
-    block_ids = {block.get("id") for block in blocks}
-
-    for block in blocks:
         section_id = block.get("section_id")
-        if section_id and section_id not in section_ids:
-            report.add(
-                "unknown_section_id",
-                "Block references unknown section_id",
-                {"block_id": block.get("id"), "section_id": section_id},
+        if section_id and section_id not in self._section_ids:
+            self._block_refs.append(
+                ValidationIssue(
+                    "unknown_section_id",
+                    "Block references unknown section_id",
+                    {"block_id": block_id, "section_id": section_id},
+                )
             )
 
-    if not tag_ranges:
-        return
+        list_payload = block.get("list")
+        if isinstance(list_payload, Mapping):
+            counters = list_payload.get("counters")
+            level = list_payload.get("level")
+            if isinstance(level, int) and isinstance(counters, Sequence) and len(counters) != level + 1:
+                self._list_issues.append(
+                    ValidationIssue(
+                        "invalid_list_counters",
+                        "List counters length does not match level + 1",
+                        {"block_id": block_id, "level": level, "counters": list(counters)},
+                    )
+                )
+
+    def add_tag_range(self, rng: Mapping[str, Any]) -> None:
+        """Check one tag range: IDs, marker IDs and block references."""
+
+        for kind, key in (("tag_range", "id"), ("marker", "start_marker_id"), ("marker", "end_marker_id")):
+            identifier = rng.get(key)
+            if isinstance(identifier, str) and identifier:
+                self._range_counts[(kind, identifier)] += 1
 
-    for rng in tag_ranges:
         attrs = rng.get("attributes")
         if isinstance(attrs, Mapping):
             block_id = attrs.get("block_id")
-            if block_id and block_id not in block_ids:
-                report.add(
-                    "unknown_block_in_range",
-                    "Tag range references missing block",
-                    {"range_id": rng.get("id"), "block_id": block_id},
+            if block_id and block_id not in self._block_ids:
+                self._range_refs.append(
+                    ValidationIssue(
+                        "unknown_block_in_range",
+                        "Tag range references missing block",
+                        {"range_id": rng.get("id"), "block_id": block_id},
+                    )
                 )
         for anchor_key in ("start", "end"):
             anchor = rng.get("anchors", {}).get(anchor_key)
             if isinstance(anchor, Mapping):
                 near_id = anchor.get("near_block_id")
-                if near_id and near_id not in block_ids:
-                    report.add(
-                        "unknown_anchor_block",
-                        "Anchor references missing block",
-                        {
-                            "range_id": rng.get("id"),
-                            "anchor": anchor_key,
-                            "near_block_id": near_id,
-                        },
+                if near_id and near_id not in self._block_ids:
+                    self._range_refs.append(
+                        ValidationIssue(
+                            "unknown_anchor_block",
+                            "Anchor references missing block",
+                            {"range_id": rng.get("id"), "anchor": anchor_key, "near_block_id": near_id},
+                        )
                     )
 
+    def finish(
+        self,
+        report: ValidationReport | None = None,
+        *,
+        manifest: Mapping[str, Any] | None = None,
+        schema_dir: Path | None = None,
+    ) -> ValidationReport:
+        """Append the collected issues (and schema checksum checks) to ``report``."""
+
+        report = report if report is not None else ValidationReport()
+        duplicates = itertools.chain(
+            ((("block", block_id), count) for block_id, count in self._block_counts.items()),
+            ((("section", section_id), count) for section_id, count in self._section_counts.items()),
+            self._range_counts.items(),
+        )
+        for (kind, identifier), count in duplicates:
+            if count > 1:
+                LOGGER.error(
+                    "Duplicate ID detected",
+                    extra={"kind": kind, "id": identifier, "count": count},
+                )
+                report.add(
+                    "duplicate_id",
+                    f"Duplicate {kind} ID detected: {identifier}",
+                    {"id": identifier, "kind": kind, "count": count},
+                )
+
+        for issue in itertools.chain(self._block_refs, self._range_refs, self._list_issues):
+            report.add(issue.code, issue.message, issue.context)
+
+        if manifest is not None:
+            if schema_dir is None:
+                report.add("missing_schema_dir", "schema_dir must be provided when manifest is supplied.")
+            else:
+                _check_schema_checksums(manifest, schema_dir, report)
+
+        return report
+
+
+def validate_artifacts(
+    *,
+    blocks: Iterable[Mapping[str, Any]],
+    sections: Mapping[str, Any],
+    tag_ranges: Iterable[Mapping[str, Any]] | None = None,
+    manifest: Mapping[str, Any] | None = None,
+    schema_dir: Path | None = None,
+) -> ValidationReport:
+    """Perform cross-file validation and return a structured report.
+
+    ``blocks`` and ``tag_ranges`` may be any iterables (e.g. JSONL streams);
+    each is consumed once.
+    """
+
+    validator = ArtifactValidator(sections)
+    for block in blocks:
+        validator.add_block(block)
+    for rng in tag_ranges or ():
+        validator.add_tag_range(rng)
+    return validator.finish(manifest=manifest, schema_dir=schema_dir)
+
 
 def _check_schema_checksums(
     manifest: Mapping[str, Any],
@@ -168,7 +210,7 @@ def _check_schema_checksums(
         report.add("schema_checksums_missing", "Manifest is missing schema_checksums map.")
         return
 
-    actual = collect_schema_checksums(schema_dir)
+    actual = _schema_checksums(schema_dir)
 
     missing = {name for name in actual if name not in recorded}
     extra = {name for name in recorded if name not in actual}
@@ -205,6 +247,22 @@ def _check_schema_checksums(
         )
 
 
+def _schema_checksums(schema_dir: Path) -> dict[str, str]:
+    """Return schema checksums, rehashing only when the schema files change."""
+
+    signature = tuple(
+        (path.name, stat.st_mtime_ns, stat.st_size)
+        for path in sorted(Path(schema_dir).glob("*.schema.json"))
+        for stat in (path.stat(),)
+    )
+    return _cached_schema_checksums(str(schema_dir), signature)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_schema_checksums(schema_dir: str, _signature: tuple[Any, ...]) -> dict[str, str]:
+    return collect_schema_checksums(Path(schema_dir))
+
+
 def _iter_sections(sections: Mapping[str, Any]) -> Iterable[Mapping[str, Any]]:
     root = sections.get("root", {})
     yield from _walk_section_nodes(root)
@@ -214,32 +272,3 @@ def _walk_section_nodes(node: Mapping[str, Any]) -> Iterable[Mapping[str, Any]]:
     for child in node.get("children", []):
         yield child
         yield from _walk_section_nodes(child)
-
-
-def _check_list_payload(
-    blocks: Sequence[Mapping[str, Any]],
-    report: ValidationReport,
-) -> None:
-    """Validate numbering-related payloads on blocks."""
-
-    for block in blocks:
-        list_payload = block.get("list")
-        if not isinstance(list_payload, Mapping):
-            continue
-
-        counters = list_payload.get("counters")
-        level = list_payload.get("level")
-
-        if isinstance(level, int) and isinstance(counters, Sequence):
-            expected = level + 1
-            if len(counters) != expected:
-                report.add(
-                    "invalid_list_counters",
-                    "List counters length does not match level + 1",
-                    {
-                        "block_id": block.get("id"),
-                        "level": level,
-                        "counters": list(counters),
-                    },
-                )
-
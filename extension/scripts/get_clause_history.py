@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""Script to get the change timeline of one clause across git history.
+
+Usage:
+    get_clause_history.py <analysis_dir> <clause> [--max <count>] [--text]
+
+Reads the fingerprints.json snapshots committed with the analysis; no .docx
+versions are checked out. Outputs JSON to stdout.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from effilocal.flows.history_diff import HistoryDiffError, clause_timeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Get clause change history")
+    parser.add_argument("analysis_dir", type=Path, help="Path to analysis directory")
+    parser.add_argument("clause", help="Clause number, e.g. 12 or 12.3")
+    parser.add_argument("--max", type=int, default=50, help="Maximum commits to examine")
+    parser.add_argument("--attachment", default=None, help="Attachment id (default: main body)")
+    parser.add_argument("--text", action="store_true", help="Include text of changed blocks")
+
+    args = parser.parse_args()
+
+    if not args.analysis_dir.exists():
+        print(json.dumps({"success": False, "error": f"Directory not found: {args.analysis_dir}"}))
+        return
+
+    try:
+        changes = clause_timeline(
+            args.analysis_dir,
+            args.clause,
+            max_commits=args.max,
+            attachment_id=args.attachment,
+            include_text=args.text,
+        )
+    except HistoryDiffError as exc:
+        print(json.dumps({"success": False, "error": str(exc)}))
+        return
+
+    output = {
+        "success": True,
+        "clause": args.clause,
+        "changes": [change.to_dict() for change in changes],
+    }
+    print(json.dumps(output))
+
+
+if __name__ == "__main__":
+    main()
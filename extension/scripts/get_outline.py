@@ -3,66 +3,45 @@
 
 Usage:
     python get_outline.py <analysis_dir>
+    python get_outline.py <analysis_dir> --start 0 --limit 200 [--collapsed ID,ID]
+    python get_outline.py <analysis_dir> --page-of BLOCK_ID [--limit 200]
+    python get_outline.py <analysis_dir> --children BLOCK_ID
+    python get_outline.py <analysis_dir> --since VERSION
+
+Without options the whole outline is returned. ``--start``/``--limit``
+return one window, ``--children`` the direct children of a block (to expand
+a collapsed node) and ``--since`` the added/modified/removed blocks since
+the analysis version the webview already shows.
 
 Returns JSON to stdout with outline structure.
 """
+import argparse
 import json
 import sys
 from pathlib import Path
 
 # Add parent directory to path to import effilocal
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from effilocal.artifact_loader import ArtifactLoader
+from effilocal.outline import DEFAULT_PAGE_SIZE, OutlineService
 
 
 def get_outline_json(analysis_dir: str) -> str:
     """Load analysis and return outline as JSON.
-    
+
     Returns ALL blocks with checkboxes, showing ordinal for numbered blocks
     and type/style info for unnumbered blocks.
     """
     try:
-        loader = ArtifactLoader(analysis_dir)
-        
-        # Get ALL blocks for the outline
-        outline_items = []
-        
-        for block in loader.blocks:
-            list_meta = block.get('list') or {}
-            ordinal = list_meta.get('ordinal', '')
-            level = list_meta.get('level', 0)
-            block_type = block.get('type', 'paragraph')
-            text = block.get('text', '')[:100]  # Limit to 100 chars
-            
-            # For unnumbered blocks, show style or type as label
-            if not ordinal:
-                style = block.get('style', '')
-                if block_type == 'heading':
-                    ordinal = f'[{style or "Heading"}]'
-                elif block_type == 'table_cell':
-                    table_info = block.get('table', {})
-                    ordinal = f'[Table R{table_info.get("row", 0)+1}C{table_info.get("col", 0)+1}]'
-                else:
-                    # No label for regular paragraphs - just show the text
-                    ordinal = ''
-            
-            outline_items.append({
-                'id': block['id'],
-                'ordinal': ordinal,
-                'text': text,
-                'level': level,
-                'type': block_type,
-                'section_id': block.get('section_id'),
-                'is_numbered': bool(list_meta.get('ordinal')),
-            })
-        
+        service = OutlineService.from_dir(analysis_dir)
+        outline_items = service.full_outline()
         return json.dumps({
             'success': True,
             'outline': outline_items,
-            'count': len(outline_items)
+            'count': len(outline_items),
+            'version': service.version,
         }, ensure_ascii=False, indent=2)
-        
+
     except Exception as e:
         return json.dumps({
             'success': False,
@@ -70,10 +49,51 @@ def get_outline_json(analysis_dir: str) -> str:
         }, ensure_ascii=False, indent=2)
 
 
+def query_outline_json(analysis_dir: str, args: argparse.Namespace) -> str:
+    """Answer a paged, children or delta outline query as compact JSON."""
+    try:
+        service = OutlineService.from_dir(analysis_dir)
+        collapsed = [block_id for block_id in (args.collapsed or '').split(',') if block_id]
+        if args.since is not None:
+            result = service.delta(args.since)
+        elif args.children:
+            result = service.children(args.children, args.start, args.limit)
+        elif args.page_of:
+            result = service.page_of(args.page_of, args.limit, collapsed=collapsed)
+        else:
+            result = service.page(args.start, args.limit, collapsed=collapsed)
+        return json.dumps({'success': True, **result}, ensure_ascii=False)
+
+    except KeyError as e:
+        return json.dumps({'success': False, 'error': f'Unknown block: {e.args[0]}'})
+    except Exception as e:
+        return json.dumps({'success': False, 'error': str(e)})
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Outline queries for the webview.')
+    parser.add_argument('analysis_dir')
+    parser.add_argument('--start', type=int, default=0, help='First visible row to return')
+    parser.add_argument('--limit', type=int, default=None, help=f'Rows per page (default {DEFAULT_PAGE_SIZE})')
+    parser.add_argument('--collapsed', help='Comma-separated block IDs whose subtrees are hidden')
+    parser.add_argument('--page-of', help='Return the page containing this block ID')
+    parser.add_argument('--children', help='Return the direct children of this block ID')
+    parser.add_argument('--since', help='Return changes since this analysis version')
+    return parser.parse_args(argv)
+
+
 if __name__ == '__main__':
     if len(sys.argv) < 2:
         print(json.dumps({'success': False, 'error': 'Usage: get_outline.py <analysis_dir>'}))
         sys.exit(1)
-    
-    analysis_dir = sys.argv[1]
-    print(get_outline_json(analysis_dir))
+
+    args = parse_args()
+    query = (
+        args.limit is not None or args.start or args.collapsed
+        or args.page_of or args.children or args.since is not None
+    )
+    if not query:
+        print(get_outline_json(args.analysis_dir))
+    else:
+        args.limit = args.limit if args.limit is not None else DEFAULT_PAGE_SIZE
+        print(query_outline_json(args.analysis_dir, args))
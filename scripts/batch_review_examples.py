@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Generate review examples for many incoming/outgoing .msg pairs at once.
+
+Non-interactive batch front end for ``generate_review_example.py``. Pairs
+come from a directory (one sub-directory per pair, holding the two .msg
+files) or from a JSONL mapping file, and are processed in a process pool.
+Document analyses are cached by content hash, so an attachment that appears
+in several pairs (a template, a re-sent draft) is analyzed once.
+
+Each pair is written to ``<output>/<pair_id>/`` together with a
+``generate.log`` of its console output. ``<output>/batch_report.jsonl``
+records status, wall time, written files and any error for every pair.
+
+Mapping file format (one JSON object per line; paths relative to the file):
+
+    {"id": "acme", "incoming": "acme/in.msg", "outgoing": "acme/out.msg",
+     "client": "Acme", "counterparty": "Globex", "original_provided_by": "client",
+     "original_index": 1, "edited_index": 2}
+
+Only ``incoming`` and ``outgoing`` are required. Parties default to the
+"For X:" comment prefixes (first = client); when an email carries several
+.docx attachments the first is used unless an index is given.
+
+Usage:
+    python scripts/batch_review_examples.py --pairs-dir mailbox/ --output corpus/
+    python scripts/batch_review_examples.py --mapping pairs.jsonl --output corpus/ --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Iterable
+
+# Add project root to path for effilocal imports
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from effilocal.doc.email_parser import MsgParser
+from effilocal.util.io import write_jsonl
+from scripts.generate_review_example import generate_review_example, resolve_parties
+
+REPORT_FILENAME = "batch_report.jsonl"
+LOG_FILENAME = "generate.log"
+CACHE_DIRNAME = ".analysis_cache"
+
+
+@dataclass(frozen=True)
+class PairJob:
+    """One incoming/outgoing email pair to turn into a review example."""
+
+    pair_id: str
+    incoming: Path
+    outgoing: Path
+    client: str | None = None
+    counterparty: str | None = None
+    original_provided_by: str = "counterparty"
+    original_index: int | None = None
+    edited_index: int | None = None
+
+
+@dataclass
+class PairResult:
+    """Outcome of processing one pair."""
+
+    pair_id: str
+    status: str
+    seconds: float
+    output_dir: str
+    files: list[str] = field(default_factory=list)
+    error: str | None = None
+    traceback: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+def _message_time(path: Path) -> datetime | None:
+    try:
+        date = MsgParser.parse(path).date
+        return datetime.fromisoformat(date) if date else None
+    except (OSError, ValueError):
+        return None
+
+
+def discover_pairs(pairs_dir: Path) -> list[PairJob]:
+    """
+    Find pairs in ``pairs_dir``: every sub-directory with exactly two .msg files.
+
+    The earlier message (by sent date, falling back to filename order) is the
+    incoming instructions email; the later one is the outgoing advice.
+    Sub-directories with any other number of .msg files are skipped.
+    """
+    jobs: list[PairJob] = []
+    for folder in sorted(p for p in pairs_dir.iterdir() if p.is_dir()):
+        messages = sorted(folder.glob("*.msg"))
+        if len(messages) != 2:
+            continue
+        first, second = (_message_time(path) for path in messages)
+        with contextlib.suppress(TypeError):  # naive vs aware timestamps: keep name order
+            if first is not None and second is not None and second < first:
+                messages.reverse()
+        jobs.append(PairJob(pair_id=folder.name, incoming=messages[0], outgoing=messages[1]))
+    return jobs
+
+
+def load_mapping(mapping_path: Path) -> list[PairJob]:
+    """Load pair jobs from a JSONL mapping file (see module docstring)."""
+    base = mapping_path.parent
+    jobs: list[PairJob] = []
+    with mapping_path.open("r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            try:
+                incoming = base / entry["incoming"]
+                outgoing = base / entry["outgoing"]
+            except KeyError as exc:
+                raise ValueError(f"{mapping_path}:{line_number}: missing {exc.args[0]!r}") from None
+            jobs.append(
+                PairJob(
+                    pair_id=str(entry.get("id") or incoming.stem),
+                    incoming=incoming,
+                    outgoing=outgoing,
+                    client=entry.get("client"),
+                    counterparty=entry.get("counterparty"),
+                    original_provided_by=entry.get("original_provided_by", "counterparty"),
+                    original_index=entry.get("original_index"),
+                    edited_index=entry.get("edited_index"),
+                )
+            )
+    return jobs
+
+
+def process_pair(job: PairJob, output_root: Path, cache_dir: Path, single_file: bool = False) -> PairResult:
+    """
+    Generate the review example for one pair without prompting.
+
+    Never raises: failures are captured in the returned PairResult so one bad
+    pair does not stop the batch.
+    """
+    output_dir = output_root / job.pair_id
+    output_dir.mkdir(parents=True, exist_ok=True)
+    resolver = partial(
+        resolve_parties,
+        client=job.client,
+        counterparty=job.counterparty,
+        original_provided_by=job.original_provided_by,
+    )
+    start = time.perf_counter()
+    with (output_dir / LOG_FILENAME).open("w", encoding="utf-8") as log, contextlib.redirect_stdout(log):
+        try:
+            written = generate_review_example(
+                incoming_path=job.incoming,
+                outgoing_path=job.outgoing,
+                output_dir=output_dir,
+                original_index=job.original_index or 1,
+                edited_index=job.edited_index or 1,
+                single_file=single_file,
+                party_resolver=resolver,
+                analysis_cache_dir=cache_dir,
+            )
+        except Exception as exc:
+            trace = traceback.format_exc()
+            print(trace)
+            return PairResult(
+                pair_id=job.pair_id,
+                status="error",
+                seconds=round(time.perf_counter() - start, 3),
+                output_dir=str(output_dir),
+                error=f"{type(exc).__name__}: {exc}",
+                traceback=trace,
+            )
+    return PairResult(
+        pair_id=job.pair_id,
+        status="ok",
+        seconds=round(time.perf_counter() - start, 3),
+        output_dir=str(output_dir),
+        files=[path.name for path in written],
+    )
+
+
+def run_batch(
+    jobs: Iterable[PairJob],
+    output_root: Path,
+    *,
+    workers: int | None = None,
+    cache_dir: Path | None = None,
+    single_file: bool = False,
+) -> list[PairResult]:
+    """
+    Process ``jobs`` in a process pool and write the batch report.
+
+    Args:
+        jobs: Pairs to process
+        output_root: Root directory for per-pair output and the report
+        workers: Pool size (default: CPU count); 1 runs in-process
+        cache_dir: Analysis cache (default: ``<output_root>/.analysis_cache``)
+        single_file: Combine each pair's output into one markdown file
+
+    Returns:
+        Results in job order
+    """
+    jobs = list(jobs)
+    duplicates = sorted(pair_id for pair_id, count in Counter(job.pair_id for job in jobs).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Duplicate pair ids: {', '.join(duplicates)}")
+    output_root.mkdir(parents=True, exist_ok=True)
+    cache_dir = cache_dir or output_root / CACHE_DIRNAME
+    worker = partial(process_pair, output_root=output_root, cache_dir=cache_dir, single_file=single_file)
+
+    results: dict[str, PairResult] = {}
+    if workers == 1:
+        for job in jobs:
+            results[job.pair_id] = worker(job)
+            _print_progress(results[job.pair_id], len(results), len(jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            futures = {pool.submit(worker, job): job for job in jobs}
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.pair_id] = result
+                _print_progress(result, len(results), len(jobs))
+
+    ordered = [results[job.pair_id] for job in jobs]
+    write_jsonl(output_root / REPORT_FILENAME, (asdict(result) for result in ordered))
+    return ordered
+
+
+def _print_progress(result: PairResult, done: int, total: int) -> None:
+    detail = f"{result.seconds:.1f}s" if result.ok else result.error
+    print(f"[{done}/{total}] {result.pair_id}: {result.status} ({detail})")
+
+
+def summarize(results: list[PairResult]) -> dict[str, Any]:
+    """Return aggregate counts and timings for a batch."""
+    seconds = sorted(result.seconds for result in results)
+    return {
+        "pairs": len(results),
+        "ok": sum(result.ok for result in results),
+        "errors": sum(not result.ok for result in results),
+        "total_seconds": round(sum(seconds), 3),
+        "median_seconds": seconds[len(seconds) // 2] if seconds else 0.0,
+        "max_seconds": seconds[-1] if seconds else 0.0,
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Return parsed CLI arguments."""
+    parser = argparse.ArgumentParser(description="Batch-generate review examples from .msg pairs.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--pairs-dir", type=Path, help="Directory with one sub-directory per .msg pair")
+    source.add_argument("--mapping", type=Path, help="JSONL mapping file listing the pairs")
+    parser.add_argument("--output", "-o", type=Path, required=True, help="Output root directory")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count; 1 = in-process)")
+    parser.add_argument("--cache-dir", type=Path, help="Analysis cache directory (default: <output>/.analysis_cache)")
+    parser.add_argument("--single-file", action="store_true", help="Combine each pair's output into one markdown file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    jobs = load_mapping(args.mapping) if args.mapping else discover_pairs(args.pairs_dir)
+    if not jobs:
+        print("No .msg pairs found.")
+        return 1
+
+    results = run_batch(
+        jobs,
+        args.output,
+        workers=args.workers,
+        cache_dir=args.cache_dir,
+        single_file=args.single_file,
+    )
+    summary = summarize(results)
+    print(
+        f"\n{summary['ok']}/{summary['pairs']} pairs succeeded "
+        f"({summary['errors']} errors) in {summary['total_seconds']:.1f}s of worker time; "
+        f"report: {args.output / REPORT_FILENAME}"
+    )
+    return 0 if summary["errors"] == 0 else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
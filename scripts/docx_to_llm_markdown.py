@@ -32,6 +32,7 @@ Examples:
 import json
 import sys
 import re
+import tempfile
 from pathlib import Path
 from datetime import date
 from typing import Optional
@@ -50,6 +51,37 @@ def run_analyze_doc(docx_path: Path, out_dir: Path) -> Path:
     return out_dir
 
 
+def run_analyze_doc_cached(docx_bytes: bytes, cache_dir: Path) -> Path:
+    """
+    Return the analysis directory for ``docx_bytes``, analyzing at most once.
+    
+    Analyses are stored under ``cache_dir`` keyed by the SHA-256 of the bytes,
+    so the same attachment seen in many email pairs is analyzed once. Each run
+    is written to a private temp directory and renamed into place, so
+    concurrent workers never read a partial analysis; if two workers race,
+    the second discards its copy and uses the published one.
+    """
+    from effilocal.util.hash import sha256_bytes
+    
+    digest = sha256_bytes(docx_bytes).split(":", 1)[1]
+    target = cache_dir / digest
+    if target.is_dir():
+        return target
+    
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=cache_dir, prefix=".tmp-") as tmp_dir:
+        docx_path = Path(tmp_dir) / f"{digest[:16]}.docx"
+        docx_path.write_bytes(docx_bytes)
+        analysis_dir = Path(tmp_dir) / "analysis"
+        run_analyze_doc(docx_path, analysis_dir)
+        try:
+            analysis_dir.rename(target)
+        except OSError:
+            if not target.is_dir():
+                raise
+    return target
+
+
 def load_blocks(analysis_dir: Path) -> list[dict]:
     """Load blocks from blocks.jsonl."""
     blocks_file = analysis_dir / "blocks.jsonl"
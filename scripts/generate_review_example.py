@@ -40,9 +40,8 @@ import argparse
 import sys
 import tempfile
 from dataclasses import dataclass, field
-from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from docx import Document
 
@@ -51,14 +50,14 @@ _PROJECT_ROOT = Path(__file__).parent.parent
 if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
-from effilocal.doc.amended_paragraph import iter_amended_paragraphs
-from effilocal.doc.uuid_embedding import get_paragraph_para_id
+from effilocal.doc.revision_stream import RevisionSpan, iter_paragraph_revisions
 from effilocal.mcp_server.core.comments import extract_all_comments
 from effilocal.mcp_server.utils.document_utils import iter_document_paragraphs
 
 # Import refactored party detection and anonymization modules
 from effilocal.doc.clause_lookup import extract_clause_title_from_text
 from effilocal.doc.party_detection import (
+    PartyDetector,
     PartyInfo,
     DEFINED_TERM_TO_ROLE,
     extract_defined_party_terms,
@@ -81,6 +80,7 @@ from effilocal.doc.anonymization import (
 from effilocal.doc.email_parser import (
     Attachment,
     EmailData,
+    MsgParser,
     parse_msg_file,
     select_docx_attachment,
 )
@@ -88,6 +88,7 @@ from effilocal.doc.email_parser import (
 # Import docx_to_llm_markdown module functions
 from scripts.docx_to_llm_markdown import (
     run_analyze_doc,
+    run_analyze_doc_cached,
     convert_to_markdown,
 )
 
@@ -173,10 +174,13 @@ class ParagraphDiff:
     parent_title: str = None  # Title of parent clause (e.g., "LIMITATION OF LIABILITY")
     clause_number: str = None  # Rendered clause number (e.g., "11.1", "11.2")
     para_id: str = None  # Word's native paragraph ID (w14:paraId)
+    changes: list[RevisionSpan] = None  # Exact offsets of each insertion/deletion
     
     def __post_init__(self):
         if self.rationale is None:
             self.rationale = []
+        if self.changes is None:
+            self.changes = []
         if self.parent_title is None:
             self.parent_title = ""
         if self.clause_number is None:
@@ -331,111 +335,38 @@ def match_comments_to_diffs(
         diff.rationale = matched_rationales
 
 
-def process_track_changes(doc: Document) -> list[ParagraphDiff]:
+def process_track_changes(doc: Document | bytes | Path) -> list[ParagraphDiff]:
     """
     Extract tracked changes as paragraph-level before/after diffs.
     
     For each paragraph with changes, reconstructs:
     - before_text: What the paragraph looked like before edits
     - after_text: What it looks like after edits (visible text)
-    - Summary of insertions and deletions
+    - Summary of insertions and deletions, with exact character offsets
+    
+    Revisions are read in a single streaming pass over the document XML
+    (see effilocal.doc.revision_stream); passing the raw .docx bytes avoids
+    building a python-docx tree at all.
     
     Args:
-        doc: python-docx Document object
+        doc: python-docx Document object, .docx bytes, or path
         
     Returns:
         List of ParagraphDiff objects (only paragraphs with changes)
     """
-    diffs: list[ParagraphDiff] = []
-    
-    for para_idx, amended_para in enumerate(iter_amended_paragraphs(doc)):
-        # Build before and after text from runs
-        before_parts: list[str] = []
-        after_parts: list[str] = []
-        authors: set[str] = set()
-        dates: set[str] = set()
-        
-        # Track consecutive insertions/deletions for consolidation
-        current_insertions: list[str] = []
-        current_deletions: list[str] = []
-        all_insertions: list[str] = []
-        all_deletions: list[str] = []
-        
-        def flush_changes():
-            """Consolidate and flush accumulated changes."""
-            nonlocal current_insertions, current_deletions
-            if current_insertions:
-                consolidated = "".join(current_insertions).strip()
-                if consolidated:
-                    all_insertions.append(consolidated)
-                current_insertions = []
-            if current_deletions:
-                consolidated = "".join(current_deletions).strip()
-                if consolidated:
-                    all_deletions.append(consolidated)
-                current_deletions = []
-        
-        for run in amended_para.amended_runs:
-            formats = run.get("formats", [])
-            
-            if "delete" in formats:
-                # Deleted text: in before, not in after
-                deleted_text = run.get("deleted_text", "")
-                if deleted_text:
-                    before_parts.append(deleted_text)
-                    current_deletions.append(deleted_text)
-                    if run.get("author"):
-                        authors.add(run["author"])
-                    if run.get("date"):
-                        dates.add(run["date"])
-                # Flush insertions if we switched to deletions
-                if current_insertions:
-                    consolidated = "".join(current_insertions).strip()
-                    if consolidated:
-                        all_insertions.append(consolidated)
-                    current_insertions = []
-            
-            elif "insert" in formats:
-                # Inserted text: in after, not in before
-                inserted_text = run.get("text", "")
-                if inserted_text:
-                    after_parts.append(inserted_text)
-                    current_insertions.append(inserted_text)
-                    if run.get("author"):
-                        authors.add(run["author"])
-                    if run.get("date"):
-                        dates.add(run["date"])
-                # Flush deletions if we switched to insertions
-                if current_deletions:
-                    consolidated = "".join(current_deletions).strip()
-                    if consolidated:
-                        all_deletions.append(consolidated)
-                    current_deletions = []
-            
-            else:
-                # Normal text: in both before and after - flush accumulated changes
-                flush_changes()
-                normal_text = run.get("text", "")
-                if normal_text:
-                    before_parts.append(normal_text)
-                    after_parts.append(normal_text)
-        
-        # Flush any remaining changes at end of paragraph
-        flush_changes()
-        
-        # Only include paragraphs with actual changes
-        if all_insertions or all_deletions:
-            # Get the native para_id from the paragraph element
-            para_id = get_paragraph_para_id(amended_para._paragraph._element)
-            diffs.append(ParagraphDiff(
-                before_text="".join(before_parts),
-                after_text="".join(after_parts),
-                authors=authors,
-                dates=dates,
-                insertions=all_insertions,
-                deletions=all_deletions,
-                para_id=para_id
-            ))
+    diffs = [
+        ParagraphDiff(
+            before_text=revisions.before_text,
+            after_text=revisions.after_text,
+            authors=revisions.authors,
+            dates=revisions.dates,
+            insertions=revisions.insertions,
+            deletions=revisions.deletions,
+            para_id=revisions.para_id,
+            changes=revisions.spans,
+        )
+        for revisions in iter_paragraph_revisions(doc)
+    ]
     
     # Post-process: assign parent titles to sub-clauses
     # When a paragraph has a title (e.g., "LIMITATION OF LIABILITY."),
@@ -470,14 +401,15 @@ def detect_and_confirm_parties(
     print("PARTY DETECTION")
     print("=" * 60)
     
-    # Extract information
-    defined_terms = extract_defined_party_terms(original_doc)
-    company_names = extract_company_names(original_doc)
+    # Read the document once; every extractor runs over the shared text
+    detector = PartyDetector.from_document(original_doc)
+    defined_terms = detector.defined_terms
+    company_names = detector.company_names
     comment_prefixes = extract_comment_prefixes(comments)
     
-    # Extract company name to defined term mapping from preamble
+    # Company name to defined term mapping from preamble
     # e.g., {"NBCUniversal": "Company", "Didimo": "Vendor"}
-    company_to_term = extract_company_to_defined_term_mapping(original_doc)
+    company_to_term = detector.company_to_term
     
     print(f"\nDetected defined terms (from 'X shall/will/may'): {defined_terms[:5]}")
     print(f"Detected company names (from preamble): {company_names[:5]}")
@@ -528,35 +460,6 @@ def detect_and_confirm_parties(
         client_prefix = input("Enter your client's name: ").strip()
         counterparty_prefix = input("Enter the counterparty's name: ").strip()
     
-    # Match to defined terms - prioritize the company→term mapping
-    client_defined = company_to_term.get(client_prefix, "")
-    counterparty_defined = company_to_term.get(counterparty_prefix, "")
-    
-    # If no direct mapping, try matching via prefix_matches
-    if not client_defined:
-        matched = prefix_matches.get(client_prefix, "")
-        client_defined = company_to_term.get(matched, matched)
-    if not counterparty_defined:
-        matched = prefix_matches.get(counterparty_prefix, "")
-        counterparty_defined = company_to_term.get(matched, matched)
-    
-    # If still no good match, use similarity matching to defined terms
-    if not client_defined or client_defined == client_prefix:
-        for term in defined_terms:
-            if compute_similarity(client_prefix, term) > 0.3:
-                client_defined = term
-                break
-        if not client_defined:
-            client_defined = defined_terms[0] if defined_terms else "Vendor"
-    
-    if not counterparty_defined or counterparty_defined == counterparty_prefix:
-        for term in defined_terms:
-            if term != client_defined and compute_similarity(counterparty_prefix, term) > 0.3:
-                counterparty_defined = term
-                break
-        if not counterparty_defined:
-            counterparty_defined = defined_terms[1] if len(defined_terms) > 1 else "Company"
-    
     # Ask who provided the original
     print("\n" + "-" * 40)
     print("Who provided the original agreement?")
@@ -574,49 +477,12 @@ def detect_and_confirm_parties(
             break
         print("Please enter 1 or 2.")
     
-    # Infer semantic roles from defined terms
-    client_role = infer_party_role(client_defined)
-    counterparty_role = infer_party_role(counterparty_defined)
-    
-    # Extract alternate names for each party (e.g., "Company" and "NBCUniversal")
-    party_alternates = extract_party_alternate_names(original_doc)
-    client_alternates = party_alternates.get(client_defined, [])
-    counterparty_alternates = party_alternates.get(counterparty_defined, [])
-    
-    # Extract full company names (e.g., "NBCUniversal Media, LLC") and associate with parties
-    full_names = extract_full_company_names(original_doc)
-    for full_name in full_names:
-        # Check if this full name belongs to client or counterparty by matching against prefix
-        # The prefix might be a short form like "NBC" for "NBCUniversal Media, LLC"
-        # So check: is prefix contained in full_name, OR is any part of full_name contained in prefix?
-        full_name_lower = full_name.lower()
-        full_name_parts = [full_name.split(',')[0].lower(), full_name.split()[0].lower()]
-        
-        # Check client match: prefix in full_name OR full_name part in prefix
-        client_match = (
-            client_prefix.lower() in full_name_lower or 
-            any(part in client_prefix.lower() for part in full_name_parts if len(part) > 3)
-        )
-        # Check counterparty match: prefix in full_name OR full_name part in prefix  
-        counterparty_match = (
-            counterparty_prefix.lower() in full_name_lower or
-            any(part in counterparty_prefix.lower() for part in full_name_parts if len(part) > 3)
-        )
-        
-        if client_match and not counterparty_match:
-            if full_name not in client_alternates:
-                client_alternates.append(full_name)
-            # Also add ALL-CAPS version for signature blocks
-            upper_name = full_name.upper()
-            if upper_name not in client_alternates:
-                client_alternates.append(upper_name)
-        elif counterparty_match and not client_match:
-            if full_name not in counterparty_alternates:
-                counterparty_alternates.append(full_name)
-            # Also add ALL-CAPS version for signature blocks
-            upper_name = full_name.upper()
-            if upper_name not in counterparty_alternates:
-                counterparty_alternates.append(upper_name)
+    # Resolve defined terms, roles and alternate names for the chosen parties
+    party_info = detector.party_info(client_prefix, counterparty_prefix, original_provided_by)
+    client_defined = party_info.client_defined_term
+    counterparty_defined = party_info.counterparty_defined_term
+    client_alternates = party_info.client_alternate_names
+    counterparty_alternates = party_info.counterparty_alternate_names
     
     # Summary
     print("\n" + "-" * 40)
@@ -628,22 +494,56 @@ def detect_and_confirm_parties(
     counterparty_names_str = f"'{counterparty_defined}'"
     if counterparty_alternates and len(counterparty_alternates) > 1:
         counterparty_names_str = f"'{counterparty_defined}' (also: {', '.join(n for n in counterparty_alternates if n != counterparty_defined)})"
-    print(f"  Client: {client_prefix} -> defined as {client_names_str} (role: {client_role}) -> [CLIENT]")
-    print(f"  Counterparty: {counterparty_prefix} -> defined as {counterparty_names_str} (role: {counterparty_role}) -> [COUNTERPARTY]")
+    print(f"  Client: {client_prefix} -> defined as {client_names_str} (role: {party_info.client_role}) -> [CLIENT]")
+    print(f"  Counterparty: {counterparty_prefix} -> defined as {counterparty_names_str} (role: {party_info.counterparty_role}) -> [COUNTERPARTY]")
     print(f"  Original provided by: {original_provided_by}")
     print("-" * 40)
     
-    return PartyInfo(
-        client_prefix=client_prefix,
-        counterparty_prefix=counterparty_prefix,
-        client_defined_term=client_defined,
-        counterparty_defined_term=counterparty_defined,
-        original_provided_by=original_provided_by,
-        client_role=client_role,
-        counterparty_role=counterparty_role,
-        client_alternate_names=client_alternates,
-        counterparty_alternate_names=counterparty_alternates
-    )
+    return party_info
+
+
+def resolve_parties(
+    original_doc: Document,
+    comments: list[dict[str, Any]],
+    client: str | None = None,
+    counterparty: str | None = None,
+    original_provided_by: str = "counterparty"
+) -> PartyInfo:
+    """
+    Non-interactive counterpart of detect_and_confirm_parties.
+    
+    Parties not given explicitly are taken from the "For X:" comment
+    prefixes in order (first is the client, second the counterparty).
+    
+    Args:
+        original_doc: The original agreement document
+        comments: All comments from the edited document
+        client: Client name/prefix (overrides detection)
+        counterparty: Counterparty name/prefix (overrides detection)
+        original_provided_by: "client" or "counterparty"
+        
+    Returns:
+        PartyInfo for the resolved parties
+        
+    Raises:
+        ValueError: If a party is neither given nor detectable
+    """
+    if original_provided_by not in ("client", "counterparty"):
+        raise ValueError(f"original_provided_by must be 'client' or 'counterparty', got {original_provided_by!r}")
+    
+    prefixes = [p for p in extract_comment_prefixes(comments) if p not in (client, counterparty)]
+    if client is None and prefixes:
+        client = prefixes.pop(0)
+    if counterparty is None and prefixes:
+        counterparty = prefixes.pop(0)
+    if not client or not counterparty:
+        raise ValueError(
+            "Cannot determine both parties from 'For X:' comment prefixes; "
+            "specify client and counterparty explicitly"
+        )
+    
+    detector = PartyDetector.from_document(original_doc)
+    return detector.party_info(client, counterparty, original_provided_by)
 
 
 # =============================================================================
@@ -711,7 +611,8 @@ def generate_original_agreement_md(
     client_names: list[str] | str = "",
     counterparty_names: list[str] | str = "",
     original_provided_by: str = "counterparty",
-    party_info: PartyInfo | None = None
+    party_info: PartyInfo | None = None,
+    analysis_cache_dir: Path | None = None
 ) -> str:
     """
     Generate markdown with the full text of the original agreement.
@@ -726,6 +627,8 @@ def generate_original_agreement_md(
         counterparty_names: Counterparty name(s) to anonymize
         original_provided_by: Who provided the original ("client" or "counterparty")
         party_info: Optional PartyInfo for enhanced YAML output
+        analysis_cache_dir: Optional content-hash keyed analysis cache; the
+            analysis is reused for identical documents
         
     Returns:
         Markdown string with agreement content including clause numbers
@@ -749,6 +652,28 @@ def generate_original_agreement_md(
         party_info=party_info
     )
     
+    def render(analysis_dir: Path) -> str:
+        # Convert to markdown using the module
+        markdown = convert_to_markdown(analysis_dir, source_name)
+        
+        # Anonymize party names in the agreement text
+        if client_names or counterparty_names:
+            markdown = anonymize_text(markdown, client_names, counterparty_names, client_role, counterparty_role)
+        
+        # Wrap with our header
+        lines = [
+            yaml_header,
+            "# Original Agreement",
+            "",
+            "---",
+            "",
+            markdown
+        ]
+        return "\n".join(lines)
+    
+    if analysis_cache_dir is not None:
+        return render(run_analyze_doc_cached(docx_bytes, analysis_cache_dir))
+    
     # Write bytes to temp file for analyze_doc
     with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as tmp:
         tmp.write(docx_bytes)
@@ -761,24 +686,7 @@ def generate_original_agreement_md(
         try:
             # Run analyze_doc to extract blocks with numbering
             run_analyze_doc(tmp_path, analysis_dir)
-            
-            # Convert to markdown using the module
-            markdown = convert_to_markdown(analysis_dir, source_name)
-            
-            # Anonymize party names in the agreement text
-            if client_names or counterparty_names:
-                markdown = anonymize_text(markdown, client_names, counterparty_names, client_role, counterparty_role)
-            
-            # Wrap with our header
-            lines = [
-                yaml_header,
-                "# Original Agreement",
-                "",
-                "---",
-                "",
-                markdown
-            ]
-            return "\n".join(lines)
+            return render(analysis_dir)
             
         finally:
             # Clean up temp docx file
@@ -1124,7 +1032,10 @@ def _format_clause_edit(
         ])
         
         # Changes - show focused before/after snippets
-        change_snippets = _find_change_regions(before_text, after_text, deletions, insertions)
+        change_snippets = _find_change_regions(
+            before_text, after_text, deletions, insertions,
+            spans=_exact_spans(diff, before_text, after_text),
+        )
         
         if change_snippets:
             lines.append("### Changes")
@@ -1331,7 +1242,10 @@ def _format_edit_for_merged(
         ])
         
         # Show focused changes
-        change_snippets = _find_change_regions(before_text, after_text, deletions, insertions)
+        change_snippets = _find_change_regions(
+            before_text, after_text, deletions, insertions,
+            spans=_exact_spans(diff, before_text, after_text),
+        )
         
         if change_snippets:
             lines.append("**Changes:**")
@@ -1418,23 +1332,95 @@ class ChangeRegion:
     after_end: int
     
     def overlaps_with(self, other: 'ChangeRegion', margin: int = 30) -> bool:
-        """Check if two regions overlap or are close enough to merge."""
-        # Check before_text overlap
-        before_overlaps = not (self.before_end + margin < other.before_start or 
-                               other.before_end + margin < self.before_start)
-        # Check after_text overlap  
-        after_overlaps = not (self.after_end + margin < other.after_start or
-                              other.after_end + margin < self.after_start)
+        """Check if two regions overlap or are close enough to merge.
+        
+        A coordinate (before or after text) is only compared when both regions
+        have a position in it (-1 marks a missing position).
+        """
+        before_overlaps = (
+            self.before_start >= 0 and other.before_start >= 0
+            and not (self.before_end + margin < other.before_start or
+                     other.before_end + margin < self.before_start)
+        )
+        after_overlaps = (
+            self.after_start >= 0 and other.after_start >= 0
+            and not (self.after_end + margin < other.after_start or
+                     other.after_end + margin < self.after_start)
+        )
         return before_overlaps or after_overlaps
     
     def merge_with(self, other: 'ChangeRegion') -> 'ChangeRegion':
         """Merge two regions into one spanning both."""
         return ChangeRegion(
-            before_start=min(self.before_start, other.before_start),
+            before_start=_min_position(self.before_start, other.before_start),
             before_end=max(self.before_end, other.before_end),
-            after_start=min(self.after_start, other.after_start),
+            after_start=_min_position(self.after_start, other.after_start),
             after_end=max(self.after_end, other.after_end),
         )
+    
+    @property
+    def sort_key(self) -> int:
+        """Document-order position (before offset, else after offset)."""
+        return self.before_start if self.before_start >= 0 else self.after_start
+
+
+def _min_position(a: int, b: int) -> int:
+    """Smallest of two positions, ignoring missing (-1) ones."""
+    if a < 0 or b < 0:
+        return max(a, b)
+    return min(a, b)
+
+
+def _locate_in_order(text: str, parts: list[str]) -> list[tuple[int, int]]:
+    """
+    Locate each part in text, searching forward from the previous match.
+    
+    Parts are in document order, so each search starts where the previous
+    one ended; the total work is one pass over text rather than one full
+    search per part. Parts that cannot be found are skipped.
+    """
+    positions: list[tuple[int, int]] = []
+    cursor = 0
+    for part in parts:
+        if not part:
+            continue
+        pos = text.find(part, cursor)
+        if pos < 0:
+            # Out-of-order or overlapping part - fall back to a full search
+            pos = text.find(part)
+            if pos < 0:
+                continue
+        positions.append((pos, pos + len(part)))
+        cursor = pos + len(part)
+    return positions
+
+
+def _merge_regions(regions: list[ChangeRegion]) -> list[ChangeRegion]:
+    """Merge overlapping regions with a single sweep over regions sorted by position."""
+    merged: list[ChangeRegion] = []
+    for region in sorted(regions, key=lambda r: r.sort_key):
+        if merged and merged[-1].overlaps_with(region):
+            merged[-1] = merged[-1].merge_with(region)
+        else:
+            merged.append(region)
+    return merged
+
+
+def _exact_spans(
+    diff: ParagraphDiff,
+    before_text: str,
+    after_text: str,
+) -> list[RevisionSpan] | None:
+    """
+    Return the diff's exact revision offsets if they still apply.
+    
+    Offsets refer to the raw paragraph text; once anonymization has changed
+    the text they no longer line up, and the caller must locate changes by
+    search instead.
+    """
+    if diff.changes and before_text == diff.before_text and after_text == diff.after_text:
+        return diff.changes
+    return None
 
 
 def _find_change_regions(
@@ -1442,75 +1428,50 @@ def _find_change_regions(
     after_text: str, 
     deletions: list[str], 
     insertions: list[str],
-    context_chars: int = 20
+    context_chars: int = 20,
+    spans: list[RevisionSpan] | None = None,
 ) -> list[tuple[str, str]]:
     """
     Find all change regions and merge overlapping ones.
     
+    When ``spans`` (exact offsets from the revision stream) are given they are
+    used directly; otherwise deletions/insertions are located in document
+    order in before_text/after_text. The n-th insertion is paired with the
+    n-th deletion to form a replacement region.
+    
     Returns list of (before_snippet, after_snippet) tuples with context.
     """
-    regions: list[ChangeRegion] = []
+    if spans is not None:
+        deletion_positions = [
+            (span.before_start, span.before_end) for span in spans if span.kind == "delete"
+        ]
+        insertion_positions = [
+            (span.after_start, span.after_end) for span in spans if span.kind == "insert"
+        ]
+    else:
+        deletion_positions = _locate_in_order(before_text, deletions)
+        insertion_positions = _locate_in_order(after_text, insertions)
     
-    # Find positions of all deletions in before_text
-    for deletion in deletions:
-        if deletion and deletion in before_text:
-            pos = before_text.find(deletion)
+    regions: list[ChangeRegion] = [
+        ChangeRegion(before_start=start, before_end=end, after_start=-1, after_end=-1)
+        for start, end in deletion_positions
+    ]
+    for index, (start, end) in enumerate(insertion_positions):
+        if index < len(regions):
+            regions[index].after_start = start
+            regions[index].after_end = end
+        else:
             regions.append(ChangeRegion(
-                before_start=pos,
-                before_end=pos + len(deletion),
-                after_start=-1,  # Will be matched with insertion if possible
-                after_end=-1,
+                before_start=-1,
+                before_end=-1,
+                after_start=start,
+                after_end=end,
             ))
     
-    # Find positions of all insertions in after_text
-    for insertion in insertions:
-        if insertion and insertion in after_text:
-            pos = after_text.find(insertion)
-            # Try to find a region without after position to pair with
-            paired = False
-            for region in regions:
-                if region.after_start == -1:
-                    region.after_start = pos
-                    region.after_end = pos + len(insertion)
-                    paired = True
-                    break
-            if not paired:
-                regions.append(ChangeRegion(
-                    before_start=-1,
-                    before_end=-1,
-                    after_start=pos,
-                    after_end=pos + len(insertion),
-                ))
-    
-    # Merge overlapping regions
-    if len(regions) > 1:
-        merged = True
-        while merged:
-            merged = False
-            new_regions = []
-            skip_indices = set()
-            
-            for i, region in enumerate(regions):
-                if i in skip_indices:
-                    continue
-                    
-                current = region
-                for j in range(i + 1, len(regions)):
-                    if j in skip_indices:
-                        continue
-                    if current.overlaps_with(regions[j]):
-                        current = current.merge_with(regions[j])
-                        skip_indices.add(j)
-                        merged = True
-                
-                new_regions.append(current)
-            
-            regions = new_regions
-    
     # Convert regions to aligned before/after snippets
     results: list[tuple[str, str]] = []
     
-    for region in regions:
+    for region in _merge_regions(regions):
         before_snippet, after_snippet = _build_aligned_snippets(
             before_text, after_text, region, context_chars
         )
@@ -1721,7 +1682,8 @@ def _format_paragraph_diff(
         
         change_snippets = _find_change_regions(
             before_text, after_text,
-            deletions, insertions
+            deletions, insertions,
+            spans=_exact_spans(diff, before_text, after_text),
         )
         
         for before_snippet, after_snippet in change_snippets:
@@ -1938,8 +1900,10 @@ def generate_review_example(
     output_dir: Path,
     original_index: int | None = None,
     edited_index: int | None = None,
-    single_file: bool = False
-) -> None:
+    single_file: bool = False,
+    party_resolver: Callable[[Document, list[dict[str, Any]]], PartyInfo] | None = None,
+    analysis_cache_dir: Path | None = None
+) -> list[Path]:
     """
     Generate legal review example markdown files.
     
@@ -1953,34 +1917,43 @@ def generate_review_example(
         original_index: Optional 1-based index for original .docx selection
         edited_index: Optional 1-based index for edited .docx selection
         single_file: If True, combine all outputs into one file
+        party_resolver: Called with the original document and all comments
+            to decide the parties; defaults to the interactive
+            detect_and_confirm_parties (use resolve_parties for batch runs)
+        analysis_cache_dir: Optional content-hash keyed cache of document
+            analyses shared across runs
+        
+    Returns:
+        Paths of the files written
     """
-    # Parse emails
-    print(f"Parsing incoming email: {incoming_path}")
-    incoming_email = parse_msg_file(incoming_path)
-    
-    print(f"Parsing outgoing email: {outgoing_path}")
-    outgoing_email = parse_msg_file(outgoing_path)
-    
-    # Select attachments
-    print("\nSelecting original agreement...")
-    original_attachment = select_docx_attachment(
-        incoming_email.attachments,
-        "Select original agreement:",
-        original_index
-    )
-    print(f"  Selected: {original_attachment.filename}")
+    # Parse emails (attachments are listed, not read, until selected)
+    with MsgParser(incoming_path) as incoming_parser, MsgParser(outgoing_path) as outgoing_parser:
+        print(f"Parsing incoming email: {incoming_path}")
+        incoming_email = incoming_parser.parse_message()
+        
+        print(f"Parsing outgoing email: {outgoing_path}")
+        outgoing_email = outgoing_parser.parse_message()
+        
+        # Select attachments
+        print("\nSelecting original agreement...")
+        original_attachment = select_docx_attachment(
+            incoming_email.attachments,
+            "Select original agreement:",
+            original_index
+        )
+        print(f"  Selected: {original_attachment.filename}")
     
-    print("\nSelecting edited agreement...")
-    edited_attachment = select_docx_attachment(
-        outgoing_email.attachments,
-        "Select edited agreement:",
-        edited_index
-    )
-    print(f"  Selected: {edited_attachment.filename}")
+        print("\nSelecting edited agreement...")
+        edited_attachment = select_docx_attachment(
+            outgoing_email.attachments,
+            "Select edited agreement:",
+            edited_index
+        )
+        print(f"  Selected: {edited_attachment.filename}")
     
-    # Load documents
-    original_doc = Document(BytesIO(original_attachment.data))
-    edited_doc = Document(BytesIO(edited_attachment.data))
+        # Load documents: only the selected attachments are read, over the open handles
+        original_doc = Document(original_attachment.open())
+        edited_doc = Document(edited_attachment.open())
     
     # Extract all comments first (before party detection)
     print("\nExtracting comments...")
@@ -1988,7 +1961,7 @@ def generate_review_example(
     print(f"  Found {len(all_comments)} comments total")
     
     # Detect and confirm parties
-    party_info = detect_and_confirm_parties(original_doc, all_comments)
+    party_info = (party_resolver or detect_and_confirm_parties)(original_doc, all_comments)
     
     # Build lists of name variations to anonymize
     # Uses all_client_names/all_counterparty_names which include prefix, defined term, and alternates
@@ -2007,13 +1980,13 @@ def generate_review_example(
     print(f"  Found: {client_count} for [CLIENT], {counterparty_count} for [COUNTERPARTY]")
     
     print("Processing track changes...")
-    paragraph_diffs = process_track_changes(edited_doc)
+    paragraph_diffs = process_track_changes(edited_attachment.data)
     
     # Build ClauseLookup for both documents (provides clause number, title, text by para_id)
     print("  Building clause lookups...")
     from effilocal.doc.clause_lookup import ClauseLookup
-    edited_lookup = ClauseLookup.from_docx_bytes(edited_attachment.data)
-    original_lookup = ClauseLookup.from_docx_bytes(original_attachment.data)
+    edited_lookup = ClauseLookup.from_docx_bytes(edited_attachment.data, analysis_cache_dir)
+    original_lookup = ClauseLookup.from_docx_bytes(original_attachment.data, analysis_cache_dir)
     
     # Build paragraph_text_map for backward compatibility (used by _format_clause_comments_only)
     paragraph_text_map = edited_lookup.to_text_map()
@@ -2065,7 +2038,8 @@ def generate_review_example(
         client_names=client_names,
         counterparty_names=counterparty_names,
         original_provided_by=party_info.original_provided_by,
-        party_info=party_info
+        party_info=party_info,
+        analysis_cache_dir=analysis_cache_dir
     )
     comments_md = generate_comments_md(
         categorized_comments, 
@@ -2102,6 +2076,7 @@ def generate_review_example(
     
     # Write output
     output_dir.mkdir(parents=True, exist_ok=True)
+    written: list[Path] = []
     
     if single_file:
         # Use merged review_edits instead of separate comments + track_changes
@@ -2115,6 +2090,7 @@ def generate_review_example(
         mappings_file = output_dir / "00_mappings.md"
         mappings_file.write_text(mappings_md, encoding="utf-8")
         print(f"Generated: {mappings_file}")
+        written.extend([output_file, mappings_file])
     else:
         files = [
             ("00_mappings.md", mappings_md),
@@ -2128,8 +2104,10 @@ def generate_review_example(
             output_file = output_dir / filename
             output_file.write_text(content, encoding="utf-8")
             print(f"  Generated: {output_file}")
+            written.append(output_file)
     
     print("\nDone!")
+    return written
 
 
 # =============================================================================
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from lxml import etree
+
+from effilocal.doc.numbering_inspector import (
+    NumberingInspector,
+    iter_paragraphs,
+    parse_docx_parts,
+)
+from effilocal.doc.numbering_inspector.model import NS
+
+
+def _fixture_path(name: str) -> Path:
+    base = Path(__file__).resolve().parent.parent / "fixtures"
+    return base / name
+
+
+def _xpath_paragraph(para_node, idx: int) -> tuple:
+    """Reference extraction using the xpath queries the walk replaced."""
+    numpr = para_node.xpath("./w:pPr/w:numPr", namespaces=NS)
+    direct = None
+    if numpr:
+        ilvl = numpr[0].xpath("./w:ilvl/@w:val", namespaces=NS)
+        num_id = numpr[0].xpath("./w:numId/@w:val", namespaces=NS)
+        direct = {
+            "numId": int(num_id[0]) if num_id else None,
+            "ilvl": int(ilvl[0]) if ilvl else 0,
+            "numRestart": bool(numpr[0].xpath("./w:numRestart", namespaces=NS)),
+        }
+    style = para_node.xpath("./w:pPr/w:pStyle/@w:val", namespaces=NS)
+    return (
+        idx,
+        (para_node.xpath("./@w14:paraId", namespaces=NS) or [""])[0],
+        style[0] if style else "",
+        "".join(para_node.xpath(".//w:t/text()", namespaces=NS)).strip(),
+        direct,
+    )
+
+
+def test_attribute_walk_matches_xpath_extraction() -> None:
+    for name in ("numbering_decimal.docx", "numbering_restart.docx", "lists.docx", "table.docx"):
+        doc_tree, _, _ = parse_docx_parts(_fixture_path(name))
+        expected = [
+            _xpath_paragraph(node, idx)
+            for idx, node in enumerate(doc_tree.xpath("//w:body//w:p", namespaces=NS))
+        ]
+        actual = [
+            (p.idx, p.para_id, p.style_id, p.text, p.direct_numpr) for p in iter_paragraphs(doc_tree)
+        ]
+        assert actual == expected, name
+
+
+def test_iter_paragraphs_accepts_caller_elements() -> None:
+    doc_tree, _, _ = parse_docx_parts(_fixture_path("numbering_decimal.docx"))
+    body = doc_tree.getroot().find(f"{{{NS['w']}}}body")
+    elements = list(body.iter(f"{{{NS['w']}}}p"))
+
+    from_tree = list(iter_paragraphs(doc_tree))
+    from_elements = list(iter_paragraphs(iter(elements)))
+
+    assert from_elements == from_tree
+
+
+def test_from_docx_defers_document_parse() -> None:
+    path = _fixture_path("numbering_decimal.docx")
+    inspector = NumberingInspector.from_docx(path)
+
+    assert inspector._doc_tree is None
+    inspector.style_has_numbering("ListParagraph")
+    assert inspector._doc_tree is None
+
+    rows, _ = inspector.analyze()
+
+    assert isinstance(inspector.doc_tree, etree._ElementTree)
+    doc_tree, num_tree, styles_tree = parse_docx_parts(path)
+    eager = NumberingInspector(doc_tree=doc_tree, num_tree=num_tree, styles_tree=styles_tree)
+    assert rows == eager.analyze()[0]
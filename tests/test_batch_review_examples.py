@@ -0,0 +1,152 @@
+"""Tests for the batch review example front end."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from docx import Document
+
+from scripts import docx_to_llm_markdown
+from scripts.batch_review_examples import (
+    REPORT_FILENAME,
+    PairJob,
+    discover_pairs,
+    load_mapping,
+    process_pair,
+    run_batch,
+    summarize,
+)
+from scripts.generate_review_example import resolve_parties
+
+LAMPLIGHT_DIR = Path(__file__).parent.parent / "EL_Projects" / "Lamplight" / "instructions"
+EARLY_MSG = LAMPLIGHT_DIR / "RE Lamplight agreement .msg"  # sent 10:48
+LATE_MSG = LAMPLIGHT_DIR / "Re Lamplight agreement 1.msg"  # sent 13:03
+FIXTURE_DOCX = Path(__file__).parent / "fixtures" / "numbering_decimal.docx"
+
+
+def _fake_generate(output_dir: Path, **_kwargs) -> list[Path]:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / "01_instructions.md"
+    path.write_text("ok", encoding="utf-8")
+    return [path]
+
+
+class TestDiscoverPairs:
+    """Pair discovery from a directory tree."""
+
+    def test_orders_pair_by_sent_date(self, tmp_path: Path):
+        pair_dir = tmp_path / "lamplight"
+        pair_dir.mkdir()
+        # Name order is the reverse of date order
+        shutil.copy(LATE_MSG, pair_dir / "a.msg")
+        shutil.copy(EARLY_MSG, pair_dir / "b.msg")
+        (tmp_path / "incomplete").mkdir()
+        shutil.copy(EARLY_MSG, tmp_path / "incomplete" / "only.msg")
+
+        jobs = discover_pairs(tmp_path)
+
+        assert [job.pair_id for job in jobs] == ["lamplight"]
+        assert jobs[0].incoming.name == "b.msg"
+        assert jobs[0].outgoing.name == "a.msg"
+
+
+class TestLoadMapping:
+    """JSONL mapping files."""
+
+    def test_resolves_paths_relative_to_mapping(self, tmp_path: Path):
+        mapping = tmp_path / "pairs.jsonl"
+        mapping.write_text(
+            json.dumps({"id": "p1", "incoming": "in.msg", "outgoing": "out.msg", "client": "Acme"})
+            + "\n\n"
+            + json.dumps({"incoming": "x/second.msg", "outgoing": "x/reply.msg", "edited_index": 2})
+            + "\n",
+            encoding="utf-8",
+        )
+
+        jobs = load_mapping(mapping)
+
+        assert jobs[0] == PairJob("p1", tmp_path / "in.msg", tmp_path / "out.msg", client="Acme")
+        assert jobs[1].pair_id == "second"
+        assert jobs[1].edited_index == 2
+
+    def test_missing_path_is_reported_with_line(self, tmp_path: Path):
+        mapping = tmp_path / "pairs.jsonl"
+        mapping.write_text(json.dumps({"incoming": "in.msg"}) + "\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="pairs.jsonl:1: missing 'outgoing'"):
+            load_mapping(mapping)
+
+
+class TestRunBatch:
+    """Batch execution, error capture and reporting."""
+
+    def test_failures_are_reported_not_raised(self, tmp_path: Path):
+        job = PairJob("missing", tmp_path / "nope.msg", tmp_path / "nope2.msg")
+
+        result = process_pair(job, tmp_path / "out", tmp_path / "cache")
+
+        assert result.status == "error"
+        assert result.error.startswith("FileNotFoundError")
+        assert "FileNotFoundError" in (tmp_path / "out" / "missing" / "generate.log").read_text()
+
+    def test_writes_report_in_job_order(self, tmp_path: Path):
+        jobs = [PairJob(name, tmp_path / "in.msg", tmp_path / "out.msg") for name in ("b", "a")]
+
+        with patch("scripts.batch_review_examples.generate_review_example", side_effect=_fake_generate):
+            results = run_batch(jobs, tmp_path / "corpus", workers=1)
+
+        report = [json.loads(line) for line in (tmp_path / "corpus" / REPORT_FILENAME).read_text().splitlines()]
+        assert [row["pair_id"] for row in report] == ["b", "a"]
+        assert all(row["status"] == "ok" and row["files"] == ["01_instructions.md"] for row in report)
+        assert summarize(results)["ok"] == 2
+
+    def test_rejects_duplicate_pair_ids(self, tmp_path: Path):
+        jobs = [PairJob("same", tmp_path / "a.msg", tmp_path / "b.msg")] * 2
+
+        with pytest.raises(ValueError, match="Duplicate pair ids: same"):
+            run_batch(jobs, tmp_path / "corpus", workers=1)
+
+
+class TestAnalysisCache:
+    """Content-hash keyed analysis reuse."""
+
+    def test_identical_bytes_are_analyzed_once(self, tmp_path: Path):
+        data = FIXTURE_DOCX.read_bytes()
+
+        with patch.object(
+            docx_to_llm_markdown, "run_analyze_doc", wraps=docx_to_llm_markdown.run_analyze_doc
+        ) as analyze:
+            first = docx_to_llm_markdown.run_analyze_doc_cached(data, tmp_path)
+            second = docx_to_llm_markdown.run_analyze_doc_cached(data, tmp_path)
+
+        assert analyze.call_count == 1
+        assert first == second
+        assert (first / "blocks.jsonl").exists()
+        assert [p.name for p in tmp_path.iterdir()] == [first.name]
+
+
+class TestResolveParties:
+    """Non-interactive party resolution."""
+
+    def test_defaults_to_comment_prefix_order(self):
+        comments = [{"text": "For Acme: please review"}, {"text": "For Globex: noted"}]
+
+        info = resolve_parties(Document(), comments)
+
+        assert (info.client_prefix, info.counterparty_prefix) == ("Acme", "Globex")
+        assert info.original_provided_by == "counterparty"
+
+    def test_explicit_client_takes_precedence(self):
+        comments = [{"text": "For Acme: please review"}, {"text": "For Globex: noted"}]
+
+        info = resolve_parties(Document(), comments, client="Globex", original_provided_by="client")
+
+        assert (info.client_prefix, info.counterparty_prefix) == ("Globex", "Acme")
+
+    def test_raises_when_parties_unknown(self):
+        with pytest.raises(ValueError, match="specify client and counterparty"):
+            resolve_parties(Document(), [])
@@ -0,0 +1,147 @@
+"""Tests for the indexed, compacting chat history store."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from effilocal.flows import chat_history
+from effilocal.flows.chat_history import (
+    ChatHistoryStore,
+    append_history_entries,
+    clear_history,
+    history_entries_to_messages,
+    load_history_entries,
+)
+
+
+def _message(index: int, role: str = "user") -> dict:
+    return {"type": "message", "role": role, "content": f"message {index}", "token_count": 2}
+
+
+@pytest.fixture
+def root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(chat_history, "CHAT_ARTIFACTS_ROOT", tmp_path)
+    monkeypatch.setattr(chat_history, "_STORES", {})
+    return tmp_path
+
+
+class TestTailIndex:
+    """The last N entries load through the offset index."""
+
+    def test_tail_returns_newest_entries(self, tmp_path: Path):
+        with ChatHistoryStore(tmp_path / "doc", flush_every=4) as store:
+            store.append([_message(index) for index in range(10)])
+
+            assert [entry["content"] for entry in store.tail(3)] == ["message 7", "message 8", "message 9"]
+            assert len(store.tail(None)) == 10
+            assert len(store) == 10
+
+        assert (tmp_path / "doc" / "chat_history.idx").stat().st_size == 10 * 8
+
+    def test_tail_reads_only_the_requested_bytes(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        with ChatHistoryStore(tmp_path / "doc") as store:
+            store.append([_message(index) for index in range(200)])
+            store.flush()
+            decoded: list[bytes] = []
+            original = chat_history._decode
+            monkeypatch.setattr(chat_history, "_decode", lambda line: decoded.append(line) or original(line))
+
+            store.tail(5)
+
+        assert len(decoded) == 6  # five entries plus the first line probed for a checkpoint
+
+    def test_unindexed_log_is_caught_up(self, tmp_path: Path):
+        directory = tmp_path / "doc"
+        directory.mkdir()
+        # A log written before the index existed, ending in a torn line
+        lines = [json.dumps(_message(index)) for index in range(5)]
+        (directory / "chat_history.jsonl").write_text("\n".join(lines) + "\n{\"type\": \"mess", encoding="utf-8")
+
+        store = ChatHistoryStore(directory)
+        store.append([_message(5)])
+        entries = store.tail(None)
+        store.close()
+
+        assert [entry["content"] for entry in entries] == [f"message {index}" for index in range(6)]
+        assert ChatHistoryStore(directory).tail(1)[0]["content"] == "message 5"
+
+    def test_missing_log_with_stale_index_loads_nothing(self, tmp_path: Path):
+        directory = tmp_path / "doc"
+        with ChatHistoryStore(directory) as store:
+            store.append([_message(0)])
+        (directory / "chat_history.jsonl").unlink()
+
+        assert ChatHistoryStore(directory).tail(None) == []
+        assert not (directory / "chat_history.idx").exists()
+
+
+class TestCompaction:
+    """Long histories compact into a checkpoint plus recent entries."""
+
+    def test_compaction_archives_and_checkpoints(self, tmp_path: Path):
+        directory = tmp_path / "doc"
+        store = ChatHistoryStore(directory, compact_after=10, keep=4, flush_every=1)
+        for index in range(11):
+            store.append([_message(index, "user" if index % 2 == 0 else "assistant")])
+        store.close()
+
+        entries = ChatHistoryStore(directory).tail(None)
+        checkpoint = entries[0]
+        assert checkpoint["type"] == "checkpoint"
+        assert checkpoint["archived_entries"] == 7
+        assert checkpoint["summary"].splitlines()[0] == "- User: message 0"
+        assert [entry["content"] for entry in entries[1:]] == [f"message {index}" for index in range(7, 11)]
+        archived = (directory / "chat_history.archive.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(archived) == 7
+        # A limited tail still carries the checkpoint
+        assert [entry.get("content", "checkpoint") for entry in ChatHistoryStore(directory).tail(1)] == [
+            "checkpoint",
+            "message 10",
+        ]
+
+    def test_custom_summarizer_sees_previous_summary(self, tmp_path: Path):
+        calls: list[tuple[str, int]] = []
+
+        def summarizer(previous: str, entries) -> str:
+            calls.append((previous, len(entries)))
+            return f"summary {len(calls)}"
+
+        store = ChatHistoryStore(tmp_path / "doc", compact_after=4, keep=2, flush_every=1, summarizer=summarizer)
+        for index in range(9):
+            store.append([_message(index)])
+        store.close()
+
+        # The checkpoint counts towards the threshold once it exists
+        assert calls == [("", 3), ("summary 1", 2), ("summary 2", 2)]
+        assert store.tail(None)[0]["summary"] == "summary 3"
+
+    def test_checkpoint_becomes_developer_message(self):
+        checkpoint = {"type": "checkpoint", "summary": "- User: term?", "archived_entries": 3}
+
+        messages = history_entries_to_messages([checkpoint, _message(1)], "doc")
+
+        assert messages[0]["role"] == "developer"
+        assert messages[0]["content"].endswith("- User: term?")
+        assert messages[1]["role"] == "user"
+
+
+class TestModuleHelpers:
+    """Module-level helpers share one buffered store per document."""
+
+    def test_append_load_and_clear(self, root: Path):
+        append_history_entries("doc", [_message(0), _message(1, "assistant")])
+
+        assert [entry["content"] for entry in load_history_entries("doc", limit=1)] == ["message 1"]
+        assert len(load_history_entries("doc")) == 2
+
+        clear_history("doc")
+
+        assert not (root / "doc").exists()
+        assert load_history_entries("doc") == []
+
+    def test_missing_history_creates_nothing(self, root: Path):
+        assert load_history_entries("absent") == []
+        assert not (root / "absent").exists()
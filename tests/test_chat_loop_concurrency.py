@@ -0,0 +1,116 @@
+"""Tests for concurrent tool-call execution in the chat loop."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Mapping
+
+import pytest
+
+pytest.importorskip("logfire")
+pytest.importorskip("shared.structured")
+
+from effilocal.flows import chat_loop  # noqa: E402
+from effilocal.flows import dispatcher as flow_dispatcher  # noqa: E402
+from effilocal.flows.chat_history import ConversationRecorder  # noqa: E402
+
+
+class FakeStream:
+    def __init__(self, events: list[Any]) -> None:
+        self._events = events
+
+    def __enter__(self) -> list[Any]:
+        return self._events
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+class FakeClient:
+    """Streams a fixed list of events and records the request."""
+
+    def __init__(self, events: list[Any]) -> None:
+        self.requests: list[dict[str, Any]] = []
+        self.responses = SimpleNamespace(stream=self._stream)
+        self._events = events
+
+    def _stream(self, **kwargs: Any) -> FakeStream:
+        self.requests.append(kwargs)
+        return FakeStream(self._events)
+
+
+def _tool_event(name: str, **arguments: Any) -> SimpleNamespace:
+    event = SimpleNamespace(
+        type="response.tool_call",
+        function=SimpleNamespace(name=name, arguments=json.dumps(arguments)),
+        result=None,
+        submitted=[],
+    )
+    event.submit = lambda: event.submitted.append(time.perf_counter())
+    return event
+
+
+def _completed(text: str = "done") -> SimpleNamespace:
+    return SimpleNamespace(type="response.completed", response=SimpleNamespace(output_text=text))
+
+
+@pytest.fixture(autouse=True)
+def _prompts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(chat_loop, "_load_developer_prompt", lambda: "developer")
+    monkeypatch.setattr(chat_loop, "list_tools", lambda: [])
+
+
+def _run(client: FakeClient, recorder: ConversationRecorder | None = None) -> str:
+    return chat_loop.run_chat_loop(client=client, model="test", doc_id="doc", question="q", recorder=recorder)
+
+
+class TestConcurrentToolCalls:
+    """Read-only tools overlap; results stay in call order."""
+
+    def test_parallel_calls_overlap_and_record_in_order(self, monkeypatch: pytest.MonkeyPatch):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_run_tool_call(payload: Mapping[str, Any]) -> dict[str, Any]:
+            section_id = payload["function"]["arguments"]["section_id"]
+            barrier.wait()  # both calls must be in flight at once
+            if section_id == "first":
+                time.sleep(0.05)  # finishes last, is still delivered first
+            return {"section_id": section_id, "blocks": [], "truncated": False, "next_page": None}
+
+        monkeypatch.setattr(flow_dispatcher, "run_tool_call", fake_run_tool_call)
+        first = _tool_event("get_section", doc_id="doc", section_id="first")
+        second = _tool_event("get_section", doc_id="doc", section_id="second")
+        client = FakeClient([first, second, _completed()])
+        recorder = ConversationRecorder()
+
+        assert _run(client, recorder) == "done"
+
+        assert client.requests[0]["parallel_tool_calls"] is True
+        assert [entry["result"]["section_id"] for entry in recorder.entries] == ["first", "second"]
+        assert json.loads(first.result)["section_id"] == "first"
+        assert first.submitted[0] <= second.submitted[0]
+
+    def test_pages_are_prefetched_and_merged_in_order(self, monkeypatch: pytest.MonkeyPatch):
+        requested: list[Any] = []
+        pages = {None: ("p1", ["b0"]), "p1": ("p2", ["b1"]), "p2": (None, ["b2"])}
+
+        def fake_run_tool_call(payload: Mapping[str, Any]) -> dict[str, Any]:
+            token = payload["function"]["arguments"].get("page_token")
+            requested.append(token)
+            next_page, block_ids = pages[token]
+            return {
+                "blocks": [{"id": block_id} for block_id in block_ids],
+                "truncated": next_page is not None,
+                "next_page": next_page,
+            }
+
+        monkeypatch.setattr(flow_dispatcher, "run_tool_call", fake_run_tool_call)
+        event = _tool_event("get_content_by_range", doc_id="doc", start_block=0, end_block=2)
+
+        _run(FakeClient([event, _completed()]))
+
+        assert requested == [None, "p1", "p2"]
+        assert [block["id"] for block in json.loads(event.result)["blocks"]] == ["b0", "b1", "b2"]
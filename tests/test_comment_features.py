@@ -529,5 +529,67 @@ class TestCommentTestUtilities:
                 assert root is not None, f"Should parse {xml_file}"
 
 
+# ============================================================================
+# Test: single-pass body scan
+# ============================================================================
+
+def _set_para_id(paragraph, para_id: str) -> None:
+    paragraph._p.set(qn('w14:paraId'), para_id)
+
+
+@pytest.fixture
+def anchored_doc():
+    """Comments anchored in a body paragraph, an SDT-wrapped paragraph and a table cell."""
+    doc = Document()
+    intro = doc.add_paragraph("Intro text here")
+    _set_para_id(intro, "0000000A")
+    doc.add_comment(intro.runs, text="On intro", author="A")
+
+    wrapped = doc.add_paragraph("Wrapped clause")
+    _set_para_id(wrapped, "0000000B")
+    doc.add_comment(wrapped.runs, text="On wrapped", author="B")
+    sdt = wrapped._p.makeelement(qn('w:sdt'), {})
+    content = sdt.makeelement(qn('w:sdtContent'), {})
+    sdt.append(content)
+    wrapped._p.addprevious(sdt)
+    content.append(wrapped._p)
+
+    cell_paragraph = doc.add_table(rows=1, cols=1).cell(0, 0).paragraphs[0]
+    _set_para_id(cell_paragraph, "0000000C")
+    run = cell_paragraph.add_run("Cell text")
+    doc.add_comment([run], text="On cell", author="C")
+
+    closing = doc.add_paragraph("Closing words")
+    _set_para_id(closing, "0000000D")
+    return doc
+
+
+class TestSinglePassBodyScan:
+    """extract_all_comments gathers anchors, reference and paragraph text in one walk."""
+
+    def test_anchors_in_body_sdt_and_table(self, anchored_doc):
+        comments = {c['text']: c for c in extract_all_comments(anchored_doc)}
+
+        assert (comments['On intro']['paragraph_index'], comments['On intro']['doc_para_id']) == (0, "0000000A")
+        assert (comments['On wrapped']['paragraph_index'], comments['On wrapped']['doc_para_id']) == (1, "0000000B")
+        assert (comments['On cell']['paragraph_index'], comments['On cell']['doc_para_id']) == (None, "0000000C")
+        assert [comments[key]['reference_text'] for key in ('On intro', 'On wrapped', 'On cell')] == [
+            "Intro text here",
+            "Wrapped clause",
+            "Cell text",
+        ]
+
+    def test_paragraph_and_reference_text_maps(self, anchored_doc):
+        from effilocal.mcp_server.core.comments import get_all_paragraph_texts, get_all_reference_texts
+
+        assert get_all_paragraph_texts(anchored_doc) == {
+            "0000000A": "Intro text here",
+            "0000000B": "Wrapped clause",
+            "0000000C": "Cell text",
+            "0000000D": "Closing words",
+        }
+        assert sorted(get_all_reference_texts(anchored_doc).values()) == ["Cell text", "Intro text here", "Wrapped clause"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
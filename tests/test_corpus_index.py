@@ -0,0 +1,125 @@
+"""Tests for the cross-document clause index."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from effilocal.corpus_index import CorpusIndex, default_corpus_roots
+
+PREAMBLE = "This Agreement is dated 3rd March 2024 between Acme Widgets Limited and Globex Corporation Limited."
+
+
+def _write_analysis(directory: Path, sections: list[tuple[str, str | None, list[tuple[str, str]]]], *, preamble: str = PREAMBLE) -> Path:
+    """Write a minimal analysis; each section is (title, role, [(ordinal, text), ...])."""
+    directory.mkdir(parents=True, exist_ok=True)
+    blocks = [{"id": "pre", "type": "paragraph", "text": preamble}]
+    children = []
+    for number, (title, role, clauses) in enumerate(sections, start=1):
+        block_ids = []
+        for ordinal, text in clauses:
+            block_id = f"s{number}-{len(block_ids)}"
+            blocks.append({"id": block_id, "type": "list_item", "text": text, "list": {"ordinal": ordinal}})
+            block_ids.append(block_id)
+        children.append({"id": f"sec-{number}", "title": title, "level": 1, "role": role, "block_ids": block_ids, "children": []})
+    with open(directory / "blocks.jsonl", "w", encoding="utf-8") as f:
+        for block in blocks:
+            f.write(json.dumps(block) + "\n")
+    (directory / "sections.json").write_text(json.dumps({"doc_id": "doc", "root": {"children": children}}), encoding="utf-8")
+    (directory / "manifest.json").write_text(json.dumps({"doc_id": "doc", "created_at": "2025-01-01T00:00:00+00:00"}), encoding="utf-8")
+    (directory / "index.json").write_text(json.dumps({"doc_id": "doc", "source_filename": f"{directory.name}.docx"}), encoding="utf-8")
+    return directory
+
+
+SUPPLY = [
+    ("1. Definitions", "definitions", [("1.", "1. Definitions. In this Agreement Losses means all losses.")]),
+    ("2. LIMITATION OF LIABILITY. The Supplier's liability", None, [("2.", "2. LIMITATION OF LIABILITY. The Supplier's liability is capped at the fees.")]),
+    ("3. Term", None, [("3.", "3. Term. This Agreement continues for one year and limits nothing.")]),
+]
+LICENCE = [
+    ("1. Licence", None, [("1.", "1. Licence. The Licensor grants a licence.")]),
+    ("2. Limitation of liability", None, [("2.", "2. Limitation of liability. Neither party limits liability for fraud.")]),
+]
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> Path:
+    _write_analysis(tmp_path / "EL_Precedents" / "analysis" / "supply", SUPPLY)
+    _write_analysis(
+        tmp_path / "EL_Projects" / "Beta" / "analysis" / "licence",
+        LICENCE,
+        preamble="Dated 15 January 2023 between Initech Limited and Hooli Limited.",
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def index(library: Path):
+    with CorpusIndex(library / "corpus.sqlite") as corpus:
+        corpus.update(default_corpus_roots(library))
+        yield corpus
+
+
+class TestSearch:
+    """Filtered clause queries across documents."""
+
+    def test_title_query_spans_documents(self, index: CorpusIndex):
+        hits = index.search(title="limitation of liability")
+
+        assert sorted((hit.project, hit.ordinal, hit.title) for hit in hits) == [
+            ("Beta", "2.", "Limitation of liability"),
+            ("EL_Precedents", "2.", "LIMITATION OF LIABILITY"),
+        ]
+        assert all(hit.block_id and hit.block_id.startswith("s2-") for hit in hits)
+
+    def test_heading_matches_outrank_body_matches(self, index: CorpusIndex):
+        hits = index.search("limits")
+
+        assert hits[0].title == "Limitation of liability"
+        assert {hit.title for hit in hits} >= {"Term"}
+
+    def test_role_party_and_date_filters(self, index: CorpusIndex):
+        assert [hit.title for hit in index.search(role="definitions")] == ["Definitions"]
+        assert {hit.project for hit in index.search(party="initech")} == {"Beta"}
+        assert {hit.doc_date for hit in index.search(date_from="2024-01-01")} == {"2024-03-03"}
+        assert index.search(title="liability", date_to="2023-12-31")[0].source_filename == "licence.docx"
+
+    def test_query_terms_are_quoted(self, index: CorpusIndex):
+        assert index.search('liability" OR "term') == []
+
+
+class TestIncrementalUpdate:
+    """Only changed documents are rewritten."""
+
+    def test_unchanged_documents_are_skipped(self, library: Path, index: CorpusIndex):
+        stats = index.update(default_corpus_roots(library))
+
+        assert (stats.added, stats.updated, stats.unchanged) == (0, 0, 2)
+
+    def test_reanalyzed_document_is_replaced_in_place(self, library: Path, index: CorpusIndex):
+        licence_dir = library / "EL_Projects" / "Beta" / "analysis" / "licence"
+        _write_analysis(licence_dir, [("1. Indemnity", None, [("1.", "1. Indemnity. Each party indemnifies.")])])
+        os.utime(licence_dir / "blocks.jsonl", ns=(1, 1))
+
+        assert index.index_document(licence_dir)
+        assert not index.index_document(licence_dir)
+        assert [hit.project for hit in index.search(title="limitation")] == ["EL_Precedents"]
+        assert [hit.title for hit in index.search(project="Beta")] == ["Indemnity"]
+
+    def test_removed_documents_are_dropped(self, library: Path, index: CorpusIndex):
+        for path in (library / "EL_Projects" / "Beta" / "analysis" / "licence").iterdir():
+            path.unlink()
+
+        stats = index.update(default_corpus_roots(library))
+
+        assert stats.removed == 1
+        assert index.document_count() == 1
+
+    def test_index_persists_across_connections(self, library: Path, index: CorpusIndex):
+        index.close()
+
+        with CorpusIndex(library / "corpus.sqlite") as reopened:
+            assert len(reopened.search(title="liability")) == 2
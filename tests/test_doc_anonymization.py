@@ -325,6 +325,74 @@ class TestAnonymizeTextEdgeCases:
         assert "Vendor" not in result
 
 
+# =============================================================================
+# Tests: Anonymizer
+# =============================================================================
+
+
+class TestAnonymizer:
+    """Tests for the precompiled Anonymizer engine."""
+    
+    def test_from_party_info_uses_role_placeholders(self, simple_party_info) -> None:
+        """Should replace every party name with the semantic role placeholder."""
+        from effilocal.doc.anonymization import Anonymizer
+        
+        anonymizer = Anonymizer.from_party_info(simple_party_info)
+        result = anonymizer.anonymize('Didimo Inc ("Vendor") and NBCUniversal ("Company").')
+        
+        assert result == '[SUPPLIER] ("[SUPPLIER]") and [CUSTOMER] ("[CUSTOMER]").'
+    
+    def test_collapses_or_pattern_only_within_one_party(self) -> None:
+        """Mixed-party ("X" or "Y") patterns should be replaced name by name."""
+        from effilocal.doc.anonymization import Anonymizer
+        
+        anonymizer = Anonymizer(["Vendor", "Didimo"], ["Company"])
+        
+        assert anonymizer('("Vendor" or "Didimo")') == '("[CLIENT]")'
+        assert anonymizer('("Vendor" or "Company")') == '("[CLIENT]" or "[COUNTERPARTY]")'
+    
+    def test_client_wins_for_shared_name(self) -> None:
+        """A name listed for both parties should map to the client, as before."""
+        from effilocal.doc.anonymization import Anonymizer
+        
+        anonymizer = Anonymizer(["Party"], ["Party", "Company"])
+        
+        assert anonymizer.anonymize("The Party and the Company.") == "The [CLIENT] and the [COUNTERPARTY]."
+    
+    def test_empty_anonymizer_returns_text_unchanged(self) -> None:
+        """An anonymizer without names should be falsy and a no-op."""
+        from effilocal.doc.anonymization import Anonymizer
+        
+        anonymizer = Anonymizer("", [])
+        
+        assert not anonymizer
+        assert anonymizer.anonymize("The Vendor.") == "The Vendor."
+    
+    def test_matches_anonymize_text_on_500_paragraph_contract(self, simple_party_info) -> None:
+        """Anonymizing a whole contract in one go should match per-paragraph anonymize_text."""
+        from effilocal.doc.anonymization import Anonymizer, anonymize_text
+        from scripts.benchmark_anonymization import synthetic_contract
+        
+        paragraphs = synthetic_contract(500)
+        client_role = simple_party_info.client_placeholder.strip("[]")
+        counterparty_role = simple_party_info.counterparty_placeholder.strip("[]")
+        
+        expected = [
+            anonymize_text(
+                text,
+                simple_party_info.all_client_names,
+                simple_party_info.all_counterparty_names,
+                client_role,
+                counterparty_role,
+            )
+            for text in paragraphs
+        ]
+        result = Anonymizer.from_party_info(simple_party_info).anonymize_many(paragraphs)
+        
+        assert result == expected
+        assert not any("Vendor" in text or "Company" in text for text in result)
+
+
 # =============================================================================
 # Tests: generate_yaml_header - Basic
 # =============================================================================
@@ -860,6 +860,104 @@ class TestPartyInfo:
         assert "" not in counterparty_names
 
 
+# =============================================================================
+# Tests: PartyDetector
+# =============================================================================
+
+
+def _docx_bytes(doc: Document) -> bytes:
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+class TestPartyDetector:
+    """Tests for single-pass PartyDetector."""
+    
+    def test_from_docx_matches_extract_functions(self, simple_doc: Document) -> None:
+        """Reading raw XML should give the same results as the per-Document extractors."""
+        from effilocal.doc.party_detection import (
+            PartyDetector,
+            extract_company_names,
+            extract_company_to_defined_term_mapping,
+            extract_defined_party_terms,
+            extract_full_company_names,
+            extract_party_alternate_names,
+        )
+        
+        detector = PartyDetector.from_docx(_docx_bytes(simple_doc))
+        
+        assert detector.defined_terms == extract_defined_party_terms(simple_doc)
+        assert detector.company_names == extract_company_names(simple_doc)
+        assert detector.full_company_names == extract_full_company_names(simple_doc)
+        assert detector.company_to_term == extract_company_to_defined_term_mapping(simple_doc)
+        assert detector.alternate_names == extract_party_alternate_names(simple_doc)
+    
+    def test_from_docx_reads_table_cells_for_defined_terms(self) -> None:
+        """Defined terms used only inside tables should still be found."""
+        from effilocal.doc.party_detection import PartyDetector
+        
+        doc = Document()
+        doc.add_paragraph("Preamble.")
+        table = doc.add_table(rows=1, cols=1)
+        table.cell(0, 0).text = "The Licensor shall deliver the Software."
+        
+        detector = PartyDetector.from_docx(_docx_bytes(doc))
+        
+        assert detector.defined_terms == ["Licensor"]
+        assert detector.preamble == ["Preamble."]
+    
+    def test_from_blocks_splits_paragraphs_and_cells(self) -> None:
+        """Blocks with table info should only feed the defined-term scan."""
+        from effilocal.doc.party_detection import PartyDetector
+        
+        blocks = [
+            {"type": "paragraph", "text": ""},
+            {"type": "paragraph", "text": 'Acme Ltd ("Supplier") and Beta Inc. ("Customer").'},
+            {"type": "table_cell", "text": "Supplier shall invoice.", "table": {"row": 0, "col": 0}},
+        ]
+        
+        detector = PartyDetector.from_blocks(blocks, max_paragraphs=1)
+        
+        assert detector.preamble == [blocks[1]["text"]]
+        assert detector.company_to_term == {"Acme": "Supplier", "Beta": "Customer"}
+        assert detector.defined_terms == ["Supplier"]
+    
+    def test_party_info_resolves_terms_roles_and_alternates(self, simple_doc: Document) -> None:
+        """party_info should build the complete PartyInfo from comment prefixes."""
+        from effilocal.doc.party_detection import PartyDetector
+        
+        detector = PartyDetector.from_document(simple_doc)
+        
+        info = detector.party_info("Didimo", "NBCUniversal", original_provided_by="counterparty")
+        
+        assert info.client_defined_term == "Vendor"
+        assert info.counterparty_defined_term == "Company"
+        assert info.client_role == "supplier"
+        assert info.counterparty_role == "customer"
+        assert info.client_alternate_names == ["Vendor", "Didimo, Inc.", "DIDIMO, INC."]
+        assert "NBCUniversal Media, LLC" in info.counterparty_alternate_names
+        assert "NBCUniversal" in info.all_counterparty_names
+    
+    def test_party_info_keeps_unmatched_identifier(self) -> None:
+        """Without any detected terms, the identifier itself becomes the defined term."""
+        from effilocal.doc.party_detection import PartyDetector
+        
+        info = PartyDetector(["No parties here."]).party_info("Alpha", "Beta")
+        
+        assert info.client_defined_term == "Alpha"
+        assert info.counterparty_defined_term == "Beta"
+        assert info.client_role == "party"
+    
+    def test_extractors_are_memoized(self, simple_doc: Document) -> None:
+        """Each extractor should run once per detector."""
+        from effilocal.doc.party_detection import PartyDetector
+        
+        detector = PartyDetector.from_document(simple_doc)
+        
+        assert detector.alternate_names is detector.alternate_names
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
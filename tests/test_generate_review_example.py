@@ -99,6 +99,26 @@ class TestAttachment:
         
         assert docx_att.is_docx is True
         assert pdf_att.is_docx is False
+    
+    def test_attachment_reads_source_once_on_demand(self) -> None:
+        """Lazy attachments should read their source only when data is needed."""
+        from scripts.generate_review_example import Attachment
+        
+        calls = []
+        
+        def source() -> BytesIO:
+            calls.append(1)
+            return BytesIO(b"docx bytes")
+        
+        attachment = Attachment("contract.docx", size=10, source=source)
+        
+        assert attachment.size == 10
+        assert not attachment.is_loaded
+        assert calls == []
+        
+        assert attachment.open().read() == b"docx bytes"
+        assert attachment.data == b"docx bytes"
+        assert len(calls) == 1
 
 
 # =============================================================================
@@ -133,6 +153,31 @@ class TestParseMsgFile:
         assert docx_attachments[0].data is not None
         assert len(docx_attachments[0].data) > 0
     
+    def test_attachments_listed_without_reading_data(self, sample_msg_paths: tuple[Path, Path]) -> None:
+        """Attachments should report names and sizes before any data is read."""
+        from effilocal.doc.email_parser import MsgParser
+        
+        instructions_path, _ = sample_msg_paths
+        email_data = MsgParser.parse(instructions_path)
+        
+        assert email_data.attachments
+        assert not any(a.is_loaded for a in email_data.attachments)
+        for attachment in email_data.attachments:
+            assert attachment.size == len(attachment.data)
+    
+    def test_parser_context_reads_over_open_handle(self, sample_msg_paths: tuple[Path, Path]) -> None:
+        """Attachments read inside the context use the parser's open file."""
+        from effilocal.doc.email_parser import MsgParser
+        
+        instructions_path, _ = sample_msg_paths
+        with MsgParser(instructions_path) as parser:
+            email_data = parser.parse_message()
+            assert parser.is_open
+            doc = Document(email_data.docx_attachments[0].open())
+        
+        assert not parser.is_open
+        assert doc.paragraphs
+    
     def test_parse_msg_file_raises_for_nonexistent_file(self) -> None:
         """parse_msg_file should raise FileNotFoundError for missing files."""
         from scripts.generate_review_example import parse_msg_file
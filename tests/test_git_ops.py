@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import shutil
 import subprocess
 import tempfile
 from datetime import datetime
@@ -11,10 +12,15 @@ import pytest
 
 from effilocal.util.git_ops import (
     CommitInfo,
+    GitBackend,
     auto_commit,
+    close_backends,
     generate_commit_message,
+    get_backend,
     get_effi_commits,
+    get_file_at_commit,
     get_file_history,
+    get_file_versions,
     get_repo_root,
     has_changes,
     is_git_repo,
@@ -39,6 +45,8 @@ def temp_git_repo() -> Path:
         )
         
         yield repo_path
+        # Release cat-file processes so the directory can be removed (Windows)
+        close_backends()
 
 
 @pytest.fixture
@@ -244,6 +252,96 @@ class TestGetFileHistory:
         assert len(history) == 5
 
 
+def _commit_versions(repo_path: Path, file_path: Path, count: int) -> None:
+    for i in range(count):
+        file_path.write_text(f"Content {i}")
+        subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", f"Update {i}"],
+            cwd=repo_path, check=True, capture_output=True
+        )
+
+
+class TestGetFileVersions:
+    """Tests for the batched history + content query."""
+
+    def test_versions_carry_content_newest_first(self, repo_with_file: tuple[Path, Path]):
+        repo_path, file_path = repo_with_file
+        _commit_versions(repo_path, file_path, 3)
+
+        versions = get_file_versions(repo_path, file_path)
+
+        assert [v.content for v in versions] == [
+            b"Content 2",
+            b"Content 1",
+            b"Content 0",
+            b"Initial content",
+        ]
+        assert [v.commit.hash for v in versions] == [
+            c.hash for c in get_file_history(repo_path, file_path)
+        ]
+
+    def test_max_commits_limit(self, repo_with_file: tuple[Path, Path]):
+        repo_path, file_path = repo_with_file
+        _commit_versions(repo_path, file_path, 5)
+
+        versions = get_file_versions(repo_path, file_path, max_commits=2)
+
+        assert len(versions) == 2
+        assert versions[0].to_dict()["size"] == len(b"Content 4")
+
+    def test_not_a_repo(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            assert get_file_versions(Path(tmpdir), Path(tmpdir) / "x.txt") == []
+
+
+class TestGitBackend:
+    """Tests for the persistent cat-file backend."""
+
+    def test_reuses_single_process(self, repo_with_file: tuple[Path, Path]):
+        repo_path, file_path = repo_with_file
+        _commit_versions(repo_path, file_path, 3)
+        history = get_file_history(repo_path, file_path)
+
+        backend = get_backend(repo_path)
+        first = backend.read_blob(history[0].hash, "test.txt")
+        process = backend._process
+        second = backend.read_blob(history[-1].hash, "test.txt")
+
+        assert (first, second) == (b"Content 2", b"Initial content")
+        assert backend._process is process
+
+    def test_missing_object_returns_none(self, repo_with_file: tuple[Path, Path]):
+        repo_path, _ = repo_with_file
+        with GitBackend(repo_path) as backend:
+            assert backend.read_blob("HEAD", "does not exist.txt") is None
+            # The process survives a miss and keeps answering
+            assert backend.read_blob("HEAD", "test.txt") == b"Initial content"
+
+    def test_get_file_at_commit_binary_content(self, temp_git_repo: Path):
+        payload = bytes(range(256)) * 4 + b"\n\n"
+        binary = temp_git_repo / "doc.docx"
+        binary.write_bytes(payload)
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "binary"],
+            cwd=temp_git_repo, check=True, capture_output=True
+        )
+
+        assert get_file_at_commit(temp_git_repo, binary, "HEAD") == payload
+        assert get_file_at_commit(temp_git_repo, binary, "0" * 40) is None
+
+    def test_repo_root_cache_invalidated_when_git_dir_removed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_path = Path(tmpdir)
+            subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+            assert get_repo_root(repo_path) is not None
+
+            shutil.rmtree(repo_path / ".git")
+
+            assert get_repo_root(repo_path) is None
+
+
 class TestGetEffiCommits:
     """Tests for get_effi_commits function."""
 
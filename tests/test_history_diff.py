@@ -0,0 +1,181 @@
+"""Tests for block fingerprints and per-clause history diffs."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from effilocal.doc.fingerprints import (
+    FINGERPRINTS_FILENAME,
+    build_fingerprints,
+    clause_matches,
+    diff_blocks,
+    diff_fingerprints,
+    load_fingerprints,
+)
+from effilocal.flows.history_diff import HistoryDiffError, clause_timeline
+from effilocal.util.git_ops import close_backends
+from effilocal.util.hash import norm_text_hash
+from effilocal.util.io import write_jsonl
+
+
+def _block(block_id: str, text: str, ordinal: str | None = None, **extra) -> dict:
+    return {
+        "id": block_id,
+        "para_id": block_id,
+        "text": text,
+        "content_hash": norm_text_hash(text),
+        "list": {"ordinal": ordinal} if ordinal else None,
+        "attachment_id": None,
+        **extra,
+    }
+
+
+def _contract(clause_12_text: str = "Liability is capped.", extra_12: bool = False) -> list[dict]:
+    blocks = [
+        _block("A1", "Definitions", "1."),
+        _block("A2", "Term means the term.", "1.1"),
+        _block("C12", "Limitation of liability", "12."),
+        _block("C121", clause_12_text, "12.1"),
+        _block("C121a", "indirect loss;", "(a)"),
+    ]
+    if extra_12:
+        blocks.append(_block("C122", "Nothing limits fraud.", "12.2"))
+    blocks.append(_block("C13", "Termination", "13."))
+    return blocks
+
+
+class TestFingerprints:
+    """Tests for building and diffing fingerprints."""
+
+    def test_sub_items_inherit_running_clause_number(self):
+        fps = load_fingerprints(build_fingerprints(_contract(), "doc"))
+
+        clauses = {fp.id: fp.clause for fp in fps}
+
+        assert clauses["C121a"] == "12.1"
+        assert clauses["C13"] == "13"
+
+    def test_attachment_boundary_resets_clause(self):
+        blocks = _contract() + [_block("S1", "Schedule text", None, attachment_id="sch1")]
+        blocks[-1]["attachment_id"] = "sch1"
+
+        fps = load_fingerprints(build_fingerprints(blocks))
+
+        assert fps[-1].clause is None
+        assert fps[-1].attachment_id == "sch1"
+
+    def test_clause_matches_includes_sub_clauses_only(self):
+        assert clause_matches("12.1", "12")
+        assert clause_matches("12", "12.")
+        assert not clause_matches("120", "12")
+
+    def test_diff_detects_added_removed_and_modified(self):
+        old = load_fingerprints(build_fingerprints(_contract()))
+        new = load_fingerprints(build_fingerprints(_contract("Liability is unlimited.", extra_12=True)))
+
+        delta = diff_fingerprints(old, new)
+
+        assert delta.new_blocks == ["C122"]
+        assert delta.modified_blocks == ["C121"]
+        assert delta.deleted_blocks == []
+
+    def test_diff_falls_back_to_para_id(self):
+        old = load_fingerprints(build_fingerprints([_block("X", "same", "1.")]))
+        renamed = _block("Y", "same", "1.")
+        renamed["para_id"] = "X"
+
+        delta = diff_fingerprints(old, load_fingerprints(build_fingerprints([renamed])))
+
+        assert not delta
+
+    def test_diff_blocks_matches_analysis_delta_layout(self):
+        old = _contract()
+        new = _contract("Changed.")[1:]
+
+        assert diff_blocks(old, new).to_dict() == {
+            "new_blocks": [],
+            "deleted_blocks": ["A1"],
+            "modified_blocks": ["C121"],
+        }
+
+
+@pytest.fixture
+def analysis_repo() -> Path:
+    """A git repo with an analysis directory holding committed snapshots."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir)
+        for args in (
+            ["init"],
+            ["config", "user.email", "test@example.com"],
+            ["config", "user.name", "Test User"],
+        ):
+            subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+        (repo / "analysis").mkdir()
+        yield repo
+        close_backends()
+
+
+def _commit_snapshot(repo: Path, blocks: list[dict], message: str, *, fingerprints: bool = True) -> None:
+    analysis = repo / "analysis"
+    write_jsonl(analysis / "blocks.jsonl", blocks)
+    if fingerprints:
+        (analysis / FINGERPRINTS_FILENAME).write_text(json.dumps(build_fingerprints(blocks)))
+    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
+    subprocess.run(["git", "commit", "-m", message], cwd=repo, check=True, capture_output=True)
+
+
+class TestClauseTimeline:
+    """Tests for clause_timeline over git history."""
+
+    def test_reports_only_commits_touching_clause(self, analysis_repo: Path):
+        _commit_snapshot(analysis_repo, _contract(), "v1")
+        changed_clause_1 = _contract()
+        changed_clause_1[1] = _block("A2", "Term means something else.", "1.1")
+        _commit_snapshot(analysis_repo, changed_clause_1, "v2")
+        _commit_snapshot(analysis_repo, _contract("Liability is unlimited."), "v3")
+
+        timeline = clause_timeline(analysis_repo / "analysis", "12")
+
+        assert [c.commit.message for c in timeline] == ["v1", "v3"]
+        assert timeline[0].initial is True
+        assert timeline[1].delta.modified_blocks == ["C121"]
+
+    def test_include_text_reads_committed_blocks(self, analysis_repo: Path):
+        _commit_snapshot(analysis_repo, _contract(), "v1")
+        _commit_snapshot(analysis_repo, _contract(extra_12=True), "v2")
+
+        timeline = clause_timeline(analysis_repo / "analysis", "12.2", include_text=True)
+
+        assert len(timeline) == 1
+        assert timeline[0].texts == {"C122": "Nothing limits fraud."}
+
+    def test_falls_back_to_blocks_history(self, analysis_repo: Path):
+        _commit_snapshot(analysis_repo, _contract(), "v1", fingerprints=False)
+        _commit_snapshot(analysis_repo, _contract("New cap."), "v2", fingerprints=False)
+
+        timeline = clause_timeline(analysis_repo / "analysis", "12.1")
+
+        assert [c.commit.message for c in timeline] == ["v1", "v2"]
+        assert timeline[1].to_dict()["modified_blocks"] == ["C121"]
+
+    def test_mixed_history_keeps_commits_before_fingerprints(self, analysis_repo: Path):
+        _commit_snapshot(analysis_repo, _contract(), "v1", fingerprints=False)
+        _commit_snapshot(analysis_repo, _contract("New cap."), "v2", fingerprints=False)
+        _commit_snapshot(analysis_repo, _contract("Newer cap."), "v3")
+
+        timeline = clause_timeline(analysis_repo / "analysis", "12.1")
+
+        assert [c.commit.message for c in timeline] == ["v1", "v2", "v3"]
+        assert [c.initial for c in timeline] == [True, False, False]
+        assert timeline[2].delta.modified_blocks == ["C121"]
+        assert timeline[2].delta.new_blocks == []
+
+    def test_not_a_repo(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(HistoryDiffError):
+                clause_timeline(Path(tmpdir), "1")
@@ -0,0 +1,130 @@
+"""Tests for the background JSONL appender behind the tool-call logs."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from effilocal.tools import audit
+from effilocal.util.io import JsonlAppender, flush_appends
+
+
+def _lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestJsonlAppender:
+    """Lines are written in call order by one background thread."""
+
+    def test_preserves_order_per_file(self, tmp_path: Path):
+        appender = JsonlAppender(max_queue=8)
+        first, second = tmp_path / "a" / "edits.jsonl", tmp_path / "b" / "edits.jsonl"
+
+        for index in range(100):
+            appender.append(first if index % 3 else second, {"n": index})
+        assert appender.flush(timeout=5)
+
+        assert [entry["n"] for entry in _lines(first)] == [n for n in range(100) if n % 3]
+        assert [entry["n"] for entry in _lines(second)] == [n for n in range(100) if not n % 3]
+        appender.close()
+
+    def test_concurrent_writers_keep_their_own_order(self, tmp_path: Path):
+        appender = JsonlAppender()
+        path = tmp_path / "edits.jsonl"
+
+        def write(worker: int) -> None:
+            for index in range(50):
+                appender.append(path, {"worker": worker, "n": index})
+
+        threads = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        appender.close()
+
+        entries = _lines(path)
+        assert len(entries) == 200
+        for worker in range(4):
+            assert [entry["n"] for entry in entries if entry["worker"] == worker] == list(range(50))
+
+    def test_handles_stay_open_and_reopen_after_removal(self, tmp_path: Path):
+        appender = JsonlAppender(max_open_files=2)
+        paths = [tmp_path / f"{index}.jsonl" for index in range(3)]
+
+        for path in paths:
+            appender.append(path, {"path": path.name})
+        appender.flush(timeout=5)
+        assert list(appender._handles) == paths[1:]  # least recently used closed
+
+        paths[2].unlink()
+        appender.flush(timeout=5)
+        appender.append(paths[2], {"again": True})
+        appender.close()
+
+        assert _lines(paths[2]) == [{"again": True}]
+        assert not appender._handles
+
+    def test_path_spellings_share_one_handle(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.chdir(tmp_path)
+        appender = JsonlAppender()
+
+        for index in range(20):
+            appender.append("edits.jsonl" if index % 2 else tmp_path / "logs" / ".." / "edits.jsonl", {"n": index})
+        assert appender.flush(timeout=5)
+
+        assert list(appender._handles) == [tmp_path / "edits.jsonl"]
+        appender.close()
+        assert [entry["n"] for entry in _lines(tmp_path / "edits.jsonl")] == list(range(20))
+
+    def test_unencodable_entry_raises_in_caller(self, tmp_path: Path):
+        appender = JsonlAppender()
+        path = tmp_path / "edits.jsonl"
+
+        with pytest.raises(UnicodeEncodeError):
+            appender.append(path, {"text": "\ud800"})
+        appender.append(path, {"text": "\ud800"}, ensure_ascii=True)
+        appender.append(path, {"n": 1})
+        assert appender.flush(timeout=5)
+        appender.close()
+
+        assert _lines(path) == [{"text": "\ud800"}, {"n": 1}]
+        assert path.read_text(encoding="utf-8").splitlines()[0] == '{"text": "\\ud800"}'
+
+    def test_failed_entry_is_skipped_and_dead_thread_restarted(self, tmp_path: Path, monkeypatch):
+        appender = JsonlAppender()
+        path = tmp_path / "edits.jsonl"
+        original = JsonlAppender._write
+
+        def failing_once(self, target: Path, line: bytes) -> None:
+            if b'"bad"' in line:
+                raise RuntimeError("write failed")
+            original(self, target, line)
+
+        monkeypatch.setattr(JsonlAppender, "_write", failing_once)
+        for name in ("before", "bad", "after"):
+            appender.append(path, {"name": name})
+        assert appender.flush(timeout=5)
+        assert [entry["name"] for entry in _lines(path)] == ["before", "after"]
+
+        # A writer thread that died anyway is replaced instead of hanging flush()
+        appender._queue.put(None)
+        appender._thread.join(timeout=5)
+        appender.append(path, {"name": "restarted"})
+        assert appender.flush(timeout=5)
+        appender.close()
+
+        assert _lines(path)[-1] == {"name": "restarted"}
+
+    def test_audit_log_goes_through_shared_appender(self, tmp_path: Path, monkeypatch):
+        path = tmp_path / "tool_audit.jsonl"
+        monkeypatch.setenv(audit.AUDIT_FILE_ENV, str(path))
+
+        for tool in ("get_section", "get_content_by_range"):
+            audit.log_tool_call(tool=tool, doc_id="doc", args={}, truncated=False, duration_ms=1.0)
+        flush_appends(timeout=5)
+
+        assert [entry["tool"] for entry in _lines(path)] == ["get_section", "get_content_by_range"]
@@ -0,0 +1,103 @@
+"""Tests for budget-aware packing of labeling batches."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Mapping
+
+import pytest
+
+from effilocal.flows.label_doc import label
+
+DOC_ID = "packing-doc"
+SIZES = [40, 900, 60, 3000, 50, 70, 80]
+
+
+class RecordingTransport:
+    """Stub transport that records payloads and labels every section."""
+
+    def __init__(self) -> None:
+        self.payloads: list[dict[str, Any]] = []
+
+    def __call__(self, *, system: str, payload: Mapping[str, Any], schema: Any) -> str:
+        self.payloads.append(json.loads(json.dumps(payload)))
+        labels = [
+            {"section_id": entry["section_id"], "role": "unsure", "topics": [f"t{len(self.payloads)}"]}
+            for entry in payload["outline"]
+        ]
+        return json.dumps({"doc_id": DOC_ID, "confidence": 0.5, "labels": labels})
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    doc_dir = tmp_path / DOC_ID
+    doc_dir.mkdir()
+    blocks, children = [], []
+    for index, size in enumerate(SIZES):
+        text = " ".join(["word"] * (size // 5))[:size]
+        blocks.append({"id": f"b{index}", "text": text})
+        children.append({
+            "id": f"s{index}",
+            "title": f"Section {index}",
+            "level": 1,
+            "block_ids": [f"b{index}"],
+            "char_count": len(text),
+            "children": [],
+        })
+    (doc_dir / "blocks.jsonl").write_text("\n".join(json.dumps(block) for block in blocks) + "\n", encoding="utf-8")
+    (doc_dir / "sections.json").write_text(json.dumps({"root": {"children": children}}), encoding="utf-8")
+    (doc_dir / "styles.json").write_text(json.dumps({"styles": []}), encoding="utf-8")
+    return tmp_path
+
+
+def _sizes(transport: RecordingTransport) -> list[int]:
+    return [len(json.dumps(payload, ensure_ascii=False)) for payload in transport.payloads]
+
+
+class TestBudgetPacking:
+    """Batches are packed to the character budget."""
+
+    def test_fills_batches_up_to_budget(self, data_dir: Path):
+        transport = RecordingTransport()
+
+        result, report = label(DOC_ID, data_dir=data_dir, transport=transport, payload_max_chars=2500)
+
+        assert report["errors"] == []
+        assert all(size <= 2500 for size in _sizes(transport))
+        batches = [[entry["section_id"] for entry in payload["outline"]] for payload in transport.payloads]
+        # Document order is kept and small neighbours share a batch
+        assert [section_id for batch in batches for section_id in batch] == [
+            "s0", "s1", "s2", "s3", "s3", "s4", "s5", "s6",
+        ]
+        assert batches[0] == ["s0", "s1", "s2"]
+        assert batches[-1] == ["s4", "s5", "s6"]
+        assert [label["section_id"] for label in result["labels"]] == [f"s{index}" for index in range(len(SIZES))]
+
+    def test_oversized_section_is_split_deterministically(self, data_dir: Path):
+        first, second = RecordingTransport(), RecordingTransport()
+
+        label(DOC_ID, data_dir=data_dir, transport=first, payload_max_chars=2500)
+        result, _ = label(DOC_ID, data_dir=data_dir, transport=second, payload_max_chars=2500)
+
+        parts = [payload for payload in first.payloads if payload["outline"][0].get("snippet_part")]
+        assert [payload["outline"][0]["snippet_part"] for payload in parts] == ["1/2", "2/2"]
+        rejoined = " ".join(payload["snippets"]["s3"] for payload in parts)
+        assert rejoined.split() == (" ".join(["word"] * 600)).split()
+        assert first.payloads == second.payloads
+        s3_label = next(label for label in result["labels"] if label["section_id"] == "s3")
+        assert s3_label["topics"] == ["t2", "t3"]
+
+    def test_section_limit_still_applies(self, data_dir: Path):
+        transport = RecordingTransport()
+
+        label(DOC_ID, data_dir=data_dir, transport=transport, payload_max_chars=100_000, batch_section_limit=3)
+
+        assert [len(payload["outline"]) for payload in transport.payloads] == [3, 3, 1]
+
+    def test_without_budget_uses_section_limit(self, data_dir: Path):
+        transport = RecordingTransport()
+
+        label(DOC_ID, data_dir=data_dir, transport=transport)
+
+        assert len(transport.payloads) == 1
@@ -0,0 +1,122 @@
+"""Tests for the MCP tool metrics registry and the audit summary."""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+from effilocal import cli
+from effilocal.mcp_server.metrics import MetricsRegistry, instrument, metrics_path
+from effilocal.tools.audit import summarize_audit
+
+
+def _samples(text: str) -> dict[str, float]:
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, _, value = line.rpartition(" ")
+            samples[name] = float(value)
+    return samples
+
+
+class TestRegistry:
+    """Tool wrappers record calls, errors, sizes and blocks."""
+
+    @pytest.mark.asyncio
+    async def test_records_calls_errors_and_sizes(self, tmp_path: Path):
+        registry = MetricsRegistry()
+        document = tmp_path / "contract.docx"
+        document.write_bytes(b"x" * 20_000)
+
+        async def get_blocks(filename: str):
+            return {"blocks": [{"id": "b1"}, {"id": "b2"}]}
+
+        def add_text(filename: str):
+            return f"Document {filename} does not exist"
+
+        def explode(filename: str):
+            raise ValueError("boom")
+
+        await instrument(get_blocks, registry=registry)(filename=str(document))
+        instrument(add_text, registry=registry)(str(tmp_path / "missing.docx"))
+        with pytest.raises(ValueError):
+            instrument(explode, registry=registry)(filename=str(document))
+        instrument(lambda: None, registry=registry)  # registered, never called
+
+        samples = _samples(registry.render())
+        assert samples['effilocal_tool_calls_total{tool="get_blocks"}'] == 1
+        assert samples['effilocal_tool_calls_total{tool="<lambda>"}'] == 0
+        assert samples['effilocal_tool_errors_total{tool="get_blocks"}'] == 0
+        assert samples['effilocal_tool_errors_total{tool="add_text"}'] == 1
+        assert samples['effilocal_tool_errors_total{tool="explode"}'] == 1
+        assert samples['effilocal_tool_duration_seconds_count{tool="explode"}'] == 1
+        assert samples['effilocal_tool_duration_seconds_bucket{tool="add_text",le="+Inf"}'] == 1
+        assert samples['effilocal_tool_document_bytes_bucket{tool="get_blocks",le="16384"}'] == 0
+        assert samples['effilocal_tool_document_bytes_bucket{tool="get_blocks",le="65536"}'] == 1
+        assert samples['effilocal_tool_document_bytes_count{tool="add_text"}'] == 0
+        assert samples['effilocal_tool_blocks_sum{tool="get_blocks"}'] == 2
+
+    def test_cache_hit_rates(self):
+        registry = MetricsRegistry()
+
+        @lru_cache(maxsize=4)
+        def square(value: int) -> int:
+            return value * value
+
+        registry.register_cache("square", square)
+        for value in (1, 1, 1, 2):
+            square(value)
+        registry.record_cache("plans", hit=False)
+        registry.record_cache("plans", hit=True)
+
+        samples = _samples(registry.render())
+        assert samples['effilocal_cache_requests_total{cache="square",result="hit"}'] == 2
+        assert samples['effilocal_cache_requests_total{cache="square",result="miss"}'] == 2
+        assert samples['effilocal_cache_hit_ratio{cache="plans"}'] == 0.5
+
+    def test_metrics_path_sits_beside_mcp_path(self):
+        assert metrics_path("/mcp") == "/metrics"
+        assert metrics_path("/api/mcp/") == "/api/metrics"
+
+
+class TestMetricsRoute:
+    """The HTTP transport serves the registry."""
+
+    def test_route_serves_prometheus_text(self):
+        pytest.importorskip("dotenv")
+        from starlette.testclient import TestClient
+
+        from effilocal.mcp_server import main
+
+        main.register_metrics_route("/test-metrics")
+        with TestClient(main.mcp.http_app(path="/mcp")) as client:
+            response = client.get("/test-metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE effilocal_tool_duration_seconds histogram" in response.text
+
+
+class TestAuditSummary:
+    """Audit files summarise into per-tool percentiles."""
+
+    def test_percentiles_per_tool(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+        path = tmp_path / "tool_audit.jsonl"
+        lines = [{"tool": "get_section", "duration_ms": float(ms), "truncated": ms > 90} for ms in range(1, 101)]
+        lines.append({"tool": "get_toc", "duration_ms": 5.0, "truncated": False})
+        path.write_text("\n".join(json.dumps(line) for line in lines) + "\nnot json\n", encoding="utf-8")
+
+        summary = summarize_audit([path])
+
+        assert list(summary) == ["get_section", "get_toc"]
+        section = summary["get_section"]
+        assert (section["calls"], section["truncated"], section["max_ms"]) == (100, 10, 100.0)
+        assert section["p50_ms"] == 50.5
+        assert section["p99_ms"] == 99.01
+        assert summary["get_toc"]["p90_ms"] == 5.0
+
+        assert cli.main(["audit-summary", str(path)]) == 0
+        assert json.loads(capsys.readouterr().out) == summary
@@ -0,0 +1,87 @@
+"""Startup import budget for the MCP server.
+
+Runs ``python -X importtime -c "import effilocal.mcp_server.main"`` in a
+fresh interpreter and checks that no document library is imported before the
+first tool call and that effilocal's own startup imports stay within budget.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+from effilocal.mcp_server.lazy_imports import LazyModule
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Imported by tool implementations only; must not load at server startup.
+DEFERRED_MODULES = (
+    "docx",
+    "lxml",
+    "extract_msg",
+    "msoffcrypto",
+    "docx2pdf",
+    "word_document_server.tools",
+    "effilocal.doc",
+    "effilocal.mcp_server.tools",
+)
+
+# Self time (ms) allowed for effilocal modules imported at startup.
+EFFILOCAL_BUDGET_MS = 150.0
+
+
+def _import_report(module: str) -> dict[str, tuple[float, float]]:
+    """Return ``{module: (self_ms, cumulative_ms)}`` from ``-X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+    report: dict[str, tuple[float, float]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        report[name.strip()] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+    return report
+
+
+def _slowest(report: dict[str, tuple[float, float]], count: int = 10) -> str:
+    rows = sorted(report.items(), key=lambda item: item[1][1], reverse=True)[:count]
+    return "\n".join(f"{cumulative:9.1f} ms  {name}" for name, (_, cumulative) in rows)
+
+
+class TestServerStartupImports:
+    """What ``import effilocal.mcp_server.main`` pulls in."""
+
+    def test_document_libraries_are_deferred(self):
+        report = _import_report("effilocal.mcp_server.main")
+
+        loaded = [
+            name
+            for name in report
+            if any(name == prefix or name.startswith(prefix + ".") for prefix in DEFERRED_MODULES)
+        ]
+        assert not loaded, f"Imported at startup: {loaded}\nSlowest imports:\n{_slowest(report)}"
+
+    def test_effilocal_imports_within_budget(self):
+        report = _import_report("effilocal.mcp_server.main")
+
+        own_ms = sum(self_ms for name, (self_ms, _) in report.items() if name.split(".")[0] == "effilocal")
+        assert own_ms < EFFILOCAL_BUDGET_MS, f"effilocal startup imports took {own_ms:.1f} ms"
+
+
+class TestLazyModule:
+    """Deferred module proxy."""
+
+    def test_imports_on_first_attribute_access(self):
+        proxy = LazyModule("json.tool")
+
+        assert not proxy.is_loaded
+        assert callable(proxy.main)
+        assert proxy.is_loaded
+        assert proxy.load() is sys.modules["json.tool"]
@@ -27,6 +27,7 @@ from effilocal.mcp_server.tool_logging import (
     get_project_path,
     log_tool_call,
     get_edits_log_path,
+    flush_tool_logs,
 )
 
 
@@ -99,6 +100,7 @@ class TestToolCallLogger:
         logger = ToolCallLogger(temp_project)
         logger.log("test_tool", {"arg": "value"}, "result")
         
+        flush_tool_logs()
         logs_dir = os.path.join(temp_project, "logs")
         assert os.path.exists(logs_dir)
     
@@ -107,6 +109,7 @@ class TestToolCallLogger:
         logger = ToolCallLogger(temp_project)
         logger.log("test_tool", {"arg": "value"}, "result")
         
+        flush_tool_logs()
         edits_path = os.path.join(temp_project, "logs", "edits.jsonl")
         assert os.path.exists(edits_path)
     
@@ -115,6 +118,7 @@ class TestToolCallLogger:
         logger = ToolCallLogger(temp_project)
         logger.log("search_and_replace", {}, "done")
         
+        flush_tool_logs()
         edits_path = os.path.join(temp_project, "logs", "edits.jsonl")
         with open(edits_path) as f:
             entry = json.loads(f.readline())
@@ -127,6 +131,7 @@ class TestToolCallLogger:
         request = {"filename": "doc.docx", "find_text": "old", "replace_text": "new"}
         logger.log("search_and_replace", request, "done")
         
+        flush_tool_logs()
         edits_path = os.path.join(temp_project, "logs", "edits.jsonl")
         with open(edits_path) as f:
             entry = json.loads(f.readline())
@@ -138,6 +143,7 @@ class TestToolCallLogger:
         logger = ToolCallLogger(temp_project)
         logger.log("tool", {}, "Success: 3 replacements made")
         
+        flush_tool_logs()
         edits_path = os.path.join(temp_project, "logs", "edits.jsonl")
         with open(edits_path) as f:
             entry = json.loads(f.readline())
@@ -150,6 +156,7 @@ class TestToolCallLogger:
         response = {"success": True, "count": 5}
         logger.log("tool", {}, response)
         
+        flush_tool_logs()
         edits_path = os.path.join(temp_project, "logs", "edits.jsonl")
         with open(edits_path) as f:
             entry = json.loads(f.readline())
@@ -161,6 +168,7 @@ class TestToolCallLogger:
         logger = ToolCallLogger(temp_project)
         logger.log("tool", {}, "result")
         
+        flush_tool_logs()
         edits_path = os.path.join(temp_project, "logs", "edits.jsonl")
         with open(edits_path) as f:
             entry = json.loads(f.readline())
@@ -174,6 +182,7 @@ class TestToolCallLogger:
         logger = ToolCallLogger(temp_project)
         logger.log("tool", {}, "result")
         
+        flush_tool_logs()
         edits_path = os.path.join(temp_project, "logs", "edits.jsonl")
         with open(edits_path) as f:
             entry = json.loads(f.readline())
@@ -188,6 +197,7 @@ class TestToolCallLogger:
         logger.log("tool2", {}, "r2")
         logger.log("tool3", {}, "r3")
         
+        flush_tool_logs()
         edits_path = os.path.join(temp_project, "logs", "edits.jsonl")
         with open(edits_path) as f:
             lines = f.readlines()
@@ -203,6 +213,7 @@ class TestToolCallLogger:
         logger.log("tool", {}, "r1")
         logger.log("tool", {}, "r2")
         
+        flush_tool_logs()
         edits_path = os.path.join(temp_project, "logs", "edits.jsonl")
         with open(edits_path) as f:
             lines = f.readlines()
@@ -245,6 +256,7 @@ class TestLogToolCallFunction:
             "replaced"
         )
         
+        flush_tool_logs()
         edits_path = os.path.join(temp_project["project"], "logs", "edits.jsonl")
         assert os.path.exists(edits_path)
     
@@ -306,6 +318,7 @@ class TestConcurrentLogging:
         assert len(errors) == 0
         
         # Verify all entries were written
+        flush_tool_logs()
         edits_path = os.path.join(temp_project, "logs", "edits.jsonl")
         with open(edits_path) as f:
             lines = f.readlines()
@@ -351,6 +364,7 @@ class TestToolLoggingDecorator:
         
         assert result == "Added: Hello"
         
+        flush_tool_logs()
         edits_path = os.path.join(temp_project["project"], "logs", "edits.jsonl")
         assert os.path.exists(edits_path)
         
@@ -377,6 +391,7 @@ class TestToolLoggingDecorator:
         
         assert result == {"success": True, "value": 42}
         
+        flush_tool_logs()
         edits_path = os.path.join(temp_project["project"], "logs", "edits.jsonl")
         with open(edits_path) as f:
             entry = json.loads(f.readline())
@@ -400,6 +415,7 @@ class TestToolLoggingDecorator:
             failing_tool(filename=doc_path)
         
         # Error should still be logged
+        flush_tool_logs()
         edits_path = os.path.join(temp_project["project"], "logs", "edits.jsonl")
         with open(edits_path) as f:
             entry = json.loads(f.readline())
@@ -436,6 +452,7 @@ class TestNoTaskIdInServerLogging:
         logger = ToolCallLogger(temp_project)
         logger.log("tool", {}, "result")
         
+        flush_tool_logs()
         edits_path = os.path.join(temp_project, "logs", "edits.jsonl")
         with open(edits_path) as f:
             entry = json.loads(f.readline())
@@ -447,6 +464,7 @@ class TestNoTaskIdInServerLogging:
         logger = ToolCallLogger(temp_project)
         logger.log("search_and_replace", {"filename": "doc.docx"}, "replaced 3")
         
+        flush_tool_logs()
         edits_path = os.path.join(temp_project, "logs", "edits.jsonl")
         with open(edits_path) as f:
             entry = json.loads(f.readline())
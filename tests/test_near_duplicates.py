@@ -0,0 +1,127 @@
+"""Tests for MinHash/LSH near-duplicate clause detection."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from effilocal.doc.near_duplicates import (
+    MINHASH_FILENAME,
+    NUM_PERM,
+    NearDuplicateIndex,
+    block_signature,
+    build_minhash_signatures,
+    load_signatures,
+    signature_similarity,
+)
+
+LIABILITY = (
+    "Subject to clause 11(c), the total aggregate liability of the Supplier under or in connection "
+    "with this Agreement, whether in contract, tort (including negligence), breach of statutory duty "
+    "or otherwise, shall not exceed an amount equal to twelve months' fees paid or payable under this Agreement."
+)
+CONFIDENTIALITY = (
+    "Each party shall keep in strict confidence all technical or commercial know-how, specifications, "
+    "inventions, processes or initiatives which are of a confidential nature and have been disclosed to it."
+)
+GOVERNING_LAW = (
+    "This agreement and any dispute or claim arising out of or in connection with it shall be governed by "
+    "and construed in accordance with the law of England and Wales."
+)
+
+
+def _shingles(text: str) -> set[str]:
+    words = text.casefold().replace("(", " ").replace(")", " ").replace(",", " ").replace(".", " ").split()
+    return {" ".join(words[i:i + 3]) for i in range(len(words) - 2)}
+
+
+def _write_analysis(directory: Path, texts: dict[str, str], *, with_minhash: bool = True) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    blocks = [{"id": block_id, "text": text} for block_id, text in texts.items()]
+    with open(directory / "blocks.jsonl", "w", encoding="utf-8") as f:
+        for block in blocks:
+            f.write(json.dumps(block) + "\n")
+    if with_minhash:
+        (directory / MINHASH_FILENAME).write_text(json.dumps(build_minhash_signatures(blocks)), encoding="utf-8")
+    return directory
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> NearDuplicateIndex:
+    return NearDuplicateIndex.from_directories(
+        [
+            _write_analysis(tmp_path / "supply", {"lol": LIABILITY, "conf": CONFIDENTIALITY, "heading": "Liability"}),
+            _write_analysis(tmp_path / "licence", {"law": GOVERNING_LAW}, with_minhash=False),
+        ]
+    )
+
+
+class TestSignatures:
+    """MinHash estimates of shingle-set similarity."""
+
+    def test_identical_text_is_similarity_one(self):
+        signature = block_signature(LIABILITY)
+
+        assert len(signature) == NUM_PERM
+        assert signature_similarity(signature, block_signature(" ".join(LIABILITY.upper().split()))) == 1.0
+
+    def test_estimate_tracks_jaccard(self):
+        edited = LIABILITY.replace("twelve months'", "six months'").replace("Supplier", "Customer")
+        left, right = _shingles(LIABILITY), _shingles(edited)
+        jaccard = len(left & right) / len(left | right)
+
+        estimate = signature_similarity(block_signature(LIABILITY), block_signature(edited))
+
+        assert abs(estimate - jaccard) < 0.15
+
+    def test_short_blocks_are_not_signed(self):
+        assert block_signature("Limitation of liability") is None
+        assert block_signature(None) is None
+
+
+class TestNearDuplicateIndex:
+    """LSH queries across documents."""
+
+    def test_near_copy_finds_precedent(self, library: NearDuplicateIndex, tmp_path: Path):
+        draft = {"id": "d1", "text": LIABILITY.replace("Supplier", "Vendor")}
+
+        matches = library.match_blocks([draft, {"id": "d2", "text": "Unrelated words about nothing in particular here."}])
+
+        assert list(matches) == ["d1"]
+        (best,) = matches["d1"][:1]
+        assert (best.doc_key, best.block_id) == (str(tmp_path / "supply"), "lol")
+        assert 0.6 < best.similarity < 1.0
+
+    def test_directories_without_minhash_are_signed_on_load(self, library: NearDuplicateIndex, tmp_path: Path):
+        matches = library.query(block_signature(GOVERNING_LAW))
+
+        assert [(match.doc_key, match.block_id, match.similarity) for match in matches] == [
+            (str(tmp_path / "licence"), "law", 1.0)
+        ]
+        assert len(library) == 3
+
+    def test_replacing_a_document_drops_old_blocks(self, library: NearDuplicateIndex, tmp_path: Path):
+        library.add_document(str(tmp_path / "supply"), {"conf": block_signature(CONFIDENTIALITY)})
+
+        assert library.query(block_signature(LIABILITY)) == []
+        assert library.query(block_signature(CONFIDENTIALITY), exclude_doc=str(tmp_path / "supply")) == []
+
+    def test_repeated_replacement_reclaims_slots(self):
+        index = NearDuplicateIndex()
+        signatures = {"conf": block_signature(CONFIDENTIALITY), "law": block_signature(GOVERNING_LAW)}
+
+        for _ in range(50):
+            index.add_document("doc", signatures)
+        index.add_document("other", {"lol": block_signature(LIABILITY)})
+        index.remove_document("doc")
+
+        assert len(index._entries) == 3
+        assert all(sum(map(len, buckets.values())) == 1 for buckets in index._buckets)
+        assert [match.block_id for match in index.query(block_signature(LIABILITY))] == ["lol"]
+
+    def test_payload_round_trip(self, tmp_path: Path):
+        directory = _write_analysis(tmp_path / "doc", {"lol": LIABILITY})
+
+        assert load_signatures(directory) == {"lol": block_signature(LIABILITY)}
@@ -0,0 +1,195 @@
+"""Tests for paged outline queries and delta updates."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from effilocal.outline import OutlineService
+from effilocal.util.hash import sha256_file
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+GET_OUTLINE = PROJECT_ROOT / "extension" / "scripts" / "get_outline.py"
+VERSION = "2025-12-01T10:00:00+00:00"
+PREVIOUS_VERSION = "2025-11-30T09:00:00+00:00"
+
+# 1 (heading) > 1.1 > (a), (b); 2 (heading) > 2.1; trailing paragraph
+HIERARCHY = {
+    "h1": ["c11"],
+    "c11": ["a", "b"],
+    "h2": ["c21"],
+}
+ORDER = ["h1", "c11", "a", "b", "h2", "c21", "tail"]
+
+
+def _block(block_id: str) -> dict:
+    if block_id.startswith("h"):
+        return {"id": block_id, "type": "heading", "style": "Heading 1", "text": f"Heading {block_id}"}
+    if block_id == "tail":
+        return {"id": block_id, "type": "paragraph", "text": "x" * 150}
+    return {
+        "id": block_id,
+        "type": "list_item",
+        "text": f"Clause {block_id}",
+        "list": {"ordinal": block_id, "level": 1},
+    }
+
+
+def _write_analysis(directory: Path, order: list[str], *, delta: dict | None = None) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    parents = {child: parent for parent, children in HIERARCHY.items() for child in children}
+    with open(directory / "blocks.jsonl", "w", encoding="utf-8") as f:
+        for block_id in order:
+            f.write(json.dumps(_block(block_id)) + "\n")
+    relationships = [
+        {
+            "block_id": block_id,
+            "parent_block_id": parents.get(block_id),
+            "child_block_ids": [child for child in HIERARCHY.get(block_id, []) if child in order],
+        }
+        for block_id in order
+    ]
+    payloads = {
+        "manifest.json": {"doc_id": "doc", "v": 1, "created_at": VERSION},
+        "sections.json": {"doc_id": "doc", "root": {"children": []}},
+        "relationships.json": {"doc_id": "doc", "relationships": relationships},
+        "styles.json": {"styles": []},
+        "index.json": {"doc_id": "doc"},
+    }
+    if delta is not None:
+        payloads["analysis_delta.json"] = delta
+    for name, payload in payloads.items():
+        (directory / name).write_text(json.dumps(payload), encoding="utf-8")
+    return directory
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> OutlineService:
+    return OutlineService.from_dir(_write_analysis(tmp_path, ORDER))
+
+
+def _ids(page: dict) -> list[str]:
+    return [row["id"] for row in page["outline"]]
+
+
+class TestPaging:
+    """Windowed pages over the visible outline."""
+
+    def test_windows_cover_the_outline(self, service: OutlineService):
+        first = service.page(0, 3)
+        second = service.page(first["next_start"], 3)
+        last = service.page(6, 3)
+
+        assert _ids(first) == ["h1", "c11", "a"]
+        assert _ids(second) == ["b", "h2", "c21"]
+        assert _ids(last) == ["tail"]
+        assert (first["total"], last["next_start"]) == (7, None)
+        assert first["version"] == VERSION
+
+    def test_rows_match_full_outline(self, service: OutlineService):
+        full = service.full_outline()
+
+        assert service.page(2, 2)["outline"] == full[2:4]
+        assert full[0]["ordinal"] == "[Heading 1]"
+        assert len(full[-1]["text"]) == 100
+        assert (full[1]["child_count"], full[1]["index"]) == (2, 1)
+
+    def test_collapsed_subtrees_are_hidden(self, service: OutlineService):
+        page = service.page(0, 10, collapsed=["h1"])
+
+        assert _ids(page) == ["h1", "h2", "c21", "tail"]
+        assert (page["total"], page["hidden"]) == (4, 3)
+
+    def test_page_of_accounts_for_collapsed_rows(self, service: OutlineService):
+        page = service.page_of("c21", 2, collapsed=["h1"])
+
+        assert (_ids(page), page["start"]) == (["c21", "tail"], 2)
+        with pytest.raises(KeyError):
+            service.page_of("a", 2, collapsed=["h1"])
+
+    def test_children_expand_one_node(self, service: OutlineService):
+        page = service.children("c11")
+
+        assert _ids(page) == ["a", "b"]
+        assert page["parent_id"] == "c11"
+
+
+class TestDelta:
+    """Delta updates keyed on analysis_delta.json."""
+
+    def test_current_version_has_no_changes(self, service: OutlineService):
+        assert service.delta(VERSION)["status"] == "current"
+
+    def test_same_second_reanalysis_changes_version(self, tmp_path: Path):
+        directory = _write_analysis(tmp_path, ORDER)
+        checksum = sha256_file(directory / "blocks.jsonl")
+        manifest = {"doc_id": "doc", "v": 1, "created_at": VERSION, "checksums": {"blocks.jsonl": checksum}}
+        (directory / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+        first = OutlineService.from_dir(directory).version
+
+        _write_analysis(directory, ORDER[:-1])
+        manifest["checksums"]["blocks.jsonl"] = sha256_file(directory / "blocks.jsonl")
+        (directory / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+        second = OutlineService.from_dir(directory)
+
+        assert checksum.startswith("sha256:")
+        assert first == f"{VERSION}#{checksum.split(':', 1)[1][:16]}"
+        assert first != second.version
+        assert second.delta(first)["status"] == "reload"
+
+    def test_delta_from_base_version(self, tmp_path: Path):
+        delta = {
+            "base_version": PREVIOUS_VERSION,
+            "version": VERSION,
+            "new_blocks": ["b"],
+            "deleted_blocks": ["old"],
+            "modified_blocks": ["c11"],
+        }
+        service = OutlineService.from_dir(_write_analysis(tmp_path, ORDER, delta=delta))
+
+        result = service.delta(PREVIOUS_VERSION)
+
+        assert result["status"] == "delta"
+        assert [(row["id"], row["index"], row["after_id"]) for row in result["added"]] == [("b", 3, "a")]
+        assert [row["id"] for row in result["modified"]] == ["c11"]
+        assert result["removed"] == ["old"]
+
+    def test_unknown_base_requires_reload(self, tmp_path: Path):
+        delta = {"base_version": PREVIOUS_VERSION, "version": VERSION, "new_blocks": []}
+        service = OutlineService.from_dir(_write_analysis(tmp_path, ORDER, delta=delta))
+
+        assert service.delta("1999-01-01T00:00:00+00:00")["status"] == "reload"
+        assert service.delta(None)["status"] == "reload"
+
+
+class TestGetOutlineScript:
+    """The webview's get_outline.py entry point."""
+
+    def _run(self, *args: str) -> dict:
+        result = subprocess.run(
+            [sys.executable, str(GET_OUTLINE), *args],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return json.loads(result.stdout)
+
+    def test_default_returns_whole_outline(self, tmp_path: Path):
+        _write_analysis(tmp_path, ORDER)
+
+        result = self._run(str(tmp_path))
+
+        assert result["success"] and result["count"] == len(ORDER)
+
+    def test_paged_query(self, tmp_path: Path):
+        _write_analysis(tmp_path, ORDER)
+
+        result = self._run(str(tmp_path), "--limit", "2", "--collapsed", "h1")
+
+        assert _ids(result) == ["h1", "h2"]
+        assert result["next_start"] == 2
@@ -0,0 +1,114 @@
+"""Tests for the cached plan store."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from effilocal.mcp_server.plan import storage
+from effilocal.mcp_server.plan.models import WorkPlan, WorkTask
+from effilocal.mcp_server.plan.storage import (
+    get_plan_md_path,
+    get_plan_meta_path,
+    load_plan,
+    save_plan,
+)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> str:
+    project_path = tmp_path / "EL_Projects" / "Acme"
+    project_path.mkdir(parents=True)
+    return str(project_path)
+
+
+@pytest.fixture
+def writes(project: str, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    names: list[str] = []
+    original = storage._atomic_write_text
+
+    def counting(path: Path, content: str) -> None:
+        names.append(path.name)
+        original(path, content)
+
+    monkeypatch.setattr(storage, "_atomic_write_text", counting)
+    return names
+
+
+def _plan(*titles: str) -> WorkPlan:
+    plan = WorkPlan()
+    for title in titles:
+        plan.add_task_at_end(WorkTask(title=title, description=""))
+    return plan
+
+
+def _md_titles(project: str) -> list[str]:
+    content = get_plan_md_path(project).read_text(encoding="utf-8")
+    return [line.split(". ", 1)[1] for line in content.splitlines() if line.startswith("## ")]
+
+
+class TestPlanCache:
+    """Loads are served from memory until a file changes."""
+
+    def test_repeated_loads_skip_disk(self, project: str, monkeypatch: pytest.MonkeyPatch):
+        save_plan(project, _plan("Review"))
+        reads: list[str] = []
+        original = storage._read_plan
+        monkeypatch.setattr(storage, "_read_plan", lambda path: reads.append(path) or original(path))
+
+        first = load_plan(project)
+        first.tasks[0].title = "Mutated"
+        second = load_plan(project)
+
+        assert reads == []
+        assert second.tasks[0].title == "Review"
+
+    def test_external_edit_invalidates(self, project: str):
+        save_plan(project, _plan("Review"))
+        load_plan(project)
+
+        data = json.loads(get_plan_meta_path(project).read_text(encoding="utf-8"))
+        data["tasks"][0]["title"] = "Edited in the extension"
+        get_plan_meta_path(project).write_text(json.dumps(data), encoding="utf-8")
+
+        assert load_plan(project).tasks[0].title == "Edited in the extension"
+
+
+class TestWrites:
+    """Both files are written before save_plan returns, unless unchanged."""
+
+    def test_every_change_reaches_markdown(self, project: str, writes: list[str]):
+        titles: list[str] = []
+
+        for index in range(5):
+            titles.append(f"Task {index}")
+            save_plan(project, _plan(*titles))
+            assert _md_titles(project) == titles
+
+        assert writes.count("plan.meta.json") == 5
+        assert writes.count("plan.md") == 5
+        assert not list(Path(project, "plans", "current").glob("*.tmp"))
+
+    def test_unchanged_content_is_skipped(self, project: str, writes: list[str]):
+        plan = _plan("Review")
+        save_plan(project, plan)
+        save_plan(project, plan)
+
+        plan.tasks[0].status = "completed"
+        save_plan(project, plan)
+
+        assert writes.count("plan.meta.json") == 2
+        assert writes.count("plan.md") == 2
+
+    def test_external_markdown_edit_is_overwritten_by_next_save(self, project: str, writes: list[str]):
+        plan = _plan("Server")
+        save_plan(project, plan)
+        # The extension saves only plan.md
+        get_plan_md_path(project).write_text(storage._generate_plan_md(_plan("Extension")), encoding="utf-8")
+
+        save_plan(project, plan)
+
+        assert _md_titles(project) == ["Server"]
+        assert writes == ["plan.meta.json", "plan.md", "plan.meta.json", "plan.md"]
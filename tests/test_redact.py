@@ -0,0 +1,122 @@
+"""Tests for the compiled redaction engine."""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from effilocal.util.redact import (
+    DEFAULT_RULES,
+    RedactionRule,
+    Redactor,
+    redact_snippets,
+    redact_text,
+)
+
+TEXT = "Mail john.doe@example.com or call +44 (0)20 7946 0958; Acme Ltd and Acme pay 12345678."
+
+
+def _sequential(text: str) -> str:
+    """Reference: one re.sub per default rule."""
+    for rule in DEFAULT_RULES:
+        text = rule.pattern.sub(rule.replacement, text)
+    return text
+
+
+class TestRedactor:
+    """Single-pass redaction."""
+
+    def test_default_rules_match_sequential_substitution(self):
+        samples = [TEXT, "", "no contact details", "a@b.co, 555-123-4567 and (020) 7946-0958", "+1 2 3"]
+
+        assert [redact_text(sample) for sample in samples] == [_sequential(sample) for sample in samples]
+
+    def test_terms_prefer_longest_and_respect_word_boundaries(self):
+        redactor = Redactor(terms={"PARTY": ["Acme", "Acme Ltd"], "ACCOUNT": ["12345678"]})
+
+        assert redactor.redact(TEXT) == (
+            "Mail ***EMAIL*** or call ***PHONE***; ***PARTY*** and ***PARTY*** pay ***ACCOUNT***."
+        )
+        assert redactor.redact("Acmeville") == "Acmeville"
+
+    def test_spans_map_original_to_redacted_text(self):
+        result = Redactor(terms={"PARTY": ["Acme"]}).redact_with_spans(TEXT)
+
+        assert [span.rule for span in result.spans] == ["email", "phone", "party", "party", "phone"]
+        for span in result.spans:
+            assert result.text[span.redacted_start:span.redacted_end].startswith("***")
+        assert TEXT[result.spans[0].start:result.spans[0].end] == "john.doe@example.com"
+        assert result.text == Redactor(terms={"PARTY": ["Acme"]}).redact(TEXT)
+
+    def test_rule_flags_and_group_references_are_kept(self):
+        redactor = Redactor([
+            RedactionRule(re.compile(r"account no\. (\d{2})\d+", re.IGNORECASE), r"ACCOUNT \1**"),
+        ])
+
+        assert redactor.redact("Account No. 998877") == "ACCOUNT 99**"
+
+    def test_named_groups_stay_per_rule(self):
+        redactor = Redactor([
+            RedactionRule(re.compile(r"\b(?P<word>\w+) (?P=word)\b"), "[repeat]"),
+            RedactionRule(re.compile(r"(?P<word>\d+)-(?P<tail>\d+)"), r"\g<tail>-\g<word>"),
+            RedactionRule(re.compile(r"(?i)secret"), "[secret]"),
+        ], terms={"PARTY": ["Acme"]})
+
+        assert redactor.redact("Acme said the the SECRET code 12-34") == (
+            "***PARTY*** said [repeat] [secret] code 34-12"
+        )
+
+    def test_rejects_numeric_backreferences(self):
+        with pytest.raises(ValueError, match=r"numeric backreference \\1"):
+            Redactor([RedactionRule(re.compile(r"\b(\w+) \1\b"), "X", name="repeat")])
+
+        # Octal escapes and class members are not references
+        assert Redactor([RedactionRule(re.compile(r"[\1]x|\101"), "X")]).redact("A \x01x") == "X X"
+
+    @pytest.mark.parametrize("pattern", [r"(a+)+b", r"(?:\w+\s?)*x", r"(a|b+)*c"])
+    def test_rejects_nested_unbounded_repeats(self, pattern: str):
+        with pytest.raises(ValueError, match="nests unbounded repeats"):
+            Redactor([RedactionRule(re.compile(pattern), "X")])
+
+    def test_possessive_and_bounded_repeats_are_allowed(self):
+        Redactor([RedactionRule(re.compile(r"(?:a+)++b|(a{1,5})+c"), "X")])
+
+    def test_address_like_runs_stay_linear(self):
+        started = time.perf_counter()
+
+        redact_text("a." * 50_000)
+
+        assert time.perf_counter() - started < 1.0
+
+
+class TestRuleFiles:
+    """User-supplied rule sets."""
+
+    def test_from_file(self, tmp_path: Path):
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps({
+            "terms": {"PARTY": ["Acme"]},
+            "patterns": [{"pattern": r"\bSORT \d{2}-\d{2}-\d{2}\b", "replacement": "***SORT***", "ignore_case": True}],
+        }), encoding="utf-8")
+
+        redactor = Redactor.from_file(path)
+
+        assert redactor.redact("Acme, sort 12-34-56, a@b.com") == "***PARTY***, ***SORT***, ***EMAIL***"
+
+    def test_from_file_names_the_bad_rule(self, tmp_path: Path):
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps({
+            "patterns": [{"pattern": r"\b(\w+) \1\b", "name": "repeated word"}],
+        }), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="rules.json: Redaction rule 'repeated word'"):
+            Redactor.from_file(path)
+
+    def test_redact_snippets_accepts_redactor(self):
+        redactor = Redactor(rules=[], terms={"PARTY": ["Acme"]})
+
+        assert redact_snippets({"s1": "Acme a@b.com"}, redactor) == {"s1": "***PARTY*** a@b.com"}
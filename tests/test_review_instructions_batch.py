@@ -0,0 +1,122 @@
+"""Tests for batch execution of review instructions."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+from effilocal.mcp_server.core.comments import extract_all_comments
+from effilocal.mcp_server.tools.review_tools import (
+    execute_review_instruction,
+    execute_review_instructions,
+)
+
+
+@pytest.fixture
+def review_doc(tmp_path: Path) -> Path:
+    doc = Document()
+    doc.add_paragraph("The Supplier shall deliver the Goods within 30 days.")
+    paragraph = doc.add_paragraph("Payment is due within 60 days ")
+    paragraph.add_run("of the invoice date.")
+    doc.add_paragraph("The Customer may terminate on notice.")
+    doc.add_paragraph("Notices must be in writing. Notices may be emailed.")
+    path = tmp_path / "review.docx"
+    doc.save(path)
+    return path
+
+
+def _texts(path: Path) -> list[str]:
+    return [paragraph.text for paragraph in Document(path).paragraphs]
+
+
+class TestExecuteReviewInstructions:
+    """Batch execution against a single load and save."""
+
+    @pytest.mark.asyncio
+    async def test_applies_edits_and_comments(self, review_doc: Path):
+        result = json.loads(await execute_review_instructions(str(review_doc), [
+            {"id": "a", "search_text": "30 days", "instruction_code": "E", "replacement_text": "14 days"},
+            {"id": "b", "search_text": "60 days", "instruction_code": "E+IC",
+             "replacement_text": "45 days", "internal_comment_text": "Shortened"},
+            {"id": "c", "search_text": "Customer", "instruction_code": "NE+IC",
+             "internal_comment_text": "Acceptable"},
+        ]))
+
+        assert result["success"]
+        assert (result["applied"], result["failed"]) == (3, 0)
+        assert [entry["id"] for entry in result["results"]] == ["a", "b", "c"]
+        assert _texts(review_doc)[:3] == [
+            "The Supplier shall deliver the Goods within 14 days.",
+            "Payment is due within 45 days of the invoice date.",
+            "The Customer may terminate on notice.",
+        ]
+        comments = extract_all_comments(Document(review_doc))
+        # Comment codes follow document order
+        assert [comment["text"] for comment in comments] == ["EFFI-C-0 Shortened", "EFFI-C-1 Acceptable"]
+
+    @pytest.mark.asyncio
+    async def test_edits_in_one_run_apply_against_original_offsets(self, review_doc: Path):
+        result = json.loads(await execute_review_instructions(str(review_doc), [
+            {"search_text": "deliver", "instruction_code": "E", "replacement_text": "supply"},
+            {"search_text": "The Supplier", "instruction_code": "E", "replacement_text": "The Vendor"},
+            {"search_text": "Supplier shall", "instruction_code": "E", "replacement_text": "X"},
+        ]))
+
+        assert (result["applied"], result["failed"]) == (2, 1)
+        assert "overlaps the edit made by instruction 1" in result["results"][2]["error"]
+        assert _texts(review_doc)[0] == "The Vendor shall supply the Goods within 30 days."
+        assert result["results"][0]["updated_run_text"] == _texts(review_doc)[0]
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_per_instruction(self, review_doc: Path):
+        result = json.loads(await execute_review_instructions(str(review_doc), [
+            {"search_text": "missing text", "instruction_code": "E", "replacement_text": "x"},
+            {"search_text": "Notices", "instruction_code": "NE+IC", "internal_comment_text": "?"},
+            {"search_text": "Goods", "instruction_code": "BOGUS"},
+            {"search_text": "Goods", "instruction_code": "E", "replacment_text": "typo"},
+            {"search_text": 30, "instruction_code": "E", "replacement_text": "x"},
+            {"search_text": "Goods", "instruction_code": "E", "replacement_text": "Products"},
+        ]))
+
+        assert not result["success"]
+        assert (result["applied"], result["failed"]) == (1, 5)
+        results = result["results"]
+        assert "not found" in results[0]["error"]
+        assert results[1]["requires_disambiguation"]
+        assert len(results[1]["matches"]) == 2
+        assert "Unsupported instruction_code" in results[2]["error"]
+        assert "replacment_text" in results[3]["error"]
+        assert results[4]["error"] == "Field(s) must be strings: search_text"
+        assert results[5]["success"]
+
+    @pytest.mark.asyncio
+    async def test_nothing_applied_leaves_file_untouched(self, review_doc: Path):
+        before = review_doc.read_bytes()
+
+        result = json.loads(await execute_review_instructions(str(review_doc), [
+            {"search_text": "missing", "instruction_code": "E", "replacement_text": "x"},
+        ]))
+
+        assert not result["saved"]
+        assert review_doc.read_bytes() == before
+
+    @pytest.mark.asyncio
+    async def test_matches_single_instruction_result(self, review_doc: Path, tmp_path: Path):
+        single_path = tmp_path / "single.docx"
+        shutil.copy(review_doc, single_path)
+        instruction = {"search_text": "of the invoice", "instruction_code": "E+EC",
+                       "replacement_text": "of receipt of the invoice", "external_comment_text": "Clarified"}
+
+        single = json.loads(await execute_review_instruction(filename=str(single_path), **instruction))
+        batch = json.loads(await execute_review_instructions(str(review_doc), [instruction]))
+
+        batch_result = batch["results"][0]
+        assert batch_result.pop("index") == 0
+        single.pop("filename")
+        batch_result.pop("filename")
+        assert batch_result == single
+        assert _texts(review_doc) == _texts(single_path)
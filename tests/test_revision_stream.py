@@ -0,0 +1,162 @@
+"""Tests for the streaming tracked-changes extractor."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+from effilocal.doc.amended_paragraph import iter_amended_paragraphs
+from effilocal.doc.revision_stream import RevisionSpan, iter_paragraph_revisions
+from scripts.generate_review_example import _find_change_regions, process_track_changes
+
+
+def _run(text: str) -> str:
+    return f'<w:r><w:t xml:space="preserve">{text}</w:t></w:r>'
+
+
+def _ins(text: str, author: str = "Alice") -> str:
+    return (
+        f'<w:ins w:id="1" w:author="{author}" w:date="2025-01-01T00:00:00Z">'
+        f'<w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:ins>'
+    )
+
+
+def _del(text: str, author: str = "Bob") -> str:
+    return (
+        f'<w:del w:id="2" w:author="{author}" w:date="2025-01-02T00:00:00Z">'
+        f'<w:r><w:delText xml:space="preserve">{text}</w:delText></w:r></w:del>'
+    )
+
+
+def _append_paragraph(parent, *children: str, para_id: str | None = None) -> None:
+    attrs = f' w14:paraId="{para_id}"' if para_id else ""
+    xml = (
+        f'<w:p {nsdecls("w")} xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml"'
+        f'{attrs}>{"".join(children)}</w:p>'
+    )
+    parent.append(parse_xml(xml))
+
+
+@pytest.fixture
+def redline_doc() -> Document:
+    doc = Document()
+    table = doc.add_table(rows=1, cols=1)
+    cell = table.rows[0].cells[0]._tc
+    cell.remove(cell[-1])
+    _append_paragraph(cell, _run("Cell "), _ins("inserted"), para_id="00000004")
+    body = doc.element.body
+    tbl = table._tbl
+    body.remove(tbl)
+    sect_pr = body[-1]
+    body.remove(sect_pr)
+    _append_paragraph(body, _run("Unchanged paragraph."), para_id="00000001")
+    _append_paragraph(
+        body,
+        _run("The fee is "),
+        _del("ten"),
+        _ins("twenty"),
+        _run(" pounds and the term is "),
+        _ins(" two "),
+        _ins("years"),
+        _run("."),
+        para_id="00000002",
+    )
+    _append_paragraph(body, _del("Deleted entirely."), para_id="00000003")
+    body.append(tbl)
+    body.append(sect_pr)
+    return doc
+
+
+def _docx_bytes(doc: Document) -> bytes:
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+class TestIterParagraphRevisions:
+    """Tests for iter_paragraph_revisions."""
+
+    def test_yields_only_changed_body_paragraphs(self, redline_doc: Document):
+        revisions = list(iter_paragraph_revisions(redline_doc))
+
+        assert [r.para_id for r in revisions] == ["00000002", "00000003"]
+        assert [r.para_idx for r in revisions] == [1, 2]
+
+    def test_offsets_point_at_change_text(self, redline_doc: Document):
+        rev = next(iter_paragraph_revisions(redline_doc))
+
+        assert rev.before_text == "The fee is ten pounds and the term is ."
+        assert rev.after_text == "The fee is twenty pounds and the term is  two years."
+        for span in rev.spans:
+            if span.kind == "delete":
+                assert rev.before_text[span.before_start:span.before_end] == span.text
+            else:
+                assert rev.after_text[span.after_start:span.after_end] == span.text
+        assert rev.insertions == ["twenty", "two years"]
+        assert rev.deletions == ["ten"]
+        assert rev.authors == {"Alice", "Bob"}
+
+    def test_bytes_source_matches_in_memory_walk(self, redline_doc: Document):
+        streamed = list(iter_paragraph_revisions(_docx_bytes(redline_doc), include_tables=True))
+        walked = list(iter_paragraph_revisions(redline_doc, include_tables=True))
+
+        assert [(r.para_id, r.before_text, r.after_text, r.spans) for r in streamed] == [
+            (r.para_id, r.before_text, r.after_text, r.spans) for r in walked
+        ]
+        assert streamed[-1].para_id == "00000004"
+
+    def test_matches_amended_paragraph_text(self, redline_doc: Document):
+        amended = [p.amended_text for p in iter_amended_paragraphs(redline_doc)]
+
+        revisions = iter_paragraph_revisions(redline_doc, changed_only=False)
+
+        assert [r.after_text for r in revisions] == amended
+
+
+class TestProcessTrackChanges:
+    """process_track_changes built on the revision stream."""
+
+    def test_accepts_document_or_bytes(self, redline_doc: Document):
+        from_doc = process_track_changes(redline_doc)
+        from_bytes = process_track_changes(_docx_bytes(redline_doc))
+
+        assert [d.after_text for d in from_doc] == [d.after_text for d in from_bytes]
+        assert from_doc[0].changes == from_bytes[0].changes
+
+
+class TestFindChangeRegions:
+    """Region location and merging."""
+
+    def test_exact_spans_disambiguate_repeated_words(self):
+        before = "the cat and the dog"
+        after = "the cat and a dog"
+        spans = [
+            RevisionSpan("delete", "the", 12, 15, 12, 12),
+            RevisionSpan("insert", "a", 12, 12, 12, 13),
+        ]
+
+        by_search = _find_change_regions(before, after, ["the"], ["a"], context_chars=4)
+        by_offset = _find_change_regions(before, after, [], [], context_chars=4, spans=spans)
+
+        assert by_offset == [("... the dog", "... a dog")]
+        assert by_search != by_offset
+
+    def test_distant_changes_stay_separate(self):
+        before = "alpha " + "x " * 40 + "omega"
+        after = "ALPHA " + "x " * 40 + "OMEGA"
+
+        regions = _find_change_regions(before, after, ["alpha", "omega"], ["ALPHA", "OMEGA"])
+
+        assert len(regions) == 2
+
+    def test_nearby_changes_merge(self):
+        before = "one two three"
+        after = "1 two 3"
+
+        regions = _find_change_regions(before, after, ["one", "three"], ["1", "3"])
+
+        assert regions == [("one two three", "1 two 3")]
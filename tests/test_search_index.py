@@ -0,0 +1,142 @@
+"""Tests for the inverted full-text block index."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from effilocal.doc.search_index import (
+    SEARCH_INDEX_FILENAME,
+    BlockSearchIndex,
+    build_search_index,
+)
+from effilocal.flows.analyze_doc import analyze
+from effilocal.mcp_server.tools.search_tools import search_blocks
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+BLOCKS = [
+    {"id": "b0", "text": "Definitions and interpretation", "list": {"ordinal": "1."}},
+    {"id": "b1", "text": "The Supplier shall supply the Services.", "list": {"ordinal": "1.1"}},
+    {"id": "b2", "text": "Supplies are invoiced monthly; the supplier pays VAT."},
+    {"id": "b3", "text": None},
+    {"id": "b4", "text": "İstanbul office: the supplier's address."},
+]
+
+
+def _scan(query: str) -> list[tuple[int, tuple[int, ...]]]:
+    """Reference case-insensitive substring scan."""
+    results = []
+    for position, block in enumerate(BLOCKS):
+        text = block["text"] or ""
+        folded, needle = text.lower(), query.lower()
+        offsets, start = [], folded.find(needle)
+        while start != -1:
+            offsets.append(start)
+            start = folded.find(needle, start + len(needle))
+        if offsets:
+            results.append((position, tuple(offsets)))
+    return results
+
+
+@pytest.fixture
+def index() -> BlockSearchIndex:
+    return BlockSearchIndex.build(BLOCKS)
+
+
+@pytest.fixture(scope="module")
+def analysis_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    root = tmp_path_factory.mktemp("search_index")
+    # analyze() embeds block ids into the document, so work on a copy
+    docx_path = shutil.copy(FIXTURES / "numbering_decimal.docx", root / "numbering_decimal.docx")
+    analyze(Path(docx_path), doc_id="search-index-test", out_dir=root / "analysis")
+    return root / "analysis"
+
+
+def _analysis_blocks(analysis_dir: Path) -> list[dict]:
+    lines = (analysis_dir / "blocks.jsonl").read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+class TestSearch:
+    """Query semantics match a linear scan."""
+
+    @pytest.mark.parametrize("query", ["supplier", "SUPPL", "the s", "; the", "ly", "x", "monthly; the supplier"])
+    def test_substring_matches_scan(self, index: BlockSearchIndex, query: str):
+        hits = index.search(query)
+
+        # Block 4 folds to a longer string; its offsets are covered below
+        assert [(hit.position, hit.offsets) for hit in hits if hit.position != 4] == [
+            (position, offsets) for position, offsets in _scan(query) if position != 4
+        ]
+        assert [hit.position for hit in hits] == [position for position, _ in _scan(query)]
+
+    def test_whole_word_and_case(self, index: BlockSearchIndex):
+        assert [hit.block_id for hit in index.search("supplier", whole_word=True)] == ["b1", "b2", "b4"]
+        assert [hit.block_id for hit in index.search("suppl", whole_word=True)] == []
+        assert [hit.block_id for hit in index.search("Supplier", case_sensitive=True)] == ["b1"]
+
+    def test_hits_carry_ordinal_and_limit(self, index: BlockSearchIndex):
+        hits = index.search("the", limit=2)
+
+        assert [(hit.block_id, hit.ordinal) for hit in hits] == [("b1", "1.1"), ("b2", None)]
+        assert hits[0].to_dict()["offsets"] == [0, 26]
+
+    def test_offsets_refer_to_original_text(self, index: BlockSearchIndex):
+        # "İ".lower() is two characters, shifting folded offsets by one
+        (hit,) = index.search("office")
+
+        assert BLOCKS[4]["text"][hit.offsets[0]:].startswith("office")
+
+
+class TestPersistence:
+    """Round trip and staleness checks."""
+
+    def test_payload_round_trip(self, index: BlockSearchIndex):
+        payload = json.loads(json.dumps(build_search_index(BLOCKS)))
+
+        restored = BlockSearchIndex.from_payload(payload, BLOCKS)
+
+        assert restored is not None
+        assert restored.search("supplier") == index.search("supplier")
+
+    def test_stale_payload_is_rejected(self):
+        payload = build_search_index(BLOCKS)
+        edited = [dict(block) for block in BLOCKS]
+        edited[1]["text"] = "The Customer shall pay."
+
+        assert BlockSearchIndex.from_payload(payload, edited) is None
+        assert BlockSearchIndex.from_payload(payload, BLOCKS[:-1]) is None
+
+    def test_analysis_writes_fresh_index(self, analysis_dir: Path):
+        payload = json.loads((analysis_dir / SEARCH_INDEX_FILENAME).read_text(encoding="utf-8"))
+
+        assert BlockSearchIndex.from_payload(payload, _analysis_blocks(analysis_dir)) is not None
+
+
+class TestSearchBlocksTool:
+    """The search_blocks MCP tool."""
+
+    def test_returns_matches_with_snippets(self, analysis_dir: Path):
+        blocks = _analysis_blocks(analysis_dir)
+        word = next(block["text"].split()[0] for block in blocks if block.get("text"))
+
+        result = json.loads(search_blocks(str(analysis_dir), word, limit=1))
+
+        assert result["success"]
+        assert result["count"] == 1
+        assert word.lower() in result["matches"][0]["snippet"].lower()
+
+    def test_missing_directory(self, tmp_path: Path):
+        result = json.loads(search_blocks(str(tmp_path / "missing"), "x"))
+
+        assert not result["success"]
+
+    def test_non_numeric_limit(self, analysis_dir: Path):
+        result = json.loads(search_blocks(str(analysis_dir), "x", limit="ten"))
+
+        assert not result["success"]
+        assert "limit must be an integer" in result["error"]
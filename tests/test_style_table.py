@@ -0,0 +1,118 @@
+"""Tests for the per-document resolved style table."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.shared import Pt
+
+from effilocal.doc.paragraphs import build_paragraph_block, paragraph_style_info
+from effilocal.doc.style_table import StyleTable
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def _style_xml(style_id: str, name: str, based_on: str | None = None, ppr: str = "") -> str:
+    based = f'<w:basedOn w:val="{based_on}"/>' if based_on else ""
+    return (
+        f'<w:style {nsdecls("w")} w:type="paragraph" w:styleId="{style_id}">'
+        f'<w:name w:val="{name}"/>{based}<w:pPr>{ppr}</w:pPr></w:style>'
+    )
+
+
+@pytest.fixture
+def chained_doc() -> Document:
+    doc = Document()
+    styles = doc.styles.element
+    styles.append(
+        parse_xml(
+            _style_xml(
+                "ClauseBase",
+                "Clause Base",
+                based_on="Normal",
+                ppr='<w:numPr><w:ilvl w:val="1"/><w:numId w:val="7"/></w:numPr>'
+                '<w:ind w:left="720" w:hanging="360"/>',
+            )
+        )
+    )
+    styles.append(
+        parse_xml(_style_xml("ClauseText", "Clause Text", based_on="ClauseBase", ppr='<w:ind w:left="1440"/>'))
+    )
+    doc.add_paragraph("Body", style="Clause Text")
+    doc.add_paragraph("Title", style="Heading 2")
+    doc.add_paragraph("Plain")
+    return doc
+
+
+class TestStyleTable:
+    """Resolution of names, chains and inherited properties."""
+
+    def test_resolves_chain_and_inherited_properties(self, chained_doc: Document):
+        table = StyleTable.for_document(chained_doc)
+        style = table.get("ClauseText")
+
+        assert style.name == "Clause Text"
+        assert style.based_on == ("ClauseBase", "Normal")
+        assert style.num_pr == {"numId": 7, "ilvl": 1, "numRestart": False}
+        # Nearest definition wins per attribute
+        assert style.indent == {"left": Pt(72), "hanging": Pt(18)}
+
+    def test_heading_level_uses_ui_name(self, chained_doc: Document):
+        table = StyleTable.for_document(chained_doc)
+        heading = table.paragraph_style(chained_doc.paragraphs[1]._p)
+
+        assert heading.style_id == "Heading2"
+        assert heading.name == "Heading 2"
+        assert heading.heading_level == 2
+        assert heading.block_type == "heading"
+
+    def test_unknown_or_wrong_type_id_falls_back_to_default(self, chained_doc: Document):
+        table = StyleTable.for_document(chained_doc)
+        paragraph = chained_doc.paragraphs[2]
+        paragraph._p.get_or_add_pPr().style = "DefaultParagraphFont"  # a character style
+
+        assert table.paragraph_style(paragraph._p).style_id == "Normal"
+        assert paragraph.style.style_id == "Normal"
+
+    def test_for_part_caches_until_styles_change(self, chained_doc: Document):
+        first = StyleTable.for_document(chained_doc)
+
+        assert StyleTable.for_document(chained_doc) is first
+
+        chained_doc.styles.add_style("Schedule Title", WD_STYLE_TYPE.PARAGRAPH)
+        rebuilt = StyleTable.for_document(chained_doc)
+
+        assert rebuilt is not first
+        assert rebuilt.get("ScheduleTitle").name == "Schedule Title"
+
+    @pytest.mark.parametrize("name", ["numbering_nested.docx", "lists.docx", "table.docx", "mixed.docx"])
+    def test_matches_python_docx_on_fixtures(self, name: str):
+        doc = Document(str(FIXTURES / name))
+        table = StyleTable.for_document(doc)
+        paragraphs = list(doc.paragraphs) + [
+            p for tbl in doc.tables for row in tbl.rows for cell in row.cells for p in cell.paragraphs
+        ]
+
+        for paragraph in paragraphs:
+            assert paragraph_style_info(paragraph, table) == paragraph_style_info(paragraph)
+
+
+class TestBuildParagraphBlockWithStyleTable:
+    """build_paragraph_block gives identical blocks with or without a table."""
+
+    def test_blocks_match_python_docx_resolution(self, chained_doc: Document):
+        table = StyleTable.for_document(chained_doc)
+
+        for paragraph in chained_doc.paragraphs:
+            with_table, _ = build_paragraph_block(
+                paragraph, "s", hash_provider=lambda text: text, style_table=table
+            )
+            without, _ = build_paragraph_block(paragraph, "s", hash_provider=lambda text: text)
+            for block in (with_table, without):
+                block.pop("section_id")
+            assert with_table == without
@@ -0,0 +1,102 @@
+"""Tests for stored token estimates and token-budgeted dispatcher pages."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from effilocal.flows.analyze_doc import analyze
+from effilocal.flows.chat_history import ConversationRecorder, history_entries_to_messages
+from effilocal.tools import audit, dispatcher, limits
+from effilocal.util.tokens import estimate_tokens, token_prefix_sums
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+DOC_ID = "token-budget-doc"
+
+
+@pytest.fixture
+def doc_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / DOC_ID
+    root.mkdir()
+    blocks = [{"id": f"b{index}", "text": "word " * (10 * (index + 1)), "token_count": 10 * (index + 1)}
+              for index in range(6)]
+    (root / "blocks.jsonl").write_text("\n".join(json.dumps(block) for block in blocks) + "\n", encoding="utf-8")
+    section = {"id": "s0", "title": "All", "level": 1, "block_ids": [block["id"] for block in blocks], "children": []}
+    (root / "sections.json").write_text(json.dumps({"root": {"children": [section]}}), encoding="utf-8")
+    monkeypatch.setattr(dispatcher, "FIXTURES_ROOT", tmp_path)
+    monkeypatch.setenv(audit.AUDIT_FILE_ENV, str(tmp_path / "tool_audit.jsonl"))
+    return root
+
+
+class TestEstimates:
+    """Token estimates and where they are stored."""
+
+    def test_estimate_counts_words_and_punctuation(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("The Supplier shall, at its cost:") == 9  # "Supplier" is two
+        assert token_prefix_sums([3, 4, 5]) == [0, 3, 7, 12]
+
+    def test_analysis_stores_block_and_section_counts(self, tmp_path: Path):
+        docx_path = shutil.copy(FIXTURES / "numbering_decimal.docx", tmp_path / "numbering_decimal.docx")
+        out_dir = tmp_path / "analysis"
+
+        analyze(Path(docx_path), doc_id="token-test", out_dir=out_dir)
+
+        lines = (out_dir / "blocks.jsonl").read_text(encoding="utf-8").splitlines()
+        blocks = [json.loads(line) for line in lines if line.strip()]
+        assert all(block["token_count"] == estimate_tokens(block.get("text")) for block in blocks)
+        sections = json.loads((out_dir / "sections.json").read_text(encoding="utf-8"))["root"]["children"]
+        by_id = {block["id"]: block for block in blocks}
+        for section in sections:
+            assert section["token_count"] == sum(by_id[block_id]["token_count"] for block_id in section["block_ids"])
+
+
+class TestTokenPages:
+    """Dispatcher pages are filled up to the token budget."""
+
+    def test_range_pages_fill_budget(self, doc_root: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(limits, "MAX_TOKENS", 60)
+
+        first = dispatcher.get_content_by_range(doc_id=DOC_ID, start_block=0, end_block=5)
+        second = dispatcher.get_content_by_range(doc_id=DOC_ID, start_block=3, end_block=5)
+
+        # 10 + 20 + 30 fits; adding 40 would not
+        assert [block["id"] for block in first["blocks"]] == ["b0", "b1", "b2"]
+        assert first["next_page"] == {"start_block": 3, "end_block": 5}
+        # A block over budget is still returned on its own
+        assert [block["id"] for block in second["blocks"]] == ["b3"]
+        assert second["truncated"]
+
+    def test_whole_range_within_budget(self, doc_root: Path):
+        result = dispatcher.get_content_by_range(doc_id=DOC_ID, start_block=1, end_block=5)
+
+        assert len(result["blocks"]) == 5
+        assert not result["truncated"]
+        assert result["next_page"] is None
+
+    def test_section_pages_respect_block_cap(self, doc_root: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(limits, "MAX_BLOCKS", 2)
+
+        result = dispatcher.get_section(doc_id=DOC_ID, section_id="s0")
+
+        assert [block["id"] for block in result["blocks"]] == ["b0", "b1"]
+        assert result["next_page"] == {"start_block": 2, "end_block": 5}
+
+
+class TestHistoryTokens:
+    """Chat history carries token counts recorded once."""
+
+    def test_recorded_counts_are_reused(self):
+        recorder = ConversationRecorder()
+        recorder.record_user("What is the term?")
+        recorder.record_assistant("Two years.")
+        recorder.entries[1]["token_count"] = 99  # stored count wins over re-estimating
+
+        messages = history_entries_to_messages(recorder.entries, "doc")
+
+        assert messages[0]["content"].endswith("What is the term?")
+        assert messages[0]["token_count"] > estimate_tokens("What is the term?")
+        assert messages[1]["token_count"] == 99 + 4
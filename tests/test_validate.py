@@ -0,0 +1,134 @@
+"""Tests for artifact validation (schema and cross-file checks)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from effilocal.flows import validate_doc
+from effilocal.util.validate import ArtifactValidator, validate_artifacts
+
+SECTION_ID = "11111111-1111-4111-8111-111111111111"
+BLOCK_A = "aaaaaaaa-aaaa-4aaa-8aaa-aaaaaaaaaaaa"
+BLOCK_B = "bbbbbbbb-bbbb-4bbb-8bbb-bbbbbbbbbbbb"
+RANGE_ID = "cccccccc-cccc-4ccc-8ccc-cccccccccccc"
+
+
+def _sections(*section_ids: str) -> dict:
+    return {"root": {"children": [{"id": section_id, "children": []} for section_id in section_ids]}}
+
+
+def _block(block_id: str, section_id: str = SECTION_ID, **extra) -> dict:
+    return {"id": block_id, "section_id": section_id, **extra}
+
+
+def _write_blocks(directory: Path, lines: list[str]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "blocks.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _issues_for(report, filename: str) -> list:
+    return [issue for issue in report.errors if (issue.context or {}).get("filename") == filename]
+
+
+class TestArtifactValidator:
+    """Single-pass cross checks match the batch API."""
+
+    def test_matches_validate_artifacts(self):
+        sections = _sections(SECTION_ID, SECTION_ID)
+        blocks = [
+            _block(BLOCK_A),
+            _block(BLOCK_A, section_id="unknown"),
+            _block(BLOCK_B, list={"level": 1, "counters": [1]}),
+        ]
+        tag_ranges = [
+            {
+                "id": RANGE_ID,
+                "start_marker_id": BLOCK_A,
+                "end_marker_id": BLOCK_A,
+                "attributes": {"block_id": "missing"},
+                "anchors": {"end": {"near_block_id": "gone"}},
+            }
+        ]
+
+        validator = ArtifactValidator(sections)
+        for block in blocks:
+            validator.add_block(block)
+        for rng in tag_ranges:
+            validator.add_tag_range(rng)
+        streamed = validator.finish()
+
+        expected = validate_artifacts(blocks=blocks, sections=sections, tag_ranges=tag_ranges)
+        assert streamed.errors == expected.errors
+        assert [issue.code for issue in streamed.errors] == [
+            "duplicate_id",
+            "duplicate_id",
+            "duplicate_id",
+            "unknown_section_id",
+            "unknown_block_in_range",
+            "unknown_anchor_block",
+            "invalid_list_counters",
+        ]
+
+    def test_accepts_generators(self):
+        report = validate_artifacts(
+            blocks=(block for block in [_block(BLOCK_A)]),
+            sections=_sections(SECTION_ID),
+            tag_ranges=iter([{"attributes": {"block_id": BLOCK_A}}]),
+        )
+
+        assert report.ok
+
+
+class TestValidateDirectory:
+    """Streaming schema validation of an analysis directory."""
+
+    def test_schema_errors_carry_line_numbers(self, tmp_path: Path):
+        _write_blocks(tmp_path, [json.dumps(_block(BLOCK_A)), "", json.dumps({"id": "bad"})])
+
+        report = validate_doc.validate_directory(tmp_path)
+
+        block_errors = _issues_for(report, "blocks.jsonl")
+        assert {issue.context["index"] for issue in block_errors} == {0, 1}
+        assert all(issue.code == "schema_validation_error" for issue in block_errors)
+        assert any(issue.message.startswith("blocks.jsonl line 2:") for issue in block_errors)
+
+    def test_unparseable_line_reports_only_invalid_json(self, tmp_path: Path):
+        _write_blocks(tmp_path, [json.dumps({"id": "bad"}), "{not json"])
+
+        report = validate_doc.validate_directory(tmp_path)
+
+        block_errors = _issues_for(report, "blocks.jsonl")
+        assert [issue.code for issue in block_errors] == ["invalid_json"]
+
+    def test_missing_artifacts_reported_in_artifact_order(self, tmp_path: Path):
+        tmp_path.mkdir(exist_ok=True)
+
+        report = validate_doc.validate_directory(tmp_path, deep=True)
+
+        assert [issue.message.rsplit(": ", 1)[1] for issue in report.errors] == [
+            "blocks.jsonl",
+            "sections.json",
+            "styles.json",
+            "index.json",
+            "manifest.json",
+            "relationships.json",
+        ]
+
+    def test_validators_are_compiled_once(self):
+        assert validate_doc._validator("block.schema.json") is validate_doc._validator("block.schema.json")
+
+
+class TestValidateTree:
+    """Recursive validation of every analysis directory."""
+
+    def test_finds_nested_analysis_directories(self, tmp_path: Path):
+        _write_blocks(tmp_path / "b" / "analysis", ["{not json"])
+        _write_blocks(tmp_path / "a", [json.dumps(_block(BLOCK_A))])
+        (tmp_path / "empty").mkdir()
+
+        reports = validate_doc.validate_tree(tmp_path, workers=1)
+
+        assert list(reports) == [tmp_path / "a", tmp_path / "b" / "analysis"]
+        assert all(not report.ok for report in reports.values())
+        assert "invalid_json" in {issue.code for issue in reports[tmp_path / "b" / "analysis"].errors}